@@ -9,7 +9,15 @@ import streamlit as st
 import sys
 sys.path.append('.')
 
+from utils.startup_profiler import profile_page, finish_page
+profile_page("Home")
+
+from utils.app_startup import run_app_startup
+run_app_startup()
+
 from utils.coaching_db import init_database
+from utils.sql_tracing import is_tracing_enabled, render_sql_admin_panel
+from utils.shards import is_school_admin_enabled, render_school_admin_panel
 
 # ============================================
 # PAGE CONFIG
@@ -529,3 +537,21 @@ st.markdown("""
     </p>
 </div>
 """, unsafe_allow_html=True)
+
+# ============================================
+# ADMIN: SQL-TRACING (nur mit PULSE_SQL_TRACE=1)
+# ============================================
+
+if is_tracing_enabled():
+    with st.expander("🛠️ Admin: SQL-Statements"):
+        render_sql_admin_panel()
+
+# ============================================
+# ADMIN: SCHUL-SHARDS (nur mit PULSE_SCHOOL_ADMIN=1)
+# ============================================
+
+if is_school_admin_enabled():
+    with st.expander("🏫 Admin: Schulübergreifende Auswertung"):
+        render_school_admin_panel()
+
+finish_page()
@@ -15,11 +15,20 @@ from pathlib import Path
 import sys
 sys.path.append('..')
 
+from utils.startup_profiler import profile_page, finish_page
+profile_page("Ressourcen")
+
+from utils.app_startup import run_app_startup
+run_app_startup()
+
+from utils.fragments import begin_page_run, end_page_run, render_rerun_timings
+begin_page_run("Ressourcen")
+
 from utils.scale_info import get_scale_info
 from utils.evidence_integration import get_evidence, get_hattie_info, get_pisa_info
 
 # Import aus ausgelagerten Modulen
-from utils.ressourcen.content_database import CONTENT_DATABASE
+from utils.ressourcen.content_database import CONTENT_DATABASE, get_factor_content
 from utils.ressourcen.helpers import (
     embed_youtube,
     render_video_section,
@@ -193,7 +202,7 @@ with st.sidebar:
 # ============================================
 
 # Hole Content
-content = CONTENT_DATABASE.get(factor, {})
+content = get_factor_content(factor)
 if not content:
     st.error("Bereich nicht gefunden.")
     st.stop()
@@ -244,9 +253,7 @@ elif factor == "EXT_MOTIV":
     if HAS_GAMIFICATION and is_logged_in():
         user = get_current_user()
         if user:
-            from utils.gamification_db import get_db_path, update_user_stats, get_or_create_user
-            import sqlite3
-            conn = sqlite3.connect(get_db_path())
+            from utils.gamification_db import update_user_stats, get_or_create_user
 
             user_data = {
                 "user_id": user.get("user_id", "anonymous"),
@@ -260,8 +267,8 @@ elif factor == "EXT_MOTIV":
                 current_streak = u.get("current_streak", 0)
                 update_user_stats(user_id, xp, current_streak)
 
-            render_motivation_altersstufen(color, conn=conn, user_data=user_data, xp_callback=award_xp_callback)
-            conn.close()
+            # Keine Connection übergeben: das Challenge-Fragment öffnet seine eigene
+            render_motivation_altersstufen(color, user_data=user_data, xp_callback=award_xp_callback)
         else:
             render_motivation_altersstufen(color)
     else:
@@ -302,3 +309,7 @@ with col2:
         💡 Tipp: Fang mit EINEM Video oder EINEM Tipp an!
     </div>
     """, unsafe_allow_html=True)
+
+end_page_run()
+render_rerun_timings()
+finish_page()
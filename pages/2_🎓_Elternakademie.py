@@ -18,6 +18,12 @@ from pathlib import Path
 import sys
 sys.path.append('..')
 
+from utils.startup_profiler import profile_page, finish_page
+profile_page("Elternakademie")
+
+from utils.app_startup import run_app_startup
+run_app_startup()
+
 from utils.coaching_db import (
     get_all_students, search_students, get_student_by_id,
     save_assessment, get_student_summary, create_student
@@ -27,6 +33,7 @@ from utils.questionnaire_builder import (
     load_items_for_scales, group_items_by_scale, estimate_questionnaire_duration
 )
 from utils.german_labels import add_german_labels_to_value_labels
+from utils.label_sets import get_label_set
 
 # ============================================
 # ELTERN-UNTERSTÜTZUNGS CONFIGURATION
@@ -498,26 +505,13 @@ if st.session_state.get('show_questionnaire', False):
             question_text = item.get('question_text_de', item.get('question_text_en', 'Keine Frage'))
 
             if variable_name in value_labels:
-                labels_df = value_labels[variable_name]
-
-                # Filter missing codes
-                def is_valid_value(val):
-                    val_str = str(val)
-                    return not (val_str.startswith('.') or val_str == 'SYSTEM MISSING')
-
-                valid_labels = labels_df[labels_df['value'].apply(is_valid_value)].copy()
+                # Antwortoptionen ohne Missing-Codes (internierte Antwortskala)
+                label_set = get_label_set(value_labels[variable_name])
 
                 options = []
                 option_values = []
-                for idx, row in valid_labels.iterrows():
-                    value = row['value']
-                    label = row.get('label_de')
-                    if label is None or label == '' or label == 'None':
-                        label = row.get('label')
-                    if label is None or label == '' or label == 'None':
-                        label = f'Option {value}'
-
-                    options.append(label)
+                for value, label in label_set.options:
+                    options.append(label if label is not None else f'Option {value}')
                     option_values.append(value)
 
                 # Display question with horizontal radio buttons
@@ -597,3 +591,5 @@ st.caption("""
 🎯 Eltern-Unterstützung ist mit d = 0.49 (mittlere Effektstärke) nachweislich wirksam
 ⚠️ Entscheidend ist die QUALITÄT der Unterstützung, nicht nur die Quantität
 """)
+
+finish_page()
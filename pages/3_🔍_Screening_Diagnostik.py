@@ -9,17 +9,22 @@ Basierend auf XGBoost-Analyse und Interventionsfähigkeit
 """
 
 import streamlit as st
-import pandas as pd
 import json
 from datetime import datetime
 from pathlib import Path
 import sys
 sys.path.append('..')
 
+from utils.startup_profiler import profile_page, finish_page
+profile_page("Screening_Diagnostik")
+
+from utils.app_startup import run_app_startup
+run_app_startup()
+
 from utils.coaching_db import (
-    get_all_students, search_students, get_student_by_id,
-    save_assessment, get_student_summary, create_student
+    get_student_by_id, get_student_summary, create_student
 )
+from utils import assessment_drafts
 from utils.scale_info import SCALE_CATEGORIES, get_scale_info
 from utils.questionnaire_builder import (
     load_items_for_scales, group_items_by_scale, estimate_questionnaire_duration
@@ -28,11 +33,19 @@ from utils.grade_specific_items import (
     extract_grade_from_class, adapt_matheff_for_grade
 )
 from utils.german_labels import add_german_labels_to_value_labels
+from utils.label_sets import get_label_set
+from utils.coaching_timeline import render_coaching_timeline
+from utils.student_search import get_classes, search_students_ranked
+from utils.export import render_export_panel
+from utils.adaptive_screening import get_adaptive_bank, summarize_scale, visible_items
 
 # ============================================
 # SCREENING CONFIGURATION
 # ============================================
 
+# Schüler-Auswahl: maximal so viele Treffer in der Sidebar
+PICKER_LIMIT = 20
+
 # Stufe 1: Schnell-Screening (15 Min)
 SCREENING_LEVEL_1 = {
     'name': 'Schnell-Screening',
@@ -138,22 +151,22 @@ student_tab1, student_tab2 = st.sidebar.tabs(["Bestehend", "Neu anlegen"])
 with student_tab1:
     st.markdown("**Schüler suchen:**")
     search_term = st.text_input("Suchbegriff (Code/Klasse)", key="sidebar_search_student", label_visibility="collapsed")
+    class_filter = st.selectbox("Klasse", ["Alle Klassen"] + get_classes(), key="sidebar_search_class")
 
-    if search_term:
-        students_df = search_students(search_term)
-    else:
-        students_df = get_all_students(active_only=True)
-
-    if not students_df.empty:
-        # Format for display
-        students_df['created_date_short'] = pd.to_datetime(students_df['created_date']).dt.strftime('%d.%m.%Y')
+    students = search_students_ranked(
+        search_term,
+        class_name=None if class_filter == "Alle Klassen" else class_filter,
+        limit=PICKER_LIMIT
+    )
 
+    if students:
         # Create selection
-        for idx, row in students_df.iterrows():
+        for row in students:
             col1, col2 = st.columns([3, 1])
             with col1:
                 st.markdown(f"**{row['student_code']}**")
-                st.caption(f"Klasse: {row['class'] or 'N/A'} | Erstellt: {row['created_date_short']}")
+                created = (row['created_date'] or '')[:10]
+                st.caption(f"Klasse: {row['class'] or 'N/A'} | Erstellt: {created}")
             with col2:
                 if st.button("Wählen", key=f"sidebar_select_{row['id']}"):
                     st.session_state.screening_student_id = row['id']
@@ -161,6 +174,8 @@ with student_tab1:
                     st.session_state.screening_responses = {}
                     st.session_state.show_screening_form = False
                     st.rerun()
+        if len(students) == PICKER_LIMIT:
+            st.caption("Weitere Treffer vorhanden - Suchbegriff verfeinern")
     else:
         st.info("Keine Schüler gefunden")
 
@@ -246,6 +261,26 @@ if st.session_state.screening_student_id:
 
     st.success(f"✅ **Ausgewählter Schüler:** {student['student_code']} | Klasse: {student['class'] or 'N/A'}")
 
+    # Unterbrochenes Screening fortsetzen (Autosave, siehe utils/assessment_drafts.py)
+    draft = None if st.session_state.show_screening_form else assessment_drafts.load_draft(student['id'])
+    if draft and draft['context']:
+        draft_level = draft['context']['screening_level']
+        updated = f" | Stand: {str(draft['updated_at'])[:16]}" if draft['updated_at'] else ""
+        st.warning(
+            f"⏸️ **Unterbrochenes Screening:** Stufe {draft_level} | "
+            f"{len(draft['responses'])} Antworten gespeichert{updated}"
+        )
+        resume_col, discard_col, _ = st.columns([1, 1, 2])
+        if resume_col.button("▶️ Fortsetzen", type="primary"):
+            st.session_state.show_screening_form = True
+            st.session_state.screening_level = draft_level
+            st.session_state.current_scales = draft['context']['scales']
+            st.session_state.screening_responses = dict(draft['responses'])
+            st.rerun()
+        if discard_col.button("🗑️ Verwerfen"):
+            assessment_drafts.discard(student['id'])
+            st.rerun()
+
     # Tabs for screening levels
     tab1, tab2, tab3 = st.tabs([
         f"📊 Stufe 1: Schnell-Screening ({SCREENING_LEVEL_1['duration']} Min)",
@@ -321,6 +356,11 @@ if st.session_state.screening_student_id:
             st.session_state.show_screening_form = True
             st.session_state.screening_level = 1
             st.session_state.current_scales = total_scales_l1
+            assessment_drafts.start_draft(
+                student['id'],
+                {'screening_level': 1, 'scales': total_scales_l1},
+                st.session_state.screening_responses
+            )
             st.rerun()
 
     # ============================================
@@ -417,6 +457,11 @@ if st.session_state.screening_student_id:
             st.session_state.show_screening_form = True
             st.session_state.screening_level = 2
             st.session_state.current_scales = total_scales_l2
+            assessment_drafts.start_draft(
+                student['id'],
+                {'screening_level': 2, 'scales': total_scales_l2},
+                st.session_state.screening_responses
+            )
             st.rerun()
 
         st.write("")
@@ -435,8 +480,16 @@ if st.session_state.screening_student_id:
         if total_assessments > 0:
             st.info(f"**{total_assessments} Assessment(s)** für {student['student_code']} gefunden")
 
-            # TODO: Display assessment history and intervention recommendations
-            st.markdown("_Detaillierte Auswertung in Entwicklung_")
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Letztes Screening", (summary['last_assessment'] or "-")[:10])
+            col2.metric("Aktive Förderpläne", summary['active_plans'])
+            col3.metric("Fortschritts-Einträge", summary['progress_logs'])
+
+            st.markdown("**🗓️ Verlauf**")
+            render_coaching_timeline(
+                st.session_state.screening_student_id,
+                version=(total_assessments, summary['total_plans'], summary['progress_logs'])
+            )
         else:
             st.warning("Noch keine Screening-Ergebnisse vorhanden")
 
@@ -447,6 +500,21 @@ else:
 # SCREENING FORM (wenn aktiviert)
 # ============================================
 
+def record_screening_answer(variable_name, options, option_values):
+    """
+    on_change der Antwort-Radios: übernimmt die Antwort, BEVOR der Rerun
+    ``visible_items`` berechnet - sonst erscheint im adaptiven Modus die
+    nächste Frage erst nach einer weiteren Interaktion.
+    """
+    response = st.session_state.get(f"screening_q_{variable_name}")
+    if response is None:
+        return
+    response_value = option_values[options.index(response)]
+    if st.session_state.screening_responses.get(variable_name) != response_value:
+        st.session_state.screening_responses[variable_name] = response_value
+        assessment_drafts.record_response(st.session_state.screening_student_id, variable_name, response_value)
+
+
 if st.session_state.get('show_screening_form', False):
     st.divider()
     st.header("📝 Fragebogen ausfüllen")
@@ -518,8 +586,33 @@ if st.session_state.get('show_screening_form', False):
     if 'screening_responses' not in st.session_state:
         st.session_state.screening_responses = {}
 
+    # Adaptiver Kurzmodus: kalibrierte Skalen nur bis zum SE-Ziel abfragen
+    adaptive_mode = st.toggle(
+        "⚡ Adaptiver Kurzmodus",
+        key="screening_adaptive_mode",
+        help="Wählt nach jeder Antwort die aussagekräftigste nächste Frage und beendet eine Skala, "
+             "sobald der Wert genau genug geschätzt ist. Skalen ohne IRT-Kalibrierung werden vollständig abgefragt."
+    )
+    adaptive_banks = {}
+    if adaptive_mode:
+        for scale_name, scale_items in grouped_items.items():
+            bank = get_adaptive_bank(scale_name, [item['variable_name'] for item in scale_items])
+            if bank is not None:
+                adaptive_banks[scale_name] = bank
+        if adaptive_banks:
+            st.caption(f"Adaptiv: {', '.join(adaptive_banks)}")
+        else:
+            st.caption("Keine der gewählten Skalen ist kalibriert - alle Fragen werden angezeigt.")
+
     # Display questionnaire
+    required_items = []
     for scale_name, scale_items in grouped_items.items():
+        if scale_name in adaptive_banks:
+            shown = visible_items(adaptive_banks[scale_name], st.session_state.screening_responses)
+            by_name = {item['variable_name']: item for item in scale_items}
+            scale_items = [by_name[variable] for variable in shown]
+        required_items.extend(item['variable_name'] for item in scale_items)
+
         st.subheader(f"📊 {get_scale_info(scale_name)['name_de']}")
 
         if scale_name in fragestamm:
@@ -532,14 +625,8 @@ if st.session_state.get('show_screening_form', False):
             question_text = item.get('question_text_de', item.get('question_text_en', 'Keine Frage'))
 
             if variable_name in value_labels:
-                labels_df = value_labels[variable_name]
-
-                # Filter missing codes
-                def is_valid_value(val):
-                    val_str = str(val)
-                    return not (val_str.startswith('.') or val_str == 'SYSTEM MISSING')
-
-                valid_labels = labels_df[labels_df['value'].apply(is_valid_value)].copy()
+                # Antwortoptionen ohne Missing-Codes (internierte Antwortskala)
+                label_set = get_label_set(value_labels[variable_name])
 
                 # Fallback labels
                 likert_4_labels = {
@@ -551,12 +638,8 @@ if st.session_state.get('show_screening_form', False):
 
                 options = []
                 option_values = []
-                for idx, row in valid_labels.iterrows():
-                    value = row['value']
-                    label = row.get('label_de')
-                    if label is None or label == '' or label == 'None':
-                        label = row.get('label')
-                    if label is None or label == '' or label == 'None':
+                for value, label in label_set.options:
+                    if label is None:
                         label = likert_4_labels.get(value, f'Option {value}')
 
                     options.append(label)
@@ -565,44 +648,64 @@ if st.session_state.get('show_screening_form', False):
                 # Display question with horizontal radio buttons
                 st.markdown(f"**{question_text}**")
 
+                # Fortgesetztes Screening: gespeicherte Antwort vorauswählen
+                radio_key = f"screening_q_{variable_name}"
+                saved_value = st.session_state.screening_responses.get(variable_name)
+                if radio_key not in st.session_state and saved_value in option_values:
+                    st.session_state[radio_key] = options[option_values.index(saved_value)]
+
                 response = st.radio(
                     label="Antwort",
                     options=options,
-                    key=f"screening_q_{variable_name}",
+                    key=radio_key,
                     horizontal=True,
                     label_visibility="collapsed",
-                    index=None
+                    index=None,
+                    on_change=record_screening_answer,
+                    args=(variable_name, options, option_values)
                 )
 
                 if response:
-                    response_value = option_values[options.index(response)]
-                    st.session_state.screening_responses[variable_name] = response_value
+                    st.session_state.pop('screening_adaptive', None)  # gehört zum zuletzt geladenen Assessment
 
                 st.markdown("---")
 
     # Buttons
     col1, col2, col3 = st.columns([1, 1, 2])
 
+    with col3:
+        st.caption("💾 Antworten werden automatisch zwischengespeichert - ein abgebrochenes Screening lässt sich später fortsetzen.")
+
     with col1:
         if st.button("✅ Absenden", type="primary"):
-            total_items = len(items)
-            answered = len(st.session_state.screening_responses)
+            total_items = len(required_items)
+            answered = sum(1 for variable in required_items if variable in st.session_state.screening_responses)
 
             if answered < total_items:
                 st.error(f"Bitte alle Fragen beantworten ({answered}/{total_items})")
             else:
                 try:
+                    item_responses = {
+                        variable: st.session_state.screening_responses[variable] for variable in required_items
+                    }
                     results_dict = {
                         'screening_level': current_level,
-                        'item_responses': st.session_state.screening_responses,
+                        'item_responses': item_responses,
                         'scales': list(current_scales),
                         'timestamp': datetime.now().isoformat()
                     }
-
-                    assessment_id = save_assessment(
+                    if adaptive_banks:
+                        results_dict['adaptive'] = {
+                            scale_name: summarize_scale(bank, item_responses)
+                            for scale_name, bank in adaptive_banks.items()
+                        }
+
+                    mode_note = ", adaptiv" if adaptive_banks else ""
+                    # Speichert das Assessment und löscht den Entwurf (eine Transaktion)
+                    assessment_id = assessment_drafts.finalize(
                         student_id=st.session_state.screening_student_id,
                         results_dict=results_dict,
-                        notes=f"Screening Stufe {current_level} ({len(current_scales)} Skalen, {total_items} Items)"
+                        notes=f"Screening Stufe {current_level} ({len(current_scales)} Skalen, {total_items} Items{mode_note})"
                     )
 
                     st.success(f"✅ Screening erfolgreich gespeichert (Assessment #{assessment_id})")
@@ -617,10 +720,18 @@ if st.session_state.get('show_screening_form', False):
 
     with col2:
         if st.button("❌ Abbrechen"):
+            assessment_drafts.discard(st.session_state.screening_student_id)
             st.session_state.screening_responses = {}
             st.session_state.show_screening_form = False
             st.rerun()
 
+# ============================================
+# SIDEBAR: EXPORT
+# ============================================
+
+with st.sidebar.expander("📥 Daten exportieren"):
+    render_export_panel()
+
 # ============================================
 # SIDEBAR: INFO
 # ============================================
@@ -654,3 +765,5 @@ st.sidebar.markdown("""
 - Interventionsfähigkeit
 - Demokratische Validierung
 """)
+
+finish_page()
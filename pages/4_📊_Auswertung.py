@@ -9,14 +9,21 @@ Version: 2.2 - Kombiniert Hattie-Features mit Ressourcen-Links
 
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
 import plotly.express as px
-import json
 import sys
 sys.path.append('..')
 
+from utils.startup_profiler import profile_page, finish_page
+profile_page("Auswertung")
+
+from utils.app_startup import run_app_startup
+run_app_startup()
+
+from utils import charts
 from utils.coaching_db import get_student_by_id, get_latest_assessment
 from utils.scale_info import get_scale_info
+from utils.scale_scoring import extract_scales_from_responses, calculate_scale_score
+from utils.wle_scoring import score_responses
 from utils.evidence_integration import (
     get_evidence, 
     get_hattie_info, 
@@ -75,73 +82,6 @@ def is_score_critical(score, scale_code):
     else:
         return score < 2.5  # Bei normalen Skalen: niedrig = kritisch
 
-def extract_scales_from_responses(responses):
-    """Extrahiert Skalen aus Responses"""
-
-    # Mapping von PISA Item-Codes zu Skalen
-    PISA_ITEM_TO_SCALE = {
-        'ST290': 'MATHEFF',
-        'ST291': 'MATHEFF',
-        'ST292': 'ANXMAT',
-        'ST268': 'PERSEVAGR',
-        'ST034': 'BELONG',
-        'ST270': 'TEACHSUP',
-        'ST038': 'BULLIED',
-    }
-
-    scales = {}
-
-    for item_name in responses.keys():
-        scale_name = None
-
-        # Check if it's a custom item (GENEFF_Q01, etc.)
-        if '_Q' in item_name:
-            scale_name = item_name.split('_Q')[0]
-
-        # Check if it's a PISA item (ST290Q01JA, etc.)
-        elif item_name.startswith('ST'):
-            item_prefix = item_name[:5]
-            scale_name = PISA_ITEM_TO_SCALE.get(item_prefix)
-
-        # Add to scales dict
-        if scale_name:
-            if scale_name not in scales:
-                scales[scale_name] = []
-            scales[scale_name].append(item_name)
-
-    return scales
-
-def calculate_scale_score(responses, scale_items):
-    """Berechnet Skalen-Score aus Item-Antworten
-
-    WICHTIG: Einige PISA-Items verwenden umgekehrte Skalen:
-    - PISA: 1=Strongly agree, 4=Strongly disagree
-    - Unsere App: 1=Stimmt gar nicht, 4=Stimmt genau
-
-    Diese Items werden automatisch umgekehrt (5 - Wert)
-    """
-
-    # Items die umgekehrt werden müssen (PISA: 1=agree, 4=disagree)
-    REVERSE_CODED_PREFIXES = ['ST292', 'ST034', 'ST270']
-
-    values = []
-    for item in scale_items:
-        if item in responses:
-            try:
-                val = float(responses[item])
-                if 1 <= val <= 4:
-                    # Prüfe ob Item umgekehrt werden muss
-                    needs_reversal = any(item.startswith(prefix) for prefix in REVERSE_CODED_PREFIXES)
-                    if needs_reversal:
-                        val = 5 - val  # Umkehrung: 1→4, 2→3, 3→2, 4→1
-                    values.append(val)
-            except:
-                pass
-
-    if values:
-        return sum(values) / len(values)
-    return None
-
 def interpret_score(score, scale_code):
     """Gibt eine einfache Interpretation des Scores"""
 
@@ -172,41 +112,12 @@ def interpret_score(score, scale_code):
             return "🔴 Niedrig", "#ff9999", "Dieser Bereich braucht besondere Aufmerksamkeit."
 
 def create_bar_chart(scores_df):
-    """Erstellt Balkendiagramm aller Skalen"""
+    """Erstellt Balkendiagramm aller Skalen (gecacht, siehe utils/charts.py)"""
     scores_df = scores_df.sort_values('Wert', ascending=True)
-
-    fig = go.Figure()
-
-    colors = []
-    for idx, row in scores_df.iterrows():
-        val = row['Wert']
-        scale_code = row['scale_code']
-        _, color, _ = interpret_score(val, scale_code)
-        colors.append(color)
-
-    fig.add_trace(go.Bar(
-        y=scores_df['Bereich'],
-        x=scores_df['Wert'],
-        orientation='h',
-        marker_color=colors,
-        text=scores_df['Wert'].apply(lambda x: f'{x:.2f}'),
-        textposition='outside',
-        showlegend=False
-    ))
-
-    fig.add_vline(x=2.5, line_dash="dash", line_color="gray",
-                  annotation_text="Mittel", annotation_position="top")
-
-    fig.update_layout(
-        title="Deine Werte im Überblick",
-        xaxis_title="Wert (1 = niedrig, 4 = hoch)",
-        yaxis_title="",
-        height=400,
-        xaxis_range=[0, 4.5],
-        showlegend=False
-    )
-
-    return fig
+    return charts.bar_chart([
+        (row['Bereich'], row['Wert'], interpret_score(row['Wert'], row['scale_code'])[1])
+        for _, row in scores_df.iterrows()
+    ])
 
 
 # ============================================
@@ -235,53 +146,8 @@ def get_effect_size_category(d_value):
         return "⚪ Gering", "#808080", "Unter Durchschnitt"
 
 def create_effect_size_visualization(d_value):
-    """Erstellt eine Gauge-Visualisierung für die Effektstärke"""
-    
-    # Bestimme Farbe
-    if d_value >= 0.8:
-        bar_color = "#00cc88"
-    elif d_value >= 0.6:
-        bar_color = "#4ecdc4"  
-    elif d_value >= 0.4:
-        bar_color = "#FFD700"
-    else:
-        bar_color = "#808080"
-    
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=d_value,
-        domain={'x': [0, 1], 'y': [0, 1]},
-        number={'suffix': "", 'font': {'size': 24}},
-        gauge={
-            'axis': {'range': [0, 1.2], 'tickwidth': 1, 'tickcolor': "darkgray",
-                    'tickvals': [0, 0.2, 0.4, 0.6, 0.8, 1.0, 1.2],
-                    'ticktext': ['0', '0.2', '0.4\n(Umschlag)', '0.6', '0.8', '1.0', '1.2']},
-            'bar': {'color': bar_color, 'thickness': 0.75},
-            'bgcolor': "white",
-            'borderwidth': 2,
-            'bordercolor': "gray",
-            'steps': [
-                {'range': [0, 0.2], 'color': '#f0f0f0'},
-                {'range': [0.2, 0.4], 'color': '#e0e0e0'},
-                {'range': [0.4, 0.6], 'color': '#fff3cd'},
-                {'range': [0.6, 0.8], 'color': '#cce5ff'},
-                {'range': [0.8, 1.2], 'color': '#d4edda'}
-            ],
-            'threshold': {
-                'line': {'color': "red", 'width': 3},
-                'thickness': 0.8,
-                'value': 0.4
-            }
-        }
-    ))
-    
-    fig.update_layout(
-        height=180,
-        margin=dict(l=20, r=20, t=30, b=10),
-        font={'size': 12}
-    )
-    
-    return fig
+    """Erstellt eine Gauge-Visualisierung für die Effektstärke (gecacht pro d-Wert)"""
+    return charts.effect_size_gauge(d_value)
 
 def explain_effect_size(d_value):
     """Erklärt die Effektstärke schülerfreundlich"""
@@ -387,8 +253,11 @@ Dieser Faktor hat laut Hattie eine Effektstärke von d = {d_value}
 (Rang {rank} von 252 Faktoren).
         """
 
-def render_hattie_scale_box(scale_name, scale_display, score, evidence):
-    """Rendert eine schöne Box für eine Skala mit Hattie-Daten"""
+def render_hattie_scale_box(scale_name, scale_display, score, evidence, show_gauge=True):
+    """Rendert eine schöne Box für eine Skala mit Hattie-Daten
+
+    show_gauge=False: Effektstärken-Tacho steht bereits in der Sammelansicht
+    """
     
     hattie = evidence.get('hattie', {}) if evidence else {}
     pisa = evidence.get('pisa', {}) if evidence else {}
@@ -439,8 +308,9 @@ def render_hattie_scale_box(scale_name, scale_display, score, evidence):
             st.markdown("### 🔬 Hattie-Forschung")
             
             # Effektstärke-Visualisierung
-            fig = create_effect_size_visualization(d_value)
-            st.plotly_chart(fig, use_container_width=True, key=f"hattie_effect_{scale_name}")
+            if show_gauge:
+                fig = create_effect_size_visualization(d_value)
+                st.plotly_chart(fig, use_container_width=True, key=f"hattie_effect_{scale_name}")
             
             st.markdown(f"""
             - **Faktor:** {factor}
@@ -510,8 +380,8 @@ if 'screening_responses' not in st.session_state or not st.session_state.screeni
     if 'screening_student_id' in st.session_state:
         assessment = get_latest_assessment(st.session_state.screening_student_id)
         if assessment:
-            results = json.loads(assessment['results'])
-            st.session_state.screening_responses = results.get('item_responses', {})
+            st.session_state.screening_responses = assessment['results'].get('item_responses', {})
+            st.session_state.screening_adaptive = assessment['results'].get('adaptive', {})
             st.info(f"📂 Auswertung vom {assessment['assessment_date']} geladen")
         else:
             st.warning("⚠️ Keine Screening-Daten vorhanden. Bitte führe zuerst ein Screening durch.")
@@ -532,10 +402,16 @@ if 'screening_student_id' in st.session_state:
 # Extract scales and calculate scores
 scales_dict = extract_scales_from_responses(st.session_state.screening_responses)
 
+# Adaptiv erhobene Skalen: erwarteter Mittelwert über alle Items der Skala
+adaptive_scores = st.session_state.get('screening_adaptive', {})
+
 # Prepare data
 scores_data = []
 for scale_name, items in scales_dict.items():
-    student_score = calculate_scale_score(st.session_state.screening_responses, items)
+    if scale_name in adaptive_scores:
+        student_score = adaptive_scores[scale_name]['score']
+    else:
+        student_score = calculate_scale_score(st.session_state.screening_responses, items)
     if student_score:
         scale_info = get_scale_info(scale_name)
         scale_display = scale_info.get('name_de', scale_name) if scale_info else scale_name
@@ -553,6 +429,17 @@ if not scores_data:
 
 scores_df = pd.DataFrame(scores_data)
 
+# PISA-WLE (nur für kalibrierte Skalen, sonst leer)
+wle_scores = score_responses(st.session_state.screening_responses)
+
+# Sammelansicht: alle Tachos eines Tabs in einer Grafik (ein Plotly-Payload)
+combined_gauges = st.sidebar.toggle(
+    "📊 Alle Tachos in einer Grafik",
+    value=True,
+    key="auswertung_combined_gauges",
+    help="Aus: ein Tacho pro Bereich in den aufklappbaren Boxen"
+)
+
 
 # ============================================
 # TABS
@@ -629,6 +516,13 @@ with tab1:
 with tab2:
     st.header("🔍 Details zu den einzelnen Bereichen")
     
+    if combined_gauges:
+        fig = charts.combined_score_gauges([
+            (row['Bereich'], row['Wert'], interpret_score(row['Wert'], row['scale_code'])[1])
+            for _, row in scores_df.iterrows()
+        ])
+        st.plotly_chart(fig, use_container_width=True, key="gauges_combined")
+    
     for idx, row in scores_df.iterrows():
         scale_name = row['scale_code']
         scale_display = row['Bereich']
@@ -638,33 +532,13 @@ with tab2:
         
         with st.expander(f"**{scale_display}** - Dein Wert: {score:.2f} / 4.0", expanded=False):
             
-            col1, col2 = st.columns([1, 2])
-            
-            with col1:
-                fig = go.Figure(go.Indicator(
-                    mode="gauge+number",
-                    value=score,
-                    domain={'x': [0, 1], 'y': [0, 1]},
-                    gauge={
-                        'axis': {'range': [1, 4], 'tickwidth': 1},
-                        'bar': {'color': status_color},
-                        'steps': [
-                            {'range': [1, 2], 'color': '#ffcccc'},
-                            {'range': [2, 2.5], 'color': '#ffe6cc'},
-                            {'range': [2.5, 3], 'color': '#ffffcc'},
-                            {'range': [3, 3.5], 'color': '#e6ffcc'},
-                            {'range': [3.5, 4], 'color': '#ccffcc'}
-                        ],
-                        'threshold': {
-                            'line': {'color': "black", 'width': 2},
-                            'thickness': 0.75,
-                            'value': 2.5
-                        }
-                    },
-                    number={'suffix': " / 4.0", 'font': {'size': 20}}
-                ))
-                fig.update_layout(height=200, margin=dict(l=20, r=20, t=30, b=20))
-                st.plotly_chart(fig, use_container_width=True, key=f"gauge_{scale_name}")
+            if combined_gauges:
+                col2 = st.container()
+            else:
+                col1, col2 = st.columns([1, 2])
+                with col1:
+                    fig = charts.score_gauge(score, status_color)
+                    st.plotly_chart(fig, use_container_width=True, key=f"gauge_{scale_name}")
             
             with col2:
                 st.markdown(f"""
@@ -673,6 +547,12 @@ with tab2:
                     <p style="margin: 10px 0;">{status_msg}</p>
                 </div>
                 """, unsafe_allow_html=True)
+                if scale_name in wle_scores:
+                    wle = wle_scores[scale_name]
+                    st.caption(
+                        f"PISA-Skala (WLE): {wle['wle']:+.2f} ± {wle['se']:.2f} "
+                        "- direkt vergleichbar mit PISA 2022 (OECD-Mittel 0, SD 1)"
+                    )
             
             # Scale-specific interpretations
             st.markdown("### 💡 Was bedeutet das für dich?")
@@ -764,13 +644,21 @@ with tab3:
     # Sortiere nach d-Wert (absteigend)
     scales_with_hattie.sort(key=lambda x: x['d_value'], reverse=True)
     
+    # Sammelansicht der Effektstärken (nur Skalen mit Hattie-Daten)
+    if combined_gauges:
+        effect_entries = [(item['scale_display'], item['d_value']) for item in scales_with_hattie if item['hattie']]
+        if effect_entries:
+            fig = charts.combined_effect_gauges(effect_entries)
+            st.plotly_chart(fig, use_container_width=True, key="hattie_effect_combined")
+    
     # Render jede Skala
     for item in scales_with_hattie:
         render_hattie_scale_box(
             item['scale_name'],
             item['scale_display'],
             item['score'],
-            item['evidence']
+            item['evidence'],
+            show_gauge=not combined_gauges
         )
         
         # NEU: Button zur Ressourcen-Seite nach jeder Box
@@ -1010,3 +898,5 @@ Verbesserungsstrategien zu sehen!
 """)
 
 st.sidebar.caption(f"Basierend auf {sum(scores_df['items_count'])} beantworteten Fragen")
+
+finish_page()
@@ -11,11 +11,17 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
-import sqlite3
 import sys
 sys.path.append('..')
 
+from utils.startup_profiler import profile_page, finish_page
+profile_page("PISA_Forschungsgrundlage")
+
+from utils.app_startup import run_app_startup
+run_app_startup()
+
 from utils.scale_info import get_scale_info, SCALE_CATEGORIES
+from utils.pisa_db import shared_connection
 
 # ============================================
 # PAGE CONFIG
@@ -34,37 +40,33 @@ st.set_page_config(
 @st.cache_data
 def load_pisa_summary_stats():
     """Lade zusammenfassende PISA-Statistiken"""
-    conn = sqlite3.connect('pisa_2022_germany.db')
-
     # Wichtigste Skalen
     key_scales = ['MATHEFF', 'ANXMAT', 'BELONG', 'TEACHSUP', 'PERSEVAGR']
 
     stats = {}
-    for scale in key_scales:
-        try:
-            query = f"""
-            SELECT
-                AVG({scale}) as mean,
-                COUNT({scale}) as n
-            FROM student_data
-            WHERE {scale} IS NOT NULL
-            """
-            df = pd.read_sql_query(query, conn)
-            stats[scale] = {
-                'mean': df['mean'].iloc[0],
-                'n': int(df['n'].iloc[0])
-            }
-        except:
-            stats[scale] = {'mean': None, 'n': 0}
-
-    conn.close()
+    with shared_connection() as conn:
+        for scale in key_scales:
+            try:
+                query = f"""
+                SELECT
+                    AVG({scale}) as mean,
+                    COUNT({scale}) as n
+                FROM student_data
+                WHERE {scale} IS NOT NULL
+                """
+                df = pd.read_sql_query(query, conn)
+                stats[scale] = {
+                    'mean': df['mean'].iloc[0],
+                    'n': int(df['n'].iloc[0])
+                }
+            except:
+                stats[scale] = {'mean': None, 'n': 0}
+
     return stats
 
 @st.cache_data
 def calculate_correlations():
     """Berechne Korrelationen mit Matheleistung"""
-    conn = sqlite3.connect('pisa_2022_germany.db')
-
     query = """
     SELECT
         MATHEFF, ANXMAT, BELONG, TEACHSUP, PERSEVAGR,
@@ -73,8 +75,8 @@ def calculate_correlations():
     WHERE PV1MATH IS NOT NULL
     """
 
-    df = pd.read_sql_query(query, conn)
-    conn.close()
+    with shared_connection() as conn:
+        df = pd.read_sql_query(query, conn)
 
     correlations = {}
     for col in ['MATHEFF', 'ANXMAT', 'BELONG', 'TEACHSUP', 'PERSEVAGR']:
@@ -261,7 +263,6 @@ with tab3:
     """)
 
     # Lade Daten für Quadranten
-    conn = sqlite3.connect('pisa_2022_germany.db')
     query = """
     SELECT
         MATHEFF, ANXMAT, PV1MATH as performance
@@ -271,8 +272,8 @@ with tab3:
       AND PV1MATH IS NOT NULL
     LIMIT 1000
     """
-    df_quad = pd.read_sql_query(query, conn)
-    conn.close()
+    with shared_connection() as conn:
+        df_quad = pd.read_sql_query(query, conn)
 
     # Berechne Mediane
     matheff_median = df_quad['MATHEFF'].median()
@@ -520,3 +521,5 @@ st.markdown("""
 **Hinweis:** Diese App nutzt ausschließlich wissenschaftlich validierte PISA-Instrumente.
 Alle Interpretationen basieren auf etablierten pädagogisch-psychologischen Theorien.
 """)
+
+finish_page()
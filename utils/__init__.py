@@ -14,6 +14,15 @@ Verwendung:
     render_hattie_challenge_widget()
 """
 
+# Tracing-/Profiling-Hooks vor allen weiteren Imports installieren
+# (nur mit PULSE_SQL_TRACE=1 bzw. PULSE_PROFILE=1)
+from . import sql_tracing, startup_profiler
+sql_tracing.install_if_enabled()
+startup_profiler.install_if_enabled()
+
+# Migrationen, Wartung und das Vorwärmen der PISA-Datenbank laufen nicht
+# beim Import, sondern über utils/app_startup.py (von den Seiten aufgerufen)
+
 from .gamification_db import (
     init_database,
     get_or_create_user,
@@ -0,0 +1,96 @@
+"""
+⚡ Adaptives Screening
+======================
+
+Computergestützter adaptiver Kurzmodus (CAT) für das Screening. Statt alle
+Items einer Skala abzufragen, wird nach jeder Antwort das Item mit der
+größten Information am aktuellen Theta gewählt, bis der Standardfehler
+unter ``TARGET_SE`` fällt.
+
+Grundlage sind die GPCM-Parameter aus ``utils/irt_model.py`` (einmalig aus
+PISA ``student_data`` kalibriert). Skalen ohne Kalibrierung (eigene Skalen,
+fehlende Parameterdatei) werden wie bisher vollständig abgefragt.
+
+Zustand ist allein das Antwort-Dict: Die Reihenfolge der beantworteten
+Items ist die Einfügereihenfolge in ``screening_responses``, das nächste
+Item ergibt sich deterministisch daraus. Damit überlebt der Modus jeden
+Streamlit-Rerun ohne zusätzlichen Session-State.
+
+Vergleichbarkeit: ``summarize_scale`` liefert neben Theta/SE den erwarteten
+Mittelwert über *alle* Items der Skala (1-4), also denselben Maßstab wie
+``calculate_scale_score`` bei vollständiger Abfrage.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from utils.irt_model import ItemBank, get_item_bank
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+TARGET_SE = 0.45        # PISA-Metrik (SD ≈ 1) -> Reliabilität ≈ 0.8
+MIN_ITEMS = 2
+MAX_ITEMS = None        # None = bis SE-Ziel oder Bank erschöpft
+
+
+def get_adaptive_bank(scale: str, variables: List[str]) -> Optional[ItemBank]:
+    """
+    Item-Bank für die im Fragebogen angezeigten Items einer Skala.
+
+    Returns:
+        None, wenn die Skala nicht (ausreichend) kalibriert ist oder
+        Items ohne Parameter enthält (z.B. klassenstufen-angepasste MATHEFF-Items)
+    """
+    bank = get_item_bank(scale)
+    if bank is None or not all(v in bank for v in variables) or len(variables) <= MIN_ITEMS:
+        return None
+    return bank.subset(variables)
+
+
+def answered_items(bank: ItemBank, responses: Dict[str, Any]) -> List[str]:
+    """Beantwortete Items der Bank in Antwortreihenfolge."""
+    return [v for v in responses if v in bank and bank.category(v, responses[v]) is not None]
+
+
+def next_item(bank: ItemBank, responses: Dict[str, Any], target_se: float = TARGET_SE,
+              min_items: int = MIN_ITEMS, max_items: Optional[int] = MAX_ITEMS) -> Optional[str]:
+    """
+    Nächstes Item (maximale Information am aktuellen Theta) oder None,
+    wenn die Skala abgeschlossen ist.
+    """
+    answered = answered_items(bank, responses)
+    if len(answered) >= len(bank) or (max_items and len(answered) >= max_items):
+        return None
+
+    theta, se = bank.estimate(responses)
+    if len(answered) >= min_items and se <= target_se:
+        return None
+
+    information = bank.info[:, bank.grid_index(theta)].copy()
+    for variable in answered:
+        information[bank.items.index(variable)] = -np.inf
+    return bank.items[int(np.argmax(information))]
+
+
+def visible_items(bank: ItemBank, responses: Dict[str, Any], **kwargs) -> List[str]:
+    """Beantwortete Items plus (falls nicht fertig) das nächste."""
+    items = answered_items(bank, responses)
+    following = next_item(bank, responses, **kwargs)
+    if following:
+        items.append(following)
+    return items
+
+
+def summarize_scale(bank: ItemBank, responses: Dict[str, Any]) -> Dict[str, Any]:
+    """Ergebnis einer adaptiv erhobenen Skala (für ``results['adaptive']``)."""
+    theta, se = bank.estimate(responses)
+    return {
+        "theta": round(theta, 4),
+        "se": round(se, 4),
+        "score": round(bank.expected_score(theta), 4),
+        "items_used": len(answered_items(bank, responses)),
+        "items_total": len(bank),
+    }
@@ -0,0 +1,56 @@
+"""
+🚦 App-Start
+============
+
+Einmalige Startaufgaben der Streamlit-App.
+
+Sie laufen bewusst NICHT beim Import von ``utils``: CLIs wie
+``python -m utils.load_test`` oder ``utils.benchmarks`` sollen keine
+Hintergrund-Jobs auf der Live-Datenbank starten. Stattdessen ruft jede
+Einstiegsseite (Home und ``pages/*``) direkt nach ``profile_page`` auf:
+
+    from utils.app_startup import run_app_startup
+    run_app_startup()
+
+Streamlit führt bei Direktaufruf einer Unterseite ``Home.py`` nicht aus -
+daher der Aufruf auf jeder Seite. Pro Prozess läuft der Start nur einmal,
+danach ist der Aufruf ein Flag-Check.
+
+Aufgaben:
+- Content Store bauen, falls er fehlt oder veraltet ist (eigener Prozess)
+- Schema-Migrationen der Gamification- und Coaching-DB der aktiven Schule
+  (danach kein DDL im Hot-Path; weitere Schul-Shards beim ersten Zugriff)
+- Retention/Rollup höchstens einmal pro Tag im Hintergrund
+  (``PULSE_MAINTENANCE=0`` deaktiviert)
+- PISA-Datenbank im Hintergrund in den Page-Cache lesen
+  (``PULSE_PISA_PREWARM=0`` deaktiviert)
+"""
+
+import threading
+
+_started = False
+_lock = threading.Lock()
+
+
+def run_app_startup() -> bool:
+    """
+    Führt die Startaufgaben einmal pro Prozess aus.
+
+    Returns:
+        True beim ersten Aufruf im Prozess
+    """
+    global _started
+    if _started:
+        return False
+    with _lock:
+        if _started:
+            return False
+        _started = True
+
+    from . import coaching_db, content_store, maintenance, migrations, pisa_db
+    content_store.ensure_content_store()
+    migrations.ensure_schema()
+    coaching_db.init_database(coaching_db.get_db_path())
+    maintenance.run_maintenance_if_due()
+    pisa_db.prewarm_pisa_cache()
+    return True
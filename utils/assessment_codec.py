@@ -0,0 +1,103 @@
+"""
+🗜️ Assessment-Codec
+===================
+
+Speicherformat für ``assessments.results`` in ``coaching.db``.
+
+- ``results``: zlib-komprimiertes, kompaktes JSON mit allen Item-Antworten
+  und Metadaten, eingeleitet von ``RESULTS_MAGIC``. Alte Zeilen mit
+  unkomprimiertem JSON-Text werden weiterhin gelesen.
+- ``summary``: kleiner JSON-Header (Screening-Stufe, Zeitstempel,
+  Anzahl Items, Score pro Skala, PISA-WLE pro kalibrierter Skala). Verläufe, Listen und Export lesen nur
+  diesen Header; der Blob wird erst für die Item-Ansicht dekodiert.
+
+msgpack/zstd wären etwas kompakter, brauchen aber zusätzliche Pakete -
+zlib + JSON reichen für die typischen 20-60 Antworten pro Screening.
+"""
+
+import json
+import zlib
+from typing import Any, Dict, Optional, Tuple, Union
+
+from utils.scale_scoring import calculate_scale_score, extract_scales_from_responses
+
+RESULTS_MAGIC = b"PLZ1"
+COMPRESSION_LEVEL = 6
+SCORE_DECIMALS = 4
+
+
+def compute_scale_scores(responses: Dict[str, Any]) -> Dict[str, float]:
+    """Score pro Skala aus den Item-Antworten (wie auf der Auswertungs-Seite)."""
+    scores = {}
+    for scale, items in extract_scales_from_responses(responses).items():
+        score = calculate_scale_score(responses, items)
+        if score is not None:
+            scores[scale] = round(score, SCORE_DECIMALS)
+    return scores
+
+
+def compute_wle_scores(responses: Dict[str, Any]) -> Dict[str, float]:
+    """PISA-WLE pro kalibrierter Skala (leer ohne ``irt_parameters.json``)."""
+    if not responses:
+        return {}
+    from utils.wle_scoring import score_responses  # NumPy erst bei Bedarf laden
+    return {scale: values["wle"] for scale, values in score_responses(responses).items()}
+
+
+def build_summary(results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Header eines Assessments (ohne Item-Antworten).
+
+    Adaptiv erhobene Skalen (``results["adaptive"]``) verwenden den
+    erwarteten Skalenmittelwert statt des Mittels der wenigen gestellten Items.
+    """
+    responses = results.get("item_responses", {}) or {}
+    scores = compute_scale_scores(responses)
+    for scale, adaptive in (results.get("adaptive") or {}).items():
+        scores[scale] = round(adaptive["score"], SCORE_DECIMALS)
+    summary = {
+        "screening_level": results.get("screening_level"),
+        "timestamp": results.get("timestamp"),
+        "item_count": len(responses),
+        "scales": scores,
+    }
+    wle = compute_wle_scores(responses)
+    if wle:
+        summary["wle"] = wle
+    return summary
+
+
+def encode_results(results: Dict[str, Any]) -> Tuple[bytes, str]:
+    """
+    Kodiert ein Ergebnis-Dict für die Datenbank.
+
+    Returns:
+        (komprimierter Blob für ``results``, JSON-Header für ``summary``)
+    """
+    payload = json.dumps(results, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    blob = RESULTS_MAGIC + zlib.compress(payload, COMPRESSION_LEVEL)
+    summary = json.dumps(build_summary(results), ensure_ascii=False, separators=(",", ":"))
+    return blob, summary
+
+
+def is_encoded(value: Union[str, bytes, None]) -> bool:
+    return isinstance(value, bytes) and value.startswith(RESULTS_MAGIC)
+
+
+def decode_results(value: Union[str, bytes, None]) -> Dict[str, Any]:
+    """Dekodiert ``results`` (komprimiert oder alter JSON-Text)."""
+    if not value:
+        return {}
+    if is_encoded(value):
+        value = zlib.decompress(value[len(RESULTS_MAGIC):])
+    return json.loads(value)
+
+
+def decode_summary(summary: Optional[str], results: Union[str, bytes, None] = None) -> Dict[str, Any]:
+    """
+    Dekodiert den Header; fehlt er (noch nicht migrierte Zeile), wird er aus
+    ``results`` berechnet.
+    """
+    if summary:
+        return json.loads(summary)
+    return build_summary(decode_results(results))
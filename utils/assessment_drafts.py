@@ -0,0 +1,244 @@
+"""
+💾 Screening-Entwürfe (Autosave)
+================================
+
+Zwischenspeicher für laufende Screenings. Bricht die Verbindung ab oder
+startet der Server neu, kann das Screening dort fortgesetzt werden, wo der
+Schüler aufgehört hat.
+
+Schreibpfad:
+- ``record_response`` legt eine Antwort nur in einen prozessweiten Puffer
+  (pro Schule und Schüler, der letzte Wert je Item gewinnt).
+- Ein Hintergrund-Thread schreibt den Puffer alle ``PULSE_DRAFT_FLUSH_MS``
+  Millisekunden (Standard 1000) oder sobald ``MAX_PENDING`` Antworten
+  anstehen - pro Schule EINE Transaktion für alle Schüler
+  (``save_draft_responses``). Eine Klasse, die gleichzeitig antwortet,
+  erzeugt so etwa einen Schreibvorgang pro Sekunde statt einen pro Klick.
+- ``PULSE_DRAFT_FLUSH_MS=0`` schreibt synchron (ohne Thread).
+
+Lesen/Abschließen:
+- ``load_draft`` = Stand in der DB + noch nicht geschriebene Antworten.
+- ``finalize`` speichert das fertige Assessment und löscht den Entwurf in
+  einer Transaktion (``promote_draft``).
+
+Bei einem harten Absturz gehen höchstens die Antworten des letzten
+Intervalls verloren; beim regulären Beenden schreibt ein ``atexit``-Hook
+den Puffer.
+"""
+
+import atexit
+import os
+import sys
+import threading
+from typing import Any, Dict, Optional
+
+from . import shards
+from .coaching_db import (
+    DRAFT_CONTEXT_KEY,
+    discard_draft,
+    get_draft,
+    promote_draft,
+    save_draft_responses,
+)
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+ENV_FLUSH_MS = "PULSE_DRAFT_FLUSH_MS"
+DEFAULT_FLUSH_MS = 1000
+MAX_PENDING = 500
+
+# Schule -> Schüler -> Variable -> Wert
+Batch = Dict[str, Dict[int, Dict[str, Any]]]
+
+_lock = threading.Lock()         # schützt _pending
+_write_lock = threading.Lock()   # serialisiert Flush, Abschluss und Verwerfen
+_pending: Batch = {}
+_pending_count = 0
+_wakeup = threading.Event()
+_flusher: Optional[threading.Thread] = None
+
+
+def flush_interval() -> float:
+    """Flush-Intervall in Sekunden (0 = synchron schreiben)."""
+    try:
+        return max(0, int(os.environ.get(ENV_FLUSH_MS, DEFAULT_FLUSH_MS))) / 1000
+    except ValueError:
+        return DEFAULT_FLUSH_MS / 1000
+
+
+# ============================================
+# PUFFER
+# ============================================
+
+def _take(school: Optional[str] = None, student_id: Optional[int] = None) -> Batch:
+    """Entnimmt Einträge aus dem Puffer (alle, eine Schule oder einen Schüler)."""
+    global _pending_count
+    with _lock:
+        if school is None:
+            batch = dict(_pending)
+            _pending.clear()
+        elif student_id is None:
+            batch = {school: _pending.pop(school)} if school in _pending else {}
+        else:
+            students = _pending.get(school, {})
+            batch = {school: {student_id: students.pop(student_id)}} if student_id in students else {}
+            if school in _pending and not students:
+                del _pending[school]
+        _pending_count -= sum(len(r) for s in batch.values() for r in s.values())
+    return batch
+
+
+def _requeue(school: str, drafts: Dict[int, Dict[str, Any]]) -> None:
+    """Legt nicht geschriebene Antworten zurück, ohne neuere Werte zu überschreiben."""
+    global _pending_count
+    with _lock:
+        students = _pending.setdefault(school, {})
+        for student_id, responses in drafts.items():
+            current = students.setdefault(student_id, {})
+            for variable_name, value in responses.items():
+                if variable_name not in current:
+                    current[variable_name] = value
+                    _pending_count += 1
+
+
+def _write(batch: Batch) -> int:
+    written = 0
+    for school, drafts in batch.items():
+        try:
+            with shards.use_school(school):
+                written += save_draft_responses(drafts)
+        except Exception as e:
+            print(f"⚠️ Screening-Entwürfe nicht gespeichert ({school}): {e}", file=sys.stderr)
+            _requeue(school, drafts)
+    return written
+
+
+def flush(student_id: Optional[int] = None) -> int:
+    """
+    Schreibt den Puffer sofort.
+
+    Args:
+        student_id: nur diesen Schüler der aktuellen Schule (None = alles)
+
+    Returns:
+        Anzahl geschriebener Antworten
+    """
+    with _write_lock:
+        if student_id is None:
+            return _write(_take())
+        return _write(_take(shards.get_current_school(), student_id))
+
+
+def _run() -> None:
+    while True:
+        _wakeup.wait(flush_interval() or DEFAULT_FLUSH_MS / 1000)
+        _wakeup.clear()
+        flush()
+
+
+def _ensure_flusher() -> None:
+    global _flusher
+    if _flusher is not None:
+        return
+    with _lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_run, name="pulse-draft-autosave", daemon=True)
+            _flusher.start()
+            atexit.register(flush)
+
+
+# ============================================
+# API
+# ============================================
+
+def record_responses(student_id: int, responses: Dict[str, Any]) -> int:
+    """
+    Puffert Antworten eines Schülers (geschrieben wird spätestens nach einem Intervall).
+
+    Returns:
+        Anzahl gepufferter Antworten im Prozess
+    """
+    global _pending_count
+    if not responses:
+        return _pending_count
+    school = shards.get_current_school()
+    with _lock:
+        current = _pending.setdefault(school, {}).setdefault(student_id, {})
+        for variable_name, value in responses.items():
+            if variable_name not in current:
+                _pending_count += 1
+            current[variable_name] = value
+        full = _pending_count >= MAX_PENDING
+
+    if not flush_interval():
+        flush(student_id)
+        return _pending_count
+    _ensure_flusher()
+    if full:
+        _wakeup.set()
+    return _pending_count
+
+
+def record_response(student_id: int, variable_name: str, value: Any) -> int:
+    """Puffert eine einzelne Antwort."""
+    return record_responses(student_id, {variable_name: value})
+
+
+def start_draft(student_id: int, context: Dict[str, Any],
+                responses: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Beginnt einen neuen Entwurf (ein älterer Entwurf des Schülers wird ersetzt).
+
+    Args:
+        context: Rahmen des Screenings (Stufe, Skalen) für das Fortsetzen
+        responses: bereits vorhandene Antworten
+    """
+    discard(student_id)
+    record_responses(student_id, {DRAFT_CONTEXT_KEY: context, **(responses or {})})
+
+
+def load_draft(student_id: int) -> Optional[Dict]:
+    """
+    Laufendes Screening eines Schülers inkl. noch nicht geschriebener Antworten.
+
+    Returns:
+        {'responses', 'context', 'updated_at'} oder None
+    """
+    draft = get_draft(student_id)
+    with _lock:
+        pending = dict(_pending.get(shards.get_current_school(), {}).get(student_id, {}))
+    if not pending:
+        return draft
+
+    draft = draft or {'responses': {}, 'context': None, 'updated_at': None}
+    context = pending.pop(DRAFT_CONTEXT_KEY, None)
+    if context is not None:
+        draft['context'] = context
+    draft['responses'].update(pending)
+    return draft
+
+
+def finalize(student_id: int, results_dict: Dict, notes: str = None) -> Optional[int]:
+    """
+    Speichert das fertige Assessment und löscht den Entwurf (eine Transaktion).
+
+    Noch gepufferte Antworten sind in ``results_dict`` enthalten und werden
+    verworfen.
+    """
+    with _write_lock:
+        _take(shards.get_current_school(), student_id)
+        return promote_draft(student_id, results_dict, notes)
+
+
+def discard(student_id: int) -> int:
+    """Verwirft den Entwurf eines Schülers (Puffer und DB)."""
+    with _write_lock:
+        _take(shards.get_current_school(), student_id)
+        return discard_draft(student_id)
+
+
+def pending_count() -> int:
+    """Anzahl gepufferter, noch nicht geschriebener Antworten."""
+    return _pending_count
@@ -21,6 +21,12 @@ from datetime import datetime, timedelta
 import sqlite3
 from typing import Dict, List, Any, Optional
 import json
+from pathlib import Path
+
+from utils import shards
+from utils.fragments import widget_fragment, rerun_widget
+from utils.preview_store import connect_db
+from utils.storage import routed
 
 # ============================================
 # BANDURA SOURCES KONFIGURATION
@@ -179,58 +185,86 @@ BANDURA_BADGES = {
 # DATABASE FUNCTIONS
 # ============================================
 
-def get_db_path():
-    """Gibt den Pfad zur SQLite-Datenbank zurück."""
-    from pathlib import Path
-    if Path("/tmp").exists() and Path("/tmp").is_dir():
-        db_dir = Path("/tmp")
-    else:
-        db_dir = Path(__file__).parent.parent / "data"
-        db_dir.mkdir(exist_ok=True)
-    return db_dir / "hattie_gamification.db"
+# Einträge pro Tag und Quelle: Rohdaten plus Tages-Aggregate der Retention
+# (utils/maintenance.py). Parameter: (user_id, user_id)
+BANDURA_DAYS_SQL = '''
+    SELECT entry_date, source_type, COUNT(*) AS entry_count
+    FROM bandura_entries WHERE user_id = ?
+    GROUP BY entry_date, source_type
+    UNION ALL
+    SELECT entry_date, source_type, entry_count
+    FROM bandura_daily WHERE user_id = ?
+'''
+
+def get_db_path() -> Path:
+    """Gibt den Pfad zur SQLite-Datenbank der aktiven Schule zurück (siehe utils/shards.py)."""
+    return shards.get_db_path("gamification")
 
 def init_bandura_tables():
-    """Initialisiert die Bandura-spezifischen Tabellen."""
-    conn = sqlite3.connect(get_db_path())
-    c = conn.cursor()
+    """Stellt sicher, dass die Bandura-Tabellen migriert sind (siehe utils/migrations.py)."""
+    from utils.migrations import ensure_schema
+    ensure_schema(get_db_path())
 
-    # Bandura Entries Tabelle
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS bandura_entries (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            entry_date DATE NOT NULL,
-            source_type TEXT NOT NULL,
-            description TEXT NOT NULL,
-            xp_earned INTEGER DEFAULT 0,
-            FOREIGN KEY (user_id) REFERENCES users(user_id)
-        )
-    ''')
+def entry_xp(source_type: str, description: str) -> int:
+    """Basis-XP eines Eintrags (Quelle + Bonus für ausführliche Reflexion)."""
+    base_xp = BANDURA_SOURCES.get(source_type, {}).get("xp", XP_CONFIG["base_entry"])
+    if len(description) > 50:
+        base_xp += XP_CONFIG["detailed_reflection"]
+    return base_xp
 
-    # Index für Performance
-    c.execute('CREATE INDEX IF NOT EXISTS idx_bandura_user_date ON bandura_entries(user_id, entry_date)')
-    c.execute('CREATE INDEX IF NOT EXISTS idx_bandura_source ON bandura_entries(source_type)')
+def current_day_streak(dates: List[str], today=None) -> int:
+    """Aktueller Streak aus absteigend sortierten ISO-Tagen (heute oder gestern muss dabei sein)."""
+    if not dates:
+        return 0
 
-    conn.commit()
-    conn.close()
+    today = today or datetime.now().date()
+    today_str = today.isoformat()
+    yesterday_str = (today - timedelta(days=1)).isoformat()
+
+    if dates[0] != today_str and dates[0] != yesterday_str:
+        return 0
 
+    # Zähle aufeinanderfolgende Tage
+    streak = 1
+    for i in range(len(dates) - 1):
+        current = datetime.fromisoformat(dates[i]).date()
+        previous = datetime.fromisoformat(dates[i + 1]).date()
+
+        if (current - previous).days == 1:
+            streak += 1
+        else:
+            break
+
+    return streak
+
+def longest_day_streak(dates: List[str]) -> int:
+    """Längster Streak aus aufsteigend sortierten ISO-Tagen."""
+    if not dates:
+        return 0
+    longest_streak = 0
+    current_streak = 1
+    for i in range(1, len(dates)):
+        prev_date = datetime.fromisoformat(dates[i-1]).date()
+        curr_date = datetime.fromisoformat(dates[i]).date()
+        if (curr_date - prev_date).days == 1:
+            current_streak += 1
+        else:
+            longest_streak = max(longest_streak, current_streak)
+            current_streak = 1
+    return max(longest_streak, current_streak)
+
+@routed("bandura.create_entry")
 def create_bandura_entry(user_id: str, source_type: str, description: str) -> Dict[str, Any]:
     """Erstellt einen neuen Bandura-Eintrag."""
     init_bandura_tables()
-    conn = sqlite3.connect(get_db_path())
+    conn = connect_db(get_db_path(), user_id)
     conn.row_factory = sqlite3.Row
     c = conn.cursor()
 
     today = datetime.now().date().isoformat()
 
-    # Basis-XP berechnen
-    source_info = BANDURA_SOURCES.get(source_type, {})
-    base_xp = source_info.get("xp", XP_CONFIG["base_entry"])
-
-    # Bonus für ausführliche Reflexion
-    if len(description) > 50:
-        base_xp += XP_CONFIG["detailed_reflection"]
+    # Basis-XP berechnen (inkl. Bonus für ausführliche Reflexion)
+    base_xp = entry_xp(source_type, description)
 
     # Eintrag erstellen
     c.execute('''
@@ -289,7 +323,8 @@ def create_bandura_entry(user_id: str, source_type: str, description: str) -> Di
         old_level = user_row['level'] or 1
 
         c.execute('''
-            UPDATE users SET xp_total = ?, level = ?, last_activity_date = ?
+            UPDATE users SET xp_total = ?, level = ?, last_activity_date = ?,
+                             version = COALESCE(version, 0) + 1
             WHERE user_id = ?
         ''', (new_xp, new_level, today, user_id))
 
@@ -302,6 +337,10 @@ def create_bandura_entry(user_id: str, source_type: str, description: str) -> Di
     conn.commit()
     conn.close()
 
+    if user_row:
+        from utils.gamification_db import mark_user_written
+        mark_user_written(user_id)
+
     return {
         "entry_id": entry_id,
         "source_type": source_type,
@@ -328,69 +367,43 @@ def calculate_level(xp: int) -> int:
 
 def calculate_bandura_streak(user_id: str, cursor) -> int:
     """Berechnet den aktuellen Bandura-Streak."""
-    today = datetime.now().date()
-
     # Hole alle Tage mit Einträgen (absteigend sortiert)
-    cursor.execute('''
-        SELECT DISTINCT entry_date FROM bandura_entries
-        WHERE user_id = ?
+    cursor.execute(f'''
+        SELECT DISTINCT entry_date FROM ({BANDURA_DAYS_SQL})
         ORDER BY entry_date DESC
-    ''', (user_id,))
-
-    dates = [row[0] for row in cursor.fetchall()]
-
-    if not dates:
-        return 0
-
-    # Prüfe ob heute oder gestern dabei ist
-    today_str = today.isoformat()
-    yesterday_str = (today - timedelta(days=1)).isoformat()
-
-    if dates[0] != today_str and dates[0] != yesterday_str:
-        return 0 if dates[0] != today_str else 1
-
-    # Zähle aufeinanderfolgende Tage
-    streak = 1
-    for i in range(len(dates) - 1):
-        current = datetime.fromisoformat(dates[i]).date()
-        previous = datetime.fromisoformat(dates[i + 1]).date()
-
-        if (current - previous).days == 1:
-            streak += 1
-        else:
-            break
+    ''', (user_id, user_id))
 
-    return streak
+    return current_day_streak([row[0] for row in cursor.fetchall()])
 
+@routed("bandura.get_stats")
 def get_bandura_stats(user_id: str) -> Dict[str, Any]:
     """Holt Bandura-spezifische Statistiken."""
     init_bandura_tables()
-    conn = sqlite3.connect(get_db_path())
+    conn = connect_db(get_db_path(), user_id)
     conn.row_factory = sqlite3.Row
     c = conn.cursor()
 
     stats = {}
 
-    # Gesamt-Einträge
-    c.execute("SELECT COUNT(*) FROM bandura_entries WHERE user_id = ?", (user_id,))
-    stats["bandura_total"] = c.fetchone()[0]
-
-    # Einträge pro Quelle
+    # Einträge pro Quelle (inkl. verdichteter Tage)
+    c.execute(f'''
+        SELECT source_type, SUM(entry_count) FROM ({BANDURA_DAYS_SQL})
+        GROUP BY source_type
+    ''', (user_id, user_id))
+    per_source = dict(c.fetchall())
     for source in BANDURA_SOURCES.keys():
-        c.execute('''
-            SELECT COUNT(*) FROM bandura_entries
-            WHERE user_id = ? AND source_type = ?
-        ''', (user_id, source))
-        stats[f"bandura_{source}"] = c.fetchone()[0]
+        stats[f"bandura_{source}"] = per_source.get(source, 0)
+
+    # Gesamt-Einträge
+    stats["bandura_total"] = sum(per_source.values())
 
     # Tage mit allen 4 Quellen
-    c.execute('''
+    c.execute(f'''
         SELECT entry_date, COUNT(DISTINCT source_type) as source_count
-        FROM bandura_entries
-        WHERE user_id = ?
+        FROM ({BANDURA_DAYS_SQL})
         GROUP BY entry_date
         HAVING source_count = 4
-    ''', (user_id,))
+    ''', (user_id, user_id))
     stats["bandura_all_four_days"] = len(c.fetchall())
 
     # Heutiger Status
@@ -405,41 +418,28 @@ def get_bandura_stats(user_id: str) -> Dict[str, Any]:
     stats["bandura_streak"] = calculate_bandura_streak(user_id, c)
 
     # Längster Streak - Python-basierte Berechnung
-    c.execute('''
-        SELECT DISTINCT entry_date FROM bandura_entries
-        WHERE user_id = ?
+    c.execute(f'''
+        SELECT DISTINCT entry_date FROM ({BANDURA_DAYS_SQL})
         ORDER BY entry_date
-    ''', (user_id,))
-    all_dates = [row[0] for row in c.fetchall()]
-
-    longest_streak = 0
-    if all_dates:
-        current_streak = 1
-        for i in range(1, len(all_dates)):
-            prev_date = datetime.fromisoformat(all_dates[i-1]).date()
-            curr_date = datetime.fromisoformat(all_dates[i]).date()
-            if (curr_date - prev_date).days == 1:
-                current_streak += 1
-            else:
-                longest_streak = max(longest_streak, current_streak)
-                current_streak = 1
-        longest_streak = max(longest_streak, current_streak)
+    ''', (user_id, user_id))
+    longest_streak = longest_day_streak([row[0] for row in c.fetchall()])
 
     stats["bandura_longest_streak"] = max(longest_streak, stats["bandura_streak"])
 
     conn.close()
     return stats
 
+@routed("bandura.get_entries")
 def get_bandura_entries(user_id: str, limit: int = 10) -> List[Dict]:
     """Holt die letzten Bandura-Einträge."""
-    conn = sqlite3.connect(get_db_path())
+    conn = connect_db(get_db_path(), user_id)
     conn.row_factory = sqlite3.Row
     c = conn.cursor()
 
     c.execute('''
         SELECT * FROM bandura_entries
         WHERE user_id = ?
-        ORDER BY created_at DESC
+        ORDER BY created_at DESC, id DESC
         LIMIT ?
     ''', (user_id, limit))
 
@@ -499,6 +499,7 @@ def render_source_card(source_id: str, source_info: Dict, completed_today: bool)
     </div>
     """, unsafe_allow_html=True)
 
+@widget_fragment("bandura_sources")
 def render_bandura_sources_widget(compact: bool = False, color: str = "#9C27B0"):
     """
     Rendert das komplette Bandura-Quellen Widget.
@@ -508,14 +509,15 @@ def render_bandura_sources_widget(compact: bool = False, color: str = "#9C27B0")
         color: Primärfarbe für das Widget
     """
     from utils.hattie_challenge_widget import get_user_id, init_widget_state
-    from utils.gamification_db import init_database, get_or_create_user
+    from utils.gamification_db import init_database
     from utils.gamification_ui import render_level_card, render_new_badge_celebration
+    from utils.user_system import get_cached_user
 
     init_database()
     init_bandura_tables()
 
     user_id = get_user_id()
-    user = get_or_create_user(user_id)
+    user = get_cached_user(user_id)
     bandura_stats = get_bandura_stats(user_id)
 
     # Merge user stats into bandura_stats for portfolio/certificate
@@ -638,7 +640,7 @@ def render_entry_tab(user_id: str, stats: Dict, sources_today: List[str]):
                 # Speichere Ergebnis für Anzeige
                 st.session_state["last_bandura_result"] = result
                 st.session_state["last_bandura_source"] = source_info
-                st.rerun()
+                rerun_widget()
 
     # Zeige letztes Ergebnis falls vorhanden
     if "last_bandura_result" in st.session_state:
@@ -787,9 +789,10 @@ def render_history_tab(user_id: str):
 # PORTFOLIO & CERTIFICATE
 # ============================================
 
+@routed("bandura.get_entries_by_source")
 def get_all_entries_by_source(user_id: str) -> Dict[str, List[Dict]]:
     """Holt alle Einträge gruppiert nach Quelle."""
-    conn = sqlite3.connect(get_db_path())
+    conn = connect_db(get_db_path(), user_id)
     conn.row_factory = sqlite3.Row
     c = conn.cursor()
 
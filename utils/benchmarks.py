@@ -0,0 +1,390 @@
+"""
+📏 Benchmarks
+=============
+
+Benchmark-Suite für die Hot Paths (Scoring, Laden, Badges, Rendering)
+mit festen synthetischen Fixtures. Ergebnisse können als JSON-Baseline
+gespeichert und spätere Läufe damit verglichen werden, um den Effekt
+einzelner Optimierungen zu sehen.
+
+Verwendung:
+    python -m utils.benchmarks --save-baseline     # Baseline anlegen
+    python -m utils.benchmarks                     # Mit Baseline vergleichen
+    python -m utils.benchmarks -k badge --fail-on-regression
+"""
+
+import argparse
+import inspect
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import timeit
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+BENCHMARK_DIR = Path(__file__).parent.parent / "data" / "benchmarks"
+BASELINE_PATH = BENCHMARK_DIR / "baseline.json"
+
+ROUNDS = 5
+REGRESSION_THRESHOLD = 0.10     # ±10 % gelten als Rauschen
+
+SEED = 20220  # Feste Fixtures über alle Läufe
+
+# name -> Factory, die (ggf. nach Setup) die zu messende Funktion liefert.
+# Braucht ein Benchmark Aufräumarbeiten, ist die Factory ein Generator, der
+# die Funktion per ``yield`` liefert - der Code danach läuft nach der Messung.
+BENCHMARKS: Dict[str, Callable[[], Callable[[], Any]]] = {}
+
+
+class SkipBenchmark(Exception):
+    """Voraussetzung fehlt (z.B. PISA-Datenbank nicht vorhanden)."""
+
+
+def benchmark(name: str):
+    """Registriert eine Benchmark-Factory."""
+    def decorator(factory):
+        BENCHMARKS[name] = factory
+        return factory
+    return decorator
+
+
+# ============================================
+# FIXTURES
+# ============================================
+
+def make_screening_responses(seed: int = SEED) -> Dict[str, int]:
+    """Synthetische Screening-Antworten (eigene und PISA-Items gemischt)."""
+    rng = random.Random(seed)
+    responses = {}
+    for scale in ["MATHEFF", "GENEFF", "EXT_LEARNSTRAT", "EXT_METACOG", "EXT_MOTIV", "EXT_FOCUS"]:
+        for i in range(1, 9):
+            responses[f"{scale}_Q{i:02d}"] = rng.randint(1, 4)
+    for prefix in ["ST292", "ST034", "ST270", "ST268", "ST038"]:
+        for i in range(1, 7):
+            responses[f"{prefix}Q{i:02d}JA"] = rng.randint(1, 4)
+    return responses
+
+
+def make_badge_stats(seed: int = SEED) -> List[Dict[str, Any]]:
+    """Verschiedene User-Profile für die Badge-Prüfung."""
+    rng = random.Random(seed)
+    profiles = []
+    for _ in range(20):
+        profiles.append({
+            "completed_by_category": {
+                "autonomie": rng.randint(0, 10),
+                "kompetenz": rng.randint(0, 10),
+                "verbundenheit": rng.randint(0, 10),
+            },
+            "total_completed": rng.randint(0, 40),
+            "current_streak": rng.randint(0, 30),
+            "longest_streak": rng.randint(0, 60),
+            "challenge_counts": {f"us_{i}": rng.randint(1, 5) for i in range(10)},
+            "completed_age_groups": ["unterstufe"],
+            "last_activity_date": datetime.now().date(),
+            "activity_hour": rng.randint(0, 23),
+            "days_since_last": rng.randint(0, 10),
+        })
+    return profiles
+
+
+def make_activity_data(days: int = 84, seed: int = SEED) -> List[Dict[str, Any]]:
+    """Aktivitätsdaten im Format von ``get_activity_heatmap``."""
+    rng = random.Random(seed)
+    today = datetime.now().date()
+    return [
+        {"challenge_date": (today - timedelta(days=d)).isoformat(), "count": rng.randint(1, 5)}
+        for d in range(days) if rng.random() < 0.6
+    ]
+
+
+@contextmanager
+def _temp_gamification_db() -> Iterator[Path]:
+    """Leitet die Gamification-Module auf eine Temp-Datenbank um (und wieder zurück)."""
+    from utils import gamification_db, user_system, bandura_sources_widget
+
+    modules = (gamification_db, user_system, bandura_sources_widget)
+    originals = [module.get_db_path for module in modules]
+    with tempfile.TemporaryDirectory(prefix="pulse_bench_") as tmp_dir:
+        db_path = Path(tmp_dir) / "hattie_gamification.db"
+        for module in modules:
+            module.get_db_path = lambda: db_path
+        try:
+            yield db_path
+        finally:
+            for module, original in zip(modules, originals):
+                module.get_db_path = original
+
+
+# ============================================
+# BENCHMARKS
+# ============================================
+
+@benchmark("scoring.extract_scales_from_responses")
+def bench_extract_scales():
+    from utils.scale_scoring import extract_scales_from_responses
+    responses = make_screening_responses()
+    return lambda: extract_scales_from_responses(responses)
+
+
+@benchmark("scoring.calculate_scale_score")
+def bench_calculate_scale_score():
+    from utils.scale_scoring import extract_scales_from_responses, calculate_scale_score
+    responses = make_screening_responses()
+    scales = extract_scales_from_responses(responses)
+
+    def run():
+        for items in scales.values():
+            calculate_scale_score(responses, items)
+    return run
+
+
+@benchmark("scoring.wle_class")
+def bench_wle_class():
+    from utils.irt_model import load_item_banks
+    from utils.wle_scoring import score_class
+    banks = load_item_banks()
+    if not banks:
+        raise SkipBenchmark("data/irt_parameters.json fehlt (python -m utils.irt_model)")
+
+    # 300 Schüler, 10 % fehlende Antworten
+    rng = random.Random(SEED)
+    responses = [
+        {item: rng.randint(1, 4) for bank in banks.values() for item in bank.items if rng.random() > 0.1}
+        for _ in range(300)
+    ]
+    return lambda: score_class(responses)
+
+
+@benchmark("evidence.interpret_score_with_evidence")
+def bench_interpret_score():
+    from utils.evidence_integration import interpret_score_with_evidence, get_all_scales_with_evidence, get_evidence
+    # Externe Skalen haben keine Schwellenwerte und werden nicht interpretiert
+    scales = [s for s in get_all_scales_with_evidence() if get_evidence(s).get("thresholds")]
+    scores = [1.0 + 0.25 * i for i in range(13)]
+
+    def run():
+        for scale in scales:
+            for score in scores:
+                interpret_score_with_evidence(scale, score)
+    return run
+
+
+@benchmark("evidence.interpret_many")
+def bench_interpret_many():
+    import numpy as np
+    from utils.evidence_integration import interpret_many, get_all_scales_with_evidence
+    scales = get_all_scales_with_evidence()
+    rng = random.Random(SEED)
+    # Eine Schule: 300 Schüler × alle Skalen
+    scores = np.array([[1.0 + 3.0 * rng.random() for _ in scales] for _ in range(300)])
+    return lambda: interpret_many(scores, scales)
+
+
+@benchmark("loading.load_items_for_scales")
+def bench_load_items_for_scales():
+    if not Path("pisa_2022_germany.db").exists():
+        raise SkipBenchmark("pisa_2022_germany.db nicht im Arbeitsverzeichnis")
+    from utils.questionnaire_builder import load_items_for_scales
+    scales = ["MATHEFF", "ANXMAT", "BELONG", "TEACHSUP", "PERSEVAGR"]
+    return lambda: load_items_for_scales(scales)
+
+
+@benchmark("gamification.get_user_stats")
+def bench_get_user_stats():
+    from utils import gamification_db
+
+    with _temp_gamification_db():
+        gamification_db.init_database()
+
+        rng = random.Random(SEED)
+        user_id = "bench_user"
+        gamification_db.get_or_create_user(user_id, "Benchmark")
+        for _ in range(200):
+            prediction = rng.randint(40, 90)
+            challenge_id = gamification_db.create_challenge(user_id, "Mathe", prediction, "Test")
+            gamification_db.complete_challenge(challenge_id, prediction + rng.randint(-10, 15))
+
+        yield lambda: gamification_db.get_user_stats(user_id)
+
+
+@benchmark("badges.check_badge_condition_all")
+def bench_check_badges():
+    from utils.motivation_challenges.motivation_badges import MOTIVATION_BADGES, check_badge_condition
+    profiles = make_badge_stats()
+    badge_ids = list(MOTIVATION_BADGES)
+
+    def run():
+        for stats in profiles:
+            for badge_id in badge_ids:
+                check_badge_condition(badge_id, stats)
+    return run
+
+
+@benchmark("certificates.powertechniken")
+def bench_certificate_powertechniken():
+    from utils.learnstrat_challenges.certificate_generator import generate_powertechniken_certificate
+    return lambda: generate_powertechniken_certificate("Max Mustermann", ["pomodoro", "feynman", "loci"], 420, "01.01.2025")
+
+
+@benchmark("certificates.transfer")
+def bench_certificate_transfer():
+    from utils.learnstrat_challenges.certificate_generator import generate_transfer_certificate
+    return lambda: generate_transfer_certificate("Max Mustermann", 300, "01.01.2025")
+
+
+@benchmark("certificates.birkenbihl")
+def bench_certificate_birkenbihl():
+    from utils.learnstrat_challenges.certificate_generator import generate_birkenbihl_certificate
+    return lambda: generate_birkenbihl_certificate("Max Mustermann", 300, "01.01.2025")
+
+
+@benchmark("ui.render_activity_heatmap")
+def bench_render_heatmap():
+    from utils.gamification_ui import render_activity_heatmap
+    data = make_activity_data()
+    return lambda: render_activity_heatmap(data, weeks=12)
+
+
+# ============================================
+# MESSUNG & VERGLEICH
+# ============================================
+
+def measure(func: Callable[[], Any], rounds: int = ROUNDS) -> Dict[str, Any]:
+    """Misst eine Funktion (Zeit pro Aufruf in ms, je Runde mind. 0,2 s)."""
+    func()  # Warm-up (Caches, Imports)
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    timings = [t / number * 1000 for t in timer.repeat(repeat=rounds, number=number)]
+    return {
+        "min_ms": round(min(timings), 4),
+        "median_ms": round(statistics.median(timings), 4),
+        "number": number,
+        "rounds": rounds,
+    }
+
+
+def run_benchmarks(name_filter: Optional[str] = None) -> Dict[str, Any]:
+    """Führt alle (gefilterten) Benchmarks aus."""
+    results = {}
+    for name, factory in BENCHMARKS.items():
+        if name_filter and name_filter not in name:
+            continue
+        try:
+            func = factory()
+            if inspect.isgenerator(func):
+                setup = func
+                try:
+                    results[name] = measure(next(setup))
+                finally:
+                    setup.close()
+            else:
+                results[name] = measure(func)
+        except SkipBenchmark as e:
+            results[name] = {"skipped": str(e)}
+        except Exception as e:
+            results[name] = {"error": f"{type(e).__name__}: {e}"}
+
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any],
+            threshold: float = REGRESSION_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Vergleicht einen Lauf mit der Baseline (Median pro Aufruf).
+
+    Returns:
+        Liste mit name, baseline_ms, current_ms, ratio, status
+        (status: "schneller", "langsamer", "gleich", "neu")
+    """
+    rows = []
+    for name, result in current["results"].items():
+        if "median_ms" not in result:
+            continue
+        base = baseline.get("results", {}).get(name, {})
+        if "median_ms" not in base:
+            rows.append({"name": name, "baseline_ms": None, "current_ms": result["median_ms"],
+                         "ratio": None, "status": "neu"})
+            continue
+        ratio = result["median_ms"] / base["median_ms"] if base["median_ms"] else 1.0
+        if ratio > 1 + threshold:
+            status = "langsamer"
+        elif ratio < 1 - threshold:
+            status = "schneller"
+        else:
+            status = "gleich"
+        rows.append({"name": name, "baseline_ms": base["median_ms"], "current_ms": result["median_ms"],
+                     "ratio": round(ratio, 3), "status": status})
+    return rows
+
+
+def print_results(current: Dict[str, Any], comparison: Optional[List[Dict[str, Any]]] = None) -> None:
+    icons = {"schneller": "🟢", "langsamer": "🔴", "gleich": "⚪", "neu": "🆕"}
+    by_name = {row["name"]: row for row in comparison or []}
+
+    print(f"{'Benchmark':<42}{'median ms':>12}{'min ms':>12}{'Baseline':>12}{'Δ':>9}")
+    for name, result in current["results"].items():
+        if "skipped" in result:
+            print(f"{name:<42}  übersprungen: {result['skipped']}")
+            continue
+        if "error" in result:
+            print(f"{name:<42}  ❌ {result['error']}")
+            continue
+        row = by_name.get(name)
+        base = f"{row['baseline_ms']:.4f}" if row and row["baseline_ms"] is not None else "-"
+        delta = ""
+        if row and row["ratio"] is not None:
+            delta = f"{icons[row['status']]} {(row['ratio'] - 1) * 100:+.0f}%"
+        print(f"{name:<42}{result['median_ms']:>12.4f}{result['min_ms']:>12.4f}{base:>12}{delta:>9}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark-Suite für die Hot Paths")
+    parser.add_argument("-k", dest="name_filter", help="Nur Benchmarks, deren Name den Text enthält")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline-Datei zum Vergleich")
+    parser.add_argument("--save-baseline", action="store_true", help="Ergebnis als neue Baseline speichern")
+    parser.add_argument("--save", type=Path, help="Ergebnis zusätzlich unter diesem Pfad speichern")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="Exit-Code 1, wenn ein Benchmark langsamer als die Baseline ist")
+    args = parser.parse_args(argv)
+
+    current = run_benchmarks(args.name_filter)
+
+    comparison = None
+    if args.baseline.exists() and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            comparison = compare(current, json.load(f), args.threshold)
+
+    print_results(current, comparison)
+
+    targets = [args.save] if args.save else []
+    if args.save_baseline:
+        targets.append(args.baseline)
+    for target in targets:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"💾 Gespeichert: {target}")
+
+    if args.fail_on_regression and comparison and any(r["status"] == "langsamer" for r in comparison):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""
+📈 Diagramme der Auswertung
+===========================
+
+Plotly-Figuren für die Auswertungsseite (Tachos, Effektstärken, Balken).
+
+Caching:
+- Figuren hängen nur von wenigen Werten ab (Skalenwert auf 2 Nachkommastellen,
+  Farbe, d-Wert). Sie werden einmal pro Prozess gebaut und per
+  ``lru_cache`` wiederverwendet - Reruns und andere Schüler mit gleichem
+  Wert sparen den Aufbau (``go.Indicator`` validiert jedes Attribut).
+- ``st.plotly_chart`` serialisiert über ``to_dict()`` und verändert die
+  Figur nicht. Aufrufer dürfen zurückgegebene Figuren ebenfalls nicht
+  verändern.
+
+Sammelansicht: ``combined_score_gauges``/``combined_effect_gauges`` zeichnen
+alle Tachos als Raster in EINER Figur - ein Plotly-Payload statt einem pro
+Skala.
+"""
+
+import math
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import plotly.graph_objects as go
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+FIGURE_CACHE_SIZE = 512
+SCORE_DECIMALS = 2              # Anzeige "x.xx / 4.0"
+COMBINED_COLUMNS = 3
+COMBINED_ROW_HEIGHT = 190
+
+SCORE_STEPS = [
+    {'range': [1, 2], 'color': '#ffcccc'},
+    {'range': [2, 2.5], 'color': '#ffe6cc'},
+    {'range': [2.5, 3], 'color': '#ffffcc'},
+    {'range': [3, 3.5], 'color': '#e6ffcc'},
+    {'range': [3.5, 4], 'color': '#ccffcc'}
+]
+
+EFFECT_STEPS = [
+    {'range': [0, 0.2], 'color': '#f0f0f0'},
+    {'range': [0.2, 0.4], 'color': '#e0e0e0'},
+    {'range': [0.4, 0.6], 'color': '#fff3cd'},
+    {'range': [0.6, 0.8], 'color': '#cce5ff'},
+    {'range': [0.8, 1.2], 'color': '#d4edda'}
+]
+
+# (Mindest-d, Farbe) absteigend - wie get_effect_size_category
+EFFECT_COLORS = [(0.8, "#00cc88"), (0.6, "#4ecdc4"), (0.4, "#FFD700")]
+EFFECT_DEFAULT_COLOR = "#808080"
+
+# Eintrag der Sammelansicht: (Titel, Wert, Farbe)
+GaugeEntry = Tuple[str, float, str]
+
+
+def score_bucket(score: float) -> float:
+    """Skalenwert, wie er angezeigt wird (Cache-Schlüssel)."""
+    return round(float(score), SCORE_DECIMALS)
+
+
+def effect_color(d_value: float) -> str:
+    for threshold, color in EFFECT_COLORS:
+        if d_value >= threshold:
+            return color
+    return EFFECT_DEFAULT_COLOR
+
+
+# ============================================
+# INDIKATOREN
+# ============================================
+
+def _score_indicator(score: float, color: str, font_size: int = 20, **kwargs) -> go.Indicator:
+    return go.Indicator(
+        mode="gauge+number",
+        value=score,
+        gauge={
+            'axis': {'range': [1, 4], 'tickwidth': 1},
+            'bar': {'color': color},
+            'steps': SCORE_STEPS,
+            'threshold': {
+                'line': {'color': "black", 'width': 2},
+                'thickness': 0.75,
+                'value': 2.5
+            }
+        },
+        number={'suffix': " / 4.0", 'font': {'size': font_size}},
+        **kwargs
+    )
+
+
+def _effect_indicator(d_value: float, font_size: int = 24, **kwargs) -> go.Indicator:
+    return go.Indicator(
+        mode="gauge+number",
+        value=d_value,
+        number={'suffix': "", 'font': {'size': font_size}},
+        gauge={
+            'axis': {'range': [0, 1.2], 'tickwidth': 1, 'tickcolor': "darkgray",
+                     'tickvals': [0, 0.2, 0.4, 0.6, 0.8, 1.0, 1.2],
+                     'ticktext': ['0', '0.2', '0.4\n(Umschlag)', '0.6', '0.8', '1.0', '1.2']},
+            'bar': {'color': effect_color(d_value), 'thickness': 0.75},
+            'bgcolor': "white",
+            'borderwidth': 2,
+            'bordercolor': "gray",
+            'steps': EFFECT_STEPS,
+            'threshold': {
+                'line': {'color': "red", 'width': 3},
+                'thickness': 0.8,
+                'value': 0.4
+            }
+        },
+        **kwargs
+    )
+
+
+# ============================================
+# EINZELFIGUREN
+# ============================================
+
+@lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def _score_gauge(score: float, color: str) -> go.Figure:
+    fig = go.Figure(_score_indicator(score, color, domain={'x': [0, 1], 'y': [0, 1]}))
+    fig.update_layout(height=200, margin=dict(l=20, r=20, t=30, b=20))
+    return fig
+
+
+def score_gauge(score: float, color: str) -> go.Figure:
+    """Tacho für einen Skalenwert (1-4), gecacht pro (Wert, Farbe)."""
+    return _score_gauge(score_bucket(score), color)
+
+
+@lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def effect_size_gauge(d_value: float) -> go.Figure:
+    """Tacho für eine Hattie-Effektstärke, gecacht pro d-Wert."""
+    fig = go.Figure(_effect_indicator(d_value, domain={'x': [0, 1], 'y': [0, 1]}))
+    fig.update_layout(
+        height=180,
+        margin=dict(l=20, r=20, t=30, b=10),
+        font={'size': 12}
+    )
+    return fig
+
+
+@lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def _bar_chart(rows: Tuple[GaugeEntry, ...]) -> go.Figure:
+    fig = go.Figure(go.Bar(
+        y=[label for label, _, _ in rows],
+        x=[value for _, value, _ in rows],
+        orientation='h',
+        marker_color=[color for _, _, color in rows],
+        text=[f'{value:.2f}' for _, value, _ in rows],
+        textposition='outside',
+        showlegend=False
+    ))
+
+    fig.add_vline(x=2.5, line_dash="dash", line_color="gray",
+                  annotation_text="Mittel", annotation_position="top")
+
+    fig.update_layout(
+        title="Deine Werte im Überblick",
+        xaxis_title="Wert (1 = niedrig, 4 = hoch)",
+        yaxis_title="",
+        height=400,
+        xaxis_range=[0, 4.5],
+        showlegend=False
+    )
+    return fig
+
+
+def bar_chart(rows: Sequence[GaugeEntry]) -> go.Figure:
+    """Balkendiagramm aller Skalen; ``rows`` = (Bereich, Wert, Farbe) in Anzeigereihenfolge."""
+    return _bar_chart(tuple((label, float(value), color) for label, value, color in rows))
+
+
+# ============================================
+# SAMMELANSICHT
+# ============================================
+
+def _grid(count: int, columns: int) -> Tuple[int, int]:
+    columns = max(1, min(columns, count))
+    return math.ceil(count / columns), columns
+
+
+@lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def _combined_score_gauges(entries: Tuple[GaugeEntry, ...], columns: int) -> go.Figure:
+    rows, columns = _grid(len(entries), columns)
+    fig = go.Figure([
+        _score_indicator(score, color, font_size=16,
+                         title={'text': title, 'font': {'size': 14}},
+                         domain={'row': i // columns, 'column': i % columns})
+        for i, (title, score, color) in enumerate(entries)
+    ])
+    fig.update_layout(
+        grid={'rows': rows, 'columns': columns, 'pattern': 'independent', 'ygap': 0.35},
+        height=rows * COMBINED_ROW_HEIGHT,
+        margin=dict(l=30, r=30, t=40, b=10)
+    )
+    return fig
+
+
+def combined_score_gauges(entries: Sequence[GaugeEntry], columns: int = COMBINED_COLUMNS) -> go.Figure:
+    """Alle Skalen-Tachos (Titel, Wert, Farbe) als Raster in einer Figur."""
+    return _combined_score_gauges(
+        tuple((title, score_bucket(score), color) for title, score, color in entries), columns
+    )
+
+
+@lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def _combined_effect_gauges(entries: Tuple[Tuple[str, float], ...], columns: int) -> go.Figure:
+    rows, columns = _grid(len(entries), columns)
+    fig = go.Figure([
+        _effect_indicator(d_value, font_size=18,
+                          title={'text': title, 'font': {'size': 14}},
+                          domain={'row': i // columns, 'column': i % columns})
+        for i, (title, d_value) in enumerate(entries)
+    ])
+    fig.update_layout(
+        grid={'rows': rows, 'columns': columns, 'pattern': 'independent', 'ygap': 0.35},
+        height=rows * COMBINED_ROW_HEIGHT,
+        margin=dict(l=30, r=30, t=40, b=10),
+        font={'size': 12}
+    )
+    return fig
+
+
+def combined_effect_gauges(entries: Sequence[Tuple[str, float]], columns: int = COMBINED_COLUMNS) -> go.Figure:
+    """Alle Effektstärken-Tachos (Titel, d) als Raster in einer Figur."""
+    return _combined_effect_gauges(tuple((title, float(d)) for title, d in entries), columns)
@@ -7,16 +7,34 @@ import sqlite3
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Any, Optional, Dict, List
 import pandas as pd
 
-# Database path
+from utils import shards
+from utils.assessment_codec import decode_results, decode_summary, encode_results
+from utils.migrations import Registry, is_migrated, migrate, migration
+from utils.storage import routed
+
+# Database path (default school; other schools get their own shard, see utils/shards.py)
 DB_PATH = Path(__file__).parent.parent / "coaching.db"
 
+def _now() -> str:
+    """Timestamp in SQLite's CURRENT_TIMESTAMP format (sortable across all coaching tables)"""
+    return datetime.now().isoformat(sep=' ', timespec='seconds')
+
+def get_db_path() -> Path:
+    """Get database path of the active school"""
+    if shards.get_current_school() == shards.DEFAULT_SCHOOL:
+        return DB_PATH
+    return shards.get_db_path("coaching")
+
 def get_db_connection():
-    """Get database connection"""
-    return sqlite3.connect(DB_PATH, check_same_thread=False)
+    """Get database connection (schema is migrated at app startup, here only a set lookup)"""
+    db_path = get_db_path()
+    init_database(db_path)
+    return sqlite3.connect(db_path, check_same_thread=False)
 
+@routed("coaching.create_student")
 def create_student(student_code: str, class_name: str = None, notes: str = None) -> int:
     """Create new student record"""
     conn = get_db_connection()
@@ -37,6 +55,7 @@ def create_student(student_code: str, class_name: str = None, notes: str = None)
     finally:
         conn.close()
 
+@routed("coaching.get_student")
 def get_student_by_id(student_id: int) -> Optional[Dict]:
     """Get student by ID"""
     conn = get_db_connection()
@@ -54,6 +73,7 @@ def get_student_by_id(student_id: int) -> Optional[Dict]:
         return dict(zip(columns, row))
     return None
 
+@routed("coaching.get_all_students")
 def get_all_students(active_only: bool = True) -> pd.DataFrame:
     """Get all students as DataFrame
 
@@ -86,62 +106,56 @@ def get_all_students(active_only: bool = True) -> pd.DataFrame:
     else:
         return pd.DataFrame(columns=columns)
 
-def search_students(search_term: str) -> pd.DataFrame:
-    """Search students by code or class
+def search_students(search_term: str, class_name: str = None, limit: int = 50) -> pd.DataFrame:
+    """Search students by code or class (indexed, typo-tolerant, best matches first)
 
     Args:
         search_term: Search string to match against student_code or class
+        class_name: Optional class filter
+        limit: Maximum number of results
 
     Returns:
         DataFrame with matching student data
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    from utils.student_search import STUDENT_COLUMNS, search_students_ranked
 
-    cursor.execute("""
-        SELECT * FROM students
-        WHERE is_active = 1
-        AND (student_code LIKE ? OR class LIKE ?)
-        ORDER BY student_code
-    """, (f"%{search_term}%", f"%{search_term}%"))
+    rows = search_students_ranked(search_term, class_name=class_name, limit=limit)
+    return pd.DataFrame([[row[c] for c in STUDENT_COLUMNS] for row in rows], columns=STUDENT_COLUMNS)
 
-    rows = cursor.fetchall()
-    conn.close()
+def _insert_assessment(cursor, student_id: int, results_dict: Dict, notes: str = None) -> int:
+    """INSERT of one assessment (no commit)"""
+    # Calculate some basic metrics
+    responses = results_dict.get('item_responses', {})
+    num_items = len(responses)
 
-    columns = ['id', 'student_code', 'class', 'school_year', 'created_date', 'notes', 'is_active']
+    # Simple risk assessment based on scale values
+    risk_level = "mittel"  # Default
 
-    # Return as DataFrame
-    if rows:
-        return pd.DataFrame(rows, columns=columns)
-    else:
-        return pd.DataFrame(columns=columns)
+    results_blob, summary = encode_results(results_dict)
 
+    cursor.execute("""
+        INSERT INTO assessments 
+        (student_id, assessment_date, results, risk_level, notes, summary, item_count)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, (
+        student_id,
+        _now(),
+        results_blob,
+        risk_level,
+        notes,
+        summary,
+        num_items
+    ))
+    return cursor.lastrowid
+
+@routed("coaching.save_assessment")
 def save_assessment(student_id: int, results_dict: Dict, notes: str = None) -> int:
-    """Save assessment results"""
+    """Save assessment results (compressed blob + score header, see utils/assessment_codec.py)"""
     conn = get_db_connection()
     cursor = conn.cursor()
     
     try:
-        # Calculate some basic metrics
-        responses = results_dict.get('item_responses', {})
-        num_items = len(responses)
-        
-        # Simple risk assessment based on scale values
-        risk_level = "mittel"  # Default
-        
-        cursor.execute("""
-            INSERT INTO assessments 
-            (student_id, assessment_date, results, risk_level, notes)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            student_id,
-            datetime.now().isoformat(),
-            json.dumps(results_dict),
-            risk_level,
-            notes
-        ))
-        
-        assessment_id = cursor.lastrowid
+        assessment_id = _insert_assessment(cursor, student_id, results_dict, notes)
         conn.commit()
         return assessment_id
     except Exception as e:
@@ -150,15 +164,127 @@ def save_assessment(student_id: int, results_dict: Dict, notes: str = None) -> i
     finally:
         conn.close()
 
-def get_latest_assessment(student_id: int) -> Optional[Dict]:
-    """Get most recent assessment for student"""
+# ============================================
+# ASSESSMENT DRAFTS (autosave, see utils/assessment_drafts.py)
+# ============================================
+
+# Reserved variable_name for the screening context (level, scales)
+DRAFT_CONTEXT_KEY = "@context"
+
+@routed("coaching.save_draft_responses")
+def save_draft_responses(drafts: Dict[int, Dict[str, Any]]) -> int:
+    """Upsert draft responses of several students in one transaction
+
+    Args:
+        drafts: {student_id: {variable_name: value}} - values are stored as JSON
+
+    Returns:
+        Number of upserted rows
+    """
+    now = _now()
+    rows = [
+        (student_id, variable_name, json.dumps(value), now)
+        for student_id, responses in drafts.items()
+        for variable_name, value in responses.items()
+    ]
+    if not rows:
+        return 0
+
+    conn = get_db_connection()
+    try:
+        with conn:
+            conn.executemany("""
+                INSERT INTO assessment_drafts (student_id, variable_name, value, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (student_id, variable_name)
+                DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+            """, rows)
+        return len(rows)
+    finally:
+        conn.close()
+
+def _draft_from_rows(rows) -> Optional[Dict]:
+    """{'responses', 'context', 'updated_at'} from (variable_name, value, updated_at) rows"""
+    if not rows:
+        return None
+    responses = {variable_name: json.loads(value) for variable_name, value, _ in rows}
+    return {
+        'responses': responses,
+        'context': responses.pop(DRAFT_CONTEXT_KEY, None),
+        'updated_at': max(updated_at for _, _, updated_at in rows),
+    }
+
+@routed("coaching.get_draft")
+def get_draft(student_id: int) -> Optional[Dict]:
+    """In-progress screening of a student (None if there is no draft)"""
+    conn = get_db_connection()
+    try:
+        rows = conn.execute("""
+            SELECT variable_name, value, updated_at FROM assessment_drafts
+            WHERE student_id = ?
+        """, (student_id,)).fetchall()
+    finally:
+        conn.close()
+    return _draft_from_rows(rows)
+
+@routed("coaching.discard_draft")
+def discard_draft(student_id: int) -> int:
+    """Delete the draft of a student, returns the number of deleted rows"""
+    conn = get_db_connection()
+    try:
+        with conn:
+            return conn.execute("DELETE FROM assessment_drafts WHERE student_id = ?", (student_id,)).rowcount
+    finally:
+        conn.close()
+
+@routed("coaching.promote_draft")
+def promote_draft(student_id: int, results_dict: Dict, notes: str = None) -> Optional[int]:
+    """Save the finished assessment and delete the draft in one transaction"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    try:
+        assessment_id = _insert_assessment(cursor, student_id, results_dict, notes)
+        cursor.execute("DELETE FROM assessment_drafts WHERE student_id = ?", (student_id,))
+        conn.commit()
+        return assessment_id
+    except Exception as e:
+        conn.rollback()
+        print(f"Error saving assessment: {e}")
+        return None
+    finally:
+        conn.close()
+
+ASSESSMENT_COLUMNS = ['id', 'student_id', 'request_id', 'assessment_date',
+                      'quadrant', 'risk_level', 'performance_estimate', 'notes', 'summary']
+
+def _assessment_from_row(row, include_results: bool) -> Dict:
+    """Build assessment dict; 'summary' is the decoded score header, 'results' only on request"""
+    assessment = dict(zip(ASSESSMENT_COLUMNS, row))
+    raw_results = row[len(ASSESSMENT_COLUMNS)] if len(row) > len(ASSESSMENT_COLUMNS) else None
+    if include_results:
+        assessment['results'] = decode_results(raw_results)
+    assessment['summary'] = decode_summary(assessment['summary'], raw_results)
+    return assessment
+
+def _select_assessments(include_results: bool) -> str:
+    columns = ", ".join(ASSESSMENT_COLUMNS + (['results'] if include_results else []))
+    return f"SELECT {columns} FROM assessments"
+
+@routed("coaching.get_latest_assessment")
+def get_latest_assessment(student_id: int, include_results: bool = True) -> Optional[Dict]:
+    """Get most recent assessment for student
+
+    Args:
+        include_results: Also decode the full results blob (item responses)
+    """
     conn = get_db_connection()
     cursor = conn.cursor()
     
-    cursor.execute("""
-        SELECT * FROM assessments 
+    cursor.execute(f"""
+        {_select_assessments(include_results)}
         WHERE student_id = ?
-        ORDER BY assessment_date DESC
+        ORDER BY assessment_date DESC, id DESC
         LIMIT 1
     """, (student_id,))
     
@@ -166,61 +292,80 @@ def get_latest_assessment(student_id: int) -> Optional[Dict]:
     conn.close()
     
     if row:
-        columns = ['id', 'student_id', 'request_id', 'assessment_date', 
-                  'results', 'quadrant', 'risk_level', 'performance_estimate', 'notes']
-        return dict(zip(columns, row))
+        return _assessment_from_row(row, include_results)
     return None
 
-def get_all_assessments(student_id: int) -> List[Dict]:
-    """Get all assessments for student"""
+@routed("coaching.get_all_assessments")
+def get_all_assessments(student_id: int, include_results: bool = False,
+                        limit: Optional[int] = None) -> List[Dict]:
+    """Get all assessments for student (newest first)
+
+    Only the score header ('summary') is decoded unless include_results=True.
+    For paging through long histories see utils/coaching_timeline.py.
+    """
     conn = get_db_connection()
     cursor = conn.cursor()
     
-    cursor.execute("""
-        SELECT * FROM assessments 
+    cursor.execute(f"""
+        {_select_assessments(include_results)}
         WHERE student_id = ?
-        ORDER BY assessment_date DESC
-    """, (student_id,))
+        ORDER BY assessment_date DESC, id DESC
+        LIMIT ?
+    """, (student_id, -1 if limit is None else limit))
     
     rows = cursor.fetchall()
     conn.close()
     
-    columns = ['id', 'student_id', 'request_id', 'assessment_date', 
-              'results', 'quadrant', 'risk_level', 'performance_estimate', 'notes']
-    return [dict(zip(columns, row)) for row in rows]
+    return [_assessment_from_row(row, include_results) for row in rows]
+
+@routed("coaching.get_assessment_results")
+def get_assessment_results(assessment_id: int) -> Optional[Dict]:
+    """Decode the full results (item responses + metadata) of one assessment"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT results FROM assessments WHERE id = ?", (assessment_id,))
+    row = cursor.fetchone()
+    conn.close()
+
+    return decode_results(row[0]) if row else None
 
+@routed("coaching.get_student_summary")
 def get_student_summary(student_id: int) -> Dict:
-    """Get summary statistics for student"""
+    """Get summary statistics for student (dashboard numbers in one query)"""
     conn = get_db_connection()
     cursor = conn.cursor()
     
-    # Count assessments
-    cursor.execute("""
-        SELECT COUNT(*) FROM assessments WHERE student_id = ?
-    """, (student_id,))
-    total_assessments = cursor.fetchone()[0]
-    
-    # Count development plans
-    cursor.execute("""
-        SELECT COUNT(*) FROM development_plans 
-        WHERE student_id = ? AND status = 'active'
-    """, (student_id,))
-    active_plans = cursor.fetchone()[0]
-    
-    # Get latest assessment date
     cursor.execute("""
-        SELECT MAX(assessment_date) FROM assessments WHERE student_id = ?
-    """, (student_id,))
-    last_assessment = cursor.fetchone()[0]
+        SELECT
+            (SELECT COUNT(*) FROM assessments WHERE student_id = :sid),
+            (SELECT MIN(assessment_date) FROM assessments WHERE student_id = :sid),
+            (SELECT MAX(assessment_date) FROM assessments WHERE student_id = :sid),
+            (SELECT summary FROM assessments WHERE student_id = :sid
+             ORDER BY assessment_date DESC, id DESC LIMIT 1),
+            (SELECT COUNT(*) FROM development_plans WHERE student_id = :sid AND status = 'active'),
+            (SELECT COUNT(*) FROM development_plans WHERE student_id = :sid),
+            (SELECT COUNT(*) FROM progress_logs WHERE student_id = :sid),
+            (SELECT MAX(log_date) FROM progress_logs WHERE student_id = :sid),
+            (SELECT COUNT(*) FROM assessment_requests WHERE student_id = :sid AND status = 'pending')
+    """, {'sid': student_id})
+    row = cursor.fetchone()
     
     conn.close()
     
     return {
-        'total_assessments': total_assessments,
-        'active_plans': active_plans,
-        'last_assessment': last_assessment
+        'total_assessments': row[0],
+        'first_assessment': row[1],
+        'last_assessment': row[2],
+        'latest_scores': decode_summary(row[3]).get('scales', {}) if row[3] else {},
+        'active_plans': row[4],
+        'total_plans': row[5],
+        'progress_logs': row[6],
+        'last_progress_log': row[7],
+        'pending_requests': row[8]
     }
 
+@routed("coaching.save_development_plan")
 def save_development_plan(student_id: int, assessment_id: int, 
                          interventions: Dict, goals: str = None) -> int:
     """Save development plan"""
@@ -235,7 +380,7 @@ def save_development_plan(student_id: int, assessment_id: int,
         """, (
             student_id,
             assessment_id,
-            datetime.now().isoformat(),
+            _now(),
             json.dumps(interventions),
             goals
         ))
@@ -249,6 +394,7 @@ def save_development_plan(student_id: int, assessment_id: int,
     finally:
         conn.close()
 
+@routed("coaching.log_progress")
 def log_progress(student_id: int, plan_id: int, activity_type: str, 
                 content: str, outcome: str = None) -> int:
     """Log progress entry"""
@@ -263,7 +409,7 @@ def log_progress(student_id: int, plan_id: int, activity_type: str,
         """, (
             student_id,
             plan_id,
-            datetime.now().isoformat(),
+            _now(),
             activity_type,
             content,
             outcome
@@ -278,94 +424,205 @@ def log_progress(student_id: int, plan_id: int, activity_type: str,
     finally:
         conn.close()
 
-def init_database():
-    """Initialize database if it doesn't exist"""
-    if not DB_PATH.exists():
-        print(f"Creating database at {DB_PATH}")
-        
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
-        # Create tables
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS students (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                student_code TEXT UNIQUE NOT NULL,
-                class TEXT,
-                school_year TEXT,
-                created_date DATETIME DEFAULT CURRENT_TIMESTAMP,
-                notes TEXT,
-                is_active INTEGER DEFAULT 1
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS assessments (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                student_id INTEGER NOT NULL,
-                request_id INTEGER,
-                assessment_date DATETIME DEFAULT CURRENT_TIMESTAMP,
-                results TEXT NOT NULL,
-                quadrant TEXT,
-                risk_level TEXT,
-                performance_estimate REAL,
-                notes TEXT,
-                FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS development_plans (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                student_id INTEGER NOT NULL,
-                assessment_id INTEGER NOT NULL,
-                created_date DATETIME DEFAULT CURRENT_TIMESTAMP,
-                interventions TEXT NOT NULL,
-                goals TEXT,
-                status TEXT DEFAULT 'active',
-                start_date DATE,
-                target_end_date DATE,
-                actual_end_date DATE,
-                notes TEXT,
-                FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE,
-                FOREIGN KEY (assessment_id) REFERENCES assessments(id) ON DELETE CASCADE
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS progress_logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                student_id INTEGER NOT NULL,
-                plan_id INTEGER,
-                log_date DATETIME DEFAULT CURRENT_TIMESTAMP,
-                activity_type TEXT NOT NULL,
-                content TEXT NOT NULL,
-                outcome TEXT,
-                reflection TEXT,
-                created_by TEXT,
-                FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE,
-                FOREIGN KEY (plan_id) REFERENCES development_plans(id) ON DELETE SET NULL
-            )
+def _create_base_tables(conn):
+    """Tables of the original schema (no-op for existing files)"""
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS students (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_code TEXT UNIQUE NOT NULL,
+            class TEXT,
+            school_year TEXT,
+            created_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+            notes TEXT,
+            is_active INTEGER DEFAULT 1
+        )
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS assessments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_id INTEGER NOT NULL,
+            request_id INTEGER,
+            assessment_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+            results TEXT NOT NULL,
+            quadrant TEXT,
+            risk_level TEXT,
+            performance_estimate REAL,
+            notes TEXT,
+            summary TEXT,
+            item_count INTEGER,
+            FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE
+        )
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS development_plans (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_id INTEGER NOT NULL,
+            assessment_id INTEGER NOT NULL,
+            created_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+            interventions TEXT NOT NULL,
+            goals TEXT,
+            status TEXT DEFAULT 'active',
+            start_date DATE,
+            target_end_date DATE,
+            actual_end_date DATE,
+            notes TEXT,
+            FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE,
+            FOREIGN KEY (assessment_id) REFERENCES assessments(id) ON DELETE CASCADE
+        )
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS progress_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_id INTEGER NOT NULL,
+            plan_id INTEGER,
+            log_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+            activity_type TEXT NOT NULL,
+            content TEXT NOT NULL,
+            outcome TEXT,
+            reflection TEXT,
+            created_by TEXT,
+            FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE,
+            FOREIGN KEY (plan_id) REFERENCES development_plans(id) ON DELETE SET NULL
+        )
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS assessment_requests (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_id INTEGER NOT NULL,
+            created_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+            selected_scales TEXT NOT NULL,
+            assessment_type TEXT,
+            survey_url TEXT,
+            status TEXT DEFAULT 'pending',
+            completed_date DATETIME,
+            FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE
+        )
+    """)
+
+    conn.commit()
+
+def init_database(db_path: Path = None):
+    """Create the database if needed and apply pending migrations (once per process and file)
+
+    Runs at app startup (utils/app_startup.py), in CLIs on the first connection.
+    Afterwards it is a set lookup. Without db_path the database of the active school is used.
+    """
+    db_path = Path(db_path or get_db_path())
+    if is_migrated(db_path):
+        return
+    if not db_path.exists():
+        print(f"Creating database at {db_path}")
+    migrate(db_path, COACHING_MIGRATIONS, prepare=_create_base_tables)
+
+# ============================================
+# MIGRATIONS (PRAGMA user_version)
+# ============================================
+
+# Steps run through the shared runner in utils/migrations.py (file lock,
+# BEGIN IMMEDIATE and user_version per step). Never change existing steps,
+# only append new ones.
+COACHING_MIGRATIONS: Registry = []
+
+MIGRATION_BATCH_SIZE = 500
+
+@migration(1, "Compress results JSON and add the score header (batched)", COACHING_MIGRATIONS)
+def _compress_assessments(c):
+    """Freed pages are reused by later inserts; no VACUUM on the request path"""
+    columns = {row[1] for row in c.execute("PRAGMA table_info(assessments)")}
+    for column, sql_type in (('summary', 'TEXT'), ('item_count', 'INTEGER')):
+        if column not in columns:
+            c.execute(f"ALTER TABLE assessments ADD COLUMN {column} {sql_type}")
+
+    converted = 0
+    while True:
+        rows = c.execute("""
+            SELECT id, results FROM assessments WHERE summary IS NULL LIMIT ?
+        """, (MIGRATION_BATCH_SIZE,)).fetchall()
+        if not rows:
+            if converted:
+                print(f"Compressed {converted} assessment(s)")
+            return
+
+        updates = []
+        for assessment_id, raw in rows:
+            try:
+                results = decode_results(raw)
+            except (ValueError, TypeError):
+                results = {}
+            blob, summary = encode_results(results)
+            updates.append((blob, summary, len(results.get('item_responses', {}) or {}), assessment_id))
+        c.executemany("""
+            UPDATE assessments SET results = ?, summary = ?, item_count = ? WHERE id = ?
+        """, updates)
+        converted += len(updates)
+
+@migration(2, "Uniform timestamps + composite indexes for dashboard and timeline", COACHING_MIGRATIONS)
+def _add_timeline_indexes(c):
+    # Older rows used isoformat() with 'T'; CURRENT_TIMESTAMP uses ' '
+    for table, column in (('assessments', 'assessment_date'),
+                          ('development_plans', 'created_date'),
+                          ('progress_logs', 'log_date')):
+        c.execute(f"""
+            UPDATE {table} SET {column} = substr(replace({column}, 'T', ' '), 1, 19)
+            WHERE {column} LIKE '____-__-__T%' OR length({column}) > 19
         """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS assessment_requests (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                student_id INTEGER NOT NULL,
-                created_date DATETIME DEFAULT CURRENT_TIMESTAMP,
-                selected_scales TEXT NOT NULL,
-                assessment_type TEXT,
-                survey_url TEXT,
-                status TEXT DEFAULT 'pending',
-                completed_date DATETIME,
-                FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE
+
+    c.execute("CREATE INDEX IF NOT EXISTS idx_assessments_student_date ON assessments(student_id, assessment_date)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_plans_student_date ON development_plans(student_id, created_date)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_plans_student_status ON development_plans(student_id, status)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_logs_student_date ON progress_logs(student_id, log_date)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_requests_student_status ON assessment_requests(student_id, status)")
+
+@migration(3, "Indexes + FTS5 trigram table for the student picker (utils/student_search.py)", COACHING_MIGRATIONS)
+def _add_student_search(c):
+    c.execute("CREATE INDEX IF NOT EXISTS idx_students_active_code ON students(is_active, lower(student_code))")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_students_active_class ON students(is_active, class)")
+
+    try:
+        c.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS students_fts USING fts5(
+                student_code, class, content='students', content_rowid='id', tokenize='trigram'
             )
         """)
-        
-        conn.commit()
-        conn.close()
-        
-        print("Database created successfully")
+    except sqlite3.OperationalError:
+        # No FTS5/trigram in this SQLite build (< 3.34): search falls back to LIKE
+        return
+
+    c.execute("""
+        CREATE TRIGGER IF NOT EXISTS students_fts_insert AFTER INSERT ON students BEGIN
+            INSERT INTO students_fts(rowid, student_code, class) VALUES (new.id, new.student_code, new.class);
+        END
+    """)
+    c.execute("""
+        CREATE TRIGGER IF NOT EXISTS students_fts_delete AFTER DELETE ON students BEGIN
+            INSERT INTO students_fts(students_fts, rowid, student_code, class)
+            VALUES ('delete', old.id, old.student_code, old.class);
+        END
+    """)
+    c.execute("""
+        CREATE TRIGGER IF NOT EXISTS students_fts_update AFTER UPDATE OF student_code, class ON students BEGIN
+            INSERT INTO students_fts(students_fts, rowid, student_code, class)
+            VALUES ('delete', old.id, old.student_code, old.class);
+            INSERT INTO students_fts(rowid, student_code, class) VALUES (new.id, new.student_code, new.class);
+        END
+    """)
+    c.execute("INSERT INTO students_fts(students_fts) VALUES ('rebuild')")
 
-# Initialize database on import
-init_database()
+@migration(4, "Per-item draft responses of in-progress screenings (autosave)", COACHING_MIGRATIONS)
+def _add_assessment_drafts(c):
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS assessment_drafts (
+            student_id INTEGER NOT NULL,
+            variable_name TEXT NOT NULL,
+            value TEXT NOT NULL,
+            updated_at DATETIME NOT NULL,
+            PRIMARY KEY (student_id, variable_name),
+            FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE
+        ) WITHOUT ROWID
+    """)
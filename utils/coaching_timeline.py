@@ -0,0 +1,175 @@
+"""
+🗓️ Coaching-Timeline
+====================
+
+Chronologischer Verlauf eines Schülers aus ``coaching.db``: Assessments,
+Förderpläne und Fortschritts-Logs in einem gemeinsamen, absteigend
+sortierten Strom.
+
+Blättern per Keyset statt OFFSET: Der Cursor ist der Sortierschlüssel
+(Zeitpunkt, Art, ID) des letzten Eintrags. Jede Quelle liest nur
+``limit`` Zeilen ab dem Cursor über ihren Index ``(student_id, <datum>)``
+(siehe Migration 2 in ``coaching_db.py``) - eine Seite kostet damit
+gleich viel, egal wie lang die Historie ist.
+
+Verwendung:
+    entries, cursor = get_timeline_page(student_id)
+    while cursor:
+        entries, cursor = get_timeline_page(student_id, after=cursor)
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.assessment_codec import decode_summary
+from utils.coaching_db import get_db_connection
+from utils.storage import routed
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+PAGE_SIZE = 20
+
+# Art -> (Rang bei gleichem Zeitpunkt, Tabelle, Datumsspalte, Spalten für title/status/payload)
+TIMELINE_SOURCES = {
+    "assessment": (3, "assessments", "assessment_date", "notes", "risk_level", "summary"),
+    "plan": (2, "development_plans", "created_date", "goals", "status", "interventions"),
+    "log": (1, "progress_logs", "log_date", "activity_type", "outcome", "content"),
+}
+
+TIMELINE_ICONS = {"assessment": "📊", "plan": "🎯", "log": "📝"}
+
+
+def encode_cursor(event_time: str, rank: int, entry_id: int) -> str:
+    return f"{event_time}|{rank}|{entry_id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int, int]:
+    event_time, rank, entry_id = cursor.rsplit("|", 2)
+    return event_time, int(rank), int(entry_id)
+
+
+# ============================================
+# ABFRAGE
+# ============================================
+
+def _source_query(kind: str, student_id: int, after: Optional[Tuple[str, int, int]],
+                  limit: int) -> Tuple[str, List[Any]]:
+    """SELECT einer Quelle ab dem Cursor (Rang ist pro Quelle konstant)."""
+    rank, table, date_col, title, status, payload = TIMELINE_SOURCES[kind]
+    where, params = ["student_id = ?"], [student_id]
+
+    if after is not None:
+        event_time, cursor_rank, cursor_id = after
+        if rank < cursor_rank:
+            where.append(f"{date_col} <= ?")
+            params.append(event_time)
+        elif rank > cursor_rank:
+            where.append(f"{date_col} < ?")
+            params.append(event_time)
+        else:
+            where.append(f"({date_col}, id) < (?, ?)")
+            params.extend([event_time, cursor_id])
+
+    sql = f"""
+        SELECT * FROM (
+            SELECT '{kind}' AS kind, {rank} AS rank, id, {date_col} AS event_time,
+                   {title} AS title, {status} AS status, {payload} AS payload
+            FROM {table}
+            WHERE {' AND '.join(where)}
+            ORDER BY {date_col} DESC, id DESC
+            LIMIT ?
+        )
+    """
+    return sql, params + [limit]
+
+
+def _entry_from_row(row) -> Dict[str, Any]:
+    kind, _, entry_id, event_time, title, status, payload = row
+    entry = {"kind": kind, "id": entry_id, "time": event_time, "title": title, "status": status}
+    if kind == "assessment":
+        entry["summary"] = decode_summary(payload) if payload else {}
+    elif kind == "plan":
+        entry["interventions"] = json.loads(payload) if payload else {}
+    else:
+        entry["content"] = payload
+    return entry
+
+
+@routed("coaching.get_timeline_page")
+def get_timeline_page(student_id: int, after: Optional[str] = None,
+                      limit: int = PAGE_SIZE) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Liefert eine Seite der Coaching-Timeline (neueste zuerst).
+
+    Args:
+        student_id: Schüler
+        after: Cursor der vorherigen Seite (None = Anfang)
+        limit: Einträge pro Seite
+
+    Returns:
+        (Einträge, Cursor für die nächste Seite oder None am Ende)
+    """
+    position = decode_cursor(after) if after else None
+
+    # Eine Zeile mehr als nötig verrät, ob es eine nächste Seite gibt
+    parts, params = [], []
+    for kind in TIMELINE_SOURCES:
+        sql, source_params = _source_query(kind, student_id, position, limit + 1)
+        parts.append(sql)
+        params.extend(source_params)
+
+    conn = get_db_connection()
+    try:
+        rows = conn.execute(f"""
+            {" UNION ALL ".join(parts)}
+            ORDER BY event_time DESC, rank DESC, id DESC
+            LIMIT ?
+        """, params + [limit + 1]).fetchall()
+    finally:
+        conn.close()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(rows[-1][3], rows[-1][1], rows[-1][2]) if has_more else None
+    return [_entry_from_row(row) for row in rows], next_cursor
+
+
+# ============================================
+# UI
+# ============================================
+
+def render_coaching_timeline(student_id: int, version: Any = None, key_prefix: str = "timeline") -> None:
+    """
+    Zeigt die Timeline seitenweise mit "Mehr laden"-Button.
+
+    Args:
+        version: Ändert sich bei neuen Einträgen (z.B. Zähler aus
+                 ``get_student_summary``) und verwirft dann die geladenen Seiten
+    """
+    import streamlit as st
+
+    state_key = f"{key_prefix}_{student_id}"
+    cached = st.session_state.get(state_key)
+    if cached is None or cached[0] != version:
+        cached = st.session_state[state_key] = (version, *get_timeline_page(student_id))
+    _, entries, cursor = cached
+
+    if not entries:
+        st.caption("Noch keine Einträge")
+        return
+
+    for entry in entries:
+        icon = TIMELINE_ICONS[entry["kind"]]
+        line = f"{icon} **{entry['time'][:16]}** · {entry['title'] or entry['kind']}"
+        if entry.get("status"):
+            line += f" · _{entry['status']}_"
+        st.markdown(line)
+        if entry["kind"] == "assessment" and entry["summary"].get("scales"):
+            st.caption(", ".join(f"{scale}: {score:.2f}" for scale, score in entry["summary"]["scales"].items()))
+
+    if cursor and st.button("⬇️ Mehr laden", key=f"{state_key}_more"):
+        more, next_cursor = get_timeline_page(student_id, after=cursor)
+        st.session_state[state_key] = (version, entries + more, next_cursor)
+        st.rerun()
@@ -0,0 +1,434 @@
+"""
+🗃️ Content Store
+================
+
+Laufzeitquelle für die großen Inhalte (Powertechniken, Transfer, Birkenbihl,
+Motivation, Ressourcen): eine kompakte, schreibgeschützte SQLite-Datei.
+
+Jede Zeile ist ein fertig aufgelöster "Slice" - also genau das, was die
+Accessor-Funktionen (z.B. ``get_technique_content``) zurückgeben - indiziert
+nach (bereich, schluessel, altersstufe, phase). Die Datei wird read-only und
+mit ``mmap`` geöffnet, sodass sich mehrere Worker-Prozesse die Seiten im
+Page-Cache teilen, statt jeweils eigene Dict-Kopien zu halten.
+
+Die Inhalte werden in den ``*_source.py``-Modulen gepflegt. Diese importiert
+NUR der Build (``build_content_store``) - Worker laden die Literale nie.
+Fehlt der Store oder ist er veraltet (Quelldatei neuer als der Build), baut
+der erste Zugriff ihn in einem eigenen Prozess neu (``ensure_content_store``,
+läuft auch beim App-Start). Bei schreibgeschütztem ``data/`` den Store im
+Deployment vorab bauen.
+
+Alle (Inhalt, Altersstufe)-Varianten sind beim Build fertig gerendert. Zur
+Laufzeit liest ein Accessor genau seinen Slice (Primärschlüssel-Lookup plus
+JSON-Decode) - es gibt keine prozessweite Kopie des Contents, und jeder
+Aufrufer bekommt eigene Objekte, die er gefahrlos verändern darf.
+``ContentMapping`` bietet dieselben Daten als read-only Dict-Ansicht.
+
+Build:
+    python -m utils.content_store
+"""
+
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+REPO_ROOT = Path(__file__).parent.parent
+STORE_PATH = REPO_ROOT / "data" / "content_store.db"
+
+# 64 MB reichen für den kompletten Content um ein Vielfaches
+MMAP_SIZE = 64 * 1024 * 1024
+
+FALLBACK_AGE_GROUP = "unterstufe"
+
+# Gesetzt im Build-Prozess: dort darf kein weiterer Build angestoßen werden
+ENV_BUILDING = "PULSE_CONTENT_STORE_BUILD"
+BUILD_TIMEOUT = 120
+
+# Quelldateien, aus denen der Store gebaut wird (relativ zu utils/)
+SOURCE_FILES = [
+    "learnstrat_challenges/challenge_content_source.py",
+    "learnstrat_challenges/transfer_content_source.py",
+    "learnstrat_challenges/birkenbihl_content_source.py",
+    "motivation_challenges/motivation_content_source.py",
+    "ressourcen/content_database_source.py",
+]
+
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.Lock()
+
+
+def _source_fingerprint() -> Dict[str, str]:
+    """Gibt (mtime, size) jeder Quelldatei als Fingerprint zurück."""
+    base = Path(__file__).parent
+    fingerprint = {}
+    for rel in SOURCE_FILES:
+        stat = (base / rel).stat()
+        fingerprint[rel] = f"{stat.st_mtime_ns}:{stat.st_size}"
+    return fingerprint
+
+
+# ============================================
+# BUILD
+# ============================================
+
+def _age_content(data: Dict[str, Any], age_group: str) -> Dict[str, Any]:
+    """Inhalt einer Altersstufe (Fallback: Unterstufe)."""
+    altersstufen = data.get("altersstufen", {})
+    return altersstufen.get(age_group) or altersstufen.get(FALLBACK_AGE_GROUP, {})
+
+
+def _technique_slice(key: str, technique: Dict[str, Any], age_group: str) -> Dict[str, Any]:
+    return {
+        "key": key,
+        "name": technique.get("name"),
+        "icon": technique.get("icon"),
+        "effect_size": technique.get("effect_size"),
+        "effect_note": technique.get("effect_note"),
+        "core_idea": technique.get("core_idea"),
+        "science_fact": technique.get("science_fact"),
+        **_age_content(technique, age_group)
+    }
+
+
+def _phase_slice(phase_data: Dict[str, Any], age_group: str) -> Dict[str, Any]:
+    return {
+        "title": phase_data.get("title"),
+        "icon": phase_data.get("icon"),
+        "core_concept": phase_data.get("core_concept", ""),
+        **_age_content(phase_data, age_group),
+    }
+
+
+def _complete_slice(phases: Dict[str, Dict[str, Any]], age_group: str) -> Dict[str, Any]:
+    """Alle Phasen einer Altersstufe, der Content der Stufe liegt unter "content"."""
+    result = {}
+    for name, phase_data in phases.items():
+        altersstufen = phase_data["altersstufen"]
+        result[name] = {
+            **{k: v for k, v in phase_data.items() if k != "altersstufen"},
+            "content": altersstufen.get(age_group, altersstufen[FALLBACK_AGE_GROUP]),
+        }
+    return result
+
+
+def _iter_slices() -> Iterator[Tuple[str, str, str, int, Any]]:
+    """
+    Erzeugt alle Slices als (bereich, schluessel, altersstufe, phase, payload).
+
+    Einzige Stelle, die die ``*_source.py``-Module importiert.
+    """
+    from .learnstrat_challenges import (
+        birkenbihl_content_source,
+        challenge_content_source,
+        transfer_content_source,
+    )
+    from .motivation_challenges import motivation_content_source
+    from .ressourcen import content_database_source
+
+    for key, technique in challenge_content_source.POWERTECHNIKEN.items():
+        order = technique.get("order", 99)
+        # Komplette Technik für die Dict-Ansicht POWERTECHNIKEN
+        yield "powertechniken_quelle", key, "", order, technique
+        for age_group in technique.get("altersstufen", {}):
+            yield "powertechniken", key, age_group, order, _technique_slice(key, technique, age_group)
+
+    for bereich, module in [("transfer", transfer_content_source),
+                            ("birkenbihl", birkenbihl_content_source)]:
+        phases = {
+            "phase_1": module.PHASE_1_CONTENT,
+            "phase_2": module.PHASE_2_CONTENT,
+            "phase_3": module.PHASE_3_CONTENT,
+            "phase_4": module.PHASE_4_CONTENT,
+            "finale": module.FINALE_CONTENT,
+        }
+        for phase_num, phase_data in enumerate(phases.values(), start=1):
+            for age_group in phase_data.get("altersstufen", {}):
+                yield bereich, f"phase_{phase_num}", age_group, phase_num, _phase_slice(phase_data, age_group)
+
+        for age_group in module.PHASE_1_CONTENT.get("altersstufen", {}):
+            yield bereich, "komplett", age_group, 0, _complete_slice(phases, age_group)
+
+    # phase = Position, damit die Reihenfolge der Grundbedürfnisse erhalten bleibt
+    for age_group, categories in motivation_content_source.MOTIVATION_CHALLENGES.items():
+        for position, (grundbeduerfnis, challenges) in enumerate(categories.items()):
+            yield "motivation", grundbeduerfnis, age_group, position, challenges
+
+    # phase = Position im PISA-Ranking
+    for position, (factor, content) in enumerate(content_database_source.CONTENT_DATABASE.items()):
+        yield "ressourcen", factor, "", position, content
+
+
+def build_content_store(path: Path = STORE_PATH) -> int:
+    """
+    Baut den Content Store neu auf.
+
+    Es wird zunächst in eine temporäre Datei geschrieben und diese dann
+    atomar ersetzt, laufende Leser sehen also nie einen halben Store.
+
+    Returns:
+        Anzahl der geschriebenen Slices
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Pro Prozess eigene Temp-Datei, falls zwei Worker gleichzeitig bauen
+    tmp_path = path.with_suffix(f".db.{os.getpid()}.tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    conn = sqlite3.connect(tmp_path)
+    c = conn.cursor()
+    c.execute("PRAGMA page_size = 4096")
+    c.execute("""
+        CREATE TABLE content_slices (
+            bereich TEXT NOT NULL,
+            schluessel TEXT NOT NULL,
+            altersstufe TEXT NOT NULL,
+            phase INTEGER NOT NULL DEFAULT 0,
+            payload TEXT NOT NULL,
+            PRIMARY KEY (bereich, schluessel, altersstufe)
+        ) WITHOUT ROWID
+    """)
+    c.execute("CREATE INDEX idx_slices_alter ON content_slices(bereich, altersstufe, phase)")
+    c.execute("CREATE TABLE store_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    count = 0
+    for bereich, schluessel, altersstufe, phase, payload in _iter_slices():
+        c.execute(
+            "INSERT INTO content_slices VALUES (?, ?, ?, ?, ?)",
+            (bereich, schluessel, altersstufe, phase,
+             json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+        )
+        count += 1
+
+    c.execute("INSERT INTO store_meta VALUES ('fingerprint', ?)",
+              (json.dumps(_source_fingerprint(), sort_keys=True),))
+    conn.commit()
+    conn.execute("VACUUM")
+    conn.close()
+
+    os.replace(tmp_path, path)
+    reset_store_connection()
+    return count
+
+
+# ============================================
+# STORE-VERBINDUNG
+# ============================================
+
+def reset_store_connection() -> None:
+    """Schließt die Prozess-Verbindung, z.B. nach einem Rebuild."""
+    global _conn
+    with _lock:
+        if _conn is not None:
+            _conn.close()
+        _conn = None
+
+
+def _open_store() -> Optional[sqlite3.Connection]:
+    """
+    Öffnet den Store read-only (immutable, mmap).
+
+    Gibt None zurück, wenn der Store fehlt oder nicht mehr zu den
+    Quelldateien passt.
+    """
+    if not STORE_PATH.exists():
+        return None
+    conn = None
+    try:
+        conn = sqlite3.connect(
+            f"file:{STORE_PATH}?mode=ro&immutable=1",
+            uri=True,
+            check_same_thread=False
+        )
+        conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        row = conn.execute("SELECT value FROM store_meta WHERE key = 'fingerprint'").fetchone()
+        if row and json.loads(row[0]) == _source_fingerprint():
+            return conn
+    except (sqlite3.Error, OSError, ValueError):
+        pass
+    if conn is not None:
+        conn.close()
+    return None
+
+
+def _build_in_subprocess() -> None:
+    """
+    Baut den Store in einem eigenen Prozess.
+
+    So landen die Literal-Module nie im Speicher des Workers.
+    """
+    if os.environ.get(ENV_BUILDING):
+        raise RuntimeError("Content Store wird gerade gebaut - kein Zugriff während des Builds")
+    try:
+        subprocess.run(
+            [sys.executable, "-m", "utils.content_store"],
+            cwd=REPO_ROOT,
+            env={**os.environ, ENV_BUILDING: "1"},
+            capture_output=True, text=True, check=True, timeout=BUILD_TIMEOUT
+        )
+    except subprocess.CalledProcessError as e:
+        output = (e.stderr or e.stdout or "").strip().splitlines()[-5:]
+        raise RuntimeError(f"Content Store konnte nicht gebaut werden: {' '.join(output)}") from e
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise RuntimeError(f"Content Store konnte nicht gebaut werden: {e}") from e
+
+
+def _get_store_connection() -> sqlite3.Connection:
+    """
+    Öffnet den Store einmal pro Prozess; fehlt er oder ist er veraltet,
+    wird er vorher neu gebaut.
+
+    Raises:
+        RuntimeError: Build fehlgeschlagen
+    """
+    global _conn
+    if _conn is not None:
+        return _conn
+
+    with _lock:
+        if _conn is None:
+            conn = _open_store()
+            if conn is None:
+                _build_in_subprocess()
+                conn = _open_store()
+            if conn is None:
+                raise RuntimeError(f"Content Store nicht lesbar: {STORE_PATH}")
+            _conn = conn
+        return _conn
+
+
+def ensure_content_store() -> None:
+    """Stellt sicher, dass ein aktueller Store vorhanden und geöffnet ist (App-Start)."""
+    _get_store_connection()
+
+
+def is_store_available() -> bool:
+    """Prüft, ob ein aktueller Content Store vorhanden ist (ohne zu bauen)."""
+    if _conn is not None:
+        return True
+    conn = _open_store()
+    if conn is None:
+        return False
+    conn.close()
+    return True
+
+
+def _query(sql: str, params: Tuple) -> List[tuple]:
+    """Führt eine Leseabfrage auf dem Store aus."""
+    conn = _get_store_connection()
+    with _lock:
+        return conn.execute(sql, params).fetchall()
+
+
+# ============================================
+# LESEZUGRIFF
+# ============================================
+
+def get_content_slice(bereich: str, schluessel: str, altersstufe: str = "",
+                      fallback_age_group: Optional[str] = FALLBACK_AGE_GROUP) -> Optional[Any]:
+    """
+    Liest genau einen Slice aus dem Store.
+
+    Args:
+        bereich: z.B. "powertechniken", "transfer", "birkenbihl"
+        schluessel: Technik-Key, "phase_<n>", Grundbedürfnis oder Faktor
+        altersstufe: Altersstufe (leer für altersunabhängige Inhalte)
+        fallback_age_group: Altersstufe, falls die gewünschte fehlt
+
+    Returns:
+        Slice (frisch dekodiert) oder None (nicht gefunden)
+    """
+    age_groups = [altersstufe]
+    if fallback_age_group and fallback_age_group != altersstufe:
+        age_groups.append(fallback_age_group)
+
+    for age_group in age_groups:
+        rows = _query(
+            "SELECT payload FROM content_slices WHERE bereich = ? AND schluessel = ? AND altersstufe = ?",
+            (bereich, schluessel, age_group)
+        )
+        if rows:
+            return json.loads(rows[0][0])
+    return None
+
+
+def get_content_slices_for_age(bereich: str, altersstufe: str) -> Optional[Dict[str, Any]]:
+    """
+    Gibt alle Slices eines Bereichs für eine Altersstufe zurück (sortiert nach Phase).
+
+    Returns:
+        Dict schluessel -> Slice, oder None wenn es keine Slices gibt
+    """
+    rows = _query(
+        "SELECT schluessel, payload FROM content_slices WHERE bereich = ? AND altersstufe = ? "
+        "ORDER BY phase, schluessel",
+        (bereich, altersstufe)
+    )
+    if not rows:
+        return None
+    return {schluessel: json.loads(payload) for schluessel, payload in rows}
+
+
+class ContentMapping(Mapping):
+    """
+    Read-only Dict-Ansicht auf einen Bereich des Stores.
+
+    Schlüssel in Build-Reihenfolge, jeder Zugriff liest den Slice frisch aus
+    dem Store - Änderungen am Ergebnis wirken nicht zurück.
+
+    Beispiel:
+        CONTENT_DATABASE = ContentMapping("ressourcen")
+        CONTENT_DATABASE["MATHEFF"]["title"]
+    """
+
+    def __init__(self, bereich: str, altersstufe: str = ""):
+        self.bereich = bereich
+        self.altersstufe = altersstufe
+
+    def phases(self) -> Dict[str, int]:
+        """Schlüssel -> Phase bzw. Position (ohne die Slices zu dekodieren)."""
+        rows = _query(
+            "SELECT schluessel, phase FROM content_slices WHERE bereich = ? AND altersstufe = ? "
+            "ORDER BY phase, schluessel",
+            (self.bereich, self.altersstufe)
+        )
+        return dict(rows)
+
+    def __getitem__(self, schluessel: str) -> Any:
+        value = get_content_slice(self.bereich, schluessel, self.altersstufe, fallback_age_group=None)
+        if value is None:
+            raise KeyError(schluessel)
+        return value
+
+    def __contains__(self, schluessel: object) -> bool:
+        if not isinstance(schluessel, str):
+            return False
+        return bool(_query(
+            "SELECT 1 FROM content_slices WHERE bereich = ? AND schluessel = ? AND altersstufe = ?",
+            (self.bereich, schluessel, self.altersstufe)
+        ))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.phases())
+
+    def __len__(self) -> int:
+        return len(self.phases())
+
+    def __repr__(self) -> str:
+        return f"ContentMapping({self.bereich!r}, {self.altersstufe!r})"
+
+
+if __name__ == "__main__":
+    n = build_content_store()
+    size_kb = STORE_PATH.stat().st_size / 1024
+    print(f"✅ Content Store gebaut: {n} Slices, {size_kb:.0f} KB → {STORE_PATH}")
@@ -3,24 +3,23 @@ Shared database loading functions for PISA 2022 Explorer
 """
 
 import streamlit as st
-import sqlite3
 import pandas as pd
-from pathlib import Path
+
+from .pisa_db import open_readonly_connection
 
 
 def get_db_connection():
     """
     Erstellt neue Datenbankverbindung zur vollständigen PISA 2022 Deutschland Datenbank
 
-    WICHTIG: Kein Caching mehr, da SQLite-Connections nicht thread-safe gecacht werden können
+    Read-only (``mode=ro&immutable=1``, mmap), der Aufrufer schließt die
+    Verbindung. Für wiederholte Lesezugriffe ``utils.pisa_db.shared_connection()``
+    verwenden (Prozess-Pool, nicht schließen).
 
     Returns:
         sqlite3.Connection: Datenbankverbindung
     """
-    # Immer die vollständige Datenbank verwenden (6,116 Schüler)
-    db_path = "pisa_2022_germany.db"
-
-    return sqlite3.connect(db_path, check_same_thread=False)
+    return open_readonly_connection()
 
 
 @st.cache_data
@@ -11,8 +11,18 @@ Basierend auf:
 - Hattie, J. (2023). Visible Learning: The Sequel (252 Faktoren)
 - PISA 2022 Deutschland (6.116 Schüler, XGBoost-Analyse)
 - Sandra's Feature Importance Analyse (R² = 0.77)
+
+Alles, was sich aus ``EVIDENCE_DATABASE`` ableiten lässt (Schwellen,
+Interpretationen je Kategorie, Badge-HTML, Prioritäten-Reihenfolge), wird
+beim Import einmal in ``_EVIDENCE_INDEX`` vorberechnet. Die Abfrage-
+Funktionen sind damit reine Lookups; ``interpret_many`` klassifiziert ganze
+Klassen vektorisiert.
 """
 
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
 # ============================================
 # HATTIE-PISA MAPPING
 # ============================================
@@ -808,62 +818,45 @@ def get_all_scales_with_evidence() -> list:
 def interpret_score_with_evidence(scale_name: str, score: float) -> dict:
     """
     Interpretiert einen Skalenwert mit wissenschaftlicher Einordnung.
-    
+
     Returns:
         dict mit kategorie, farbe, empfehlung, hattie, pisa, tipps
+        (vorberechnet und geteilt - nicht verändern)
     """
-    evidence = get_evidence(scale_name)
-    if not evidence:
-        return {
-            "kategorie": "unbekannt",
-            "farbe": "#808080",
-            "empfehlung": "Keine Daten verfügbar"
-        }
-    
-    scale_type = evidence.get("scale_type", "positive")
-    thresholds = evidence.get("thresholds", {"kritisch": 2.0, "beobachten": 2.5, "gut": 3.0})
-    
-    # Bestimme Kategorie basierend auf Typ
-    if scale_type == "positive":
-        # Höher = besser
-        if score < thresholds["kritisch"]:
-            kategorie = "kritisch"
-            farbe = "#ff4b4b"
-            empfehlung = "Handlungsbedarf"
-        elif score < thresholds["beobachten"]:
-            kategorie = "beobachten"
-            farbe = "#ffa500"
-            empfehlung = "Beobachten"
-        else:
-            kategorie = "gut"
-            farbe = "#00cc88"
-            empfehlung = "Gut"
-    else:
-        # Niedriger = besser (z.B. ANXMAT)
-        if score > thresholds["kritisch"]:
-            kategorie = "kritisch"
-            farbe = "#ff4b4b"
-            empfehlung = "Handlungsbedarf"
-        elif score > thresholds["beobachten"]:
-            kategorie = "beobachten"
-            farbe = "#ffa500"
-            empfehlung = "Beobachten"
-        else:
-            kategorie = "gut"
-            farbe = "#00cc88"
-            empfehlung = "Gut"
-    
-    return {
-        "kategorie": kategorie,
-        "farbe": farbe,
-        "empfehlung": empfehlung,
-        "hattie": evidence.get("hattie", {}),
-        "pisa": evidence.get("pisa", {}),
-        "priority": evidence.get("intervention_priority", "UNBEKANNT"),
-        "tipps_sofort": evidence.get("was_tun", {}).get("sofort", []),
-        "erklaerung": evidence.get("erklaerung_schueler", ""),
-        "warum_wichtig": evidence.get("warum_wichtig", "")
-    }
+    entry = _EVIDENCE_INDEX["scales"].get(scale_name)
+    if entry is None:
+        return _UNKNOWN_INTERPRETATION
+    return entry["interpretations"][_classify(entry, score)]
+
+
+def interpret_many(scores_matrix, scales: Optional[Sequence[str]] = None) -> np.ndarray:
+    """
+    Klassifiziert viele Werte auf einmal (z.B. eine ganze Klasse).
+
+    Args:
+        scores_matrix: (Schüler × Skalen) - Array oder DataFrame
+        scales: Skalen-Codes der Spalten (bei DataFrames: die Spaltennamen)
+
+    Returns:
+        int-Array gleicher Form mit Index in ``CATEGORIES``
+        (0 = kritisch, 1 = beobachten, 2 = gut), -1 für fehlende Werte und
+        Skalen ohne Schwellen
+    """
+    if scales is None:
+        scales = list(scores_matrix.columns)
+    scores = np.asarray(scores_matrix, dtype=float)
+    if scores.ndim == 1:
+        scores = scores[:, None]
+
+    categories = np.full(scores.shape, -1, dtype=np.int8)
+    for col, scale_name in enumerate(scales):
+        entry = _EVIDENCE_INDEX["scales"].get(scale_name)
+        if entry is None or entry["bins"] is None:
+            continue
+        column = scores[:, col]
+        valid = ~np.isnan(column)
+        categories[valid, col] = entry["lookup"][np.digitize(column[valid], entry["bin_array"], right=entry["negative"])]
+    return categories
 
 
 def get_priority_ranking() -> list:
@@ -873,23 +866,68 @@ def get_priority_ranking() -> list:
     Returns:
         Liste von (scale_name, rank, priority) Tupeln
     """
-    ranking = []
-    for scale_name, data in EVIDENCE_DATABASE.items():
-        rank = data.get("xgboost_rank", 99)
-        priority = data.get("intervention_priority", "UNBEKANNT")
-        ranking.append((scale_name, rank, priority))
-    
-    return sorted(ranking, key=lambda x: x[1])
+    return list(_EVIDENCE_INDEX["ranking"])
 
 
 def format_hattie_badge(scale_name: str) -> str:
     """
-    Erstellt ein formatiertes Hattie-Badge für die Anzeige.
+    Formatiertes Hattie-Badge für die Anzeige.
     
     Returns:
         HTML-String mit Effektstärke und Rang
     """
-    hattie = get_hattie_info(scale_name)
+    entry = _EVIDENCE_INDEX["scales"].get(scale_name)
+    return entry["hattie_badge"] if entry else ""
+
+
+def format_pisa_badge(scale_name: str) -> str:
+    """
+    Formatiertes PISA-Badge für die Anzeige.
+    
+    Returns:
+        HTML-String mit PISA-Korrelation und Impact
+    """
+    entry = _EVIDENCE_INDEX["scales"].get(scale_name)
+    return entry["pisa_badge"] if entry else ""
+
+
+# ============================================
+# EVIDENZ-INDEX (einmal beim Import)
+# ============================================
+
+CATEGORIES = ("kritisch", "beobachten", "gut")
+
+CATEGORY_STYLES = {
+    "kritisch": ("#ff4b4b", "Handlungsbedarf"),
+    "beobachten": ("#ffa500", "Beobachten"),
+    "gut": ("#00cc88", "Gut"),
+}
+
+DEFAULT_THRESHOLDS = {"kritisch": 2.0, "beobachten": 2.5, "gut": 3.0}
+
+_UNKNOWN_INTERPRETATION = {
+    "kategorie": "unbekannt",
+    "farbe": "#808080",
+    "empfehlung": "Keine Daten verfügbar"
+}
+
+# digitize-Bin -> Index in CATEGORIES
+_POSITIVE_LOOKUP = np.array([0, 1, 2], dtype=np.int8)   # < kritisch, < beobachten, sonst
+_NEGATIVE_LOOKUP = np.array([2, 1, 0], dtype=np.int8)   # <= beobachten, <= kritisch, sonst
+
+
+def _classify(entry: dict, score: float) -> str:
+    """Kategorie eines Einzelwerts (gleiche Grenzen wie ``interpret_many``)."""
+    if entry["bins"] is None:
+        return "unbekannt"
+    low, high = entry["bins"]
+    if entry["negative"]:
+        # Niedriger = besser (z.B. ANXMAT)
+        return "gut" if score <= low else "beobachten" if score <= high else "kritisch"
+    return "kritisch" if score < low else "beobachten" if score < high else "gut"
+
+
+def _render_hattie_badge(hattie: dict, scale_name: str) -> str:
     if not hattie:
         return ""
     
@@ -922,14 +960,7 @@ def format_hattie_badge(scale_name: str) -> str:
     """
 
 
-def format_pisa_badge(scale_name: str) -> str:
-    """
-    Erstellt ein formatiertes PISA-Badge für die Anzeige.
-    
-    Returns:
-        HTML-String mit PISA-Korrelation und Impact
-    """
-    pisa = get_pisa_info(scale_name)
+def _render_pisa_badge(pisa: dict) -> str:
     if not pisa:
         return ""
     
@@ -945,3 +976,55 @@ def format_pisa_badge(scale_name: str) -> str:
         <small>Korrelation: r = {correlation} | Erklärt {variance} der Unterschiede</small>
     </div>
     """
+
+
+def _build_evidence_index() -> Dict[str, object]:
+    """
+    Rendert pro Skala Schwellen, die drei möglichen Interpretationen,
+    beide Badges und die Prioritäten-Reihenfolge vor.
+
+    Externe Skalen (``thresholds: None``) bekommen keine Bins; sie werden
+    mit Kategorie "unbekannt" interpretiert statt mit Standard-Schwellen.
+    """
+    scales = {}
+    for scale_name, evidence in EVIDENCE_DATABASE.items():
+        negative = evidence.get("scale_type", "positive") == "negative"
+        thresholds = evidence.get("thresholds", DEFAULT_THRESHOLDS)
+        bins = None
+        if thresholds:
+            bins = (thresholds["beobachten"], thresholds["kritisch"]) if negative \
+                else (thresholds["kritisch"], thresholds["beobachten"])
+
+        shared = {
+            "hattie": evidence.get("hattie", {}),
+            "pisa": evidence.get("pisa", {}),
+            "priority": evidence.get("intervention_priority", "UNBEKANNT"),
+            "tipps_sofort": evidence.get("was_tun", {}).get("sofort", []),
+            "erklaerung": evidence.get("erklaerung_schueler", ""),
+            "warum_wichtig": evidence.get("warum_wichtig", "")
+        }
+        interpretations = {
+            kategorie: {"kategorie": kategorie, "farbe": farbe, "empfehlung": empfehlung, **shared}
+            for kategorie, (farbe, empfehlung) in CATEGORY_STYLES.items()
+        }
+        interpretations["unbekannt"] = {**_UNKNOWN_INTERPRETATION, "empfehlung": "Keine Schwellenwerte", **shared}
+
+        scales[scale_name] = {
+            "negative": negative,
+            "bins": bins,
+            "bin_array": None if bins is None else np.array(bins),
+            "lookup": _NEGATIVE_LOOKUP if negative else _POSITIVE_LOOKUP,
+            "interpretations": interpretations,
+            "hattie_badge": _render_hattie_badge(evidence.get("hattie", {}), scale_name),
+            "pisa_badge": _render_pisa_badge(evidence.get("pisa", {})),
+        }
+
+    ranking: List[Tuple[str, int, str]] = sorted(
+        ((scale_name, data.get("xgboost_rank", 99), data.get("intervention_priority", "UNBEKANNT"))
+         for scale_name, data in EVIDENCE_DATABASE.items()),
+        key=lambda x: 99 if x[1] is None else x[1]   # externe Skalen: xgboost_rank None
+    )
+    return {"scales": scales, "ranking": tuple(ranking)}
+
+
+_EVIDENCE_INDEX = _build_evidence_index()
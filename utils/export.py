@@ -0,0 +1,448 @@
+"""
+📥 Export
+=========
+
+Excel-/CSV-Export der Coaching-Daten (Schüler, Assessments, Förderpläne,
+Fortschritts-Logs) und der Gamification-Tabellen der aktiven Schule.
+
+Der Export arbeitet durchgehend zeilenweise:
+- Lesen über den SQLite-Cursor in Blöcken von ``CHUNK_SIZE`` Zeilen
+  (SQLite liefert die Zeilen schrittweise, nichts wird vorab geladen)
+- Assessments: Skalen-Scores kommen aus dem ``summary``-Header
+  (``utils/assessment_codec.py``), der Ergebnis-Blob wird nicht gelesen
+- Excel: openpyxl im ``write_only``-Modus, CSV: ZIP mit einer Datei pro
+  Tabelle, geschrieben in Blöcken
+- Ziel ist eine ``SpooledTemporaryFile`` (bis ``SPOOL_MAX_BYTES`` im
+  Speicher, danach auf der Platte). Das Panel liest sie einmal als Bytes
+  (``st.download_button`` nimmt keine Temp-Dateien an) und schließt sie -
+  im Session State liegen nur die Bytes, kein offenes Datei-Handle
+
+Verwendung:
+    from utils.export import render_export_panel
+    render_export_panel()
+
+    # Selbsttest des Panels (AppTest auf einem temporären Schul-Shard)
+    python -m utils.export --check
+
+    # oder ohne Streamlit
+    with build_export("xlsx") as f:
+        Path("export.xlsx").write_bytes(f.read())
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import uuid
+import zipfile
+from dataclasses import dataclass
+from datetime import datetime
+from tempfile import SpooledTemporaryFile
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from utils import shards
+from utils.assessment_codec import decode_summary
+from utils.irt_model import load_item_banks
+from utils.scale_info import get_all_scales
+
+try:
+    from openpyxl import Workbook
+    EXCEL_AVAILABLE = True
+except ImportError:
+    EXCEL_AVAILABLE = False
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+CHUNK_SIZE = 500
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+# Excel erlaubt max. 31 Zeichen pro Blattname
+MAX_SHEET_TITLE = 31
+
+# (done, total, label) - wird nach jedem Block aufgerufen
+ProgressCallback = Callable[[int, int, str], None]
+
+
+@dataclass(frozen=True)
+class ExportTable:
+    """Eine exportierte Tabelle (ein Excel-Blatt bzw. eine CSV-Datei)."""
+    key: str
+    title: str
+    kind: str                      # "coaching" oder "gamification"
+    table: str
+    order_by: str = "rowid"
+    transform: Optional[Callable[[List[str]], "RowTransform"]] = None
+    exclude: Tuple[str, ...] = ()
+
+
+# ============================================
+# ASSESSMENTS: JSON + SKALEN
+# ============================================
+
+ASSESSMENT_SCALES = get_all_scales()
+
+
+class RowTransform:
+    """Header- und Zeilen-Umwandlung für Tabellen mit abgeleiteten Spalten."""
+
+    def __init__(self, columns: List[str]):
+        self.columns = columns
+
+    @property
+    def header(self) -> List[str]:
+        return self.columns
+
+    def __call__(self, row: Sequence[Any]) -> List[Any]:
+        return list(row)
+
+
+class AssessmentTransform(RowTransform):
+    """
+    Ersetzt den ``summary``-Header durch die Screening-Stufe, einen Score
+    pro Skala und den PISA-WLE pro kalibrierter Skala. Skalen außerhalb von
+    ``ASSESSMENT_SCALES`` landen als JSON in ``weitere_skalen``.
+    """
+
+    def __init__(self, columns: List[str]):
+        super().__init__(columns)
+        self._summary_index = columns.index("summary")
+        self._known = set(ASSESSMENT_SCALES)
+        self._wle_scales = [scale for scale in ASSESSMENT_SCALES if scale in load_item_banks()]
+
+    @property
+    def header(self) -> List[str]:
+        base = [c for c in self.columns if c != "summary"]
+        return (base + ["stufe"] + ASSESSMENT_SCALES + [f"{scale}_wle" for scale in self._wle_scales]
+                + ["weitere_skalen"])
+
+    def __call__(self, row: Sequence[Any]) -> List[Any]:
+        values = list(row)
+        summary = decode_summary(values.pop(self._summary_index))
+        scores = summary.get("scales", {})
+        extra = {k: v for k, v in scores.items() if k not in self._known}
+
+        values.append(summary.get("screening_level"))
+        values.extend(scores.get(scale) for scale in ASSESSMENT_SCALES)
+        values.extend(summary.get("wle", {}).get(scale) for scale in self._wle_scales)
+        values.append(json.dumps(extra, ensure_ascii=False) if extra else None)
+        return values
+
+
+EXPORT_TABLES = [
+    ExportTable("students", "Schüler", "coaching", "students", "id"),
+    ExportTable("assessments", "Assessments", "coaching", "assessments", "id", AssessmentTransform,
+                exclude=("results",)),
+    ExportTable("development_plans", "Förderpläne", "coaching", "development_plans", "id"),
+    ExportTable("progress_logs", "Fortschritt", "coaching", "progress_logs", "id"),
+    ExportTable("users", "Gamification-User", "gamification", "users", "user_id"),
+    ExportTable("activity_log", "Aktivitäten", "gamification", "activity_log", "id"),
+    ExportTable("activity_daily", "Aktivitäten (Tage)", "gamification", "activity_daily",
+                "activity_date, user_id"),
+    ExportTable("bandura_entries", "Bandura", "gamification", "bandura_entries", "id"),
+    ExportTable("motivation_activity_log", "Motivation", "gamification", "motivation_activity_log", "id"),
+]
+
+EXPORT_TABLES_BY_KEY = {t.key: t for t in EXPORT_TABLES}
+
+
+# ============================================
+# LESEN
+# ============================================
+
+def _connect_readonly(kind: str) -> sqlite3.Connection:
+    """Nur-Lese-Verbindung zur Datenbank der aktiven Schule."""
+    path = shards.get_db_path(kind)
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone() is not None
+
+
+def count_rows(tables: Sequence[ExportTable]) -> Dict[str, int]:
+    """Zeilen pro Tabelle (für die Fortschrittsanzeige)."""
+    counts = {}
+    for kind in {t.kind for t in tables}:
+        try:
+            conn = _connect_readonly(kind)
+        except sqlite3.OperationalError:
+            continue
+        try:
+            for t in tables:
+                if t.kind == kind and _table_exists(conn, t.table):
+                    counts[t.key] = conn.execute(f"SELECT COUNT(*) FROM {t.table}").fetchone()[0]
+        finally:
+            conn.close()
+    return counts
+
+
+def iter_table(table: ExportTable) -> Iterator[List[Any]]:
+    """
+    Liefert zuerst den Header, danach die Zeilen einer Tabelle.
+
+    Es liegen nie mehr als ``CHUNK_SIZE`` Rohzeilen gleichzeitig im Speicher.
+    """
+    try:
+        conn = _connect_readonly(table.kind)
+    except sqlite3.OperationalError:
+        return
+    try:
+        if not _table_exists(conn, table.table):
+            return
+
+        columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table.table})")
+                   if row[1] not in table.exclude]
+        cursor = conn.execute(f"SELECT {', '.join(columns)} FROM {table.table} ORDER BY {table.order_by}")
+        cursor.arraysize = CHUNK_SIZE
+        transform = (table.transform or RowTransform)(columns)
+
+        yield transform.header
+        for chunk in iter(cursor.fetchmany, []):
+            for row in chunk:
+                yield transform(row)
+    finally:
+        conn.close()
+
+
+def _iter_with_progress(tables: Sequence[ExportTable], progress: Optional[ProgressCallback]):
+    """(Tabelle, Zeilen-Iterator) mit Fortschrittsmeldung alle CHUNK_SIZE Zeilen."""
+    counts = count_rows(tables) if progress else {}
+    total = sum(counts.values())
+    done = 0
+
+    for table in tables:
+        def rows(table=table, offset=done):
+            n = -1  # Header zählt nicht
+            for row in iter_table(table):
+                yield row
+                n += 1
+                if progress and n and n % CHUNK_SIZE == 0:
+                    progress(offset + n, total, table.title)
+            if progress:
+                progress(offset + counts.get(table.key, 0), total, table.title)
+
+        yield table, rows()
+        done += counts.get(table.key, 0)
+
+
+# ============================================
+# SCHREIBEN
+# ============================================
+
+def _excel_value(value: Any) -> Any:
+    # openpyxl lehnt Steuerzeichen ab, die in Freitexten vorkommen können
+    if isinstance(value, str):
+        return "".join(ch for ch in value if ch >= " " or ch in "\t\n\r")
+    return value
+
+
+def write_excel(target: BinaryIO, tables: Sequence[ExportTable],
+                progress: Optional[ProgressCallback] = None) -> None:
+    """Schreibt alle Tabellen als Blätter einer write-only Arbeitsmappe."""
+    if not EXCEL_AVAILABLE:
+        raise RuntimeError("openpyxl ist nicht installiert - bitte CSV-Export verwenden.")
+
+    workbook = Workbook(write_only=True)
+    for table, rows in _iter_with_progress(tables, progress):
+        sheet = workbook.create_sheet(title=table.title[:MAX_SHEET_TITLE])
+        for row in rows:
+            sheet.append([_excel_value(v) for v in row])
+    workbook.save(target)
+
+
+def write_csv_zip(target: BinaryIO, tables: Sequence[ExportTable],
+                  progress: Optional[ProgressCallback] = None) -> None:
+    """Schreibt eine CSV-Datei pro Tabelle in ein ZIP (UTF-8 mit BOM, ``;`` für Excel)."""
+    with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for table, rows in _iter_with_progress(tables, progress):
+            with archive.open(f"{table.key}.csv", "w") as raw:
+                text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+                writer = csv.writer(text, delimiter=";")
+                for row in rows:
+                    writer.writerow(row)
+                text.flush()
+                text.detach()
+
+
+def build_export(fmt: str = "xlsx", keys: Optional[Sequence[str]] = None,
+                 progress: Optional[ProgressCallback] = None) -> BinaryIO:
+    """
+    Erstellt einen Export der aktiven Schule.
+
+    Args:
+        fmt: "xlsx" oder "csv" (ZIP mit einer CSV pro Tabelle)
+        keys: Auswahl aus EXPORT_TABLES (Standard: alle)
+        progress: Callback (done, total, label)
+
+    Returns:
+        Zurückgespulte Datei (vom Aufrufer zu schließen)
+    """
+    tables = [EXPORT_TABLES_BY_KEY[k] for k in keys] if keys else list(EXPORT_TABLES)
+    if any(t.kind == "coaching" for t in tables):
+        # Alte Assessments bekommen ihren Score-Header bei der Migration
+        from utils.coaching_db import init_database
+        init_database(shards.get_db_path("coaching"))
+    target = SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    if fmt == "xlsx":
+        write_excel(target, tables, progress)
+    elif fmt == "csv":
+        write_csv_zip(target, tables, progress)
+    else:
+        raise ValueError(f"Unbekanntes Export-Format: {fmt!r}")
+    target.seek(0)
+    return target
+
+
+# ============================================
+# UI
+# ============================================
+
+EXPORT_FORMATS = {
+    "xlsx": ("Excel (.xlsx)", "xlsx",
+             "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "csv": ("CSV (.zip)", "zip", "application/zip"),
+}
+
+
+def render_export_panel(key_prefix: str = "export") -> None:
+    """Auswahl, Fortschrittsbalken und Download-Button für den Export."""
+    import streamlit as st
+
+    formats = [f for f in EXPORT_FORMATS if f != "xlsx" or EXCEL_AVAILABLE]
+    fmt = st.radio("Format", formats, format_func=lambda f: EXPORT_FORMATS[f][0],
+                   horizontal=True, key=f"{key_prefix}_format")
+    keys = st.multiselect(
+        "Tabellen", [t.key for t in EXPORT_TABLES], default=[t.key for t in EXPORT_TABLES],
+        format_func=lambda k: EXPORT_TABLES_BY_KEY[k].title, key=f"{key_prefix}_tables",
+    )
+
+    if st.button("📥 Export erstellen", key=f"{key_prefix}_build", disabled=not keys,
+                 use_container_width=True):
+        bar = st.progress(0.0, text="Export wird vorbereitet...")
+
+        def progress(done: int, total: int, label: str) -> None:
+            bar.progress(min(done / total, 1.0) if total else 1.0, text=f"{label}: {done}/{total} Zeilen")
+
+        with build_export(fmt, keys, progress) as export_file:
+            st.session_state[f"{key_prefix}_file"] = (fmt, export_file.read())
+        bar.empty()
+
+    built = st.session_state.get(f"{key_prefix}_file")
+    if built:
+        fmt, data = built
+        _, extension, mime = EXPORT_FORMATS[fmt]
+        st.download_button(
+            "⬇️ Herunterladen", data=data, mime=mime, use_container_width=True,
+            file_name=f"pulse_export_{shards.get_current_school()}_{datetime.now():%Y%m%d_%H%M}.{extension}",
+            key=f"{key_prefix}_download",
+        )
+
+
+# ============================================
+# SELBSTTEST
+# ============================================
+
+_PANEL_SCRIPT = """
+import sys
+sys.path.insert(0, {root!r})
+import streamlit as st
+from streamlit.runtime import Runtime
+from utils.export import render_export_panel
+render_export_panel()
+# Media-Speicher der Test-Runtime, um die ausgelieferte Datei zu lesen
+st.session_state["_check_media"] = Runtime.instance().media_file_mgr
+"""
+
+
+def check_panel(fmt: str = "csv") -> int:
+    """
+    Klickt im Panel "Export erstellen" und danach "Herunterladen" (AppTest)
+    und prüft die ausgelieferte Datei. Läuft auf einem temporären Schul-Shard
+    mit einem Test-Schüler.
+
+    Returns:
+        Größe der heruntergeladenen Datei in Bytes
+
+    Raises:
+        AssertionError: Fehler im Panel oder ungültige Datei
+        RuntimeError: Excel-Export ohne openpyxl
+    """
+    from streamlit.testing.v1 import AppTest
+
+    from utils import coaching_db
+
+    if fmt == "xlsx" and not EXCEL_AVAILABLE:
+        raise RuntimeError("openpyxl ist nicht installiert - bitte CSV-Export verwenden.")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    previous = {name: os.environ.get(name) for name in ("PULSE_SHARD_DIR", "PULSE_SCHOOL")}
+    with tempfile.TemporaryDirectory(prefix="pulse_export_") as shard_dir:
+        school = f"export-{uuid.uuid4().hex[:8]}"
+        os.environ["PULSE_SHARD_DIR"] = shard_dir
+        os.environ["PULSE_SCHOOL"] = school
+        try:
+            shards.provision_school(school)
+            with shards.use_school(school):
+                coaching_db.create_student("EXPORT-CHECK")
+
+            at = AppTest.from_string(_PANEL_SCRIPT.format(root=root), default_timeout=60)
+            at.run()
+            at.radio(key="export_format").set_value(fmt)
+            at.button(key="export_build").click().run()
+            assert not at.exception, at.exception[0].message
+            _, data = at.session_state["export_file"]
+            assert isinstance(data, bytes), f"Session State enthält {type(data).__name__} statt Bytes"
+
+            download = at.get("download_button")
+            assert download, "Kein Download-Button nach dem Export"
+            download[0].click().run()
+            assert not at.exception, at.exception[0].message
+
+            # Ausgelieferte Datei aus dem Media-Speicher der Test-Runtime
+            filename = download[0].proto.url.rsplit("/", 1)[-1]
+            served = at.session_state["_check_media"]._storage.get_file(filename).content
+        finally:
+            for name, value in previous.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+    assert served == data, "Heruntergeladene Datei weicht vom Export ab"
+    with zipfile.ZipFile(io.BytesIO(served)) as archive:
+        if fmt == "csv":
+            students = archive.read("students.csv").decode("utf-8-sig")
+            assert "EXPORT-CHECK" in students, "Test-Schüler fehlt im Export"
+        else:
+            assert "xl/workbook.xml" in archive.namelist(), "Keine gültige Excel-Datei"
+    return len(served)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export der Coaching- und Gamification-Daten")
+    parser.add_argument("--check", action="store_true",
+                        help="Panel per AppTest prüfen (Export erstellen + Herunterladen)")
+    parser.add_argument("--format", choices=sorted(EXPORT_FORMATS), default="csv")
+    args = parser.parse_args(argv)
+    if not args.check:
+        parser.print_help()
+        return 2
+
+    try:
+        size = check_panel(args.format)
+    except (AssertionError, RuntimeError) as e:
+        print(f"❌ Export-Panel ({args.format}): {e}")
+        return 1
+    print(f"✅ Export-Panel ({args.format}): Export erstellt und heruntergeladen, {size} Bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+🧩 Widget-Fragmente
+===================
+
+Teil-Reruns für die interaktiven Widgets (Hattie, Bandura, Lernstrategien,
+Motivation) über ``st.fragment``.
+
+Ohne Fragmente führt jeder Klick in einem Widget die komplette Seite neu aus -
+inklusive Ressourcen-Tabs und aller DB-Abfragen. Als Fragment läuft nur die
+Widget-Funktion erneut.
+
+Regeln für Fragment-Widgets:
+- Connections und Loader IM Fragment öffnen. Bei einem Fragment-Rerun ruft
+  Streamlit die Funktion mit den Argumenten des letzten vollen Laufs auf -
+  eine vom Host übergebene (und danach geschlossene) Connection ist ungültig.
+- Kein ``st.sidebar`` im Fragment (verbietet Streamlit).
+- ``rerun_widget()`` statt ``st.rerun()``: startet während eines
+  Fragment-Reruns nur das Fragment neu, sonst die ganze Seite.
+
+``st.fragment`` gibt es ab Streamlit 1.37 (``experimental_fragment`` ab 1.33).
+Ältere Versionen oder ``PULSE_FRAGMENTS=0`` rendern die Widgets wie bisher als
+normale Funktionen - damit lässt sich die Vorher-Messung reproduzieren.
+
+Laufzeiten: Seiten melden ihre Läufe über ``begin_page_run``/``end_page_run``,
+die Fragmente protokollieren sich selbst. Unter ``PULSE_PROFILE=1`` zeigt
+``render_rerun_timings`` die Werte an:
+    from utils.fragments import begin_page_run, end_page_run, render_rerun_timings
+    begin_page_run("Ressourcen")
+    ...
+    render_rerun_timings()
+    end_page_run()
+"""
+
+import functools
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+import streamlit as st
+
+try:
+    from streamlit.errors import StreamlitAPIException
+except ImportError:
+    StreamlitAPIException = Exception
+
+from .startup_profiler import is_profiling_enabled
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+ENV_FLAG = "PULSE_FRAGMENTS"
+
+TIMINGS_KEY = "_rerun_timings"
+PAGE_RUN_KEY = "_page_run"
+MAX_TIMINGS = 50
+
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+# Erst st.fragment (1.37) kennt st.rerun(scope="fragment")
+_HAS_SCOPED_RERUN = hasattr(st, "fragment")
+
+# Läuft gerade ein Fragment-Rerun? (pro Script-Thread = pro Session)
+_local = threading.local()
+
+
+def fragments_enabled() -> bool:
+    """True, wenn Widgets als Fragmente laufen."""
+    if _fragment is None:
+        return False
+    return os.environ.get(ENV_FLAG, "1").lower() not in ("0", "false", "no")
+
+
+# ============================================
+# LAUFZEITEN
+# ============================================
+
+def _record(kind: str, name: str, rerun: str, duration_ms: float) -> None:
+    timings: List[Dict[str, Any]] = st.session_state.setdefault(TIMINGS_KEY, [])
+    timings.append({"kind": kind, "name": name, "rerun": rerun, "ms": round(duration_ms, 1)})
+    del timings[:-MAX_TIMINGS]
+
+
+def begin_page_run(page_name: str) -> None:
+    """Markiert den Beginn eines vollen Seitenlaufs."""
+    previous = st.session_state.get(PAGE_RUN_KEY)
+    st.session_state[PAGE_RUN_KEY] = {
+        "page": page_name,
+        "id": (previous["id"] + 1) if previous else 1,
+        "start": time.perf_counter(),
+    }
+
+
+def end_page_run() -> None:
+    """Protokolliert die Laufzeit des aktuellen Seitenlaufs."""
+    run = st.session_state.get(PAGE_RUN_KEY)
+    if run and run.get("start") is not None:
+        _record("page", run["page"], "full", (time.perf_counter() - run["start"]) * 1000)
+        run["start"] = None
+
+
+def get_rerun_timings() -> List[Dict[str, Any]]:
+    """Protokollierte Läufe dieser Session (älteste zuerst)."""
+    return list(st.session_state.get(TIMINGS_KEY, []))
+
+
+def summarize_timings(timings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Mittelwert und Anzahl pro (Art, Name, Rerun-Typ)."""
+    groups: Dict[tuple, List[float]] = {}
+    for entry in timings:
+        groups.setdefault((entry["kind"], entry["name"], entry["rerun"]), []).append(entry["ms"])
+    return [
+        {"kind": kind, "name": name, "rerun": rerun, "runs": len(values),
+         "avg_ms": round(sum(values) / len(values), 1), "last_ms": values[-1]}
+        for (kind, name, rerun), values in groups.items()
+    ]
+
+
+def render_rerun_timings() -> None:
+    """Zeigt Seiten- und Fragment-Laufzeiten an (nur mit PULSE_PROFILE=1)."""
+    if not is_profiling_enabled():
+        return
+    summary = summarize_timings(get_rerun_timings())
+    if not summary:
+        return
+    with st.expander("⏱️ Rerun-Zeiten", expanded=False):
+        mode = "Fragmente aktiv" if fragments_enabled() else "Fragmente aus (ganze Seite)"
+        st.caption(f"{mode} · Mittelwerte dieser Session")
+        lines = ["| Lauf | Rerun | Anzahl | Ø ms | zuletzt ms |", "|---|---|---|---|---|"]
+        for row in summary:
+            label = row["name"] if row["kind"] == "page" else f"🧩 {row['name']}"
+            rerun = "ganze Seite" if row["rerun"] == "full" else "nur Fragment"
+            lines.append(f"| {label} | {rerun} | {row['runs']} | {row['avg_ms']} | {row['last_ms']} |")
+        st.markdown("\n".join(lines))
+
+
+# ============================================
+# FRAGMENTE
+# ============================================
+
+def _in_fragment_rerun() -> bool:
+    return getattr(_local, "fragment_rerun", 0) > 0
+
+
+def widget_fragment(name: str) -> Callable[[Callable], Callable]:
+    """
+    Decorator: rendert ein Widget als ``st.fragment`` und misst jeden Lauf.
+
+    Ohne Fragment-Unterstützung bleibt die Funktion eine normale Funktion
+    (die Laufzeit wird trotzdem protokolliert).
+    """
+    def decorator(func: Callable) -> Callable:
+        seen_key = f"_fragment_seen_{name}"
+
+        @functools.wraps(func)
+        def run(*args, **kwargs):
+            page_run = st.session_state.get(PAGE_RUN_KEY)
+            run_id = page_run["id"] if page_run else None
+            # Derselbe Seitenlauf wie beim letzten Aufruf -> Streamlit hat nur
+            # das Fragment neu gestartet
+            fragment_rerun = (
+                fragments_enabled()
+                and run_id is not None
+                and st.session_state.get(seen_key) == run_id
+            )
+            st.session_state[seen_key] = run_id
+
+            if fragment_rerun and is_profiling_enabled():
+                last_page = next(
+                    (t["ms"] for t in reversed(get_rerun_timings()) if t["kind"] == "page"), None
+                )
+                if last_page is not None:
+                    st.caption(f"⏱️ Nur Widget neu geladen · letzter voller Seitenlauf: {last_page:.0f} ms")
+
+            _local.fragment_rerun = getattr(_local, "fragment_rerun", 0) + fragment_rerun
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _local.fragment_rerun -= fragment_rerun
+                _record("fragment", name, "fragment" if fragment_rerun else "full",
+                        (time.perf_counter() - start) * 1000)
+
+        if fragments_enabled():
+            return _fragment(run)
+        return run
+
+    return decorator
+
+
+def rerun_widget() -> None:
+    """
+    Rerun nach einer Widget-Aktion.
+
+    Während eines Fragment-Reruns wird nur das Fragment neu ausgeführt,
+    sonst (voller Lauf, keine Fragmente) die ganze Seite.
+    """
+    if _in_fragment_rerun() and _HAS_SCOPED_RERUN:
+        try:
+            st.rerun(scope="fragment")
+        except StreamlitAPIException:
+            # Doch ein voller Lauf (z.B. Seite ohne begin_page_run)
+            pass
+    st.rerun()
@@ -12,11 +12,16 @@ Features:
 """
 
 import sqlite3
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import json
 
+from .migrations import ensure_schema
+from . import shards
+from .preview_store import connect_db
+from .storage import routed
+
 # ============================================
 # KONFIGURATION
 # ============================================
@@ -46,98 +51,58 @@ LEVELS = {
 # ============================================
 
 def get_db_path() -> Path:
-    """Gibt den Pfad zur SQLite-Datenbank zurück."""
-    # Für Streamlit Cloud: tmp-Verzeichnis, sonst lokaler Ordner
-    if Path("/tmp").exists() and Path("/tmp").is_dir():
-        db_dir = Path("/tmp")
-    else:
-        db_dir = Path(__file__).parent.parent / "data"
-        db_dir.mkdir(exist_ok=True)
-    return db_dir / "hattie_gamification.db"
+    """Gibt den Pfad zur SQLite-Datenbank der aktiven Schule zurück (siehe utils/shards.py)."""
+    return shards.get_db_path("gamification")
 
 # ============================================
 # DATABASE INITIALIZATION
 # ============================================
 
 def init_database() -> None:
-    """Initialisiert die SQLite-Datenbank mit allen Tabellen."""
-    conn = sqlite3.connect(get_db_path())
-    c = conn.cursor()
-    
-    # Users-Tabelle
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            user_id TEXT PRIMARY KEY,
-            username TEXT DEFAULT 'Lernender',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            xp_total INTEGER DEFAULT 0,
-            level INTEGER DEFAULT 1,
-            current_streak INTEGER DEFAULT 0,
-            longest_streak INTEGER DEFAULT 0,
-            last_activity_date DATE,
-            settings TEXT DEFAULT '{}'
-        )
-    ''')
-    
-    # Challenges-Tabelle
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS challenges (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            challenge_date DATE NOT NULL,
-            subject TEXT NOT NULL,
-            task_description TEXT,
-            prediction INTEGER NOT NULL,
-            actual_result INTEGER,
-            outcome TEXT,
-            xp_earned INTEGER DEFAULT 0,
-            reflection TEXT,
-            completed BOOLEAN DEFAULT FALSE,
-            FOREIGN KEY (user_id) REFERENCES users(user_id)
-        )
-    ''')
-    
-    # User-Badges-Tabelle
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS user_badges (
-            user_id TEXT NOT NULL,
-            badge_id TEXT NOT NULL,
-            earned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (user_id, badge_id),
-            FOREIGN KEY (user_id) REFERENCES users(user_id)
-        )
-    ''')
-    
-    # Activity-Log für Contribution-Graph
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS activity_log (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id TEXT NOT NULL,
-            activity_date DATE NOT NULL,
-            activity_type TEXT NOT NULL,
-            xp_earned INTEGER DEFAULT 0,
-            details TEXT,
-            FOREIGN KEY (user_id) REFERENCES users(user_id)
-        )
-    ''')
-    
-    # Indizes für Performance
-    c.execute('CREATE INDEX IF NOT EXISTS idx_challenges_user ON challenges(user_id)')
-    c.execute('CREATE INDEX IF NOT EXISTS idx_challenges_date ON challenges(challenge_date)')
-    c.execute('CREATE INDEX IF NOT EXISTS idx_activity_user_date ON activity_log(user_id, activity_date)')
-    
-    conn.commit()
-    conn.close()
+    """
+    Stellt sicher, dass das Schema aktuell ist.
+
+    Das Schema selbst liegt in ``utils/migrations.py``; nach der ersten
+    Migration im Prozess ist dieser Aufruf ein reiner Set-Lookup.
+    """
+    ensure_schema(get_db_path())
 
 # ============================================
 # USER MANAGEMENT
 # ============================================
 
+# Lokale Schreibzugriffe pro User in diesem Prozess. Session-Snapshots
+# (siehe user_system) vertrauen ihrem Stand nur, solange sich dieser
+# Zähler nicht geändert hat - Schreibzugriffe anderer Prozesse werden
+# über die version-Spalte erkannt. Schlüssel ist (Schule, User), da
+# gleiche user_ids in mehreren Schul-Shards vorkommen.
+_local_user_writes: Dict[Tuple[str, str], int] = {}
+
+def mark_user_written(user_id: str) -> None:
+    """Merkt sich, dass dieser Prozess den User geändert hat."""
+    key = (shards.get_current_school(), user_id)
+    _local_user_writes[key] = _local_user_writes.get(key, 0) + 1
+
+def get_local_user_writes(user_id: str) -> int:
+    """Anzahl der Schreibzugriffe dieses Prozesses auf den User (aktive Schule)."""
+    return _local_user_writes.get((shards.get_current_school(), user_id), 0)
+
+@routed("users.get_version")
+def get_user_version(user_id: str) -> Optional[int]:
+    """Liest nur die version-Spalte eines Users (Primärschlüssel-Lookup)."""
+    conn = connect_db(get_db_path(), user_id)
+    try:
+        row = conn.execute("SELECT version FROM users WHERE user_id = ?", (user_id,)).fetchone()
+    except sqlite3.OperationalError:
+        row = None
+    conn.close()
+    return (row[0] or 0) if row else None
+
+@routed("users.get_or_create")
 def get_or_create_user(user_id: str, username: str = "Lernender") -> Dict[str, Any]:
     """Holt oder erstellt einen User."""
     init_database()
-    conn = sqlite3.connect(get_db_path())
+    conn = connect_db(get_db_path(), user_id)
     conn.row_factory = sqlite3.Row
     c = conn.cursor()
     
@@ -157,9 +122,10 @@ def get_or_create_user(user_id: str, username: str = "Lernender") -> Dict[str, A
     conn.close()
     return result
 
+@routed("users.update_stats")
 def update_user_stats(user_id: str, xp_delta: int, streak: int) -> Dict[str, Any]:
     """Aktualisiert XP und Streak eines Users."""
-    conn = sqlite3.connect(get_db_path())
+    conn = connect_db(get_db_path(), user_id)
     conn.row_factory = sqlite3.Row
     c = conn.cursor()
     
@@ -173,11 +139,13 @@ def update_user_stats(user_id: str, xp_delta: int, streak: int) -> Dict[str, Any
     
     c.execute('''
         UPDATE users 
-        SET xp_total = ?, level = ?, current_streak = ?, longest_streak = ?, last_activity_date = ?
+        SET xp_total = ?, level = ?, current_streak = ?, longest_streak = ?, last_activity_date = ?,
+            version = COALESCE(version, 0) + 1
         WHERE user_id = ?
     ''', (new_xp, new_level, streak, longest, today, user_id))
     
     conn.commit()
+    mark_user_written(user_id)
     
     c.execute("SELECT * FROM users WHERE user_id = ?", (user_id,))
     result = dict(c.fetchone())
@@ -196,15 +164,60 @@ def get_level_info(level: int) -> Dict[str, Any]:
     """Gibt Level-Informationen zurück."""
     return LEVELS.get(level, LEVELS[1])
 
+# ============================================
+# SPIELREGELN (backend-unabhängig, siehe utils/storage)
+# ============================================
+
+def challenge_outcome(prediction: int, actual_result: int, is_note_type: bool) -> Tuple[str, int]:
+    """
+    Ergebnis einer Challenge und Basis-XP.
+
+    Bei Noten: niedrigere Zahl = besser (Note 1 > Note 2).
+    Bei Prozent/Punkten: höhere Zahl = besser.
+
+    Returns:
+        ("exceeded" | "exact" | "below", Basis-XP)
+    """
+    exceeded = actual_result < prediction if is_note_type else actual_result > prediction
+    if exceeded:
+        return "exceeded", XP_CONFIG["challenge_completed"] + XP_CONFIG["exceeded_expectation"]
+    if actual_result == prediction:
+        return "exact", XP_CONFIG["challenge_completed"] + XP_CONFIG["prediction_exact"]
+    return "below", XP_CONFIG["challenge_completed"]
+
+def apply_streak_bonus(base_xp: int, streak: int) -> int:
+    """Streak-Bonus (ab 3, 7 und 30 Tagen)."""
+    if streak >= 30:
+        return int(base_xp * XP_CONFIG["streak_bonus_30"])
+    if streak >= 7:
+        return int(base_xp * XP_CONFIG["streak_bonus_7"])
+    if streak >= 3:
+        return int(base_xp * XP_CONFIG["streak_bonus_3"])
+    return base_xp
+
+def next_streak(current_streak: Optional[int], last_activity: Optional[str], today: date) -> int:
+    """Streak nach einer Aktivität heute (letzte Aktivität als ISO-Datum)."""
+    if not last_activity:
+        return 1
+    if last_activity == today.isoformat():
+        # Heute schon aktiv - Streak bleibt
+        return current_streak or 0
+    if last_activity == (today - timedelta(days=1)).isoformat():
+        # Gestern aktiv - Streak erhöht sich
+        return (current_streak or 0) + 1
+    # Streak unterbrochen
+    return 1
+
 # ============================================
 # CHALLENGE MANAGEMENT
 # ============================================
 
+@routed("challenges.create")
 def create_challenge(user_id: str, subject: str, prediction: int, 
                      task_description: str = "") -> int:
     """Erstellt eine neue Challenge (Phase 1: Vorhersage)."""
     init_database()
-    conn = sqlite3.connect(get_db_path())
+    conn = connect_db(get_db_path(), user_id)
     c = conn.cursor()
     
     today = datetime.now().date().isoformat()
@@ -220,10 +233,15 @@ def create_challenge(user_id: str, subject: str, prediction: int,
     
     return challenge_id
 
+@routed("challenges.complete")
 def complete_challenge(challenge_id: int, actual_result: int,
-                       reflection: str = "") -> Dict[str, Any]:
-    """Schließt eine Challenge ab und berechnet XP (Phase 2: Ergebnis)."""
-    conn = sqlite3.connect(get_db_path())
+                       reflection: str = "", user_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Schließt eine Challenge ab und berechnet XP (Phase 2: Ergebnis).
+
+    ``user_id`` wählt die Datenbank (Preview-User haben eine eigene).
+    """
+    conn = connect_db(get_db_path(), user_id)
     conn.row_factory = sqlite3.Row
     c = conn.cursor()
 
@@ -247,43 +265,13 @@ def complete_challenge(challenge_id: int, actual_result: int,
     is_note_type = task_desc.startswith("[note]")
 
     # Outcome bestimmen
-    # Bei Noten: niedrigere Zahl = besser (Note 1 > Note 2)
-    # Bei Prozent/Punkten: höhere Zahl = besser
-    if is_note_type:
-        # Bei Noten: actual < prediction bedeutet "übertroffen"
-        if actual_result < prediction:
-            outcome = "exceeded"
-            base_xp = XP_CONFIG["challenge_completed"] + XP_CONFIG["exceeded_expectation"]
-        elif actual_result == prediction:
-            outcome = "exact"
-            base_xp = XP_CONFIG["challenge_completed"] + XP_CONFIG["prediction_exact"]
-        else:
-            outcome = "below"
-            base_xp = XP_CONFIG["challenge_completed"]
-    else:
-        # Bei Prozent/Punkten: actual > prediction bedeutet "übertroffen"
-        if actual_result > prediction:
-            outcome = "exceeded"
-            base_xp = XP_CONFIG["challenge_completed"] + XP_CONFIG["exceeded_expectation"]
-        elif actual_result == prediction:
-            outcome = "exact"
-            base_xp = XP_CONFIG["challenge_completed"] + XP_CONFIG["prediction_exact"]
-        else:
-            outcome = "below"
-            base_xp = XP_CONFIG["challenge_completed"]
+    outcome, base_xp = challenge_outcome(prediction, actual_result, is_note_type)
     
     # Streak berechnen
     new_streak = calculate_streak(user_id, c)
     
     # Streak-Bonus anwenden
-    if new_streak >= 30:
-        xp_earned = int(base_xp * XP_CONFIG["streak_bonus_30"])
-    elif new_streak >= 7:
-        xp_earned = int(base_xp * XP_CONFIG["streak_bonus_7"])
-    elif new_streak >= 3:
-        xp_earned = int(base_xp * XP_CONFIG["streak_bonus_3"])
-    else:
-        xp_earned = base_xp
+    xp_earned = apply_streak_bonus(base_xp, new_streak)
     
     # Challenge updaten
     c.execute('''
@@ -329,17 +317,6 @@ def complete_challenge(challenge_id: int, actual_result: int,
 
 def calculate_streak(user_id: str, cursor) -> int:
     """Berechnet den aktuellen Streak eines Users."""
-    today = datetime.now().date()
-    yesterday = (today - timedelta(days=1)).isoformat()
-    today_str = today.isoformat()
-    
-    # Prüfe ob heute schon eine Challenge war
-    cursor.execute('''
-        SELECT COUNT(*) FROM challenges 
-        WHERE user_id = ? AND challenge_date = ? AND completed = TRUE
-    ''', (user_id, today_str))
-    today_count = cursor.fetchone()[0]
-    
     # Hole aktuellen Streak
     cursor.execute("SELECT current_streak, last_activity_date FROM users WHERE user_id = ?", (user_id,))
     user_data = cursor.fetchone()
@@ -347,33 +324,19 @@ def calculate_streak(user_id: str, cursor) -> int:
     if not user_data:
         return 1
     
-    current_streak = user_data['current_streak'] or 0
-    last_activity = user_data['last_activity_date']
-    
-    if not last_activity:
-        return 1
-    
-    # Streak-Logik
-    if last_activity == today_str:
-        # Heute schon aktiv - Streak bleibt
-        return current_streak
-    elif last_activity == yesterday:
-        # Gestern aktiv - Streak erhöht sich
-        return current_streak + 1
-    else:
-        # Streak unterbrochen
-        return 1
+    return next_streak(user_data['current_streak'], user_data['last_activity_date'], datetime.now().date())
 
+@routed("challenges.get_recent")
 def get_user_challenges(user_id: str, limit: int = 20) -> List[Dict]:
     """Holt die letzten Challenges eines Users."""
-    conn = sqlite3.connect(get_db_path())
+    conn = connect_db(get_db_path(), user_id)
     conn.row_factory = sqlite3.Row
     c = conn.cursor()
     
     c.execute('''
         SELECT * FROM challenges 
         WHERE user_id = ? 
-        ORDER BY created_at DESC 
+        ORDER BY created_at DESC, id DESC
         LIMIT ?
     ''', (user_id, limit))
     
@@ -382,16 +345,17 @@ def get_user_challenges(user_id: str, limit: int = 20) -> List[Dict]:
     
     return challenges
 
+@routed("challenges.get_open")
 def get_open_challenges(user_id: str) -> List[Dict]:
     """Holt offene (nicht abgeschlossene) Challenges."""
-    conn = sqlite3.connect(get_db_path())
+    conn = connect_db(get_db_path(), user_id)
     conn.row_factory = sqlite3.Row
     c = conn.cursor()
     
     c.execute('''
         SELECT * FROM challenges 
         WHERE user_id = ? AND completed = FALSE
-        ORDER BY created_at DESC
+        ORDER BY created_at DESC, id DESC
     ''', (user_id,))
     
     challenges = [dict(row) for row in c.fetchall()]
@@ -403,15 +367,23 @@ def get_open_challenges(user_id: str) -> List[Dict]:
 # STATISTICS
 # ============================================
 
-def get_user_stats(user_id: str) -> Dict[str, Any]:
-    """Holt umfassende Statistiken eines Users."""
+@routed("challenges.get_user_stats")
+def get_user_stats(user_id: str, user: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Holt umfassende Statistiken eines Users.
+
+    Args:
+        user: bereits geladene User-Zeile (z.B. Session-Snapshot), spart das
+            erneute ``get_or_create_user``
+    """
     init_database()
-    conn = sqlite3.connect(get_db_path())
+    conn = connect_db(get_db_path(), user_id)
     conn.row_factory = sqlite3.Row
     c = conn.cursor()
     
     # Basis-User-Daten
-    user = get_or_create_user(user_id)
+    if user is None:
+        user = get_or_create_user(user_id)
     stats = dict(user)
     
     # Challenge-Statistiken
@@ -454,9 +426,10 @@ def get_user_stats(user_id: str) -> Dict[str, Any]:
     conn.close()
     return stats
 
+@routed("activity.get_challenge_heatmap")
 def get_activity_heatmap(user_id: str, days: int = 90) -> List[Dict]:
     """Holt Activity-Daten für Heatmap (GitHub-Style)."""
-    conn = sqlite3.connect(get_db_path())
+    conn = connect_db(get_db_path(), user_id)
     conn.row_factory = sqlite3.Row
     c = conn.cursor()
     
@@ -479,9 +452,10 @@ def get_activity_heatmap(user_id: str, days: int = 90) -> List[Dict]:
 # BADGE SYSTEM
 # ============================================
 
+@routed("badges.get_user_badges")
 def get_user_badges(user_id: str) -> List[Dict]:
     """Holt alle verdienten Badges eines Users."""
-    conn = sqlite3.connect(get_db_path())
+    conn = connect_db(get_db_path(), user_id)
     conn.row_factory = sqlite3.Row
     c = conn.cursor()
     
@@ -496,9 +470,10 @@ def get_user_badges(user_id: str) -> List[Dict]:
     
     return badges
 
+@routed("badges.award")
 def award_badge(user_id: str, badge_id: str) -> bool:
     """Vergibt ein Badge an einen User."""
-    conn = sqlite3.connect(get_db_path())
+    conn = connect_db(get_db_path(), user_id)
     c = conn.cursor()
     
     try:
@@ -6,8 +6,11 @@ da die PISA-Datenbank nur englische Labels enthält.
 """
 
 import pandas as pd
+from functools import lru_cache
 from typing import Dict
 
+from utils.label_sets import get_label_set, intern_label_set, is_answer_value
+
 # Deutsche Label-Mappings für verschiedene Skalen-Typen
 GERMAN_LABELS = {
     # Selbstwirksamkeit (Self-efficacy) - 4-Punkt Likert
@@ -129,26 +132,42 @@ def get_german_labels_for_scale(scale_code: str, original_labels_df: pd.DataFram
     return labels_df
 
 
-def add_german_labels_to_value_labels(value_labels_dict: Dict[str, pd.DataFrame],
-                                      items: list) -> Dict[str, pd.DataFrame]:
+@lru_cache(maxsize=None)
+def _german_label_set(label_type: str, label_set_id: int) -> int:
+    """Label-Set mit deutschen Labels (gleiche Regeln wie get_german_labels_for_scale)."""
+    german_mapping = GERMAN_LABELS[label_type]
+    entries = []
+    for value, label, label_de, is_missing in get_label_set(label_set_id).entries:
+        if is_answer_value(value):
+            try:
+                label_de = german_mapping.get(int(value), label_de)
+            except (ValueError, TypeError):
+                pass
+        entries.append((value, label, label_de, is_missing))
+    return intern_label_set(entries)
+
+
+def add_german_labels_to_value_labels(value_labels_dict: Dict[str, int],
+                                      items: list) -> Dict[str, int]:
     """
     Fügt deutschen Labels für alle Items hinzu
 
     Args:
-        value_labels_dict: Dictionary mit value labels pro Variable
+        value_labels_dict: Label-Set-ID pro Variable (aus load_items_for_scales)
         items: Liste von Items mit scale-Informationen
 
     Returns:
-        Aktualisiertes Dictionary mit deutschen Labels
+        Dictionary mit den IDs der deutschen Label-Sets
     """
     # Create mapping: variable_name → scale_code
     var_to_scale = {item['variable_name']: item['scale'] for item in items}
 
-    # Update each value label
+    # Pro (Label-Typ, Label-Set) nur einmal übersetzen
     updated_dict = {}
-    for var_name, labels_df in value_labels_dict.items():
+    for var_name, label_set_id in value_labels_dict.items():
         scale_code = var_to_scale.get(var_name, '_default')
-        updated_dict[var_name] = get_german_labels_for_scale(scale_code, labels_df)
+        label_type = SCALE_LABEL_TYPES.get(scale_code, SCALE_LABEL_TYPES['_default'])
+        updated_dict[var_name] = _german_label_set(label_type, label_set_id)
 
     return updated_dict
 
@@ -4,8 +4,10 @@ Passt Fragebögen und Interventionen an die Klassenstufe an
 """
 
 import re
+from functools import lru_cache
 from typing import Tuple, List, Dict, Optional
-import pandas as pd
+
+from utils.label_sets import intern_label_set
 
 def extract_grade_from_class(class_string: str) -> Optional[int]:
     """
@@ -41,6 +43,147 @@ def extract_grade_from_class(class_string: str) -> Optional[int]:
     
     return None
 
+# ============================================
+# MATHEFF-VARIANTEN PRO KLASSENSTUFE
+# ============================================
+
+# Grade-specific MATHEFF adaptations
+MATHEFF_GRADE_ADAPTATIONS = {
+    5: {
+        'fragestamm': 'Wie gut kannst du diese Mathe-Aufgaben lösen?',
+        'items': [
+            ('MATHEFF_Q01', 'Einfache Plus- und Minus-Aufgaben im Kopf rechnen'),
+            ('MATHEFF_Q02', 'Das kleine Einmaleins anwenden'),
+            ('MATHEFF_Q03', 'Textaufgaben verstehen und lösen'),
+            ('MATHEFF_Q04', 'Mit dem Geodreieck arbeiten'),
+            ('MATHEFF_Q05', 'Einfache Brüche verstehen'),
+            ('MATHEFF_Q06', 'Säulendiagramme lesen'),
+            ('MATHEFF_Q07', 'Längen und Gewichte umrechnen'),
+            ('MATHEFF_Q08', 'Einfache geometrische Formen erkennen')
+        ]
+    },
+    6: {
+        'fragestamm': 'Wie sicher fühlst du dich bei diesen Aufgaben?',
+        'items': [
+            ('MATHEFF_Q01', 'Brüche addieren und subtrahieren'),
+            ('MATHEFF_Q02', 'Dezimalzahlen multiplizieren'),
+            ('MATHEFF_Q03', 'Prozentaufgaben lösen'),
+            ('MATHEFF_Q04', 'Winkel messen und zeichnen'),
+            ('MATHEFF_Q05', 'Flächeninhalte berechnen'),
+            ('MATHEFF_Q06', 'Einfache Gleichungen lösen'),
+            ('MATHEFF_Q07', 'Koordinatensystem verwenden'),
+            ('MATHEFF_Q08', 'Mittelwerte berechnen')
+        ]
+    },
+    7: {
+        'fragestamm': 'Wie gut kannst du folgende Aufgaben bewältigen?',
+        'items': [
+            ('MATHEFF_Q01', 'Terme vereinfachen'),
+            ('MATHEFF_Q02', 'Proportionale Zuordnungen erkennen'),
+            ('MATHEFF_Q03', 'Negative Zahlen verwenden'),
+            ('MATHEFF_Q04', 'Dreisatz anwenden'),
+            ('MATHEFF_Q05', 'Konstruktionen mit Zirkel und Lineal'),
+            ('MATHEFF_Q06', 'Prozent- und Zinsrechnung'),
+            ('MATHEFF_Q07', 'Einfache Wahrscheinlichkeiten berechnen'),
+            ('MATHEFF_Q08', 'Gleichungen mit einer Unbekannten lösen')
+        ]
+    },
+    8: {
+        'fragestamm': 'Wie zuversichtlich bist du bei diesen mathematischen Aufgaben?',
+        'items': [
+            ('MATHEFF_Q01', 'Lineare Funktionen verstehen und zeichnen'),
+            ('MATHEFF_Q02', 'Binomische Formeln anwenden'),
+            ('MATHEFF_Q03', 'Pythagoras-Satz verwenden'),
+            ('MATHEFF_Q04', 'Gleichungssysteme lösen'),
+            ('MATHEFF_Q05', 'Körper berechnen (Volumen, Oberfläche)'),
+            ('MATHEFF_Q06', 'Quadratische Gleichungen lösen'),
+            ('MATHEFF_Q07', 'Statistische Daten auswerten'),
+            ('MATHEFF_Q08', 'Prozentuale Veränderungen berechnen')
+        ]
+    },
+    9: {
+        'fragestamm': 'Wie sicher fühlst du dich bei folgenden Themen?',
+        'items': [
+            ('MATHEFF_Q01', 'Quadratische Funktionen analysieren'),
+            ('MATHEFF_Q02', 'Trigonometrie im rechtwinkligen Dreieck'),
+            ('MATHEFF_Q03', 'Potenzen und Wurzeln berechnen'),
+            ('MATHEFF_Q04', 'Ähnlichkeit und Strahlensätze'),
+            ('MATHEFF_Q05', 'Exponentialfunktionen verstehen'),
+            ('MATHEFF_Q06', 'Wahrscheinlichkeitsrechnung'),
+            ('MATHEFF_Q07', 'Körperberechnungen (Kegel, Pyramide)'),
+            ('MATHEFF_Q08', 'Algebraische Umformungen')
+        ]
+    },
+    10: {
+        'fragestamm': 'Wie gut beherrschst du diese mathematischen Konzepte?',
+        'items': [
+            ('MATHEFF_Q01', 'Trigonometrische Funktionen'),
+            ('MATHEFF_Q02', 'Logarithmen anwenden'),
+            ('MATHEFF_Q03', 'Vektoren im Raum'),
+            ('MATHEFF_Q04', 'Ableitungen berechnen'),
+            ('MATHEFF_Q05', 'Stochastik und Kombinatorik'),
+            ('MATHEFF_Q06', 'Grenzwerte verstehen'),
+            ('MATHEFF_Q07', 'Funktionsscharen untersuchen'),
+            ('MATHEFF_Q08', 'Beweise führen')
+        ]
+    },
+    11: {
+        'fragestamm': 'Wie sicher bist du in der Analysis?',
+        'items': [
+            ('MATHEFF_Q01', 'Differentialrechnung anwenden'),
+            ('MATHEFF_Q02', 'Kurvendiskussion durchführen'),
+            ('MATHEFF_Q03', 'Integrale berechnen'),
+            ('MATHEFF_Q04', 'Extremwertprobleme lösen'),
+            ('MATHEFF_Q05', 'e-Funktionen und ln-Funktionen'),
+            ('MATHEFF_Q06', 'Rotationskörper berechnen'),
+            ('MATHEFF_Q07', 'Funktionsgleichungen aufstellen'),
+            ('MATHEFF_Q08', 'Wendepunkte bestimmen')
+        ]
+    },
+    12: {
+        'fragestamm': 'Wie kompetent fühlst du dich bei diesen Abiturthemen?',
+        'items': [
+            ('MATHEFF_Q01', 'Analytische Geometrie im Raum'),
+            ('MATHEFF_Q02', 'Lineare Algebra (Matrizen)'),
+            ('MATHEFF_Q03', 'Normalverteilung anwenden'),
+            ('MATHEFF_Q04', 'Hypothesentests durchführen'),
+            ('MATHEFF_Q05', 'Vektorräume verstehen'),
+            ('MATHEFF_Q06', 'Differentialgleichungen lösen'),
+            ('MATHEFF_Q07', 'Bedingte Wahrscheinlichkeit'),
+            ('MATHEFF_Q08', 'Komplexe Modellierungsaufgaben')
+        ]
+    }
+}
+
+MATHEFF_LIKERT_LABELS = {
+    '1': 'Gar nicht sicher',
+    '2': 'Nicht sehr sicher',
+    '3': 'Ziemlich sicher',
+    '4': 'Sehr sicher'
+}
+
+def _compile_matheff_variants() -> Dict[int, Tuple[Tuple[Dict, ...], str]]:
+    """Rendert Items und Fragestamm für jede Klassenstufe einmal beim Import vor."""
+    return {
+        grade: (
+            tuple(
+                {'variable_name': item_id, 'question_text_de': item_text, 'scale': 'MATHEFF'}
+                for item_id, item_text in adaptation['items']
+            ),
+            adaptation['fragestamm'],
+        )
+        for grade, adaptation in MATHEFF_GRADE_ADAPTATIONS.items()
+    }
+
+_MATHEFF_VARIANTS = _compile_matheff_variants()
+
+@lru_cache(maxsize=1)
+def _likert_label_set() -> int:
+    """Label-Set-ID der MATHEFF-Antwortskala (für alle Items und Stufen gleich)."""
+    return intern_label_set(
+        (value, None, label_de, False) for value, label_de in MATHEFF_LIKERT_LABELS.items()
+    )
+
 def adapt_matheff_for_grade(grade: int, original_items: List[Dict]) -> Tuple[List[Dict], Dict, str]:
     """
     Passt MATHEFF-Items an die Klassenstufe an
@@ -52,153 +195,23 @@ def adapt_matheff_for_grade(grade: int, original_items: List[Dict]) -> Tuple[Lis
     Returns:
         Tuple: (adapted_items, value_labels, fragestamm)
     """
-    
-    # Grade-specific MATHEFF adaptations
-    grade_adaptations = {
-        5: {
-            'fragestamm': 'Wie gut kannst du diese Mathe-Aufgaben lösen?',
-            'items': [
-                ('MATHEFF_Q01', 'Einfache Plus- und Minus-Aufgaben im Kopf rechnen'),
-                ('MATHEFF_Q02', 'Das kleine Einmaleins anwenden'),
-                ('MATHEFF_Q03', 'Textaufgaben verstehen und lösen'),
-                ('MATHEFF_Q04', 'Mit dem Geodreieck arbeiten'),
-                ('MATHEFF_Q05', 'Einfache Brüche verstehen'),
-                ('MATHEFF_Q06', 'Säulendiagramme lesen'),
-                ('MATHEFF_Q07', 'Längen und Gewichte umrechnen'),
-                ('MATHEFF_Q08', 'Einfache geometrische Formen erkennen')
-            ]
-        },
-        6: {
-            'fragestamm': 'Wie sicher fühlst du dich bei diesen Aufgaben?',
-            'items': [
-                ('MATHEFF_Q01', 'Brüche addieren und subtrahieren'),
-                ('MATHEFF_Q02', 'Dezimalzahlen multiplizieren'),
-                ('MATHEFF_Q03', 'Prozentaufgaben lösen'),
-                ('MATHEFF_Q04', 'Winkel messen und zeichnen'),
-                ('MATHEFF_Q05', 'Flächeninhalte berechnen'),
-                ('MATHEFF_Q06', 'Einfache Gleichungen lösen'),
-                ('MATHEFF_Q07', 'Koordinatensystem verwenden'),
-                ('MATHEFF_Q08', 'Mittelwerte berechnen')
-            ]
-        },
-        7: {
-            'fragestamm': 'Wie gut kannst du folgende Aufgaben bewältigen?',
-            'items': [
-                ('MATHEFF_Q01', 'Terme vereinfachen'),
-                ('MATHEFF_Q02', 'Proportionale Zuordnungen erkennen'),
-                ('MATHEFF_Q03', 'Negative Zahlen verwenden'),
-                ('MATHEFF_Q04', 'Dreisatz anwenden'),
-                ('MATHEFF_Q05', 'Konstruktionen mit Zirkel und Lineal'),
-                ('MATHEFF_Q06', 'Prozent- und Zinsrechnung'),
-                ('MATHEFF_Q07', 'Einfache Wahrscheinlichkeiten berechnen'),
-                ('MATHEFF_Q08', 'Gleichungen mit einer Unbekannten lösen')
-            ]
-        },
-        8: {
-            'fragestamm': 'Wie zuversichtlich bist du bei diesen mathematischen Aufgaben?',
-            'items': [
-                ('MATHEFF_Q01', 'Lineare Funktionen verstehen und zeichnen'),
-                ('MATHEFF_Q02', 'Binomische Formeln anwenden'),
-                ('MATHEFF_Q03', 'Pythagoras-Satz verwenden'),
-                ('MATHEFF_Q04', 'Gleichungssysteme lösen'),
-                ('MATHEFF_Q05', 'Körper berechnen (Volumen, Oberfläche)'),
-                ('MATHEFF_Q06', 'Quadratische Gleichungen lösen'),
-                ('MATHEFF_Q07', 'Statistische Daten auswerten'),
-                ('MATHEFF_Q08', 'Prozentuale Veränderungen berechnen')
-            ]
-        },
-        9: {
-            'fragestamm': 'Wie sicher fühlst du dich bei folgenden Themen?',
-            'items': [
-                ('MATHEFF_Q01', 'Quadratische Funktionen analysieren'),
-                ('MATHEFF_Q02', 'Trigonometrie im rechtwinkligen Dreieck'),
-                ('MATHEFF_Q03', 'Potenzen und Wurzeln berechnen'),
-                ('MATHEFF_Q04', 'Ähnlichkeit und Strahlensätze'),
-                ('MATHEFF_Q05', 'Exponentialfunktionen verstehen'),
-                ('MATHEFF_Q06', 'Wahrscheinlichkeitsrechnung'),
-                ('MATHEFF_Q07', 'Körperberechnungen (Kegel, Pyramide)'),
-                ('MATHEFF_Q08', 'Algebraische Umformungen')
-            ]
-        },
-        10: {
-            'fragestamm': 'Wie gut beherrschst du diese mathematischen Konzepte?',
-            'items': [
-                ('MATHEFF_Q01', 'Trigonometrische Funktionen'),
-                ('MATHEFF_Q02', 'Logarithmen anwenden'),
-                ('MATHEFF_Q03', 'Vektoren im Raum'),
-                ('MATHEFF_Q04', 'Ableitungen berechnen'),
-                ('MATHEFF_Q05', 'Stochastik und Kombinatorik'),
-                ('MATHEFF_Q06', 'Grenzwerte verstehen'),
-                ('MATHEFF_Q07', 'Funktionsscharen untersuchen'),
-                ('MATHEFF_Q08', 'Beweise führen')
-            ]
-        },
-        11: {
-            'fragestamm': 'Wie sicher bist du in der Analysis?',
-            'items': [
-                ('MATHEFF_Q01', 'Differentialrechnung anwenden'),
-                ('MATHEFF_Q02', 'Kurvendiskussion durchführen'),
-                ('MATHEFF_Q03', 'Integrale berechnen'),
-                ('MATHEFF_Q04', 'Extremwertprobleme lösen'),
-                ('MATHEFF_Q05', 'e-Funktionen und ln-Funktionen'),
-                ('MATHEFF_Q06', 'Rotationskörper berechnen'),
-                ('MATHEFF_Q07', 'Funktionsgleichungen aufstellen'),
-                ('MATHEFF_Q08', 'Wendepunkte bestimmen')
-            ]
-        },
-        12: {
-            'fragestamm': 'Wie kompetent fühlst du dich bei diesen Abiturthemen?',
-            'items': [
-                ('MATHEFF_Q01', 'Analytische Geometrie im Raum'),
-                ('MATHEFF_Q02', 'Lineare Algebra (Matrizen)'),
-                ('MATHEFF_Q03', 'Normalverteilung anwenden'),
-                ('MATHEFF_Q04', 'Hypothesentests durchführen'),
-                ('MATHEFF_Q05', 'Vektorräume verstehen'),
-                ('MATHEFF_Q06', 'Differentialgleichungen lösen'),
-                ('MATHEFF_Q07', 'Bedingte Wahrscheinlichkeit'),
-                ('MATHEFF_Q08', 'Komplexe Modellierungsaufgaben')
-            ]
-        }
-    }
-    
     # Default to grade 8 if not in range
     if grade < 5:
         grade = 5
     elif grade > 12:
         grade = 12
-    elif grade not in grade_adaptations:
+    elif grade not in _MATHEFF_VARIANTS:
         # Use closest grade
         grade = 8
-    
-    adaptation = grade_adaptations[grade]
-    
-    # Create adapted items
-    adapted_items = []
-    for item_id, item_text in adaptation['items']:
-        adapted_items.append({
-            'variable_name': item_id,
-            'question_text_de': item_text,
-            'scale': 'MATHEFF'
-        })
-    
-    # Create value labels (same for all grades)
-    value_labels = {}
-    likert_labels = {
-        '1': 'Gar nicht sicher',
-        '2': 'Nicht sehr sicher',
-        '3': 'Ziemlich sicher',
-        '4': 'Sehr sicher'
-    }
 
-    for item in adapted_items:
-        # Create DataFrame to match expected format
-        value_labels[item['variable_name']] = pd.DataFrame({
-            'value': list(likert_labels.keys()),
-            'label_de': list(likert_labels.values()),
-            'is_missing_code': [0] * len(likert_labels)
-        })
+    items, fragestamm = _MATHEFF_VARIANTS[grade]
+
+    # Kopien, da Aufrufer die Items weiterverarbeiten (Label-Sets sind unveränderlich)
+    adapted_items = [dict(item) for item in items]
+    label_set_id = _likert_label_set()
+    value_labels = {item['variable_name']: label_set_id for item in adapted_items}
 
-    return adapted_items, value_labels, adaptation['fragestamm']
+    return adapted_items, value_labels, fragestamm
 
 def get_grade_specific_interventions(grade: int) -> Dict:
     """
@@ -287,10 +300,57 @@ def adapt_intervention_duration(base_weeks: str, grade: int) -> str:
     
     return base_weeks
 
+# ============================================
+# ALTERSGERECHTE SPRACHE
+# ============================================
+
+LANGUAGE_REPLACEMENTS = {
+    # Vereinfachte Sprache für jüngere Schüler
+    'grundschule': {
+        'Selbstwirksamkeit': 'Selbstvertrauen',
+        'kognitiv': 'gedanklich',
+        'Metakognition': 'Nachdenken über das Lernen',
+        'intrinsisch': 'aus eigenem Antrieb',
+        'extrinsisch': 'von außen motiviert'
+    },
+    # Jugendgerechte Sprache
+    'jugend': {
+        'evidenzbasiert': 'wissenschaftlich bewiesen',
+        'Intervention': 'Unterstützung',
+        'Implementation': 'Umsetzung'
+    },
+}
+
+def _compile_replacements(replacements: Dict[str, str]) -> "re.Pattern":
+    """Eine Alternation für alle Ersetzungen (längste Begriffe zuerst)."""
+    terms = sorted(replacements, key=len, reverse=True)
+    return re.compile("|".join(re.escape(term) for term in terms))
+
+_LANGUAGE_PATTERNS = {
+    band: (_compile_replacements(replacements), replacements)
+    for band, replacements in LANGUAGE_REPLACEMENTS.items()
+}
+
+def _language_band(grade: int) -> Optional[str]:
+    if grade <= 6:
+        return 'grundschule'
+    if grade <= 8:
+        return 'jugend'
+    # Keine Anpassung für ältere Schüler
+    return None
+
+@lru_cache(maxsize=4096)
+def _render_language(text: str, band: str) -> str:
+    pattern, replacements = _LANGUAGE_PATTERNS[band]
+    return pattern.sub(lambda match: replacements[match.group(0)], text)
+
 def get_age_appropriate_language(text: str, grade: int) -> str:
     """
     Passt Sprache an Altersstufe an
     
+    Alle Ersetzungen einer Stufe laufen in einem Regex-Durchgang; bereits
+    gerenderte Texte kommen aus dem Cache.
+
     Args:
         text: Original-Text
         grade: Klassenstufe
@@ -298,27 +358,7 @@ def get_age_appropriate_language(text: str, grade: int) -> str:
     Returns:
         Angepasster Text
     """
-    if grade <= 6:
-        # Vereinfachte Sprache für jüngere Schüler
-        replacements = {
-            'Selbstwirksamkeit': 'Selbstvertrauen',
-            'kognitiv': 'gedanklich',
-            'Metakognition': 'Nachdenken über das Lernen',
-            'intrinsisch': 'aus eigenem Antrieb',
-            'extrinsisch': 'von außen motiviert'
-        }
-    elif grade <= 8:
-        # Jugendgerechte Sprache
-        replacements = {
-            'evidenzbasiert': 'wissenschaftlich bewiesen',
-            'Intervention': 'Unterstützung',
-            'Implementation': 'Umsetzung'
-        }
-    else:
-        # Keine Anpassung für ältere Schüler
+    band = _language_band(grade)
+    if band is None:
         return text
-    
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    
-    return text
+    return _render_language(text, band)
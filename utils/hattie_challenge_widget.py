@@ -15,10 +15,12 @@ from datetime import datetime
 import hashlib
 from typing import Optional
 
+from utils.fragments import widget_fragment, rerun_widget
+
 # Lokale Imports
 try:
     from utils.gamification_db import (
-        init_database, get_or_create_user, create_challenge, 
+        init_database, create_challenge, 
         complete_challenge, get_user_stats, get_user_challenges,
         get_open_challenges, check_and_award_badges, get_user_badges,
         get_activity_heatmap
@@ -29,6 +31,7 @@ try:
         render_activity_heatmap, render_new_badge_celebration,
         BADGES, SUBJECTS
     )
+    from utils.user_system import get_cached_user
     GAMIFICATION_AVAILABLE = True
 except ImportError:
     GAMIFICATION_AVAILABLE = False
@@ -67,6 +70,7 @@ def init_widget_state():
 # MAIN WIDGET
 # ============================================
 
+@widget_fragment("hattie_challenge")
 def render_hattie_challenge_widget(compact: bool = False, color: str = "#667eea"):
     """
     Rendert das komplette Hattie-Challenge Widget.
@@ -88,9 +92,9 @@ def render_hattie_challenge_widget(compact: bool = False, color: str = "#667eea"
     init_widget_state()
     user_id = get_user_id()
     
-    # User laden
-    user = get_or_create_user(user_id)
-    stats = get_user_stats(user_id)
+    # User laden (Session-Snapshot, nur Versions-Check statt Full-Row-Read)
+    user = get_cached_user(user_id)
+    stats = get_user_stats(user_id, user)
     
     # Header mit Level und Streak
     st.markdown(f"""
@@ -291,7 +295,7 @@ def render_challenge_phase1(user_id: str, stats: dict, color: str):
             *Mach jetzt deine Aufgabe und komm zurück, um das Ergebnis einzutragen!*
             """)
 
-            st.rerun()
+            rerun_widget()
     
     # Wissenschaftlicher Hintergrund
     with st.expander("🔬 Warum funktioniert das?"):
@@ -403,7 +407,8 @@ def render_challenge_phase2(user_id: str, challenge: dict, color: str):
             result = complete_challenge(
                 challenge_id=challenge['id'],
                 actual_result=actual_result,
-                reflection=reflection
+                reflection=reflection,
+                user_id=user_id
             )
 
             if "error" in result:
@@ -415,7 +420,7 @@ def render_challenge_phase2(user_id: str, challenge: dict, color: str):
                 # Speichere Ergebnis in Session State für Anzeige nach dem Rerun
                 st.session_state["last_challenge_result"] = result
                 st.session_state["last_challenge_badges"] = new_badges
-                st.rerun()
+                rerun_widget()
 
     # Zeige letztes Ergebnis falls vorhanden (nach dem Rerun)
     if "last_challenge_result" in st.session_state:
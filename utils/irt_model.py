@@ -0,0 +1,354 @@
+"""
+📐 IRT-Modell
+=============
+
+Generalized Partial Credit Model (GPCM) für die PISA-Fragebogenskalen -
+dasselbe Modell, mit dem PISA 2022 die WLE-Indizes (MATHEFF, ANXMAT, ...)
+skaliert.
+
+Kalibrierung (einmalig, ``python -m utils.irt_model``):
+    Für jede Skala aus ``pisa_skalen.json``, deren WLE-Spalte in
+    ``student_data`` vorliegt, wird jedes Item einzeln gegen den PISA-WLE
+    als bekanntes Theta geschätzt (Fisher-Scoring auf nach Theta gebinnten
+    Häufigkeiten). Die Parameter liegen damit direkt auf der PISA-Metrik.
+    Items, die negativ mit dem WLE korrelieren (z.B. ST292 "Ich mache mir
+    Sorgen" bei ANXMAT), werden umgepolt. Ergebnis: ``IRT_PARAMETERS_PATH``.
+
+Laufzeit:
+    ``load_item_banks()`` liest die Parameter und legt pro Skala eine
+    ``ItemBank`` mit vorberechneten Tabellen auf ``THETA_GRID`` an
+    (Kategorienwahrscheinlichkeiten, Iteminformation, Erwartungswerte).
+    Schätzungen sind damit reine Array-Lookups ohne Optimierung.
+
+Antwortwerte sind immer die Roh-Codes aus dem Fragebogen (1..K), so wie
+sie in ``screening_responses`` stehen.
+"""
+
+import json
+import sqlite3
+import sys
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from utils.scale_scoring import REVERSE_CODED_PREFIXES
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+PISA_DB_PATH = Path("pisa_2022_germany.db")
+IRT_PARAMETERS_PATH = Path(__file__).parent.parent / "data" / "irt_parameters.json"
+
+THETA_GRID = np.round(np.arange(-5.0, 5.0 + 1e-9, 0.05), 2)
+CALIBRATION_BIN = 0.05          # Theta-Auflösung der Kalibrierung
+MIN_RESPONSES = 200             # Weniger gültige Antworten -> Item nicht kalibrieren
+MAX_CATEGORIES = 5              # Größere Codes sind PISA-Missings (95-99)
+FISHER_ITERATIONS = 50
+RIDGE = 1e-3                    # Stabilisiert Schwellen leerer Randkategorien
+
+
+# ============================================
+# MODELL
+# ============================================
+
+def category_probabilities(theta: np.ndarray, a: float, steps: Iterable[float]) -> np.ndarray:
+    """
+    GPCM-Kategorienwahrscheinlichkeiten.
+
+    Args:
+        theta: Theta-Werte (Form (G,))
+        a: Diskrimination
+        steps: Schwellen b_1..b_{K-1}
+
+    Returns:
+        Array (G, K) - Zeilen summieren zu 1
+    """
+    theta = np.asarray(theta, dtype=float)
+    steps = np.asarray(list(steps), dtype=float)
+    z = np.zeros((theta.size, steps.size + 1))
+    z[:, 1:] = np.cumsum(a * (theta[:, None] - steps[None, :]), axis=1)
+    z -= z.max(axis=1, keepdims=True)
+    p = np.exp(z)
+    return p / p.sum(axis=1, keepdims=True)
+
+
+def _fit_item(theta: np.ndarray, categories: np.ndarray, n_categories: int) -> Dict[str, Any]:
+    """Schätzt a und Schwellen eines Items bei bekanntem Theta (Fisher-Scoring)."""
+    bins = np.round(theta / CALIBRATION_BIN).astype(int)
+    bins -= bins.min()
+    counts = np.zeros((bins.max() + 1, n_categories))
+    np.add.at(counts, (bins, categories), 1)
+    occupied = counts.sum(axis=1) > 0
+    counts = counts[occupied]
+    t = (np.flatnonzero(occupied) + np.round(theta.min() / CALIBRATION_BIN)) * CALIBRATION_BIN
+    n = counts.sum(axis=1)
+
+    # Start: Schwellen aus den kumulierten Randverteilungen
+    cumulative = np.clip(np.cumsum(counts.sum(axis=0))[:-1] / n.sum(), 0.01, 0.99)
+    a, steps = 1.0, np.log(cumulative / (1 - cumulative))
+    at_or_above = np.tri(n_categories, n_categories - 1, -1)   # [k, v-1] = 1(k >= v)
+
+    for _ in range(FISHER_ITERATIONS):
+        p = category_probabilities(t, a, steps)                  # (B, K)
+        # Score-Vektor pro (Bin, Kategorie): d log P_k / d(a, b_1..b_{K-1})
+        c = np.cumsum(np.concatenate([np.zeros((t.size, 1)), t[:, None] - steps[None, :]], axis=1), axis=1)
+        d_a = c - (p * c).sum(axis=1, keepdims=True)
+        tail = at_or_above[None, :, :] - (p[:, :, None] * at_or_above[None, :, :]).sum(axis=1, keepdims=True)
+        scores = np.concatenate([d_a[:, :, None], -a * tail], axis=2)   # (B, K, 1+K-1)
+
+        params = np.concatenate([[a], steps])
+        penalty = RIDGE * np.concatenate([[0.0], steps])
+        gradient = np.einsum("bk,bkp->p", counts, scores) - penalty
+        fisher = np.einsum("b,bk,bkp,bkq->pq", n, p, scores, scores) + RIDGE * np.eye(params.size)
+        step = np.linalg.solve(fisher, gradient)
+        step *= min(1.0, 1.0 / np.abs(step).max())             # Dämpfung
+        params = params + step
+        a, steps = max(params[0], 0.05), params[1:]
+        if np.abs(step).max() < 1e-6:
+            break
+
+    return {"a": round(float(a), 5), "steps": [round(float(b), 5) for b in steps]}
+
+
+# ============================================
+# KALIBRIERUNG
+# ============================================
+
+def _table_columns(conn: sqlite3.Connection) -> set:
+    return {row[1] for row in conn.execute("PRAGMA table_info(student_data)")}
+
+
+def calibrate_scale(conn: sqlite3.Connection, scale: str, variables: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    Kalibriert eine Skala gegen ihren PISA-WLE.
+
+    Returns:
+        Skalen-Eintrag für ``irt_parameters.json`` oder None
+        (WLE-Spalte fehlt / zu wenige Daten)
+    """
+    columns = _table_columns(conn)
+    variables = [v for v in variables if v in columns]
+    if scale not in columns or not variables:
+        return None
+
+    select = ", ".join(f'"{c}"' for c in [scale] + variables)
+    rows = conn.execute(f'SELECT {select} FROM student_data WHERE "{scale}" IS NOT NULL').fetchall()
+    if len(rows) < MIN_RESPONSES:
+        return None
+    data = np.array([[np.nan if v is None else float(v) for v in row] for row in rows])
+    theta = data[:, 0]
+
+    items = {}
+    for col, variable in enumerate(variables, start=1):
+        values = data[:, col]
+        valid = (values >= 1) & (values <= MAX_CATEGORIES) & (values == np.round(values))
+        if valid.sum() < MIN_RESPONSES:
+            continue
+        raw = values[valid].astype(int)
+        n_categories = int(raw.max())
+        if n_categories < 2:
+            continue
+        reversed_ = bool(np.corrcoef(raw, theta[valid])[0, 1] < 0)
+        categories = (n_categories - raw) if reversed_ else (raw - 1)
+        item = _fit_item(theta[valid], categories, n_categories)
+        item.update(reversed=reversed_, n=int(valid.sum()))
+        items[variable] = item
+
+    if not items:
+        return None
+    return {
+        "theta_mean": round(float(theta.mean()), 5),
+        "theta_sd": round(float(theta.std()), 5),
+        "n": len(rows),
+        "items": items,
+    }
+
+
+def calibrate(db_path: Path = PISA_DB_PATH, output: Path = IRT_PARAMETERS_PATH) -> Dict[str, Any]:
+    """Kalibriert alle PISA-Skalen mit Items und schreibt ``irt_parameters.json``."""
+    from utils.json_item_loader import get_scale_items, load_json_scales
+
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        scales = {}
+        for scale in load_json_scales():
+            variables = [item["variable_name"] for item in get_scale_items(scale)]
+            entry = calibrate_scale(conn, scale, variables)
+            if entry:
+                scales[scale] = entry
+    finally:
+        conn.close()
+
+    parameters = {
+        "model": "GPCM",
+        "source": str(db_path),
+        "calibrated": datetime.now().isoformat(timespec="seconds"),
+        "scales": scales,
+    }
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(parameters, ensure_ascii=False, indent=2), encoding="utf-8")
+    load_item_banks.cache_clear()
+    return parameters
+
+
+# ============================================
+# ITEMBANK (vorberechnete Tabellen)
+# ============================================
+
+class ItemBank:
+    """
+    Kalibrierte Items einer Skala mit Tabellen auf ``THETA_GRID``.
+
+    Attribute (I Items, K Kategorien, G Gitterpunkte):
+        steps:    (I, K-1)  - Schwellen, +inf für fehlende Kategorien
+        log_prob: (I, K, G) - log P(Kategorie | Theta), -inf für fehlende Kategorien
+        info:     (I, G)    - Iteminformation a² · Var(Kategorie | Theta)
+        expected: (I, G)    - erwarteter Wert in App-Kodierung (wie ``calculate_scale_score``)
+    """
+
+    def __init__(self, scale: str, items: Dict[str, Dict[str, Any]],
+                 theta_mean: float = 0.0, theta_sd: float = 1.0):
+        self.scale = scale
+        self.items = list(items)
+        self.params = items
+        self.theta_mean = theta_mean
+        self.theta_sd = theta_sd
+        self.grid = THETA_GRID
+        self._index = {variable: i for i, variable in enumerate(self.items)}
+
+        n_categories = max(len(p["steps"]) + 1 for p in items.values())
+        self.n_categories = np.array([len(items[v]["steps"]) + 1 for v in self.items])
+        self.reversed = np.array([bool(items[v].get("reversed")) for v in self.items])
+        self.discrimination = np.array([items[v]["a"] for v in self.items])
+
+        # Schwellen auf K-1 aufgefüllt; +inf sperrt fehlende Kategorien (P = 0)
+        self.steps = np.full((len(self.items), n_categories - 1), np.inf)
+        for i, variable in enumerate(self.items):
+            self.steps[i, :len(items[variable]["steps"])] = items[variable]["steps"]
+
+        prob = np.zeros((len(self.items), n_categories, self.grid.size))
+        for i, variable in enumerate(self.items):
+            p = category_probabilities(self.grid, items[variable]["a"], items[variable]["steps"])
+            prob[i, :p.shape[1]] = p.T
+        self.prob = prob
+
+        with np.errstate(divide="ignore"):
+            self.log_prob = np.log(prob)
+
+        k = np.arange(n_categories)[None, :, None]
+        mean_k = (prob * k).sum(axis=1)
+        self.info = self.discrimination[:, None] ** 2 * ((prob * k ** 2).sum(axis=1) - mean_k ** 2)
+
+        # Kategorie -> Roh-Code -> App-Kodierung (Umkehrung wie in scale_scoring)
+        K = self.n_categories[:, None]
+        raw = np.where(self.reversed[:, None], K - mean_k, mean_k + 1)
+        app_reversed = np.array([v.startswith(REVERSE_CODED_PREFIXES) for v in self.items])
+        self.expected = np.where(app_reversed[:, None], K + 1 - raw, raw)
+
+        self.log_prior = -0.5 * ((self.grid - theta_mean) / theta_sd) ** 2
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, variable: str) -> bool:
+        return variable in self._index
+
+    def subset(self, variables: Iterable[str]) -> "ItemBank":
+        """Bank nur mit den angegebenen (kalibrierten) Items, Reihenfolge wie ``variables``."""
+        return ItemBank(self.scale, {v: self.params[v] for v in variables if v in self._index},
+                        self.theta_mean, self.theta_sd)
+
+    def category(self, variable: str, value: Any) -> Optional[int]:
+        """Roh-Code -> Kategorie-Index (None bei ungültiger Antwort)."""
+        i = self._index[variable]
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return None
+        if not 1 <= value <= self.n_categories[i]:
+            return None
+        return int(self.n_categories[i] - value) if self.reversed[i] else value - 1
+
+    def grid_index(self, theta: float) -> int:
+        return int(np.clip(np.round((theta - self.grid[0]) / 0.05), 0, self.grid.size - 1))
+
+    def log_likelihood(self, responses: Dict[str, Any]) -> np.ndarray:
+        """Log-Likelihood der beantworteten Bank-Items auf dem Gitter."""
+        total = np.zeros(self.grid.size)
+        for variable, value in responses.items():
+            if variable in self._index:
+                k = self.category(variable, value)
+                if k is not None:
+                    total += self.log_prob[self._index[variable], k]
+        return total
+
+    def estimate(self, responses: Dict[str, Any]) -> Tuple[float, float]:
+        """
+        EAP-Schätzung mit Normal-Prior (PISA-Verteilung der Skala).
+
+        Returns:
+            (Theta, Standardfehler = Posterior-SD)
+        """
+        log_post = self.log_prior + self.log_likelihood(responses)
+        post = np.exp(log_post - log_post.max())
+        post /= post.sum()
+        theta = float((post * self.grid).sum())
+        se = float(np.sqrt((post * (self.grid - theta) ** 2).sum()))
+        return theta, se
+
+    def expected_score(self, theta: float) -> float:
+        """Erwarteter Mittelwert über alle Items der Bank (1-4-Metrik der App)."""
+        return float(self.expected[:, self.grid_index(theta)].mean())
+
+
+@lru_cache(maxsize=1)
+def load_item_banks(path: Path = IRT_PARAMETERS_PATH) -> Dict[str, ItemBank]:
+    """
+    Item-Banken aller kalibrierten Skalen.
+
+    Returns:
+        {Skala: ItemBank} - leer, wenn noch nicht kalibriert wurde
+    """
+    if not path.exists():
+        return {}
+    parameters = json.loads(path.read_text(encoding="utf-8"))
+    return {
+        scale: ItemBank(scale, entry["items"], entry.get("theta_mean", 0.0), entry.get("theta_sd", 1.0))
+        for scale, entry in parameters.get("scales", {}).items()
+        if entry.get("items")
+    }
+
+
+def get_item_bank(scale: str) -> Optional[ItemBank]:
+    return load_item_banks().get(scale)
+
+
+# ============================================
+# CLI
+# ============================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="GPCM-Kalibrierung der PISA-Skalen")
+    parser.add_argument("--db", type=Path, default=PISA_DB_PATH, help="PISA-Datenbank")
+    parser.add_argument("--output", type=Path, default=IRT_PARAMETERS_PATH)
+    args = parser.parse_args(argv)
+
+    if not args.db.exists():
+        print(f"PISA-Datenbank nicht gefunden: {args.db}", file=sys.stderr)
+        return 1
+
+    parameters = calibrate(args.db, args.output)
+    for scale, entry in parameters["scales"].items():
+        print(f"{scale:12s} {len(entry['items']):3d} Items  n={entry['n']}")
+    print(f"→ {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
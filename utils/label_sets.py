@@ -0,0 +1,154 @@
+"""
+🏷️ Antwortskalen-Registry
+=========================
+
+Internierte Value Labels für die Fragebögen.
+
+Alle Items einer Skala teilen sich in der Regel eine Antwortskala (z.B. die
+4-Punkt-Zustimmung). Statt pro Item einen eigenen DataFrame zu bauen und in
+``st.session_state`` zu halten, gibt es pro unterschiedlicher Antwortskala
+genau ein unveränderliches ``LabelSet`` im Prozess. Items verweisen per
+Integer-ID darauf:
+
+    value_labels = {'ST290Q01WA': 3, 'ST290Q02WA': 3, ...}
+    label_set = get_label_set(value_labels['ST290Q01WA'])
+    for value, label in label_set.options:
+        ...
+
+Gleiche Einträge ergeben immer dieselbe ID. Die Registry wächst nur um die
+Anzahl verschiedener Antwortskalen (wenige Dutzend) und lebt so lange wie
+der Prozess.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# (Wert, Label EN, Label DE, Missing-Code)
+LabelEntry = Tuple[Any, Optional[str], Optional[str], bool]
+# (Wert, Anzeige-Label) - Anzeige-Label ist None, wenn weder DE noch EN vorhanden
+LabelOption = Tuple[Any, Optional[str]]
+
+MISSING_VALUE = 'SYSTEM MISSING'
+
+
+@dataclass(frozen=True)
+class LabelSet:
+    """Eine unveränderliche Antwortskala."""
+    id: int
+    entries: Tuple[LabelEntry, ...]
+    # Auswählbare Antworten (ohne '.x'-Codes / SYSTEM MISSING) für die Radio-Buttons
+    options: Tuple[LabelOption, ...]
+
+    @property
+    def non_missing_count(self) -> int:
+        """Anzahl der Antwortoptionen ohne Missing-Code."""
+        return sum(1 for entry in self.entries if not entry[3])
+
+
+_lock = threading.Lock()
+_ids: Dict[Tuple[LabelEntry, ...], int] = {}
+_sets: List[LabelSet] = []
+# variable_name -> ID (PISA-Datenbank ist read-only)
+_variable_ids: Dict[str, Optional[int]] = {}
+
+
+# ============================================
+# INTERNIEREN
+# ============================================
+
+def _clean_label(label: Any) -> Optional[str]:
+    """None/NaN/''/'None' -> None."""
+    if label is None or label != label or label == '' or label == 'None':
+        return None
+    return str(label)
+
+
+def is_answer_value(value: Any) -> bool:
+    """False für PISA-Missing-Codes ('.M', '.N', ...) und SYSTEM MISSING."""
+    value_str = str(value)
+    return not (value_str.startswith('.') or value_str == MISSING_VALUE)
+
+
+def intern_label_set(entries: Iterable[Sequence[Any]]) -> int:
+    """
+    Interniert eine Antwortskala und gibt ihre ID zurück.
+
+    Args:
+        entries: (Wert, Label EN, Label DE, Missing-Code) pro Option, in Anzeigereihenfolge
+    """
+    key = tuple(
+        (value, _clean_label(label), _clean_label(label_de), bool(is_missing))
+        for value, label, label_de, is_missing in entries
+    )
+    label_set_id = _ids.get(key)
+    if label_set_id is not None:
+        return label_set_id
+
+    with _lock:
+        label_set_id = _ids.get(key)
+        if label_set_id is None:
+            options = tuple(
+                (value, label_de or label)
+                for value, label, label_de, _ in key
+                if is_answer_value(value)
+            )
+            label_set_id = len(_sets)
+            _sets.append(LabelSet(label_set_id, key, options))
+            _ids[key] = label_set_id
+    return label_set_id
+
+
+def get_label_set(label_set_id: int) -> LabelSet:
+    """Gibt die Antwortskala zu einer ID zurück."""
+    return _sets[label_set_id]
+
+
+def registry_size() -> int:
+    """Anzahl der internierten Antwortskalen im Prozess."""
+    return len(_sets)
+
+
+# ============================================
+# LADEN AUS DER PISA-DATENBANK
+# ============================================
+
+def load_label_sets(conn, variable_names: Sequence[str]) -> Dict[str, int]:
+    """
+    Lädt die Antwortskalen mehrerer Variablen mit einer Abfrage.
+
+    Bereits bekannte Variablen kommen aus dem Prozess-Cache. Variablen ohne
+    Value Labels fehlen im Ergebnis.
+
+    Args:
+        conn: Verbindung zur PISA-Datenbank
+        variable_names: Variablennamen
+
+    Returns:
+        Dict variable_name -> Label-Set-ID
+    """
+    missing = [name for name in dict.fromkeys(variable_names) if name not in _variable_ids]
+    if missing:
+        placeholders = ",".join("?" * len(missing))
+        rows = conn.execute(
+            f"""
+            SELECT variable_name, value, label_en, label_de, is_missing_code
+            FROM value_labels
+            WHERE variable_name IN ({placeholders})
+            ORDER BY variable_name, sort_order, value
+            """,
+            missing,
+        ).fetchall()
+
+        grouped: Dict[str, List[LabelEntry]] = {}
+        for variable_name, value, label, label_de, is_missing in rows:
+            grouped.setdefault(variable_name, []).append((value, label, label_de, is_missing))
+        for name in missing:
+            entries = grouped.get(name)
+            _variable_ids[name] = intern_label_set(entries) if entries else None
+
+    return {
+        name: _variable_ids[name]
+        for name in variable_names
+        if _variable_ids.get(name) is not None
+    }
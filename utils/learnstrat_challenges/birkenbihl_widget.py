@@ -20,6 +20,9 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any
 import time
 
+from ..fragments import rerun_widget
+from ..storage import routed
+
 # Lokale Imports
 from .birkenbihl_content import (
     BIRKENBIHL_XP,
@@ -51,6 +54,7 @@ STATE_KEYS = {
 # DATABASE FUNCTIONS
 # ============================================
 
+@routed("learnstrat.save_phase_progress", "birkenbihl")
 def save_birkenbihl_progress(conn, user_id: str, phase_id: str, xp: int, response: str = ""):
     """Speichert den Fortschritt für eine Birkenbihl-Phase."""
     c = conn.cursor()
@@ -77,6 +81,7 @@ def save_birkenbihl_progress(conn, user_id: str, phase_id: str, xp: int, respons
     
     conn.commit()
 
+@routed("learnstrat.get_phase_progress", "birkenbihl")
 def get_birkenbihl_progress(conn, user_id: str) -> List[Dict]:
     """Holt den Birkenbihl-Fortschritt eines Users."""
     c = conn.cursor()
@@ -182,7 +187,7 @@ def render_experiment_interactive(words: List[Dict], age_group: str):
         st.info("👆 Bereit? Klicke auf 'Experiment starten'!")
         if st.button("▶️ Experiment starten", type="primary", use_container_width=True):
             st.session_state.exp_step = 1
-            st.rerun()
+            rerun_widget()
         return None
     
     # Wörter nacheinander zeigen
@@ -218,7 +223,7 @@ def render_experiment_interactive(words: List[Dict], age_group: str):
             if st.button("Weiter →", type="primary", use_container_width=True):
                 st.session_state.exp_associations[word] = association
                 st.session_state.exp_step = exp_step + 1
-                st.rerun()
+                rerun_widget()
         
         # Progress
         st.progress(exp_step / len(words))
@@ -247,7 +252,7 @@ def render_experiment_interactive(words: List[Dict], age_group: str):
         if st.button("✅ Auflösung zeigen!", type="primary", use_container_width=True):
             st.session_state.exp_step = exp_step + 1
             st.session_state.exp_recall = recall
-            st.rerun()
+            rerun_widget()
         
         return None
     
@@ -431,7 +436,7 @@ def render_birkenbihl_challenge(user: Dict, conn, xp_callback=None):
                 for key in ["exp_step", "exp_associations", "exp_recall"]:
                     if key in st.session_state:
                         del st.session_state[key]
-                st.rerun()
+                rerun_widget()
         return
     
     # ─────────────────────────────────────────
@@ -527,14 +532,14 @@ def render_birkenbihl_challenge(user: Dict, conn, xp_callback=None):
             if current_phase > 1:
                 if st.button("← Zurück", use_container_width=True):
                     st.session_state[STATE_KEYS["current_phase"]] = current_phase - 1
-                    st.rerun()
+                    rerun_widget()
         
         with col3:
             if phase_key in completed:
                 st.success("✅ Abgeschlossen!")
                 if st.button("Weiter →", type="primary", use_container_width=True):
                     st.session_state[STATE_KEYS["current_phase"]] = current_phase + 1
-                    st.rerun()
+                    rerun_widget()
             else:
                 # Phase 1 braucht Experiment
                 can_complete = True
@@ -557,7 +562,7 @@ def render_birkenbihl_challenge(user: Dict, conn, xp_callback=None):
                         
                         st.session_state[STATE_KEYS["current_phase"]] = current_phase + 1
                         st.balloons()
-                        st.rerun()
+                        rerun_widget()
                 else:
                     st.button("✅ Phase abschließen", disabled=True, use_container_width=True)
                     st.caption("Bitte führe zuerst das Experiment durch!")
@@ -600,7 +605,7 @@ def render_birkenbihl_challenge(user: Dict, conn, xp_callback=None):
         with col1:
             if st.button("← Zurück", use_container_width=True):
                 st.session_state[STATE_KEYS["current_phase"]] = 4
-                st.rerun()
+                rerun_widget()
         
         with col2:
             all_filled = all([response_1.strip(), response_2.strip(), response_3.strip()])
@@ -621,15 +626,13 @@ def render_birkenbihl_challenge(user: Dict, conn, xp_callback=None):
                     
                     st.session_state[STATE_KEYS["current_phase"]] = 6
                     st.balloons()
-                    st.rerun()
+                    rerun_widget()
             else:
                 st.button("🎓 Challenge abschließen!", disabled=True, use_container_width=True)
                 st.caption("Bitte beantworte alle 3 Fragen!")
     
-    # Sidebar
-    with st.sidebar:
-        st.markdown("### 🧵 Birkenbihl-Challenge")
-        
+    # Übersicht (Expander statt Sidebar - das Widget läuft als Fragment)
+    with st.expander("🧵 Birkenbihl-Challenge: Dein Fortschritt"):
         phase_info = [
             ("phase_1", "🧵", "Das Faden-Prinzip", BIRKENBIHL_XP["phase_faden"]),
             ("phase_2", "💭", "Eigene Gedanken", BIRKENBIHL_XP["phase_eigene_gedanken"]),
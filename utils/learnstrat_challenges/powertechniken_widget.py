@@ -20,6 +20,9 @@ from typing import Dict, List, Optional, Any
 import json
 
 # Lokale Imports
+from ..fragments import rerun_widget
+from ..migrations import ensure_connection_schema
+from ..storage import routed
 from .challenge_content import (
     POWERTECHNIKEN,
     CHALLENGE_XP,
@@ -54,43 +57,10 @@ STATE_KEYS = {
 # ============================================
 
 def init_learnstrat_tables(conn):
-    """Initialisiert die Lernstrategie-Tabellen."""
-    c = conn.cursor()
-    
-    # User Learning Preferences (Top 3)
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS user_learning_preferences (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id TEXT NOT NULL,
-            technique_1 TEXT,
-            technique_2 TEXT,
-            technique_3 TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Lernstrategie-Progress
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS learnstrat_progress (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id TEXT NOT NULL,
-            challenge_id TEXT NOT NULL,
-            technique_id TEXT,
-            completed BOOLEAN DEFAULT 0,
-            rating INTEGER,
-            reflection TEXT,
-            xp_earned INTEGER DEFAULT 0,
-            completed_at TIMESTAMP
-        )
-    ''')
-    
-    # Index für schnelle Abfragen
-    c.execute('CREATE INDEX IF NOT EXISTS idx_learnstrat_user ON learnstrat_progress(user_id)')
-    c.execute('CREATE INDEX IF NOT EXISTS idx_learnstrat_challenge ON learnstrat_progress(challenge_id)')
-    
-    conn.commit()
+    """Stellt sicher, dass die Lernstrategie-Tabellen existieren (siehe utils/migrations.py)."""
+    ensure_connection_schema(conn)
 
+@routed("learnstrat.save_technique_progress")
 def save_technique_progress(conn, user_id: str, technique_id: str, rating: int, xp: int):
     """Speichert den Fortschritt für eine Technik."""
     c = conn.cursor()
@@ -118,6 +88,7 @@ def save_technique_progress(conn, user_id: str, technique_id: str, rating: int,
     
     conn.commit()
 
+@routed("learnstrat.save_top3")
 def save_top3_preferences(conn, user_id: str, top3: List[str]):
     """Speichert die Top 3 Lerntechniken des Users."""
     c = conn.cursor()
@@ -145,6 +116,7 @@ def save_top3_preferences(conn, user_id: str, top3: List[str]):
     
     conn.commit()
 
+@routed("learnstrat.get_progress")
 def get_user_learnstrat_progress(conn, user_id: str, challenge_id: str = "powertechniken") -> List[Dict]:
     """Holt den Lernstrategie-Fortschritt eines Users."""
     c = conn.cursor()
@@ -164,6 +136,7 @@ def get_user_learnstrat_progress(conn, user_id: str, challenge_id: str = "powert
     
     return c.fetchall()
 
+@routed("learnstrat.get_top3")
 def get_user_top3(conn, user_id: str) -> Optional[List[str]]:
     """Holt die Top 3 Lerntechniken eines Users."""
     c = conn.cursor()
@@ -308,7 +281,7 @@ def render_star_rating(key: str) -> int:
             star = "⭐" if i <= rating else "☆"
             if st.button(star, key=f"star_{key}_{i}", use_container_width=True):
                 st.session_state[f"rating_{key}"] = i
-                st.rerun()
+                rerun_widget()
     
     labels = ["", "😕 Nicht mein Ding", "🤔 Geht so", "😊 Ganz okay", "😃 Richtig gut!", "🤩 Perfekt für mich!"]
     if rating > 0:
@@ -383,13 +356,13 @@ def render_top3_selection(techniques: List[Dict], ratings: Dict[str, int]):
                 if st.button("❌", key=f"remove_{key}", help="Entfernen"):
                     selected.remove(key)
                     st.session_state[STATE_KEYS["top3_selection"]] = selected
-                    st.rerun()
+                    rerun_widget()
             else:
                 if len(selected) < 3:
                     if st.button("➕", key=f"add_{key}", help="Auswählen"):
                         selected.append(key)
                         st.session_state[STATE_KEYS["top3_selection"]] = selected
-                        st.rerun()
+                        rerun_widget()
     
     return selected
 
@@ -488,7 +461,7 @@ def render_powertechniken_challenge(user: Dict, conn, xp_callback=None):
                 st.session_state[STATE_KEYS["top3_selection"]] = selected
                 st.session_state[STATE_KEYS["phase"]] = "certificate"
                 st.balloons()
-                st.rerun()
+                rerun_widget()
         else:
             st.info(f"Wähle noch {3 - len(selected)} Technik(en) aus!")
         
@@ -517,7 +490,7 @@ def render_powertechniken_challenge(user: Dict, conn, xp_callback=None):
                 for key in STATE_KEYS.values():
                     if key in st.session_state:
                         del st.session_state[key]
-                st.rerun()
+                rerun_widget()
         
         return
     
@@ -536,7 +509,7 @@ def render_powertechniken_challenge(user: Dict, conn, xp_callback=None):
     if not current_tech:
         # Alle fertig → zu Top 3
         st.session_state[STATE_KEYS["phase"]] = "top3"
-        st.rerun()
+        rerun_widget()
         return
     
     # Technik-Karte
@@ -551,7 +524,7 @@ def render_powertechniken_challenge(user: Dict, conn, xp_callback=None):
         st.markdown("---")
         if st.button("✅ Verstanden! Weiter zur Übung →", type="primary", use_container_width=True):
             st.session_state[STATE_KEYS["phase"]] = "exercise"
-            st.rerun()
+            rerun_widget()
     
     # ─────────────────────────────────────────
     # PHASE: EXERCISE (Übung)
@@ -565,11 +538,11 @@ def render_powertechniken_challenge(user: Dict, conn, xp_callback=None):
         with col1:
             if st.button("← Zurück zur Erklärung", use_container_width=True):
                 st.session_state[STATE_KEYS["phase"]] = "intro"
-                st.rerun()
+                rerun_widget()
         with col2:
             if st.button("✅ Übung gemacht! Weiter →", type="primary", use_container_width=True):
                 st.session_state[STATE_KEYS["phase"]] = "rate"
-                st.rerun()
+                rerun_widget()
     
     # ─────────────────────────────────────────
     # PHASE: RATE (Bewertung)
@@ -585,7 +558,7 @@ def render_powertechniken_challenge(user: Dict, conn, xp_callback=None):
         with col1:
             if st.button("← Zurück zur Übung", use_container_width=True):
                 st.session_state[STATE_KEYS["phase"]] = "exercise"
-                st.rerun()
+                rerun_widget()
         with col2:
             if rating > 0:
                 if st.button("✅ Bewertung abgeben!", type="primary", use_container_width=True):
@@ -608,7 +581,7 @@ def render_powertechniken_challenge(user: Dict, conn, xp_callback=None):
                     # Zur Completion-Phase
                     st.session_state[STATE_KEYS["phase"]] = "complete"
                     st.session_state["last_xp"] = xp
-                    st.rerun()
+                    rerun_widget()
             else:
                 st.button("✅ Bewertung abgeben!", disabled=True, use_container_width=True)
                 st.caption("Bitte gib eine Bewertung ab (1-5 Sterne)")
@@ -627,7 +600,7 @@ def render_powertechniken_challenge(user: Dict, conn, xp_callback=None):
             
             if st.button("➡️ Nächste Technik entdecken!", type="primary", use_container_width=True):
                 st.session_state[STATE_KEYS["phase"]] = "intro"
-                st.rerun()
+                rerun_widget()
         else:
             # Bonus XP für alle Techniken
             bonus_xp = CHALLENGE_XP["all_techniques_done"]
@@ -639,14 +612,12 @@ def render_powertechniken_challenge(user: Dict, conn, xp_callback=None):
             
             if st.button("🏆 Jetzt deine Top 3 wählen!", type="primary", use_container_width=True):
                 st.session_state[STATE_KEYS["phase"]] = "top3"
-                st.rerun()
+                rerun_widget()
     
     # ─────────────────────────────────────────
-    # NAVIGATION SIDEBAR (Optional)
+    # FORTSCHRITT (Expander statt Sidebar - das Widget läuft als Fragment)
     # ─────────────────────────────────────────
-    with st.sidebar:
-        st.markdown("### 📚 Dein Fortschritt")
-        
+    with st.expander("📚 Dein Fortschritt"):
         for tech in techniques:
             key = tech["key"]
             icon = tech["icon"]
@@ -17,6 +17,9 @@ import streamlit as st
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
+from ..fragments import rerun_widget
+from ..storage import routed
+
 # Lokale Imports
 from .transfer_content import (
     TRANSFER_XP,
@@ -25,11 +28,6 @@ from .transfer_content import (
     TRANSFER_EFFECT_SIZE,
     get_transfer_content_for_age,
     get_phase_content,
-    PHASE_1_CONTENT,
-    PHASE_2_CONTENT,
-    PHASE_3_CONTENT,
-    PHASE_4_CONTENT,
-    FINALE_CONTENT,
 )
 from .certificate_generator import (
     generate_transfer_certificate,
@@ -53,6 +51,7 @@ STATE_KEYS = {
 # DATABASE FUNCTIONS
 # ============================================
 
+@routed("learnstrat.save_phase_progress", "transfer")
 def save_transfer_progress(conn, user_id: str, phase_id: str, xp: int, response: str = ""):
     """Speichert den Fortschritt für eine Transfer-Phase."""
     c = conn.cursor()
@@ -80,6 +79,7 @@ def save_transfer_progress(conn, user_id: str, phase_id: str, xp: int, response:
     
     conn.commit()
 
+@routed("learnstrat.get_phase_progress", "transfer")
 def get_transfer_progress(conn, user_id: str) -> List[Dict]:
     """Holt den Transfer-Fortschritt eines Users."""
     c = conn.cursor()
@@ -423,7 +423,7 @@ def render_transfer_challenge(user: Dict, conn, xp_callback=None):
                 for key in STATE_KEYS.values():
                     if key in st.session_state:
                         del st.session_state[key]
-                st.rerun()
+                rerun_widget()
         return
     
     # ─────────────────────────────────────────
@@ -459,14 +459,14 @@ def render_transfer_challenge(user: Dict, conn, xp_callback=None):
             if current_phase > 1:
                 if st.button("← Zurück", use_container_width=True):
                     st.session_state[STATE_KEYS["current_phase"]] = current_phase - 1
-                    st.rerun()
+                    rerun_widget()
         
         with col3:
             if phase_key in completed:
                 st.success("✅ Abgeschlossen!")
                 if st.button("Weiter →", use_container_width=True, type="primary"):
                     st.session_state[STATE_KEYS["current_phase"]] = current_phase + 1
-                    st.rerun()
+                    rerun_widget()
             else:
                 if st.button("✅ Phase abschließen", use_container_width=True, type="primary"):
                     # XP berechnen
@@ -493,7 +493,7 @@ def render_transfer_challenge(user: Dict, conn, xp_callback=None):
                     
                     # Weiter zur nächsten Phase
                     st.session_state[STATE_KEYS["current_phase"]] = current_phase + 1
-                    st.rerun()
+                    rerun_widget()
     
     # ─────────────────────────────────────────
     # FINALE (Phase 5)
@@ -510,7 +510,7 @@ def render_transfer_challenge(user: Dict, conn, xp_callback=None):
         with col1:
             if st.button("← Zurück zu Phase 4", use_container_width=True):
                 st.session_state[STATE_KEYS["current_phase"]] = 4
-                st.rerun()
+                rerun_widget()
         
         with col2:
             # Prüfen ob alle Antworten ausgefüllt
@@ -542,7 +542,7 @@ def render_transfer_challenge(user: Dict, conn, xp_callback=None):
                     # Zum Zertifikat
                     st.session_state[STATE_KEYS["current_phase"]] = 6
                     st.balloons()
-                    st.rerun()
+                    rerun_widget()
             else:
                 st.button("🏆 Challenge abschließen!", disabled=True, use_container_width=True)
                 st.caption("Bitte fülle alle 3 Antworten aus!")
@@ -555,10 +555,8 @@ def render_transfer_challenge(user: Dict, conn, xp_callback=None):
         )
         st.session_state["show_celebration"] = False
     
-    # Sidebar mit Übersicht
-    with st.sidebar:
-        st.markdown("### 🚀 Transfer-Challenge")
-        
+    # Übersicht (Expander statt Sidebar - das Widget läuft als Fragment)
+    with st.expander("🚀 Transfer-Challenge: Dein Fortschritt"):
         phase_info = [
             ("phase_1", "🔮", "Das Geheimnis", TRANSFER_XP["phase_discovery"]),
             ("phase_2", "🎯", "Near Transfer", TRANSFER_XP["phase_near"]),
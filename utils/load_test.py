@@ -0,0 +1,386 @@
+"""
+🏫 Load Test - Klassenraum-Simulation
+=====================================
+
+Headless Lastgenerator für die DB-Schicht: Simuliert eine Schulklasse
+(Standard 30 Schüler), die gleichzeitig Screening, Hattie-Widget,
+Bandura-Tagebuch und Motivations-Challenges nutzt.
+
+Jeder simulierte Schüler führt pro Runde aus:
+- ``get_or_create_user``
+- ``create_challenge`` + ``complete_challenge``
+- ``create_bandura_entry``
+- ``record_response`` pro Item (Autosave-Puffer) + ``finalize_assessment``
+- ``save_challenge_progress``
+
+Alle Zugriffe laufen gegen eine temporäre Datenbank. Ausgegeben werden
+p50/p95/p99-Latenzen je Operation, Durchsatz und die Anzahl der
+``database is locked``-Fehler, um Storage-Konfigurationen zu vergleichen.
+
+Verwendung:
+    python -m utils.load_test --students 30 --rounds 5
+    python -m utils.load_test --mode processes --journal-mode wal --busy-timeout 1
+"""
+
+import argparse
+import json
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+DEFAULT_CONFIG = {
+    "students": 30,
+    "rounds": 5,
+    "mode": "threads",          # threads | processes
+    "journal_mode": "delete",   # SQLite-Standard; "wal" zum Vergleich
+    "busy_timeout": 5.0,        # Sekunden, wie sqlite3.connect(timeout=...)
+    "think_ms": 50,             # Maximale "Denkzeit" zwischen Aktionen
+    "seed": 42,
+}
+
+AGE_GROUPS = ["grundschule", "unterstufe", "mittelstufe", "oberstufe"]
+SUBJECTS = ["Mathe", "Deutsch", "Englisch", "Bio"]
+
+_original_connect = sqlite3.connect
+_counters = threading.local()
+
+
+# ============================================
+# CONNECTION-WRAPPER (zählt "database is locked")
+# ============================================
+
+def _count_locked(error: sqlite3.OperationalError) -> None:
+    if "locked" in str(error) or "busy" in str(error):
+        _counters.locked = getattr(_counters, "locked", 0) + 1
+
+
+class _LoadTestCursor(sqlite3.Cursor):
+    def execute(self, sql, parameters=()):
+        try:
+            return super().execute(sql, parameters)
+        except sqlite3.OperationalError as e:
+            _count_locked(e)
+            raise
+
+    def executemany(self, sql, seq_of_parameters):
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        except sqlite3.OperationalError as e:
+            _count_locked(e)
+            raise
+
+
+class _LoadTestConnection(sqlite3.Connection):
+    def cursor(self, factory=_LoadTestCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def commit(self):
+        try:
+            return super().commit()
+        except sqlite3.OperationalError as e:
+            _count_locked(e)
+            raise
+
+
+@contextmanager
+def _temp_environment(db_dir: str, busy_timeout: float) -> Iterator[None]:
+    """
+    Leitet alle DB-Module auf das Temp-Verzeichnis um und setzt die
+    Connection-Factory. Läuft im Hauptprozess und in jedem Worker-Prozess;
+    beim Verlassen werden die Originale wiederhergestellt.
+    """
+    from utils import gamification_db, coaching_db, user_system, bandura_sources_widget
+
+    modules = (gamification_db, user_system, bandura_sources_widget)
+    original_paths = [module.get_db_path for module in modules]
+    original_coaching_path = coaching_db.DB_PATH
+    original_connect = sqlite3.connect
+
+    gamification_path = Path(db_dir) / "hattie_gamification.db"
+    for module in modules:
+        module.get_db_path = lambda: gamification_path
+    coaching_db.DB_PATH = Path(db_dir) / "coaching.db"
+
+    def connect(database, *args, **kwargs):
+        kwargs.setdefault("timeout", busy_timeout)
+        kwargs.setdefault("factory", _LoadTestConnection)
+        return _original_connect(database, *args, **kwargs)
+
+    sqlite3.connect = connect
+    try:
+        yield
+    finally:
+        sqlite3.connect = original_connect
+        coaching_db.DB_PATH = original_coaching_path
+        for module, original in zip(modules, original_paths):
+            module.get_db_path = original
+
+
+def _setup_databases(config: Dict[str, Any]) -> List[int]:
+    """Legt alle Tabellen an, setzt den Journal-Mode und erzeugt die Schüler."""
+    from utils import gamification_db, coaching_db, bandura_sources_widget
+    from utils.motivation_challenges.motivation_db import init_motivation_tables
+
+    coaching_db.init_database()
+    gamification_db.init_database()
+    bandura_sources_widget.init_bandura_tables()
+
+    for path in (gamification_db.get_db_path(), coaching_db.DB_PATH):
+        conn = sqlite3.connect(path)
+        conn.execute(f"PRAGMA journal_mode = {config['journal_mode']}")
+        if path == gamification_db.get_db_path():
+            init_motivation_tables(conn)
+        conn.close()
+
+    return [
+        coaching_db.create_student(f"LOAD{i:03d}", class_name="7a")
+        for i in range(config["students"])
+    ]
+
+
+# ============================================
+# SZENARIO
+# ============================================
+
+def _timed(results: List[Dict], operation: str, func: Callable, *args, **kwargs) -> Any:
+    """Führt eine Operation aus und protokolliert Latenz, Fehler und Locks."""
+    locked_before = getattr(_counters, "locked", 0)
+    start = time.perf_counter()
+    error = None
+    value = None
+    try:
+        value = func(*args, **kwargs)
+        if value is None:
+            error = "None"
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    results.append({
+        "operation": operation,
+        "ms": (time.perf_counter() - start) * 1000,
+        "error": error,
+        "locked": getattr(_counters, "locked", 0) - locked_before,
+    })
+    return value
+
+
+def simulate_student(index: int, student_id: int, config: Dict[str, Any],
+                     db_dir: Optional[str] = None) -> List[Dict]:
+    """
+    Simuliert einen Schüler über mehrere Runden.
+
+    ``db_dir`` wird nur im Prozess-Modus gesetzt (jeder Worker richtet die
+    Umleitung selbst ein).
+    """
+    if db_dir is not None:
+        with _temp_environment(db_dir, config["busy_timeout"]):
+            return simulate_student(index, student_id, config)
+
+    from utils import gamification_db, assessment_drafts, bandura_sources_widget
+    from utils.motivation_challenges.motivation_db import save_challenge_progress
+
+    rng = random.Random(config["seed"] + index)
+    user_id = f"load_user_{index:03d}"
+    age_group = AGE_GROUPS[index % len(AGE_GROUPS)]
+    sources = list(bandura_sources_widget.BANDURA_SOURCES)
+    results: List[Dict] = []
+
+    def think():
+        if config["think_ms"]:
+            time.sleep(rng.uniform(0, config["think_ms"]) / 1000)
+
+    for round_num in range(config["rounds"]):
+        _timed(results, "get_or_create_user", gamification_db.get_or_create_user, user_id, f"Schüler {index}")
+        think()
+
+        prediction = rng.randint(40, 90)
+        challenge_id = _timed(results, "create_challenge", gamification_db.create_challenge,
+                              user_id, rng.choice(SUBJECTS), prediction, "Klassenarbeit")
+        think()
+        if challenge_id:
+            _timed(results, "complete_challenge", gamification_db.complete_challenge,
+                   challenge_id, prediction + rng.randint(-10, 15), "Lief besser als gedacht")
+        think()
+
+        _timed(results, "create_bandura_entry", bandura_sources_widget.create_bandura_entry,
+               user_id, rng.choice(sources), "Heute habe ich eine schwierige Aufgabe alleine gelöst.")
+        think()
+
+        item_responses = {f"MATHEFF_Q{i:02d}": rng.randint(1, 4) for i in range(1, 9)}
+        for variable_name, value in item_responses.items():
+            _timed(results, "record_response", assessment_drafts.record_response,
+                   student_id, variable_name, value)
+        think()
+
+        _timed(results, "finalize_assessment", assessment_drafts.finalize, student_id, {
+            "item_responses": item_responses,
+            "scale_scores": {"MATHEFF": rng.uniform(1, 4)},
+        })
+        think()
+
+        def motivation_step():
+            conn = sqlite3.connect(gamification_db.get_db_path())
+            try:
+                return save_challenge_progress(
+                    conn, user_id, f"load_{round_num}", age_group, "kompetenz",
+                    phase="complete", reflection="Geschafft!", rating=4,
+                    xp_earned=15, completed=True
+                )
+            finally:
+                conn.close()
+
+        _timed(results, "save_challenge_progress", motivation_step)
+        think()
+
+    return results
+
+
+# ============================================
+# AUSWERTUNG
+# ============================================
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-Rank-Perzentil."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(results: List[Dict], wall_s: float) -> Dict[str, Any]:
+    """Aggregiert die Einzelmessungen je Operation."""
+    by_operation: Dict[str, List[Dict]] = {}
+    for r in results:
+        by_operation.setdefault(r["operation"], []).append(r)
+
+    operations = {}
+    for name, entries in by_operation.items():
+        latencies = sorted(e["ms"] for e in entries)
+        operations[name] = {
+            "count": len(entries),
+            "errors": sum(1 for e in entries if e["error"]),
+            "locked": sum(e["locked"] for e in entries),
+            "p50_ms": round(_percentile(latencies, 50), 2),
+            "p95_ms": round(_percentile(latencies, 95), 2),
+            "p99_ms": round(_percentile(latencies, 99), 2),
+            "max_ms": round(latencies[-1], 2),
+        }
+
+    all_latencies = sorted(r["ms"] for r in results)
+    return {
+        "operations": operations,
+        "total": {
+            "count": len(results),
+            "errors": sum(1 for r in results if r["error"]),
+            "locked": sum(r["locked"] for r in results),
+            "throughput_ops_s": round(len(results) / wall_s, 1) if wall_s else 0.0,
+            "wall_s": round(wall_s, 2),
+            "p50_ms": round(_percentile(all_latencies, 50), 2),
+            "p95_ms": round(_percentile(all_latencies, 95), 2),
+            "p99_ms": round(_percentile(all_latencies, 99), 2),
+        },
+        "sample_errors": sorted({r["error"] for r in results if r["error"]})[:10],
+    }
+
+
+def run_load_test(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Führt den kompletten Lasttest aus.
+
+    Returns:
+        Dict mit config, operations (pro Operation) und total
+    """
+    config = {**DEFAULT_CONFIG, **(config or {})}
+
+    from utils import assessment_drafts
+
+    with tempfile.TemporaryDirectory(prefix="pulse_load_") as db_dir, \
+            _temp_environment(db_dir, config["busy_timeout"]):
+        student_ids = _setup_databases(config)
+
+        if config["mode"] == "processes":
+            executor = ProcessPoolExecutor(max_workers=config["students"])
+            worker_db_dir = db_dir
+        else:
+            executor = ThreadPoolExecutor(max_workers=config["students"])
+            worker_db_dir = None
+
+        start = time.perf_counter()
+        with executor:
+            futures = [
+                executor.submit(simulate_student, i, student_id, config, worker_db_dir)
+                for i, student_id in enumerate(student_ids)
+            ]
+            results = [r for f in futures for r in f.result()]
+        wall_s = time.perf_counter() - start
+        # Reste des Autosave-Puffers noch in die Temp-DB schreiben
+        assessment_drafts.flush()
+
+    return {"config": config, **summarize(results, wall_s)}
+
+
+def print_summary(summary: Dict[str, Any]) -> None:
+    config = summary["config"]
+    print(f"🏫 {config['students']} Schüler × {config['rounds']} Runden | "
+          f"{config['mode']} | journal_mode={config['journal_mode']} | busy_timeout={config['busy_timeout']}s")
+    print(f"{'Operation':<26}{'n':>6}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'Fehler':>8}{'locked':>8}")
+    for name, op in summary["operations"].items():
+        print(f"{name:<26}{op['count']:>6}{op['p50_ms']:>9.1f}{op['p95_ms']:>9.1f}"
+              f"{op['p99_ms']:>9.1f}{op['max_ms']:>9.1f}{op['errors']:>8}{op['locked']:>8}")
+    total = summary["total"]
+    print(f"\nGesamt: {total['count']} Operationen in {total['wall_s']} s "
+          f"({total['throughput_ops_s']} ops/s), p95 {total['p95_ms']} ms, "
+          f"{total['errors']} Fehler, {total['locked']} × 'database is locked'")
+    for error in summary["sample_errors"]:
+        print(f"  ⚠️ {error}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Klassenraum-Lasttest für die DB-Schicht")
+    parser.add_argument("--students", type=int, default=DEFAULT_CONFIG["students"])
+    parser.add_argument("--rounds", type=int, default=DEFAULT_CONFIG["rounds"])
+    parser.add_argument("--mode", choices=["threads", "processes"], default=DEFAULT_CONFIG["mode"])
+    parser.add_argument("--journal-mode", default=DEFAULT_CONFIG["journal_mode"],
+                        choices=["delete", "truncate", "persist", "wal"])
+    parser.add_argument("--busy-timeout", type=float, default=DEFAULT_CONFIG["busy_timeout"])
+    parser.add_argument("--think-ms", type=float, default=DEFAULT_CONFIG["think_ms"])
+    parser.add_argument("--seed", type=int, default=DEFAULT_CONFIG["seed"])
+    parser.add_argument("--json", type=Path, help="Ergebnis zusätzlich als JSON speichern")
+    args = parser.parse_args(argv)
+
+    summary = run_load_test({
+        "students": args.students,
+        "rounds": args.rounds,
+        "mode": args.mode,
+        "journal_mode": args.journal_mode,
+        "busy_timeout": args.busy_timeout,
+        "think_ms": args.think_ms,
+        "seed": args.seed,
+    })
+    print_summary(summary)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,310 @@
+"""
+🧹 Wartung: Retention, Rollup und Kompaktierung
+===============================================
+
+Die Ereignis-Tabellen der Gamification-DB wachsen sonst unbegrenzt:
+
+- ``activity_log``            → ``activity_daily``
+- ``motivation_activity_log`` → ``motivation_activity_daily``
+- ``bandura_entries``         → ``bandura_daily``
+
+Rohzeilen älter als die Retention werden pro (User, Tag, Typ) zu Anzahl und
+XP verdichtet und danach gelöscht - in kleinen Batches, damit der
+Schreib-Lock nie lange gehalten wird. Heatmaps, Streaks und Badges lesen
+Rohdaten und Tages-Aggregate gemeinsam (siehe ``get_activity_heatmap_data``
+und ``get_bandura_stats``).
+
+Tages-Aggregate bleiben dauerhaft erhalten: Der längste Bandura-Streak
+braucht Tagesauflösung, eine Monatsverdichtung würde ihn verfälschen.
+``learnstrat_progress`` ist ein Upsert pro Technik und wächst nicht mit der
+Zeit - dort läuft nur ANALYZE.
+
+Anschließend: ``PRAGMA incremental_vacuum`` (beim ersten Lauf einmalige
+Umstellung auf ``auto_vacuum = INCREMENTAL`` per VACUUM) und ANALYZE.
+
+Verwendung:
+    python -m utils.maintenance
+    python -m utils.maintenance --weeks 8 --dry-run
+
+In der App startet ``run_maintenance_if_due()`` (über ``utils/app_startup.py``)
+den Job höchstens einmal pro ``MAINTENANCE_INTERVAL_HOURS`` in einem
+Hintergrund-Thread. Der Import von ``utils`` startet nichts.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .migrations import default_db_path, ensure_schema
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+# Rohdaten-Aufbewahrung in Wochen (mind. 1, der heutige Tag wird live gelesen)
+RETENTION_WEEKS = {
+    "activity_log": 12,
+    "motivation_activity_log": 12,
+    # Portfolio zeigt die Texte der Einträge - ein Schuljahr behalten
+    "bandura_entries": 52,
+}
+
+BATCH_SIZE = 2000
+MAINTENANCE_INTERVAL_HOURS = 24
+
+# PULSE_MAINTENANCE=0 schaltet den automatischen Lauf beim App-Start ab
+ENV_FLAG = "PULSE_MAINTENANCE"
+
+# Seiten, die pro Lauf höchstens freigegeben werden (≈ 4 MB bei 4 KB Seiten)
+VACUUM_PAGES = 1000
+
+# Tabelle -> Rollup-Definition
+ROLLUPS = {
+    "activity_log": {
+        "target": "activity_daily",
+        "date_column": "activity_date",
+        "key_column": "activity_type",
+        "count_column": "activity_count",
+    },
+    "motivation_activity_log": {
+        "target": "motivation_activity_daily",
+        "date_column": "activity_date",
+        "key_column": "grundbeduerfnis",
+        "count_column": "activity_count",
+    },
+    "bandura_entries": {
+        "target": "bandura_daily",
+        "date_column": "entry_date",
+        "key_column": "source_type",
+        "count_column": "entry_count",
+    },
+}
+
+ANALYZE_TABLES = [
+    "activity_log", "activity_daily",
+    "motivation_activity_log", "motivation_activity_daily",
+    "bandura_entries", "bandura_daily",
+    "learnstrat_progress",
+]
+
+_running = threading.Lock()
+
+
+# ============================================
+# ROLLUP
+# ============================================
+
+def rollup_table(conn: sqlite3.Connection, table: str, cutoff: str,
+                 batch_size: int = BATCH_SIZE, dry_run: bool = False) -> int:
+    """
+    Verdichtet alle Zeilen einer Ereignis-Tabelle vor ``cutoff``.
+
+    Jeder Batch (Upsert ins Aggregat + Löschen der Rohzeilen) läuft in einer
+    eigenen ``BEGIN IMMEDIATE``-Transaktion.
+
+    Returns:
+        Anzahl verdichteter (bzw. bei dry_run: betroffener) Rohzeilen
+    """
+    spec = ROLLUPS[table]
+    date_col, key_col = spec["date_column"], spec["key_column"]
+
+    if dry_run:
+        return conn.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE {date_col} < ?", (cutoff,)
+        ).fetchone()[0]
+
+    batch = f"SELECT id FROM {table} WHERE {date_col} < ? ORDER BY id LIMIT ?"
+    upsert = f'''
+        INSERT INTO {spec["target"]} (user_id, {date_col}, {key_col}, {spec["count_column"]}, xp_earned)
+        SELECT user_id, {date_col}, {key_col}, COUNT(*), COALESCE(SUM(xp_earned), 0)
+        FROM {table}
+        WHERE id IN ({batch})
+        GROUP BY user_id, {date_col}, {key_col}
+        ON CONFLICT (user_id, {date_col}, {key_col}) DO UPDATE SET
+            {spec["count_column"]} = {spec["count_column"]} + excluded.{spec["count_column"]},
+            xp_earned = xp_earned + excluded.xp_earned
+    '''
+
+    previous_isolation = conn.isolation_level
+    conn.isolation_level = None
+    total = 0
+    try:
+        while True:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(upsert, (cutoff, batch_size))
+                deleted = conn.execute(
+                    f"DELETE FROM {table} WHERE id IN ({batch})", (cutoff, batch_size)
+                ).rowcount
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            total += deleted
+            if deleted < batch_size:
+                break
+    finally:
+        conn.isolation_level = previous_isolation
+    return total
+
+
+# ============================================
+# KOMPAKTIERUNG
+# ============================================
+
+def compact(conn: sqlite3.Connection, max_pages: int = VACUUM_PAGES) -> Dict[str, Any]:
+    """
+    Gibt freie Seiten zurück und aktualisiert die Statistiken.
+
+    Beim ersten Lauf wird ``auto_vacuum`` auf INCREMENTAL umgestellt; das
+    braucht einmalig ein volles VACUUM.
+    """
+    result = {"converted": False}
+    previous_isolation = conn.isolation_level
+    conn.isolation_level = None
+    try:
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+            result["converted"] = True
+
+        result["freelist_before"] = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        conn.execute(f"PRAGMA incremental_vacuum({int(max_pages)})").fetchall()
+        result["freelist_after"] = conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+        existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        for table in ANALYZE_TABLES:
+            if table in existing:
+                conn.execute(f"ANALYZE {table}")
+    finally:
+        conn.isolation_level = previous_isolation
+    return result
+
+
+# ============================================
+# JOB
+# ============================================
+
+def run_maintenance(db_path: Optional[Path] = None, retention_weeks: Optional[int] = None,
+                    batch_size: int = BATCH_SIZE, dry_run: bool = False) -> Dict[str, Any]:
+    """
+    Führt Rollup und Kompaktierung aus.
+
+    Args:
+        db_path: Datenbank (Standard: Gamification-DB)
+        retention_weeks: Einheitliche Retention für alle Tabellen (sonst RETENTION_WEEKS)
+        batch_size: Rohzeilen pro Transaktion
+        dry_run: Nur zählen, nichts ändern
+
+    Returns:
+        Report mit verdichteten Zeilen pro Tabelle und Vacuum-Infos
+    """
+    db_path = Path(db_path or default_db_path())
+    ensure_schema(db_path)
+
+    report: Dict[str, Any] = {"started_at": datetime.now().isoformat(timespec="seconds"),
+                              "dry_run": dry_run, "tables": {}}
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        for table in ROLLUPS:
+            weeks = max(1, retention_weeks or RETENTION_WEEKS[table])
+            cutoff = (date.today() - timedelta(weeks=weeks)).isoformat()
+            report["tables"][table] = {
+                "cutoff": cutoff,
+                "rows": rollup_table(conn, table, cutoff, batch_size, dry_run),
+            }
+
+        if not dry_run:
+            report["vacuum"] = compact(conn)
+            conn.execute(
+                "INSERT INTO maintenance_runs (started_at, finished_at, rows_rolled_up, details) "
+                "VALUES (?, ?, ?, ?)",
+                (report["started_at"], datetime.now().isoformat(timespec="seconds"),
+                 sum(t["rows"] for t in report["tables"].values()), json.dumps(report))
+            )
+            conn.commit()
+    finally:
+        conn.close()
+    return report
+
+
+def get_last_run(db_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Letzter abgeschlossener Wartungslauf (oder None)."""
+    conn = sqlite3.connect(db_path or default_db_path())
+    try:
+        row = conn.execute(
+            "SELECT started_at, finished_at, rows_rolled_up FROM maintenance_runs "
+            "ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+    except sqlite3.OperationalError:
+        row = None
+    finally:
+        conn.close()
+    if not row:
+        return None
+    return {"started_at": row[0], "finished_at": row[1], "rows_rolled_up": row[2]}
+
+
+def run_maintenance_if_due(db_path: Optional[Path] = None,
+                           interval_hours: float = MAINTENANCE_INTERVAL_HOURS) -> bool:
+    """
+    Startet den Job im Hintergrund für jede Datenbank, deren letzter Lauf zu
+    lange her ist (ohne ``db_path``: alle Schul-Shards).
+
+    Returns:
+        True, wenn ein Lauf gestartet wurde
+    """
+    if os.environ.get(ENV_FLAG, "1").lower() in ("0", "false", "no"):
+        return False
+
+    from .shards import get_db_path, list_schools
+    paths = [db_path] if db_path else [get_db_path("gamification", school) for school in list_schools()]
+    due = []
+    for path in paths:
+        last = get_last_run(path)
+        if not last or datetime.now() - datetime.fromisoformat(last["started_at"]) >= timedelta(hours=interval_hours):
+            due.append(path)
+    if not due or not _running.acquire(blocking=False):
+        return False
+
+    def job():
+        try:
+            for path in due:
+                try:
+                    run_maintenance(path)
+                except sqlite3.Error as e:
+                    print(f"⚠️ Wartung fehlgeschlagen ({path}): {e}", file=sys.stderr)
+        finally:
+            _running.release()
+
+    threading.Thread(target=job, name="pulse-maintenance", daemon=True).start()
+    return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Retention, Rollup und VACUUM der Gamification-DB")
+    parser.add_argument("--db", type=Path, help="Pfad zur Datenbank (Standard: Gamification-DB)")
+    parser.add_argument("--weeks", type=int, help="Einheitliche Retention in Wochen")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="Nur zählen, nichts ändern")
+    args = parser.parse_args(argv)
+
+    report = run_maintenance(args.db, args.weeks, args.batch_size, args.dry_run)
+    for table, info in report["tables"].items():
+        verb = "betroffen" if args.dry_run else "verdichtet"
+        print(f"{table}: {info['rows']} Zeilen vor {info['cutoff']} {verb}")
+    if "vacuum" in report:
+        v = report["vacuum"]
+        print(f"Freie Seiten: {v['freelist_before']} → {v['freelist_after']}"
+              + (" (auto_vacuum umgestellt)" if v["converted"] else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
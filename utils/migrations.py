@@ -0,0 +1,516 @@
+"""
+🧱 Schema-Migrationen
+=====================
+
+Versionierte Migrationen für ``hattie_gamification.db`` (Users, Challenges,
+Bandura, Motivation, Lernstrategien). Derselbe Runner migriert auch
+``coaching.db`` - deren Schritte registriert ``utils/coaching_db.py`` in
+einer eigenen Registry (``COACHING_MIGRATIONS``).
+
+Der Schema-Stand steht in ``PRAGMA user_version``. ``migrate()`` wendet alle
+ausstehenden Migrationen der Reihe nach an - jede in einer eigenen
+Transaktion, zusammen mit dem neuen ``user_version``. Mehrere Worker-Prozesse
+serialisieren sich über eine Lock-Datei neben der Datenbank.
+
+Die Migrationen laufen einmal beim App-Start (``utils/app_startup.py``),
+in CLIs spätestens beim ersten ``init_database``.
+Danach sind ``init_database``, ``init_user_tables`` usw. reine
+Speicher-Lookups ohne DDL.
+
+Neue Migration:
+    @migration(8, "Beschreibung")
+    def _m008_...(c):
+        c.execute("ALTER TABLE ...")
+
+Andere Datenbank: eigene Liste als ``registry`` übergeben, z.B.
+``@migration(5, "...", COACHING_MIGRATIONS)`` und
+``ensure_schema(path, COACHING_MIGRATIONS)``.
+
+Bestehende Migrationen nie ändern, nur neue anhängen. Alle Migrationen müssen
+auf Datenbanken aus der Zeit vor dem Migrations-Framework (user_version = 0,
+Tabellen teilweise vorhanden) laufen - daher ``IF NOT EXISTS`` und
+``_add_column``.
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    # Windows: ohne Dateisperre, BEGIN IMMEDIATE serialisiert weiterhin
+    HAS_FCNTL = False
+
+# ============================================
+# REGISTRY
+# ============================================
+
+# (version, beschreibung, funktion)
+Registry = List[Tuple[int, str, Callable[[sqlite3.Cursor], None]]]
+
+# Gamification-DB (Standard-Registry)
+MIGRATIONS: Registry = []
+
+# DB-Pfade, die in diesem Prozess bereits auf dem aktuellen Stand sind
+_migrated_paths = set()
+_lock = threading.Lock()
+
+
+def migration(version: int, description: str, registry: Optional[Registry] = None):
+    """
+    Registriert eine Migration unter einer fortlaufenden Versionsnummer.
+
+    Args:
+        registry: Ziel-Registry (Standard: ``MIGRATIONS`` der Gamification-DB)
+    """
+    registry = MIGRATIONS if registry is None else registry
+
+    def decorator(func):
+        if registry and version != registry[-1][0] + 1:
+            raise ValueError(f"Migration {version} folgt nicht auf {registry[-1][0]}")
+        registry.append((version, description, func))
+        return func
+    return decorator
+
+
+def _add_column(c: sqlite3.Cursor, table: str, column: str, definition: str) -> None:
+    """Fügt eine Spalte hinzu, falls sie noch fehlt (Alt-Datenbanken)."""
+    c.execute(f"PRAGMA table_info({table})")
+    if column not in [col[1] for col in c.fetchall()]:
+        c.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+
+# ============================================
+# MIGRATIONEN
+# ============================================
+
+@migration(1, "Gamification-Basis: users, challenges, user_badges, activity_log")
+def _m001_gamification(c):
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS users (
+            user_id TEXT PRIMARY KEY,
+            username TEXT DEFAULT 'Lernender',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            xp_total INTEGER DEFAULT 0,
+            level INTEGER DEFAULT 1,
+            current_streak INTEGER DEFAULT 0,
+            longest_streak INTEGER DEFAULT 0,
+            last_activity_date DATE,
+            settings TEXT DEFAULT '{}'
+        )
+    ''')
+
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS challenges (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            challenge_date DATE NOT NULL,
+            subject TEXT NOT NULL,
+            task_description TEXT,
+            prediction INTEGER NOT NULL,
+            actual_result INTEGER,
+            outcome TEXT,
+            xp_earned INTEGER DEFAULT 0,
+            reflection TEXT,
+            completed BOOLEAN DEFAULT FALSE,
+            FOREIGN KEY (user_id) REFERENCES users(user_id)
+        )
+    ''')
+
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS user_badges (
+            user_id TEXT NOT NULL,
+            badge_id TEXT NOT NULL,
+            earned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (user_id, badge_id),
+            FOREIGN KEY (user_id) REFERENCES users(user_id)
+        )
+    ''')
+
+    # Activity-Log für Contribution-Graph
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS activity_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            activity_date DATE NOT NULL,
+            activity_type TEXT NOT NULL,
+            xp_earned INTEGER DEFAULT 0,
+            details TEXT,
+            FOREIGN KEY (user_id) REFERENCES users(user_id)
+        )
+    ''')
+
+    c.execute('CREATE INDEX IF NOT EXISTS idx_challenges_user ON challenges(user_id)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_challenges_date ON challenges(challenge_date)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_activity_user_date ON activity_log(user_id, activity_date)')
+
+
+@migration(2, "User-System: display_name, last_login, age_group, avatar_settings")
+def _m002_user_system(c):
+    _add_column(c, "users", "display_name", "TEXT")
+    _add_column(c, "users", "last_login", "TIMESTAMP")
+    _add_column(c, "users", "age_group", "TEXT DEFAULT 'unterstufe'")
+    _add_column(c, "users", "avatar_settings", "TEXT DEFAULT '{}'")
+
+
+@migration(3, "users.version für Session-Snapshots")
+def _m003_user_version(c):
+    _add_column(c, "users", "version", "INTEGER DEFAULT 0")
+
+
+@migration(4, "Bandura-Einträge")
+def _m004_bandura(c):
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS bandura_entries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            entry_date DATE NOT NULL,
+            source_type TEXT NOT NULL,
+            description TEXT NOT NULL,
+            xp_earned INTEGER DEFAULT 0,
+            FOREIGN KEY (user_id) REFERENCES users(user_id)
+        )
+    ''')
+
+    c.execute('CREATE INDEX IF NOT EXISTS idx_bandura_user_date ON bandura_entries(user_id, entry_date)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_bandura_source ON bandura_entries(source_type)')
+
+
+@migration(5, "Motivation-Challenges (SDT)")
+def _m005_motivation(c):
+    # Challenge-Fortschritt
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS motivation_challenges (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            challenge_id TEXT NOT NULL,
+            age_group TEXT NOT NULL,
+            grundbeduerfnis TEXT NOT NULL,
+            phase TEXT DEFAULT 'intro',
+            user_input TEXT,
+            reflection TEXT,
+            rating INTEGER,
+            xp_earned INTEGER DEFAULT 0,
+            completed BOOLEAN DEFAULT 0,
+            completed_at TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            FOREIGN KEY (user_id) REFERENCES users(user_id)
+        )
+    ''')
+
+    # SDT-Progress (Skill-Tree Levels)
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS motivation_sdt_progress (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL UNIQUE,
+            autonomie_level INTEGER DEFAULT 0,
+            autonomie_xp INTEGER DEFAULT 0,
+            kompetenz_level INTEGER DEFAULT 0,
+            kompetenz_xp INTEGER DEFAULT 0,
+            verbundenheit_level INTEGER DEFAULT 0,
+            verbundenheit_xp INTEGER DEFAULT 0,
+            total_challenges INTEGER DEFAULT 0,
+            total_xp INTEGER DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            FOREIGN KEY (user_id) REFERENCES users(user_id)
+        )
+    ''')
+
+    # Streak-Tracking
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS motivation_streaks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL UNIQUE,
+            current_streak INTEGER DEFAULT 0,
+            longest_streak INTEGER DEFAULT 0,
+            last_activity_date DATE,
+            freeze_available INTEGER DEFAULT 1,
+            freeze_used_date DATE,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            FOREIGN KEY (user_id) REFERENCES users(user_id)
+        )
+    ''')
+
+    # Aktivitäts-Log (für Heatmap)
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS motivation_activity_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            activity_date DATE NOT NULL,
+            challenge_id TEXT NOT NULL,
+            grundbeduerfnis TEXT NOT NULL,
+            xp_earned INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            FOREIGN KEY (user_id) REFERENCES users(user_id)
+        )
+    ''')
+
+    # Earned Badges
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS motivation_badges (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            badge_id TEXT NOT NULL,
+            earned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            UNIQUE(user_id, badge_id),
+            FOREIGN KEY (user_id) REFERENCES users(user_id)
+        )
+    ''')
+
+    # Zertifikate
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS motivation_certificates (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            certificate_type TEXT NOT NULL,
+            age_group TEXT NOT NULL,
+            challenges_completed TEXT,
+            total_xp INTEGER DEFAULT 0,
+            issued_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            FOREIGN KEY (user_id) REFERENCES users(user_id)
+        )
+    ''')
+
+    c.execute('CREATE INDEX IF NOT EXISTS idx_mot_challenges_user ON motivation_challenges(user_id)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_mot_challenges_id ON motivation_challenges(challenge_id)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_mot_activity_user ON motivation_activity_log(user_id)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_mot_activity_date ON motivation_activity_log(activity_date)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_mot_badges_user ON motivation_badges(user_id)')
+
+
+@migration(6, "Lernstrategie-Challenges")
+def _m006_learnstrat(c):
+    # User Learning Preferences (Top 3)
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS user_learning_preferences (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            technique_1 TEXT,
+            technique_2 TEXT,
+            technique_3 TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS learnstrat_progress (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            challenge_id TEXT NOT NULL,
+            technique_id TEXT,
+            completed BOOLEAN DEFAULT 0,
+            rating INTEGER,
+            reflection TEXT,
+            xp_earned INTEGER DEFAULT 0,
+            completed_at TIMESTAMP
+        )
+    ''')
+
+    c.execute('CREATE INDEX IF NOT EXISTS idx_learnstrat_user ON learnstrat_progress(user_id)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_learnstrat_challenge ON learnstrat_progress(challenge_id)')
+
+
+@migration(7, "Tages-Aggregate für Aktivitäts-Logs (Retention, siehe maintenance.py)")
+def _m007_rollups(c):
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS activity_daily (
+            user_id TEXT NOT NULL,
+            activity_date DATE NOT NULL,
+            activity_type TEXT NOT NULL,
+            activity_count INTEGER NOT NULL DEFAULT 0,
+            xp_earned INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, activity_date, activity_type)
+        ) WITHOUT ROWID
+    ''')
+
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS motivation_activity_daily (
+            user_id TEXT NOT NULL,
+            activity_date DATE NOT NULL,
+            grundbeduerfnis TEXT NOT NULL,
+            activity_count INTEGER NOT NULL DEFAULT 0,
+            xp_earned INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, activity_date, grundbeduerfnis)
+        ) WITHOUT ROWID
+    ''')
+
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS bandura_daily (
+            user_id TEXT NOT NULL,
+            entry_date DATE NOT NULL,
+            source_type TEXT NOT NULL,
+            entry_count INTEGER NOT NULL DEFAULT 0,
+            xp_earned INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, entry_date, source_type)
+        ) WITHOUT ROWID
+    ''')
+
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS maintenance_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            started_at TIMESTAMP NOT NULL,
+            finished_at TIMESTAMP,
+            rows_rolled_up INTEGER DEFAULT 0,
+            details TEXT
+        )
+    ''')
+
+    # Cutoff-Scans der Retention laufen über das Datum
+    c.execute('CREATE INDEX IF NOT EXISTS idx_activity_date ON activity_log(activity_date)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_bandura_date ON bandura_entries(entry_date)')
+
+
+# ============================================
+# AUSFÜHRUNG
+# ============================================
+
+def get_schema_version(registry: Optional[Registry] = None) -> int:
+    """Höchste registrierte Migrationsversion."""
+    registry = MIGRATIONS if registry is None else registry
+    return registry[-1][0] if registry else 0
+
+
+def default_db_path() -> Path:
+    """Pfad der Gamification-Datenbank (zur Laufzeit aufgelöst)."""
+    from . import gamification_db
+    return gamification_db.get_db_path()
+
+
+@contextmanager
+def _file_lock(db_path: Path):
+    """Exklusive Sperre über ``<db>.migrate.lock`` (prozessübergreifend)."""
+    if not HAS_FCNTL:
+        yield
+        return
+    lock_path = Path(f"{db_path}.migrate.lock")
+    with open(lock_path, "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def apply_migrations(conn: sqlite3.Connection, registry: Optional[Registry] = None) -> List[int]:
+    """
+    Wendet alle ausstehenden Migrationen auf eine offene Verbindung an.
+
+    Jede Migration läuft mit ``BEGIN IMMEDIATE`` in einer eigenen Transaktion;
+    ``user_version`` wird innerhalb der Transaktion gesetzt. Der Stand wird
+    nach dem Sperren erneut gelesen, falls ein anderer Prozess schneller war.
+
+    Returns:
+        Liste der angewendeten Versionsnummern
+    """
+    registry = MIGRATIONS if registry is None else registry
+    previous_isolation = conn.isolation_level
+    conn.isolation_level = None
+    applied = []
+    try:
+        for version, _description, func in registry:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                current = conn.execute("PRAGMA user_version").fetchone()[0]
+                if version <= current:
+                    conn.execute("ROLLBACK")
+                    continue
+                func(conn.cursor())
+                conn.execute(f"PRAGMA user_version = {int(version)}")
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            applied.append(version)
+    finally:
+        conn.isolation_level = previous_isolation
+    return applied
+
+
+def migrate(db_path: Optional[Path] = None, registry: Optional[Registry] = None,
+            prepare: Optional[Callable[[sqlite3.Connection], None]] = None) -> List[int]:
+    """
+    Bringt eine Datenbankdatei auf den aktuellen Schema-Stand.
+
+    Args:
+        db_path: Pfad zur Datenbank (Standard: Gamification-DB)
+        registry: Migrationen (Standard: ``MIGRATIONS``)
+        prepare: Läuft unter der Dateisperre vor den Migrationen
+                 (z.B. Basis-Tabellen einer neuen Datei anlegen)
+
+    Returns:
+        Liste der angewendeten Versionsnummern
+    """
+    db_path = Path(db_path or default_db_path())
+    with _lock, _file_lock(db_path):
+        conn = sqlite3.connect(db_path, timeout=30)
+        try:
+            if prepare is not None:
+                prepare(conn)
+            applied = apply_migrations(conn, registry)
+        finally:
+            conn.close()
+    _migrated_paths.add(str(db_path))
+    return applied
+
+
+def is_migrated(db_path: Path) -> bool:
+    """Wurde die Datei in diesem Prozess bereits migriert?"""
+    return str(db_path) in _migrated_paths
+
+
+def ensure_schema(db_path: Optional[Path] = None, registry: Optional[Registry] = None) -> None:
+    """
+    Stellt sicher, dass die Datenbank migriert ist.
+
+    Nach dem ersten Aufruf pro Prozess und Pfad nur noch ein Set-Lookup.
+    """
+    db_path = db_path or default_db_path()
+    if not is_migrated(db_path):
+        migrate(db_path, registry)
+
+
+def ensure_connection_schema(conn: sqlite3.Connection) -> None:
+    """
+    Wie ``ensure_schema``, aber für eine übergebene Verbindung.
+
+    Ist ``user_version`` aktuell, passiert nichts weiter. Sonst wird die
+    zugrundeliegende Datei migriert - bzw. bei ``:memory:`` die Verbindung
+    selbst.
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= get_schema_version():
+        return
+    db_file = next((row[2] for row in conn.execute("PRAGMA database_list") if row[1] == "main"), "")
+    if db_file:
+        migrate(Path(db_file))
+    else:
+        apply_migrations(conn)
+
+
+def get_migration_status(db_path: Optional[Path] = None) -> Dict[str, int]:
+    """Aktueller und Ziel-Stand einer Datenbank (für Admin/Debugging)."""
+    db_path = db_path or default_db_path()
+    current = 0
+    if os.path.exists(db_path):
+        conn = sqlite3.connect(db_path)
+        current = conn.execute("PRAGMA user_version").fetchone()[0]
+        conn.close()
+    return {"current": current, "target": get_schema_version()}
+
+
+if __name__ == "__main__":
+    applied = migrate()
+    print(f"Angewendet: {applied or 'keine'} | Stand: {get_migration_status()}")
@@ -35,6 +35,9 @@ from .motivation_db import (
     issue_certificate,
     get_user_certificates,
     get_user_motivation_stats,
+    MotivationSnapshot,
+    load_motivation_snapshot,
+    get_motivation_snapshot,
     reset_user_motivation_data,
 )
 
@@ -81,6 +84,9 @@ __all__ = [
     "get_sdt_summary",
     "update_streak",
     "get_user_motivation_stats",
+    "MotivationSnapshot",
+    "load_motivation_snapshot",
+    "get_motivation_snapshot",
     
     # Content
     "MOTIVATION_CHALLENGES",
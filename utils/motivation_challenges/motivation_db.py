@@ -18,10 +18,15 @@ Inspiriert von:
 """
 
 import sqlite3
+from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 import json
 
+from .. import shards
+from ..migrations import ensure_connection_schema
+from ..storage import routed
+
 
 # ============================================
 # TABELLEN INITIALISIERUNG
@@ -29,138 +34,39 @@ import json
 
 def init_motivation_tables(conn: sqlite3.Connection) -> None:
     """
-    Initialisiert alle Motivation-Challenge Tabellen.
-    Idempotent - kann mehrfach aufgerufen werden.
+    Stellt sicher, dass alle Motivation-Challenge Tabellen existieren.
+    Idempotent - das Schema liegt in ``utils/migrations.py``; bei aktuellem
+    ``user_version`` wird kein DDL ausgeführt.
     """
-    c = conn.cursor()
-    
-    # ─────────────────────────────────────────
-    # Tabelle 1: Challenge-Fortschritt
-    # ─────────────────────────────────────────
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS motivation_challenges (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id TEXT NOT NULL,
-            challenge_id TEXT NOT NULL,
-            age_group TEXT NOT NULL,
-            grundbeduerfnis TEXT NOT NULL,
-            phase TEXT DEFAULT 'intro',
-            user_input TEXT,
-            reflection TEXT,
-            rating INTEGER,
-            xp_earned INTEGER DEFAULT 0,
-            completed BOOLEAN DEFAULT 0,
-            completed_at TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            
-            FOREIGN KEY (user_id) REFERENCES users(user_id)
-        )
-    ''')
-    
-    # ─────────────────────────────────────────
-    # Tabelle 2: SDT-Progress (Skill-Tree Levels)
-    # ─────────────────────────────────────────
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS motivation_sdt_progress (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id TEXT NOT NULL UNIQUE,
-            autonomie_level INTEGER DEFAULT 0,
-            autonomie_xp INTEGER DEFAULT 0,
-            kompetenz_level INTEGER DEFAULT 0,
-            kompetenz_xp INTEGER DEFAULT 0,
-            verbundenheit_level INTEGER DEFAULT 0,
-            verbundenheit_xp INTEGER DEFAULT 0,
-            total_challenges INTEGER DEFAULT 0,
-            total_xp INTEGER DEFAULT 0,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            
-            FOREIGN KEY (user_id) REFERENCES users(user_id)
-        )
-    ''')
-    
-    # ─────────────────────────────────────────
-    # Tabelle 3: Streak-Tracking
-    # ─────────────────────────────────────────
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS motivation_streaks (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id TEXT NOT NULL UNIQUE,
-            current_streak INTEGER DEFAULT 0,
-            longest_streak INTEGER DEFAULT 0,
-            last_activity_date DATE,
-            freeze_available INTEGER DEFAULT 1,
-            freeze_used_date DATE,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            
-            FOREIGN KEY (user_id) REFERENCES users(user_id)
-        )
-    ''')
-    
-    # ─────────────────────────────────────────
-    # Tabelle 4: Aktivitäts-Log (für Heatmap)
-    # ─────────────────────────────────────────
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS motivation_activity_log (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id TEXT NOT NULL,
-            activity_date DATE NOT NULL,
-            challenge_id TEXT NOT NULL,
-            grundbeduerfnis TEXT NOT NULL,
-            xp_earned INTEGER DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            
-            FOREIGN KEY (user_id) REFERENCES users(user_id)
-        )
-    ''')
-    
-    # ─────────────────────────────────────────
-    # Tabelle 5: Earned Badges
-    # ─────────────────────────────────────────
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS motivation_badges (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id TEXT NOT NULL,
-            badge_id TEXT NOT NULL,
-            earned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            
-            UNIQUE(user_id, badge_id),
-            FOREIGN KEY (user_id) REFERENCES users(user_id)
-        )
-    ''')
-    
-    # ─────────────────────────────────────────
-    # Tabelle 6: Zertifikate
-    # ─────────────────────────────────────────
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS motivation_certificates (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id TEXT NOT NULL,
-            certificate_type TEXT NOT NULL,
-            age_group TEXT NOT NULL,
-            challenges_completed TEXT,
-            total_xp INTEGER DEFAULT 0,
-            issued_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            
-            FOREIGN KEY (user_id) REFERENCES users(user_id)
-        )
-    ''')
-    
-    # ─────────────────────────────────────────
-    # Indizes für Performance
-    # ─────────────────────────────────────────
-    c.execute('CREATE INDEX IF NOT EXISTS idx_mot_challenges_user ON motivation_challenges(user_id)')
-    c.execute('CREATE INDEX IF NOT EXISTS idx_mot_challenges_id ON motivation_challenges(challenge_id)')
-    c.execute('CREATE INDEX IF NOT EXISTS idx_mot_activity_user ON motivation_activity_log(user_id)')
-    c.execute('CREATE INDEX IF NOT EXISTS idx_mot_activity_date ON motivation_activity_log(activity_date)')
-    c.execute('CREATE INDEX IF NOT EXISTS idx_mot_badges_user ON motivation_badges(user_id)')
-    
-    conn.commit()
+    ensure_connection_schema(conn)
+
+
+# ============================================
+# DATEN-VERSION (für Snapshots)
+# ============================================
+
+# Schreibzugriffe pro User in diesem Prozess. Snapshots (siehe
+# load_motivation_snapshot) gelten nur, solange sich die Version nicht ändert.
+# Schlüssel ist (Schule, User), da gleiche user_ids in mehreren Shards vorkommen.
+_data_versions: Dict[Tuple[str, str], int] = {}
+
+
+def _touch_user(user_id: str) -> None:
+    """Erhöht die Daten-Version eines Users nach einem Schreibzugriff."""
+    key = (shards.get_current_school(), user_id)
+    _data_versions[key] = _data_versions.get(key, 0) + 1
+
+
+def get_data_version(user_id: str) -> int:
+    """Aktuelle Daten-Version eines Users in der aktiven Schule (0 = noch nichts geschrieben)."""
+    return _data_versions.get((shards.get_current_school(), user_id), 0)
 
 
 # ============================================
 # CHALLENGE CRUD OPERATIONEN
 # ============================================
 
+@routed("motivation.save_challenge_progress")
 def save_challenge_progress(
     conn: sqlite3.Connection,
     user_id: str,
@@ -186,7 +92,7 @@ def save_challenge_progress(
     c.execute('''
         SELECT id FROM motivation_challenges 
         WHERE user_id = ? AND challenge_id = ? AND age_group = ?
-        ORDER BY created_at DESC LIMIT 1
+        ORDER BY created_at DESC, id DESC LIMIT 1
     ''', (user_id, challenge_id, age_group))
     
     existing = c.fetchone()
@@ -219,9 +125,11 @@ def save_challenge_progress(
         entry_id = c.lastrowid
     
     conn.commit()
+    _touch_user(user_id)
     return entry_id
 
 
+@routed("motivation.get_challenge_progress")
 def get_challenge_progress(
     conn: sqlite3.Connection,
     user_id: str,
@@ -236,7 +144,7 @@ def get_challenge_progress(
         SELECT id, phase, user_input, reflection, rating, xp_earned, completed, completed_at
         FROM motivation_challenges 
         WHERE user_id = ? AND challenge_id = ? AND age_group = ?
-        ORDER BY created_at DESC LIMIT 1
+        ORDER BY created_at DESC, id DESC LIMIT 1
     ''', (user_id, challenge_id, age_group))
     
     row = c.fetchone()
@@ -254,6 +162,7 @@ def get_challenge_progress(
     return None
 
 
+@routed("motivation.get_completed_challenges")
 def get_completed_challenges(
     conn: sqlite3.Connection,
     user_id: str,
@@ -286,16 +195,21 @@ def get_completed_challenges(
     
     c.execute(query, params)
     
-    return [{
+    return [_completed_from_row(row) for row in c.fetchall()]
+
+
+def _completed_from_row(row: tuple) -> Dict[str, Any]:
+    return {
         "challenge_id": row[0],
         "age_group": row[1],
         "grundbeduerfnis": row[2],
         "xp_earned": row[3],
         "completed_at": row[4],
         "rating": row[5]
-    } for row in c.fetchall()]
+    }
 
 
+@routed("motivation.count_completed_challenges")
 def count_completed_challenges(
     conn: sqlite3.Connection,
     user_id: str,
@@ -328,6 +242,19 @@ def count_completed_challenges(
 # SDT PROGRESS (Skill-Tree)
 # ============================================
 
+SDT_LEVEL_THRESHOLDS = [0, 100, 250, 500, 1000, 2000]
+
+
+def sdt_level(xp: int) -> int:
+    """SDT-Level (0-5) für die XP eines Grundbedürfnisses."""
+    level = 0
+    for i, threshold in enumerate(SDT_LEVEL_THRESHOLDS):
+        if xp >= threshold:
+            level = i
+    return min(level, 5)  # Max Level 5
+
+
+@routed("motivation.get_or_create_sdt_progress")
 def get_or_create_sdt_progress(
     conn: sqlite3.Connection,
     user_id: str
@@ -375,6 +302,7 @@ def get_or_create_sdt_progress(
         }
 
 
+@routed("motivation.update_sdt_progress")
 def update_sdt_progress(
     conn: sqlite3.Connection,
     user_id: str,
@@ -394,8 +322,6 @@ def update_sdt_progress(
     Returns:
         Dict mit level_up Info falls Level gestiegen
     """
-    LEVEL_THRESHOLDS = [0, 100, 250, 500, 1000, 2000]
-    
     # Aktuellen Stand holen
     progress = get_or_create_sdt_progress(conn, user_id)
     
@@ -409,11 +335,7 @@ def update_sdt_progress(
     new_xp = old_xp + xp_earned
     
     # Neues Level berechnen
-    new_level = 0
-    for i, threshold in enumerate(LEVEL_THRESHOLDS):
-        if new_xp >= threshold:
-            new_level = i
-    new_level = min(new_level, 5)  # Max Level 5
+    new_level = sdt_level(new_xp)
     
     level_up = new_level > old_level
     
@@ -428,6 +350,7 @@ def update_sdt_progress(
         WHERE user_id = ?
     ''', (new_xp, new_level, xp_earned, datetime.now().isoformat(), user_id))
     conn.commit()
+    _touch_user(user_id)
     
     return {
         "grundbeduerfnis": grundbeduerfnis,
@@ -437,7 +360,7 @@ def update_sdt_progress(
         "new_xp": new_xp,
         "xp_earned": xp_earned,
         "level_up": level_up,
-        "next_level_xp": LEVEL_THRESHOLDS[new_level + 1] if new_level < 5 else None
+        "next_level_xp": SDT_LEVEL_THRESHOLDS[new_level + 1] if new_level < 5 else None
     }
 
 
@@ -445,15 +368,16 @@ def get_sdt_summary(conn: sqlite3.Connection, user_id: str) -> Dict[str, Any]:
     """
     Holt eine Zusammenfassung des SDT-Progress für UI-Anzeige.
     """
-    progress = get_or_create_sdt_progress(conn, user_id)
-    
-    LEVEL_THRESHOLDS = [0, 100, 250, 500, 1000, 2000]
-    
+    return _build_sdt_summary(get_or_create_sdt_progress(conn, user_id))
+
+
+def _build_sdt_summary(progress: Dict[str, Any]) -> Dict[str, Any]:
+    """Baut die SDT-Zusammenfassung aus einer motivation_sdt_progress-Zeile."""
     def calc_progress_pct(xp: int, level: int) -> float:
         if level >= 5:
             return 100.0
-        current_threshold = LEVEL_THRESHOLDS[level]
-        next_threshold = LEVEL_THRESHOLDS[level + 1]
+        current_threshold = SDT_LEVEL_THRESHOLDS[level]
+        next_threshold = SDT_LEVEL_THRESHOLDS[level + 1]
         return ((xp - current_threshold) / (next_threshold - current_threshold)) * 100
     
     return {
@@ -487,6 +411,7 @@ def get_sdt_summary(conn: sqlite3.Connection, user_id: str) -> Dict[str, Any]:
 # STREAK SYSTEM (Duolingo Style)
 # ============================================
 
+@routed("motivation.get_or_create_streak")
 def get_or_create_streak(conn: sqlite3.Connection, user_id: str) -> Dict[str, Any]:
     """Holt oder erstellt Streak-Daten."""
     c = conn.cursor()
@@ -522,9 +447,9 @@ def get_or_create_streak(conn: sqlite3.Connection, user_id: str) -> Dict[str, An
         }
 
 
-def update_streak(conn: sqlite3.Connection, user_id: str) -> Dict[str, Any]:
+def advance_streak(streak_data: Dict[str, Any], today: date) -> Tuple[Dict[str, Any], bool]:
     """
-    Aktualisiert den Streak nach einer Aktivität.
+    Schreibt Streak-Daten für eine Aktivität am Tag ``today`` fort.
     
     Logik:
     - Heute schon aktiv? → Keine Änderung
@@ -533,11 +458,8 @@ def update_streak(conn: sqlite3.Connection, user_id: str) -> Dict[str, Any]:
     - Sonst → Streak auf 1 zurücksetzen
     
     Returns:
-        Dict mit streak_info und streak_broken/streak_saved Flags
+        (Ergebnis wie ``update_streak``, ob gespeichert werden muss)
     """
-    streak_data = get_or_create_streak(conn, user_id)
-    today = date.today()
-    
     last_activity = streak_data["last_activity_date"]
     if last_activity:
         if isinstance(last_activity, str):
@@ -558,7 +480,7 @@ def update_streak(conn: sqlite3.Connection, user_id: str) -> Dict[str, Any]:
     if last_activity == today:
         # Heute schon aktiv - keine Änderung
         result["streak_continued"] = True
-        return {**result, "current_streak": current_streak, "longest_streak": longest_streak}
+        return {**result, "current_streak": current_streak, "longest_streak": longest_streak}, False
     
     yesterday = today - timedelta(days=1)
     day_before = today - timedelta(days=2)
@@ -587,6 +509,29 @@ def update_streak(conn: sqlite3.Connection, user_id: str) -> Dict[str, Any]:
         longest_streak = current_streak
         result["new_longest"] = True
     
+    return {
+        **result,
+        "current_streak": current_streak,
+        "longest_streak": longest_streak,
+        "freeze_available": freeze_available
+    }, True
+
+
+@routed("motivation.update_streak")
+def update_streak(conn: sqlite3.Connection, user_id: str) -> Dict[str, Any]:
+    """
+    Aktualisiert den Streak nach einer Aktivität (Regeln siehe ``advance_streak``).
+    
+    Returns:
+        Dict mit streak_info und streak_broken/streak_saved Flags
+    """
+    streak_data = get_or_create_streak(conn, user_id)
+    today = date.today()
+    
+    result, changed = advance_streak(streak_data, today)
+    if not changed:
+        return result
+    
     # In DB speichern
     c = conn.cursor()
     c.execute('''
@@ -594,18 +539,15 @@ def update_streak(conn: sqlite3.Connection, user_id: str) -> Dict[str, Any]:
         SET current_streak = ?, longest_streak = ?, last_activity_date = ?,
             freeze_available = ?, updated_at = ?
         WHERE user_id = ?
-    ''', (current_streak, longest_streak, today.isoformat(), 
-          freeze_available, datetime.now().isoformat(), user_id))
+    ''', (result["current_streak"], result["longest_streak"], today.isoformat(), 
+          result["freeze_available"], datetime.now().isoformat(), user_id))
     conn.commit()
+    _touch_user(user_id)
     
-    return {
-        **result,
-        "current_streak": current_streak,
-        "longest_streak": longest_streak,
-        "freeze_available": freeze_available
-    }
+    return result
 
 
+@routed("motivation.add_streak_freeze")
 def add_streak_freeze(conn: sqlite3.Connection, user_id: str, count: int = 1) -> int:
     """
     Fügt Streak-Freezes hinzu (z.B. als Belohnung).
@@ -618,6 +560,7 @@ def add_streak_freeze(conn: sqlite3.Connection, user_id: str, count: int = 1) ->
         WHERE user_id = ?
     ''', (count, user_id))
     conn.commit()
+    _touch_user(user_id)
     
     c.execute('SELECT freeze_available FROM motivation_streaks WHERE user_id = ?', (user_id,))
     return c.fetchone()[0]
@@ -627,6 +570,7 @@ def add_streak_freeze(conn: sqlite3.Connection, user_id: str, count: int = 1) ->
 # ACTIVITY LOG (für Heatmap)
 # ============================================
 
+@routed("activity.log_motivation")
 def log_activity(
     conn: sqlite3.Connection,
     user_id: str,
@@ -642,8 +586,10 @@ def log_activity(
         VALUES (?, ?, ?, ?, ?)
     ''', (user_id, date.today().isoformat(), challenge_id, grundbeduerfnis, xp_earned))
     conn.commit()
+    _touch_user(user_id)
 
 
+@routed("activity.get_motivation_heatmap")
 def get_activity_heatmap_data(
     conn: sqlite3.Connection,
     user_id: str,
@@ -659,13 +605,22 @@ def get_activity_heatmap_data(
     
     start_date = date.today() - timedelta(weeks=weeks * 7)
     
+    # Ältere Tage liegen nach der Retention nur noch verdichtet vor (utils/maintenance.py)
     c.execute('''
-        SELECT activity_date, grundbeduerfnis, COUNT(*) as count, SUM(xp_earned) as xp
-        FROM motivation_activity_log
-        WHERE user_id = ? AND activity_date >= ?
+        SELECT activity_date, grundbeduerfnis, SUM(count) as count, SUM(xp) as xp
+        FROM (
+            SELECT activity_date, grundbeduerfnis, COUNT(*) as count, SUM(xp_earned) as xp
+            FROM motivation_activity_log
+            WHERE user_id = ? AND activity_date >= ?
+            GROUP BY activity_date, grundbeduerfnis
+            UNION ALL
+            SELECT activity_date, grundbeduerfnis, activity_count, xp_earned
+            FROM motivation_activity_daily
+            WHERE user_id = ? AND activity_date >= ?
+        )
         GROUP BY activity_date, grundbeduerfnis
         ORDER BY activity_date
-    ''', (user_id, start_date.isoformat()))
+    ''', (user_id, start_date.isoformat()) * 2)
     
     return [{
         "date": row[0],
@@ -675,6 +630,7 @@ def get_activity_heatmap_data(
     } for row in c.fetchall()]
 
 
+@routed("activity.get_daily_summary")
 def get_daily_activity_summary(
     conn: sqlite3.Connection,
     user_id: str,
@@ -692,6 +648,11 @@ def get_daily_activity_summary(
         GROUP BY grundbeduerfnis
     ''', (user_id, target_date.isoformat()))
     
+    return _build_daily_summary(c.fetchall(), target_date)
+
+
+def _build_daily_summary(rows: List[tuple], target_date: date) -> Dict[str, Any]:
+    """Baut die Tages-Zusammenfassung aus (grundbeduerfnis, count, xp)-Zeilen."""
     result = {
         "date": target_date.isoformat(),
         "autonomie": {"count": 0, "xp": 0},
@@ -701,7 +662,7 @@ def get_daily_activity_summary(
         "total_xp": 0
     }
     
-    for row in c.fetchall():
+    for row in rows:
         gb = row[0]
         if gb in result:
             result[gb] = {"count": row[1], "xp": row[2]}
@@ -715,6 +676,7 @@ def get_daily_activity_summary(
 # BADGES
 # ============================================
 
+@routed("motivation.award_badge")
 def award_badge(
     conn: sqlite3.Connection,
     user_id: str,
@@ -732,12 +694,14 @@ def award_badge(
             VALUES (?, ?)
         ''', (user_id, badge_id))
         conn.commit()
+        _touch_user(user_id)
         return True
     except sqlite3.IntegrityError:
         # Badge bereits vorhanden
         return False
 
 
+@routed("motivation.get_user_badges")
 def get_user_badges(conn: sqlite3.Connection, user_id: str) -> List[Dict[str, Any]]:
     """Holt alle Badges eines Users."""
     c = conn.cursor()
@@ -751,6 +715,7 @@ def get_user_badges(conn: sqlite3.Connection, user_id: str) -> List[Dict[str, An
     return [{"badge_id": row[0], "earned_at": row[1]} for row in c.fetchall()]
 
 
+@routed("motivation.has_badge")
 def has_badge(conn: sqlite3.Connection, user_id: str, badge_id: str) -> bool:
     """Prüft ob User ein bestimmtes Badge hat."""
     c = conn.cursor()
@@ -764,6 +729,7 @@ def has_badge(conn: sqlite3.Connection, user_id: str, badge_id: str) -> bool:
 # ZERTIFIKATE
 # ============================================
 
+@routed("motivation.issue_certificate")
 def issue_certificate(
     conn: sqlite3.Connection,
     user_id: str,
@@ -783,9 +749,11 @@ def issue_certificate(
         VALUES (?, ?, ?, ?, ?)
     ''', (user_id, certificate_type, age_group, json.dumps(challenges_completed), total_xp))
     conn.commit()
+    _touch_user(user_id)
     return c.lastrowid
 
 
+@routed("motivation.get_user_certificates")
 def get_user_certificates(
     conn: sqlite3.Connection,
     user_id: str
@@ -799,14 +767,18 @@ def get_user_certificates(
         ORDER BY issued_at DESC
     ''', (user_id,))
     
-    return [{
+    return [_certificate_from_row(row) for row in c.fetchall()]
+
+
+def _certificate_from_row(row: tuple) -> Dict[str, Any]:
+    return {
         "id": row[0],
         "type": row[1],
         "age_group": row[2],
         "challenges": json.loads(row[3]) if row[3] else [],
         "total_xp": row[4],
         "issued_at": row[5]
-    } for row in c.fetchall()]
+    }
 
 
 # ============================================
@@ -827,6 +799,11 @@ def get_user_motivation_stats(
     certificates = get_user_certificates(conn, user_id)
     today_activity = get_daily_activity_summary(conn, user_id)
     
+    return _build_stats(sdt, streak, badges, certificates, today_activity)
+
+
+def _build_stats(sdt: Dict, streak: Dict, badges: List[Dict],
+                 certificates: List[Dict], today_activity: Dict) -> Dict[str, Any]:
     return {
         "sdt_progress": sdt,
         "streak": {
@@ -844,10 +821,177 @@ def get_user_motivation_stats(
     }
 
 
+# ============================================
+# SNAPSHOT (ein Ladevorgang pro Rerun)
+# ============================================
+
+@dataclass
+class MotivationSnapshot:
+    """
+    Alle Daten, die das Motivation-Widget für einen Rerun braucht.
+
+    ``data_version`` und ``loaded_for`` (Datum) dienen als Cache-Schlüssel:
+    Der Snapshot gilt, bis der User etwas schreibt oder der Tag wechselt.
+    """
+    user_id: str
+    data_version: int
+    loaded_for: str
+    sdt_progress: Dict[str, Any]
+    streak: Dict[str, Any]
+    badges: List[Dict[str, Any]] = field(default_factory=list)
+    certificates: List[Dict[str, Any]] = field(default_factory=list)
+    today: Dict[str, Any] = field(default_factory=dict)
+    completed: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Gleiche Struktur wie ``get_user_motivation_stats``."""
+        return _build_stats(self.sdt_progress, self.streak, self.badges,
+                            self.certificates, self.today)
+
+    def completed_for_age(self, age_group: str) -> List[Dict[str, Any]]:
+        """Abgeschlossene Challenges einer Altersstufe (wie ``get_completed_challenges``)."""
+        return [c for c in self.completed if c["age_group"] == age_group]
+
+    def is_current(self, user_id: str) -> bool:
+        return (self.user_id == user_id
+                and self.data_version == get_data_version(user_id)
+                and self.loaded_for == date.today().isoformat())
+
+
+@routed("motivation.load_snapshot")
+def load_motivation_snapshot(conn: sqlite3.Connection, user_id: str) -> MotivationSnapshot:
+    """
+    Lädt SDT-Progress, Streak, Badges, Zertifikate, Tagesaktivität und alle
+    abgeschlossenen Challenges in einer Lese-Transaktion.
+
+    Ersetzt ``get_user_motivation_stats`` + ``get_completed_challenges``
+    (8+ Einzelabfragen) durch fünf mengenbasierte Abfragen. Fehlende
+    SDT-/Streak-Zeilen werden wie bisher angelegt.
+    """
+    version = get_data_version(user_id)
+    today = date.today()
+    c = conn.cursor()
+
+    c.execute('SAVEPOINT motivation_snapshot')
+    try:
+        # SDT + Streak in einer Zeile
+        c.execute('''
+            SELECT s.autonomie_level, s.autonomie_xp, s.kompetenz_level, s.kompetenz_xp,
+                   s.verbundenheit_level, s.verbundenheit_xp, s.total_challenges, s.total_xp,
+                   k.current_streak, k.longest_streak, k.last_activity_date,
+                   k.freeze_available, k.freeze_used_date,
+                   s.user_id IS NOT NULL, k.user_id IS NOT NULL
+            FROM (SELECT ? AS user_id) u
+            LEFT JOIN motivation_sdt_progress s ON s.user_id = u.user_id
+            LEFT JOIN motivation_streaks k ON k.user_id = u.user_id
+        ''', (user_id,))
+        row = c.fetchone()
+        has_sdt, has_streak = row[13], row[14]
+
+        c.execute('''
+            SELECT badge_id, earned_at FROM motivation_badges
+            WHERE user_id = ? ORDER BY earned_at
+        ''', (user_id,))
+        badges = [{"badge_id": r[0], "earned_at": r[1]} for r in c.fetchall()]
+
+        c.execute('''
+            SELECT id, certificate_type, age_group, challenges_completed, total_xp, issued_at
+            FROM motivation_certificates
+            WHERE user_id = ? ORDER BY issued_at DESC
+        ''', (user_id,))
+        certificates = [_certificate_from_row(r) for r in c.fetchall()]
+
+        c.execute('''
+            SELECT grundbeduerfnis, COUNT(*) as count, SUM(xp_earned) as xp
+            FROM motivation_activity_log
+            WHERE user_id = ? AND activity_date = ?
+            GROUP BY grundbeduerfnis
+        ''', (user_id, today.isoformat()))
+        today_activity = _build_daily_summary(c.fetchall(), today)
+
+        c.execute('''
+            SELECT DISTINCT challenge_id, age_group, grundbeduerfnis,
+                   xp_earned, completed_at, rating
+            FROM motivation_challenges
+            WHERE user_id = ? AND completed = 1
+            ORDER BY completed_at DESC
+        ''', (user_id,))
+        completed = [_completed_from_row(r) for r in c.fetchall()]
+
+        if not has_sdt:
+            c.execute('INSERT OR IGNORE INTO motivation_sdt_progress (user_id) VALUES (?)', (user_id,))
+        if not has_streak:
+            c.execute('INSERT OR IGNORE INTO motivation_streaks (user_id) VALUES (?)', (user_id,))
+    except Exception:
+        c.execute('ROLLBACK TO motivation_snapshot')
+        c.execute('RELEASE motivation_snapshot')
+        raise
+    c.execute('RELEASE motivation_snapshot')
+    if not (has_sdt and has_streak):
+        conn.commit()
+
+    progress = {
+        "autonomie_level": row[0] or 0,
+        "autonomie_xp": row[1] or 0,
+        "kompetenz_level": row[2] or 0,
+        "kompetenz_xp": row[3] or 0,
+        "verbundenheit_level": row[4] or 0,
+        "verbundenheit_xp": row[5] or 0,
+        "total_challenges": row[6] or 0,
+        "total_xp": row[7] or 0,
+    }
+    streak = {
+        "current_streak": row[8] or 0,
+        "longest_streak": row[9] or 0,
+        "last_activity_date": row[10],
+        "freeze_available": row[11] if has_streak else 1,
+        "freeze_used_date": row[12],
+    }
+
+    return MotivationSnapshot(
+        user_id=user_id,
+        data_version=version,
+        loaded_for=today.isoformat(),
+        sdt_progress=_build_sdt_summary(progress),
+        streak=streak,
+        badges=badges,
+        certificates=certificates,
+        today=today_activity,
+        completed=completed,
+    )
+
+
+def get_motivation_snapshot(
+    conn: sqlite3.Connection,
+    user_id: str,
+    cache: Optional[Dict[str, Any]] = None,
+    cache_key: str = "motivation_snapshot"
+) -> MotivationSnapshot:
+    """
+    Gibt den gecachten Snapshot zurück oder lädt ihn neu.
+
+    Args:
+        conn: SQLite Connection
+        user_id: ID des Users
+        cache: Dict-artiger Speicher (z.B. ``st.session_state``); None = kein Cache
+        cache_key: Schlüssel im Cache
+    """
+    snapshot = cache.get(cache_key) if cache is not None else None
+    if snapshot is not None and snapshot.is_current(user_id):
+        return snapshot
+
+    snapshot = load_motivation_snapshot(conn, user_id)
+    if cache is not None:
+        cache[cache_key] = snapshot
+    return snapshot
+
+
 # ============================================
 # UTILITY FUNCTIONS
 # ============================================
 
+@routed("motivation.reset_user_data")
 def reset_user_motivation_data(conn: sqlite3.Connection, user_id: str) -> None:
     """
     Setzt alle Motivation-Daten eines Users zurück.
@@ -860,6 +1004,7 @@ def reset_user_motivation_data(conn: sqlite3.Connection, user_id: str) -> None:
         "motivation_sdt_progress",
         "motivation_streaks",
         "motivation_activity_log",
+        "motivation_activity_daily",
         "motivation_badges",
         "motivation_certificates"
     ]
@@ -868,6 +1013,7 @@ def reset_user_motivation_data(conn: sqlite3.Connection, user_id: str) -> None:
         c.execute(f'DELETE FROM {table} WHERE user_id = ?', (user_id,))
     
     conn.commit()
+    _touch_user(user_id)
 
 
 # ============================================
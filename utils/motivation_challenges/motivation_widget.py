@@ -28,11 +28,11 @@ from typing import Dict, List, Optional, Any, Callable
 import json
 
 # Lokale Imports
+from ..fragments import rerun_widget
 from .motivation_db import (
     init_motivation_tables,
     save_challenge_progress,
     get_challenge_progress,
-    get_completed_challenges,
     count_completed_challenges,
     get_or_create_sdt_progress,
     update_sdt_progress,
@@ -45,7 +45,7 @@ from .motivation_db import (
     get_user_badges,
     has_badge,
     issue_certificate,
-    get_user_motivation_stats,
+    get_motivation_snapshot,
 )
 
 from .motivation_content import (
@@ -80,6 +80,7 @@ STATE_KEYS = {
     "current_input": "mot_current_input",
     "selected_category": "mot_selected_category",
     "challenge_started_at": "mot_started_at",
+    "snapshot": "mot_snapshot",
 }
 
 
@@ -486,11 +487,12 @@ def render_motivation_challenge(
     display_name = user_data.get("display_name", "Lernender")
     age_group = user_data.get("age_group", "unterstufe")
     
-    # Daten laden
-    stats = get_user_motivation_stats(conn, user_id)
+    # Daten laden (Snapshot, neu geladen erst nach einem Schreibzugriff)
+    snapshot = get_motivation_snapshot(conn, user_id, st.session_state, STATE_KEYS["snapshot"])
+    stats = snapshot.stats
     sdt_summary = stats["sdt_progress"]
     streak_data = stats["streak"]
-    completed_db = get_completed_challenges(conn, user_id, age_group)
+    completed_db = snapshot.completed_for_age(age_group)
     completed_ids = [c["challenge_id"] for c in completed_db]
     
     # Header mit Progress
@@ -514,14 +516,14 @@ def render_motivation_challenge(
             st.success("🎉 Du hast alle Challenges dieser Stufe abgeschlossen!")
             if st.button("🏆 Zertifikat anzeigen", type="primary"):
                 st.session_state[STATE_KEYS["phase"]] = "certificate"
-                st.rerun()
+                rerun_widget()
             st.markdown("---")
         
         def on_challenge_select(challenge_id: str):
             st.session_state[STATE_KEYS["current_challenge"]] = challenge_id
             st.session_state[STATE_KEYS["phase"]] = "intro"
             st.session_state[STATE_KEYS["challenge_started_at"]] = datetime.now().isoformat()
-            st.rerun()
+            rerun_widget()
         
         render_challenge_overview(age_group, completed_ids, on_challenge_select)
         return
@@ -532,7 +534,7 @@ def render_motivation_challenge(
         st.error("Challenge nicht gefunden!")
         if st.button("← Zurück zur Übersicht"):
             st.session_state[STATE_KEYS["phase"]] = "overview"
-            st.rerun()
+            rerun_widget()
         return
     
     # ─────────────────────────────────────────
@@ -546,11 +548,11 @@ def render_motivation_challenge(
         with col1:
             if st.button("← Zurück", use_container_width=True):
                 st.session_state[STATE_KEYS["phase"]] = "overview"
-                st.rerun()
+                rerun_widget()
         with col2:
             if st.button("✅ Verstanden! Los geht's →", type="primary", use_container_width=True):
                 st.session_state[STATE_KEYS["phase"]] = "action"
-                st.rerun()
+                rerun_widget()
         return
     
     # ─────────────────────────────────────────
@@ -567,13 +569,13 @@ def render_motivation_challenge(
         with col1:
             if st.button("← Zurück", use_container_width=True):
                 st.session_state[STATE_KEYS["phase"]] = "intro"
-                st.rerun()
+                rerun_widget()
         with col2:
             if user_input and len(user_input.strip()) >= challenge.get("action", {}).get("min_length", 10):
                 if st.button("✅ Weiter zur Reflexion →", type="primary", use_container_width=True):
                     st.session_state[STATE_KEYS["current_input"]] = user_input
                     st.session_state[STATE_KEYS["phase"]] = "reflect"
-                    st.rerun()
+                    rerun_widget()
             else:
                 st.button("✅ Weiter zur Reflexion →", disabled=True, use_container_width=True)
         return
@@ -596,7 +598,7 @@ def render_motivation_challenge(
         with col1:
             if st.button("← Zurück", use_container_width=True):
                 st.session_state[STATE_KEYS["phase"]] = "action"
-                st.rerun()
+                rerun_widget()
         with col2:
             if st.button("🎉 Challenge abschließen!", type="primary", use_container_width=True):
                 # XP berechnen
@@ -641,7 +643,7 @@ def render_motivation_challenge(
                 st.session_state[STATE_KEYS["phase"]] = "complete"
                 
                 st.balloons()
-                st.rerun()
+                rerun_widget()
         return
     
     # ─────────────────────────────────────────
@@ -671,8 +673,8 @@ def render_motivation_challenge(
         
         st.markdown("---")
         
-        # Prüfen ob alle fertig
-        updated_completed = get_completed_challenges(conn, user_id, age_group)
+        # Prüfen ob alle fertig (Snapshot wurde nach dem Abschluss neu geladen)
+        updated_completed = completed_db
         all_ids = get_all_challenge_ids(age_group)
         
         if len(updated_completed) >= len(all_ids):
@@ -685,7 +687,7 @@ def render_motivation_challenge(
                     [c["challenge_id"] for c in updated_completed], total_xp
                 )
                 st.session_state[STATE_KEYS["phase"]] = "certificate"
-                st.rerun()
+                rerun_widget()
         else:
             remaining = len(all_ids) - len(updated_completed)
             st.info(f"Noch {remaining} Challenge(s) bis zum Zertifikat!")
@@ -693,12 +695,12 @@ def render_motivation_challenge(
             if st.button("➡️ Nächste Challenge", type="primary", use_container_width=True):
                 st.session_state[STATE_KEYS["phase"]] = "overview"
                 st.session_state[STATE_KEYS["current_challenge"]] = None
-                st.rerun()
+                rerun_widget()
         
         if st.button("📋 Zurück zur Übersicht", use_container_width=True):
             st.session_state[STATE_KEYS["phase"]] = "overview"
             st.session_state[STATE_KEYS["current_challenge"]] = None
-            st.rerun()
+            rerun_widget()
         
         return
     
@@ -706,7 +708,6 @@ def render_motivation_challenge(
     # PHASE: CERTIFICATE
     # ─────────────────────────────────────────
     if phase == "certificate":
-        completed_db = get_completed_challenges(conn, user_id, age_group)
         total_xp = sum(c.get("xp_earned", 0) for c in completed_db)
         
         render_certificate_preview(
@@ -722,7 +723,7 @@ def render_motivation_challenge(
         with col2:
             if st.button("📋 Zurück zur Übersicht", use_container_width=True):
                 st.session_state[STATE_KEYS["phase"]] = "overview"
-                st.rerun()
+                rerun_widget()
         
         return
 
@@ -0,0 +1,137 @@
+"""
+🗄️ PISA-Datenbank (read-only)
+=============================
+
+Die PISA-Datenbank ist statisch. Gelesen wird deshalb read-only im
+``immutable``-Modus (keine Datei-Locks, kein Journal-Check) mit großem
+``mmap_size``: Seiten kommen direkt aus dem Page-Cache des Betriebssystems,
+den sich alle Sessions und Worker-Prozesse teilen.
+
+- ``shared_connection()``: leiht eine Verbindung aus einem kleinen
+  Prozess-Pool (``POOL_SIZE``). Die Verbindungen hängen an keinem Thread -
+  Streamlit startet pro Rerun einen neuen Script-Thread - und werden über
+  alle Reruns und Sessions wiederverwendet:
+
+      with shared_connection() as conn:
+          df = pd.read_sql_query(query, conn)
+
+- ``open_readonly_connection()``: eigene Verbindung mit denselben
+  Einstellungen, die der Aufrufer schließt.
+- ``prewarm_pisa_cache()``: liest die Datei einmal im Hintergrund in den
+  Page-Cache (über ``utils/app_startup.py``, ``PULSE_PISA_PREWARM=0``
+  deaktiviert).
+
+Ohne pandas/Streamlit, damit der App-Start das Vorwärmen ohne zusätzliche
+Import-Zeit anstoßen kann.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+# Immer die vollständige Datenbank verwenden (6,116 Schüler)
+PISA_DB_PATH = Path("pisa_2022_germany.db")
+
+# Obergrenze für das Memory-Mapping (die Datenbank passt vollständig hinein)
+MMAP_SIZE = 1024 * 1024 * 1024
+
+# Gleichzeitig ausgeliehene Verbindungen; weitere Aufrufer warten kurz
+POOL_SIZE = 4
+
+PREWARM_FLAG = "PULSE_PISA_PREWARM"
+PREWARM_CHUNK = 1024 * 1024
+
+_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+_pool_lock = threading.Lock()
+_pool_created = 0
+_prewarm_started = threading.Lock()
+
+
+# ============================================
+# VERBINDUNGEN
+# ============================================
+
+def open_readonly_connection(db_path: Path = PISA_DB_PATH) -> sqlite3.Connection:
+    """
+    Öffnet die PISA-Datenbank read-only (``mode=ro&immutable=1``, mmap).
+
+    Anders als ein normales ``sqlite3.connect`` legt das bei fehlender Datei
+    keine leere Datenbank an, sondern wirft ``sqlite3.OperationalError``.
+    """
+    conn = sqlite3.connect(
+        f"file:{db_path}?mode=ro&immutable=1",
+        uri=True,
+        check_same_thread=False
+    )
+    conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+    return conn
+
+
+def _acquire() -> sqlite3.Connection:
+    global _pool_created
+    try:
+        return _pool.get_nowait()
+    except queue.Empty:
+        pass
+    with _pool_lock:
+        create = _pool_created < POOL_SIZE
+        if create:
+            _pool_created += 1
+    if not create:
+        return _pool.get()
+    try:
+        return open_readonly_connection()
+    except Exception:
+        with _pool_lock:
+            _pool_created -= 1
+        raise
+
+
+@contextmanager
+def shared_connection() -> Iterator[sqlite3.Connection]:
+    """
+    Leiht eine geteilte read-only Verbindung aus dem Prozess-Pool.
+
+    Die Verbindung gehört nach dem ``with``-Block wieder dem Pool und darf
+    weder geschlossen noch weitergereicht werden. Eine Verbindung wird nie
+    von zwei Threads gleichzeitig benutzt.
+    """
+    conn = _acquire()
+    try:
+        yield conn
+    finally:
+        _pool.put(conn)
+
+
+def prewarm_pisa_cache(db_path: Path = PISA_DB_PATH) -> bool:
+    """
+    Liest die PISA-Datenbank einmal pro Prozess im Hintergrund in den
+    Page-Cache, damit die ersten Abfragen nicht auf die Platte warten.
+
+    Returns:
+        True, wenn das Vorwärmen gestartet wurde
+    """
+    if os.environ.get(PREWARM_FLAG, "1").lower() in ("0", "false", "no"):
+        return False
+    if not Path(db_path).exists() or not _prewarm_started.acquire(blocking=False):
+        return False
+
+    def job():
+        try:
+            with open(db_path, "rb") as f:
+                remaining = MMAP_SIZE
+                while remaining > 0 and f.read(PREWARM_CHUNK):
+                    remaining -= PREWARM_CHUNK
+        except OSError:
+            pass
+
+    threading.Thread(target=job, name="pulse-pisa-prewarm", daemon=True).start()
+    return True
@@ -0,0 +1,114 @@
+"""
+🧪 Preview Store
+================
+
+Speicher für den Preview-Modus (Lehrkräfte führen die App vor).
+
+Jeder Preview-Start bekommt eine eigene User-ID mit Präfix ``preview_`` und
+eine eigene In-Memory-SQLite-Datenbank mit demselben Schema wie
+``hattie_gamification.db`` (über ``utils/migrations.py``). Alle DB-Schichten
+öffnen ihre Verbindungen über ``connect_db(db_path, user_id)`` - für
+Preview-User landet damit jeder Lese- und Schreibzugriff im Speicher, die
+Produktions-Tabellen werden nie berührt.
+
+Zurücksetzen = Datenbank verwerfen (sofort, ohne DELETEs).
+
+Die Datenbank lebt, solange ihre Anker-Verbindung offen ist. Verwaiste
+Preview-Datenbanken (Tab geschlossen ohne "Beenden") werden nach
+``PREVIEW_IDLE_TIMEOUT`` Sekunden ohne Zugriff freigegeben.
+"""
+
+import secrets
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .migrations import apply_migrations
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+PREVIEW_USER_PREFIX = "preview_"
+PREVIEW_IDLE_TIMEOUT = 2 * 60 * 60
+
+# user_id -> [Anker-Verbindung, letzter Zugriff]
+_anchors: Dict[str, List] = {}
+_lock = threading.Lock()
+
+
+def new_preview_user_id() -> str:
+    """Erzeugt eine neue, zufällige Preview-User-ID."""
+    return f"{PREVIEW_USER_PREFIX}{secrets.token_hex(8)}"
+
+
+def is_preview_user(user_id: Optional[str]) -> bool:
+    """Prüft, ob eine User-ID zu einer Preview-Sitzung gehört."""
+    return bool(user_id) and str(user_id).startswith(PREVIEW_USER_PREFIX)
+
+
+def _memory_uri(user_id: str) -> str:
+    return f"file:pulse_{user_id}?mode=memory&cache=shared"
+
+
+# ============================================
+# VERWALTUNG
+# ============================================
+
+def _expire_idle(now: float) -> None:
+    """Gibt Preview-Datenbanken ohne Zugriff seit PREVIEW_IDLE_TIMEOUT frei (Lock gehalten)."""
+    for user_id, (anchor, last_used) in list(_anchors.items()):
+        if now - last_used > PREVIEW_IDLE_TIMEOUT:
+            anchor.close()
+            del _anchors[user_id]
+
+
+def _ensure_preview_db(user_id: str) -> None:
+    """Legt die In-Memory-Datenbank eines Preview-Users bei Bedarf an."""
+    now = time.monotonic()
+    with _lock:
+        entry = _anchors.get(user_id)
+        if entry is not None:
+            entry[1] = now
+            return
+
+        _expire_idle(now)
+        anchor = sqlite3.connect(_memory_uri(user_id), uri=True, check_same_thread=False)
+        apply_migrations(anchor)
+        _anchors[user_id] = [anchor, now]
+
+
+def discard_preview_db(user_id: str) -> None:
+    """Verwirft die Preview-Datenbank eines Users (alle Daten sind danach weg)."""
+    with _lock:
+        entry = _anchors.pop(user_id, None)
+    if entry is not None:
+        entry[0].close()
+
+
+def get_active_preview_count() -> int:
+    """Anzahl aktuell gehaltener Preview-Datenbanken (für Admin/Debugging)."""
+    with _lock:
+        return len(_anchors)
+
+
+# ============================================
+# VERBINDUNGEN
+# ============================================
+
+def connect_db(db_path: Union[str, Path], user_id: Optional[str] = None, **kwargs) -> sqlite3.Connection:
+    """
+    Öffnet eine Verbindung zur Gamification-Datenbank eines Users.
+
+    Args:
+        db_path: Pfad zur Produktions-Datenbank
+        user_id: User, für den gelesen/geschrieben wird. Preview-User werden
+                 auf ihre In-Memory-Datenbank umgeleitet.
+        **kwargs: Weitere Argumente für ``sqlite3.connect``
+    """
+    if is_preview_user(user_id):
+        _ensure_preview_db(user_id)
+        return sqlite3.connect(_memory_uri(user_id), uri=True, **kwargs)
+    return sqlite3.connect(db_path, **kwargs)
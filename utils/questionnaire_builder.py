@@ -6,14 +6,20 @@ Baut Fragebögen aus PISA-Skalen zusammen:
 2. Lädt Fragetexte (Deutsch)
 3. Lädt Value Labels (Antwortoptionen)
 4. Bereitet Daten für HTML-Generator vor
+
+Value Labels werden als internierte Antwortskalen geliefert
+(``utils.label_sets``): ``value_labels`` bildet variable_name auf eine
+Label-Set-ID ab, alle Items mit gleicher Antwortskala teilen sich eine ID.
 """
 
-import pandas as pd
 import json
 from pathlib import Path
+from contextlib import ExitStack
 from typing import List, Dict, Tuple, Optional
 from utils.json_item_loader import get_scale_items, get_fragestamm
-from utils.db_loader import get_db_connection, load_value_labels, load_question_text
+from utils.db_loader import load_question_text
+from utils.pisa_db import shared_connection
+from utils.label_sets import get_label_set, intern_label_set, load_label_sets
 
 # Paths to manual scale definitions
 MANUAL_SCALES_PATHS = [
@@ -22,7 +28,7 @@ MANUAL_SCALES_PATHS = [
 ]
 
 
-def load_manual_scale(scale_name: str) -> Tuple[Optional[List[Dict]], Optional[Dict[str, pd.DataFrame]], Optional[str]]:
+def load_manual_scale(scale_name: str) -> Tuple[Optional[List[Dict]], Optional[Dict[str, int]], Optional[str]]:
     """
     Lädt eine manuell definierte Skala aus JSON-Definitionsdateien
 
@@ -36,7 +42,7 @@ def load_manual_scale(scale_name: str) -> Tuple[Optional[List[Dict]], Optional[D
     Returns:
         Tuple mit:
         - items: List[Dict] oder None
-        - value_labels: Dict[str, pd.DataFrame] oder None
+        - value_labels: Dict[str, int] (Label-Set-ID pro Variable) oder None
         - fragestamm: str oder None
     """
     # Try each manual scales file
@@ -64,29 +70,13 @@ def load_manual_scale(scale_name: str) -> Tuple[Optional[List[Dict]], Optional[D
                 }
                 items.append(item)
 
-            # Build value labels DataFrame for all items
+            # One label set for the whole scale (German as fallback for English)
             response_scale = scale_data.get('response_scale', {})
-            value_labels_dict = {}
-
-            for item in items:
-                # Create DataFrame with value labels
-                values = []
-                labels_de = []
-                labels_en = []
-
-                for value, label_de in response_scale.items():
-                    values.append(value)
-                    labels_de.append(label_de)
-                    labels_en.append(label_de)  # Use German as fallback for English
-
-                labels_df = pd.DataFrame({
-                    'value': values,
-                    'label': labels_de,  # English fallback
-                    'label_de': labels_de,
-                    'is_missing_code': [0] * len(values)
-                })
-
-                value_labels_dict[item['variable_name']] = labels_df
+            label_set_id = intern_label_set(
+                (value, label_de, label_de, False)
+                for value, label_de in response_scale.items()
+            )
+            value_labels_dict = {item['variable_name']: label_set_id for item in items}
 
             # Get fragestamm if available
             fragestamm = scale_data.get('fragestamm', None)
@@ -101,7 +91,7 @@ def load_manual_scale(scale_name: str) -> Tuple[Optional[List[Dict]], Optional[D
     return None, None, None
 
 
-def load_items_for_scales(scale_names: List[str]) -> Tuple[List[Dict], Dict[str, pd.DataFrame], Dict[str, str], List[str]]:
+def load_items_for_scales(scale_names: List[str]) -> Tuple[List[Dict], Dict[str, int], Dict[str, str]]:
     """
     Lädt alle Items, Fragetexte und Value Labels für eine Liste von Skalen
 
@@ -111,7 +101,7 @@ def load_items_for_scales(scale_names: List[str]) -> Tuple[List[Dict], Dict[str,
     Returns:
         Tuple mit:
         - items: List[Dict] - Liste aller Items mit question_text_de
-        - value_labels: Dict[str, pd.DataFrame] - Value Labels pro Variable
+        - value_labels: Dict[str, int] - Label-Set-ID pro Variable (siehe utils.label_sets)
         - fragestamm: Dict[str, str] - Fragestämme pro Skala (falls vorhanden)
         - skipped_scales: List[str] - Skalen ohne Items (übersprungen)
 
@@ -127,70 +117,74 @@ def load_items_for_scales(scale_names: List[str]) -> Tuple[List[Dict], Dict[str,
         for scale in scale_names
     ]
 
-    conn = get_db_connection()
+    # Geteilte read-only Verbindung (erst ausleihen, wenn eine Skala DB-Daten braucht)
+    conn = None
 
     all_items = []
     value_labels_dict = {}
     fragestamm_dict = {}
     skipped_scales = []
 
-    for scale_name in scale_names:
-        # 0. Try to load from manual definitions first
-        manual_items, manual_labels, manual_fragestamm = load_manual_scale(scale_name)
-
-        if manual_items is not None:
-            # Manual scale found - use it directly
-            all_items.extend(manual_items)
-            if manual_labels:
-                value_labels_dict.update(manual_labels)
-            if manual_fragestamm:
-                fragestamm_dict[scale_name] = manual_fragestamm
-            continue
+    with ExitStack() as db:
+        for scale_name in scale_names:
+            # 0. Try to load from manual definitions first
+            manual_items, manual_labels, manual_fragestamm = load_manual_scale(scale_name)
+
+            if manual_items is not None:
+                # Manual scale found - use it directly
+                all_items.extend(manual_items)
+                if manual_labels:
+                    value_labels_dict.update(manual_labels)
+                if manual_fragestamm:
+                    fragestamm_dict[scale_name] = manual_fragestamm
+                continue
 
-        # 1. Lade Items aus JSON (fallback if not manual)
-        items = get_scale_items(scale_name)
+            # 1. Lade Items aus JSON (fallback if not manual)
+            items = get_scale_items(scale_name)
 
-        if not items:
-            print(f"⚠️  Keine Items für Skala {scale_name} in JSON gefunden (übersprungen)")
-            skipped_scales.append(scale_name)
-            continue
+            if not items:
+                print(f"⚠️  Keine Items für Skala {scale_name} in JSON gefunden (übersprungen)")
+                skipped_scales.append(scale_name)
+                continue
 
-        # 2. Lade Fragestamm (falls vorhanden)
-        fragestamm = get_fragestamm(scale_name)
-        if fragestamm:
-            fragestamm_dict[scale_name] = fragestamm
+            # 2. Lade Fragestamm (falls vorhanden)
+            fragestamm = get_fragestamm(scale_name)
+            if fragestamm:
+                fragestamm_dict[scale_name] = fragestamm
 
-        # 3. Für jedes Item: Lade detaillierte Infos aus DB
-        for item in items:
-            variable_name = item['variable_name']
+            if conn is None:
+                conn = db.enter_context(shared_connection())
 
-            # Lade Fragetext aus DB (falls vorhanden, überschreibt JSON)
-            question_data = load_question_text(conn, variable_name)
+            # 3. Value Labels aller Items mit einer Abfrage (internierte Antwortskalen)
+            scale_label_sets = load_label_sets(conn, [item['variable_name'] for item in items])
 
-            if question_data is not None and not question_data.empty:
-                # Nutze DB-Text nur wenn nicht None/leer (präziser als JSON)
-                db_text_de = question_data.get('question_text_de')
-                db_text_en = question_data.get('question_text_en')
+            # 4. Für jedes Item: Lade detaillierte Infos aus DB
+            for item in items:
+                variable_name = item['variable_name']
 
-                if db_text_de is not None and db_text_de != '':
-                    item['question_text_de'] = db_text_de
-                if db_text_en is not None and db_text_en != '':
-                    item['question_text_en'] = db_text_en
+                # Lade Fragetext aus DB (falls vorhanden, überschreibt JSON)
+                question_data = load_question_text(conn, variable_name)
 
-            # Lade Value Labels
-            value_labels = load_value_labels(conn, variable_name)
+                if question_data is not None and not question_data.empty:
+                    # Nutze DB-Text nur wenn nicht None/leer (präziser als JSON)
+                    db_text_de = question_data.get('question_text_de')
+                    db_text_en = question_data.get('question_text_en')
 
-            if not value_labels.empty:
-                value_labels_dict[variable_name] = value_labels
-            else:
-                print(f"⚠️  Keine Value Labels für {variable_name}")
+                    if db_text_de is not None and db_text_de != '':
+                        item['question_text_de'] = db_text_de
+                    if db_text_en is not None and db_text_en != '':
+                        item['question_text_en'] = db_text_en
 
-            # Füge Skalen-Info hinzu
-            item['scale'] = scale_name
+                # Value Labels (Label-Set-ID)
+                if variable_name in scale_label_sets:
+                    value_labels_dict[variable_name] = scale_label_sets[variable_name]
+                else:
+                    print(f"⚠️  Keine Value Labels für {variable_name}")
 
-            all_items.append(item)
+                # Füge Skalen-Info hinzu
+                item['scale'] = scale_name
 
-    conn.close()
+                all_items.append(item)
 
     return all_items, value_labels_dict, fragestamm_dict
 
@@ -254,13 +248,13 @@ def get_items_summary(items: List[Dict]) -> Dict:
     }
 
 
-def validate_questionnaire_data(items: List[Dict], value_labels: Dict[str, pd.DataFrame]) -> Dict:
+def validate_questionnaire_data(items: List[Dict], value_labels: Dict[str, int]) -> Dict:
     """
     Validiert, ob alle notwendigen Daten für den Fragebogen vorhanden sind
 
     Args:
         items: Liste von Items
-        value_labels: Value Labels Dictionary
+        value_labels: Label-Set-ID pro Variable
 
     Returns:
         Dict mit Validierungs-Ergebnissen
@@ -300,11 +294,10 @@ def validate_questionnaire_data(items: List[Dict], value_labels: Dict[str, pd.Da
             issues.append(f"Item {variable_name}: Keine Value Labels")
         else:
             # 4. Mindestens 2 Antwortoptionen?
-            labels_df = value_labels[variable_name]
-            non_missing = labels_df[labels_df['is_missing_code'] == 0]
+            non_missing = get_label_set(value_labels[variable_name]).non_missing_count
 
-            if len(non_missing) < 2:
-                warnings.append(f"Item {variable_name}: Nur {len(non_missing)} Antwortoptionen")
+            if non_missing < 2:
+                warnings.append(f"Item {variable_name}: Nur {non_missing} Antwortoptionen")
 
     is_valid = len(issues) == 0
 
@@ -4,7 +4,7 @@ Ressourcen Module Package.
 Enthält ausgelagerten Code für die Ressourcen-Seite.
 """
 
-from utils.ressourcen.content_database import CONTENT_DATABASE
+from utils.ressourcen.content_database import CONTENT_DATABASE, get_factor_content
 from utils.ressourcen.helpers import (
     embed_youtube,
     render_video_section,
@@ -15,6 +15,7 @@ from utils.ressourcen.matheff_content import render_matheff_altersstufen
 
 __all__ = [
     'CONTENT_DATABASE',
+    'get_factor_content',
     'embed_youtube',
     'render_video_section',
     'render_tipps_section',
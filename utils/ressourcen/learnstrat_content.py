@@ -6,7 +6,6 @@ Ausgelagert aus pages/1_📚_Ressourcen.py für bessere Organisation.
 """
 
 import streamlit as st
-import sqlite3
 
 # ============================================
 # TRY TO IMPORT GAMIFICATION WIDGET (optional)
@@ -33,6 +32,48 @@ try:
 except ImportError:
     HAS_LEARNSTRAT = False
 
+from utils.fragments import widget_fragment
+
+
+# ============================================
+# CHALLENGE-FRAGMENT
+# ============================================
+
+def _award_xp(user_id, xp, reason):
+    """Vergibt XP an den User."""
+    from utils.gamification_db import update_user_stats, get_or_create_user
+    user_data = get_or_create_user(user_id)
+    current_streak = user_data.get("current_streak", 0)
+    update_user_stats(user_id, xp, current_streak)
+
+
+@widget_fragment("learnstrat_challenge")
+def _render_challenge_fragment(challenge: str):
+    """
+    Rendert die gewählte Challenge als Fragment.
+
+    User und DB-Connection werden hier geladen (nicht vom Host übergeben),
+    damit ein Fragment-Rerun mit frischen Daten und offener Connection läuft.
+    """
+    from utils.gamification_db import get_db_path
+    from utils.preview_store import connect_db
+
+    user = get_current_user()
+    if not user:
+        st.warning("Fehler beim Laden des Benutzerprofils.")
+        return
+
+    conn = connect_db(get_db_path(), user.get("user_id"))
+    try:
+        if challenge == "powertechniken":
+            render_powertechniken_challenge(user=user, conn=conn, xp_callback=_award_xp)
+        elif challenge == "transfer":
+            render_transfer_challenge(user=user, conn=conn, xp_callback=_award_xp)
+        else:
+            render_birkenbihl_challenge(user=user, conn=conn, xp_callback=_award_xp)
+    finally:
+        conn.close()
+
 # ============================================
 # SPEZIELLE RENDERING-FUNKTION FÜR EXT_LEARNSTRAT (Cleverer lernen)
 # ============================================
@@ -89,18 +130,6 @@ def render_learnstrat_altersstufen(color: str):
             # User ist eingeloggt - zeige die Challenges
             user = get_current_user()
             if user:
-                # DB Connection für die Challenges
-                from utils.gamification_db import get_db_path
-                conn = sqlite3.connect(get_db_path())
-
-                # XP Callback definieren
-                def award_xp_callback(user_id, xp, reason):
-                    """Vergibt XP an den User."""
-                    from utils.gamification_db import update_user_stats, get_or_create_user
-                    user_data = get_or_create_user(user_id)
-                    current_streak = user_data.get("current_streak", 0)
-                    update_user_stats(user_id, xp, current_streak)
-
                 # Session State für Challenge-Auswahl
                 if "learnstrat_challenge" not in st.session_state:
                     st.session_state.learnstrat_challenge = "powertechniken"
@@ -155,30 +184,14 @@ def render_learnstrat_altersstufen(color: str):
 
                 st.divider()
 
-                # Challenge-Inhalt anzeigen
+                # Challenge-Inhalt anzeigen (Fragment: Klicks laden nur die Challenge neu)
                 if st.session_state.learnstrat_challenge == "powertechniken":
                     st.caption("Challenge 1: Wissenschaftlich fundierte Lerntechniken kennenlernen")
-                    render_powertechniken_challenge(
-                        user=user,
-                        conn=conn,
-                        xp_callback=award_xp_callback
-                    )
                 elif st.session_state.learnstrat_challenge == "transfer":
                     st.caption("Challenge 2: Transfer-Strategien (Effektstärke d=0.86!)")
-                    render_transfer_challenge(
-                        user=user,
-                        conn=conn,
-                        xp_callback=award_xp_callback
-                    )
                 else:
                     st.caption("Challenge 3: Die Birkenbihl-Methode (nach Vera F. Birkenbihl)")
-                    render_birkenbihl_challenge(
-                        user=user,
-                        conn=conn,
-                        xp_callback=award_xp_callback
-                    )
-
-                conn.close()
+                _render_challenge_fragment(st.session_state.learnstrat_challenge)
             else:
                 st.warning("Fehler beim Laden des Benutzerprofils.")
         elif HAS_LEARNSTRAT and HAS_GAMIFICATION and not is_logged_in():
@@ -48,6 +48,8 @@ except ImportError:
     except ImportError:
         WIDGET_AVAILABLE = False
 
+from utils.fragments import widget_fragment
+
 
 def render_motivation_altersstufen(
     color: str,
@@ -60,7 +62,8 @@ def render_motivation_altersstufen(
     
     Args:
         color: Farbe für das Styling (z.B. "#22c55e")
-        conn: SQLite Connection für Gamification (optional für Widget)
+        conn: SQLite Connection für Gamification (optional). Ohne Connection
+            öffnet das Challenge-Fragment eine eigene für ``user_data["user_id"]``.
         user_data: Dict mit user_id, display_name, age_group (optional für Widget)
         xp_callback: Callback für XP-Vergabe (optional)
     
@@ -165,14 +168,13 @@ def _render_challenges_tab(
     
     widget_ready = (
         WIDGET_AVAILABLE and 
-        conn is not None and 
         user_data is not None and
         user_data.get("user_id")
     )
     
-    if widget_ready:
+    if widget_ready and conn is not None:
         # ═══════════════════════════════════════
-        # INTERAKTIVES WIDGET RENDERN
+        # INTERAKTIVES WIDGET RENDERN (Connection vom Aufrufer)
         # ═══════════════════════════════════════
         
         # Tabellen initialisieren (idempotent)
@@ -185,6 +187,13 @@ def _render_challenges_tab(
             xp_callback=xp_callback
         )
         
+    elif widget_ready:
+        # ═══════════════════════════════════════
+        # INTERAKTIVES WIDGET ALS FRAGMENT (eigene Connection)
+        # ═══════════════════════════════════════
+        
+        _render_challenge_fragment(user_data, xp_callback)
+        
     else:
         # ═══════════════════════════════════════
         # FALLBACK: Platzhalter + Manuelle Version
@@ -193,6 +202,29 @@ def _render_challenges_tab(
         _render_challenges_fallback()
 
 
+@widget_fragment("motivation_challenge")
+def _render_challenge_fragment(user_data: dict, xp_callback: Optional[Callable]):
+    """
+    Rendert das Motivations-Widget als Fragment.
+
+    Die Connection wird im Fragment geöffnet - bei einem Fragment-Rerun
+    ruft Streamlit die Funktion ohne den Host erneut auf.
+    """
+    from utils.gamification_db import get_db_path
+    from utils.preview_store import connect_db
+
+    conn = connect_db(get_db_path(), user_data["user_id"])
+    try:
+        init_motivation_tables(conn)
+        render_motivation_challenge(
+            user_data=user_data,
+            conn=conn,
+            xp_callback=xp_callback
+        )
+    finally:
+        conn.close()
+
+
 def _render_challenges_fallback():
     """Fallback-Anzeige wenn Widget nicht verfügbar oder User nicht eingeloggt."""
     
@@ -0,0 +1,76 @@
+"""
+🧮 Scale Scoring
+================
+
+Berechnung der Skalen-Scores aus den Item-Antworten des Screenings
+(1-4 Skala). Ausgelagert aus der Auswertungs-Seite, damit die Funktionen
+ohne Streamlit-Lauf importiert und gebenchmarkt werden können.
+"""
+
+# Items die umgekehrt werden müssen (PISA: 1=agree, 4=disagree)
+REVERSE_CODED_PREFIXES = ('ST292', 'ST034', 'ST270')
+
+
+def extract_scales_from_responses(responses):
+    """Extrahiert Skalen aus Responses"""
+
+    # Mapping von PISA Item-Codes zu Skalen
+    PISA_ITEM_TO_SCALE = {
+        'ST290': 'MATHEFF',
+        'ST291': 'MATHEFF',
+        'ST292': 'ANXMAT',
+        'ST268': 'PERSEVAGR',
+        'ST034': 'BELONG',
+        'ST270': 'TEACHSUP',
+        'ST038': 'BULLIED',
+    }
+
+    scales = {}
+
+    for item_name in responses.keys():
+        scale_name = None
+
+        # Check if it's a custom item (GENEFF_Q01, etc.)
+        if '_Q' in item_name:
+            scale_name = item_name.split('_Q')[0]
+
+        # Check if it's a PISA item (ST290Q01JA, etc.)
+        elif item_name.startswith('ST'):
+            item_prefix = item_name[:5]
+            scale_name = PISA_ITEM_TO_SCALE.get(item_prefix)
+
+        # Add to scales dict
+        if scale_name:
+            if scale_name not in scales:
+                scales[scale_name] = []
+            scales[scale_name].append(item_name)
+
+    return scales
+
+def calculate_scale_score(responses, scale_items):
+    """Berechnet Skalen-Score aus Item-Antworten
+
+    WICHTIG: Einige PISA-Items verwenden umgekehrte Skalen:
+    - PISA: 1=Strongly agree, 4=Strongly disagree
+    - Unsere App: 1=Stimmt gar nicht, 4=Stimmt genau
+
+    Diese Items werden automatisch umgekehrt (5 - Wert)
+    """
+
+    values = []
+    for item in scale_items:
+        if item in responses:
+            try:
+                val = float(responses[item])
+                if 1 <= val <= 4:
+                    # Prüfe ob Item umgekehrt werden muss
+                    needs_reversal = item.startswith(REVERSE_CODED_PREFIXES)
+                    if needs_reversal:
+                        val = 5 - val  # Umkehrung: 1→4, 2→3, 3→2, 4→1
+                    values.append(val)
+            except:
+                pass
+
+    if values:
+        return sum(values) / len(values)
+    return None
@@ -0,0 +1,509 @@
+"""
+🏫 Schul-Shards
+===============
+
+Jede Schule (Mandant) bekommt ihren eigenen Satz SQLite-Dateien, damit die
+Schreib-Locks einer Klasse nie die Schüler einer anderen Schule blockieren:
+
+    <Datenverzeichnis>/schools/<schul_id>/hattie_gamification.db
+    <Datenverzeichnis>/schools/<schul_id>/coaching.db
+
+Die Standard-Schule (``DEFAULT_SCHOOL``) nutzt weiterhin die bisherigen
+Dateien - bestehende Installationen laufen ohne Umzug weiter.
+
+Die aktive Schule steht in ``st.session_state["school_id"]`` und wird beim
+ersten Aufruf serverseitig bestimmt - nie aus Angaben des Browsers:
+
+1. ``PULSE_SCHOOL_HOSTS`` ordnet Hostnamen Schulen zu
+   (``nord.pulse.example=gym-nord,sued.pulse.example=rs-sued``)
+2. sonst ``PULSE_SCHOOL`` (Standard: ``default``)
+
+Der Query-Parameter ``?schule=<id>`` wird nur mit ``PULSE_SCHOOL_ADMIN=1``
+ausgewertet. Zulässig sind nur Schulen, die der Admin eingerichtet hat
+(``PULSE_SCHOOLS``, ``PULSE_SCHOOL``, ``PULSE_SCHOOL_HOSTS`` oder ein
+per ``python -m utils.shards --anlegen <id>`` eingerichteter Shard);
+unbekannte IDs werden abgewiesen, es wird kein Shard für sie angelegt. Alle ``get_db_path``-Helfer der DB-Schichten
+fragen ``get_db_path(kind)`` - dadurch ist jeder Zugriff automatisch
+shard-aware. Hintergrund-Threads ohne Session wählen den Shard über
+``use_school(...)``.
+
+Verbindungen: Die DB-Schichten öffnen pro Aufruf eine kurzlebige Verbindung
+zu ``get_db_path(kind)`` (Preview-User werden in ``connect_db`` umgeleitet,
+``row_factory`` setzt jeder Aufrufer selbst). Gecachte Verbindungen pro
+Thread und Shard (``get_shard_connection``) nutzt nur der Fan-out.
+Prozessweite Zähler pro User (``mark_user_written``, ``_touch_user``) sind
+nach (Schule, user_id) getrennt.
+
+Admin: ``fan_out()`` führt eine Abfrage parallel auf allen Shards aus,
+``aggregate_across_schools()`` fasst vordefinierte Kennzahlen zusammen
+(Home-Seite mit ``PULSE_SCHOOL_ADMIN=1`` oder ``python -m utils.shards``).
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+DEFAULT_SCHOOL = "default"
+SCHOOL_SESSION_KEY = "school_id"
+SCHOOL_QUERY_PARAM = "schule"
+ENV_SCHOOL = "PULSE_SCHOOL"
+ENV_ADMIN_FLAG = "PULSE_SCHOOL_ADMIN"
+ENV_SCHOOLS = "PULSE_SCHOOLS"
+ENV_SCHOOL_HOSTS = "PULSE_SCHOOL_HOSTS"
+
+SHARD_FILES = {
+    "gamification": "hattie_gamification.db",
+    "coaching": "coaching.db",
+}
+
+FANOUT_WORKERS = 8
+
+_SCHOOL_ID_RE = re.compile(r"^[a-z0-9][a-z0-9_-]{0,39}$")
+
+_local = threading.local()
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def is_school_admin_enabled() -> bool:
+    """Prüft, ob die schulübergreifende Auswertung freigeschaltet ist."""
+    return os.environ.get(ENV_ADMIN_FLAG, "").lower() in ("1", "true", "yes")
+
+
+def normalize_school_id(school_id: str) -> str:
+    """
+    Normalisiert eine Schul-ID (klein, nur a-z, 0-9, ``_`` und ``-``).
+
+    Raises:
+        ValueError: Wenn die ID nicht als Verzeichnisname taugt
+    """
+    normalized = str(school_id).strip().lower()
+    if not _SCHOOL_ID_RE.match(normalized):
+        raise ValueError(f"Ungültige Schul-ID: {school_id!r}")
+    return normalized
+
+
+# ============================================
+# ZULÄSSIGE SCHULEN
+# ============================================
+
+def _split_env(name: str) -> List[str]:
+    return [part.strip() for part in os.environ.get(name, "").split(",") if part.strip()]
+
+
+def get_school_hosts() -> Dict[str, str]:
+    """Zuordnung Hostname -> Schule aus ``PULSE_SCHOOL_HOSTS``."""
+    hosts = {}
+    for entry in _split_env(ENV_SCHOOL_HOSTS):
+        host, _, school_id = entry.partition("=")
+        if host.strip() and school_id.strip():
+            hosts[host.strip().lower()] = normalize_school_id(school_id)
+    return hosts
+
+
+def configured_schools() -> List[str]:
+    """Vom Admin eingerichtete Schulen (Standard-Schule immer dabei)."""
+    schools = {DEFAULT_SCHOOL, _env_school()}
+    schools.update(normalize_school_id(s) for s in _split_env(ENV_SCHOOLS))
+    schools.update(get_school_hosts().values())
+    return sorted(schools)
+
+
+def is_known_school(school_id: str) -> bool:
+    """Eingerichtete Schule oder bereits vorhandener Shard."""
+    return school_id in configured_schools() or (get_schools_dir() / school_id).is_dir()
+
+
+def require_known_school(school_id: str) -> str:
+    """
+    Normalisiert eine Schul-ID und prüft, ob die Schule eingerichtet ist.
+
+    Raises:
+        ValueError: Bei ungültigen oder unbekannten IDs
+    """
+    school_id = normalize_school_id(school_id)
+    if not is_known_school(school_id):
+        raise ValueError(f"Unbekannte Schule: {school_id!r}")
+    return school_id
+
+
+# ============================================
+# AKTIVE SCHULE
+# ============================================
+
+def _requested_school(st) -> Optional[str]:
+    """``?schule=`` - nur für Admins, nur eingerichtete Schulen."""
+    requested = st.query_params.get(SCHOOL_QUERY_PARAM)
+    if not requested or not is_school_admin_enabled():
+        return None
+    try:
+        return require_known_school(requested)
+    except ValueError as e:
+        print(f"⚠️ {e} - Query-Parameter ignoriert", file=sys.stderr)
+        return None
+
+
+def _host_school(st) -> Optional[str]:
+    """Schule zum Hostnamen der Anfrage (``PULSE_SCHOOL_HOSTS``)."""
+    hosts = get_school_hosts()
+    if not hosts:
+        return None
+    context = getattr(st, "context", None)  # st.context erst ab Streamlit 1.37
+    if context is None:
+        return None
+    host = (context.headers.get("Host") or "").split(":")[0].lower()
+    return hosts.get(host)
+
+
+def _session_school() -> Optional[str]:
+    """Schule aus Session-State, Admin-Parameter oder Host (None außerhalb von Streamlit)."""
+    try:
+        import streamlit as st
+        if not st.runtime.exists():
+            return None
+
+        school_id = st.session_state.get(SCHOOL_SESSION_KEY)
+        if school_id is None:
+            school_id = _requested_school(st) or _host_school(st) or _env_school()
+            st.session_state[SCHOOL_SESSION_KEY] = school_id
+        return school_id
+    except Exception:
+        return None
+
+
+def _env_school() -> str:
+    return normalize_school_id(os.environ.get(ENV_SCHOOL) or DEFAULT_SCHOOL)
+
+
+def get_current_school() -> str:
+    """Aktive Schule: ``use_school``-Kontext, dann Session, dann ``PULSE_SCHOOL``."""
+    override = getattr(_local, "school", None)
+    if override is not None:
+        return override
+    return _session_school() or _env_school()
+
+
+def set_current_school(school_id: str) -> str:
+    """
+    Wechselt die Schule der aktuellen Session.
+
+    Alle übrigen Session-Daten (Login, Snapshots) gehören zur alten Schule
+    und werden verworfen. Nur für Admins (``PULSE_SCHOOL_ADMIN``) und nur
+    für eingerichtete Schulen.
+
+    Raises:
+        PermissionError: Ohne Admin-Freischaltung
+        ValueError: Bei unbekannten Schulen
+    """
+    import streamlit as st
+
+    if not is_school_admin_enabled():
+        raise PermissionError(f"Schulwechsel nur mit {ENV_ADMIN_FLAG}=1")
+    school_id = require_known_school(school_id)
+    if st.session_state.get(SCHOOL_SESSION_KEY) != school_id:
+        for key in list(st.session_state.keys()):
+            if key != SCHOOL_SESSION_KEY:
+                del st.session_state[key]
+        st.session_state[SCHOOL_SESSION_KEY] = school_id
+    return school_id
+
+
+@contextmanager
+def use_school(school_id: str) -> Iterator[str]:
+    """Setzt die Schule für den aktuellen Thread (Fan-out, Wartung, CLI)."""
+    previous = getattr(_local, "school", None)
+    _local.school = normalize_school_id(school_id)
+    try:
+        yield _local.school
+    finally:
+        _local.school = previous
+
+
+# ============================================
+# PFADE
+# ============================================
+
+def get_data_dir() -> Path:
+    """Datenverzeichnis (Streamlit Cloud: /tmp, sonst ./data)."""
+    if Path("/tmp").exists() and Path("/tmp").is_dir():
+        return Path("/tmp")
+    data_dir = Path(__file__).parent.parent / "data"
+    data_dir.mkdir(exist_ok=True)
+    return data_dir
+
+
+def get_schools_dir() -> Path:
+    return Path(os.environ.get("PULSE_SHARD_DIR") or get_data_dir() / "schools")
+
+
+def _default_path(kind: str) -> Path:
+    """Bisherige Dateien der Standard-Schule."""
+    if kind == "coaching":
+        from utils import coaching_db
+        return Path(coaching_db.DB_PATH)
+    return get_data_dir() / SHARD_FILES[kind]
+
+
+def get_db_path(kind: str = "gamification", school_id: Optional[str] = None) -> Path:
+    """
+    Pfad der Datenbank ``kind`` ("gamification" oder "coaching") einer Schule.
+
+    Args:
+        kind: Art der Datenbank (siehe SHARD_FILES)
+        school_id: Schule (Standard: aktive Schule)
+
+    Raises:
+        ValueError: Bei unbekannter Datenbank oder Schule
+    """
+    if kind not in SHARD_FILES:
+        raise ValueError(f"Unbekannte Datenbank: {kind!r}")
+    school_id = normalize_school_id(school_id) if school_id else get_current_school()
+    if school_id == DEFAULT_SCHOOL:
+        return _default_path(kind)
+
+    # Shard-Verzeichnisse nur für eingerichtete Schulen anlegen
+    school_id = require_known_school(school_id)
+    shard_dir = get_schools_dir() / school_id
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    return shard_dir / SHARD_FILES[kind]
+
+
+def provision_school(school_id: str) -> Path:
+    """
+    Richtet den Shard einer neuen Schule ein (Admin/CLI, nie aus Browser-Eingaben).
+
+    Danach gilt die Schule als bekannt (``is_known_school``).
+    """
+    shard_dir = get_schools_dir() / normalize_school_id(school_id)
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    return shard_dir
+
+
+def list_schools() -> List[str]:
+    """Alle Schulen mit eigenem Shard (plus Standard-Schule)."""
+    schools = [DEFAULT_SCHOOL]
+    schools_dir = get_schools_dir()
+    if schools_dir.is_dir():
+        schools.extend(
+            sorted(p.name for p in schools_dir.iterdir()
+                   if p.is_dir() and _SCHOOL_ID_RE.match(p.name) and p.name != DEFAULT_SCHOOL)
+        )
+    return schools
+
+
+# ============================================
+# VERBINDUNGEN
+# ============================================
+
+def _prepare(kind: str, path: Path) -> None:
+    """Schema eines Shards anlegen bzw. migrieren."""
+    if kind == "gamification":
+        from utils.migrations import ensure_schema
+        ensure_schema(path)
+    else:
+        from utils.coaching_db import init_database
+        init_database(path)
+
+
+def get_shard_connection(kind: str = "gamification", school_id: Optional[str] = None) -> sqlite3.Connection:
+    """
+    Gecachte Leseverbindung zu einem Shard (eine pro Thread und Datei).
+
+    Für den Fan-out über alle Schulen; die DB-Schichten öffnen eigene,
+    kurzlebige Verbindungen. Die Verbindung bleibt offen und darf vom
+    Aufrufer nicht geschlossen werden (siehe ``close_shard_connections``).
+    """
+    path = get_db_path(kind, school_id)
+    cache = getattr(_local, "connections", None)
+    if cache is None:
+        cache = _local.connections = {}
+
+    conn = cache.get(path)
+    if conn is None:
+        _prepare(kind, path)
+        conn = sqlite3.connect(path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        cache[path] = conn
+    return conn
+
+
+def close_shard_connections() -> None:
+    """Schließt alle gecachten Verbindungen des aktuellen Threads."""
+    for conn in getattr(_local, "connections", {}).values():
+        conn.close()
+    _local.connections = {}
+
+
+# ============================================
+# FAN-OUT (ADMIN)
+# ============================================
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Dauerhafter Pool, damit die Shard-Verbindungen der Worker erhalten bleiben."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=FANOUT_WORKERS, thread_name_prefix="pulse-shard")
+        return _pool
+
+
+def _query_shard(kind: str, school_id: str, sql: str, params: Sequence[Any]) -> List[Dict[str, Any]]:
+    conn = get_shard_connection(kind, school_id)
+    return [dict(row) for row in conn.execute(sql, params).fetchall()]
+
+
+def fan_out(sql: str, params: Sequence[Any] = (), kind: str = "gamification",
+            schools: Optional[List[str]] = None) -> Tuple[Dict[str, List[Dict]], Dict[str, str]]:
+    """
+    Führt eine Leseabfrage parallel auf allen Shards aus.
+
+    Returns:
+        (Zeilen pro Schule, Fehlermeldung pro Schule)
+    """
+    schools = schools or list_schools()
+    pool = _get_pool()
+    futures = {school: pool.submit(_query_shard, kind, school, sql, tuple(params))
+               for school in schools}
+
+    results, errors = {}, {}
+    for school, future in futures.items():
+        try:
+            results[school] = future.result()
+        except sqlite3.Error as e:
+            errors[school] = str(e)
+    return results, errors
+
+
+def merge_rows(per_school: Dict[str, List[Dict]], key_columns: Sequence[str] = ()) -> List[Dict[str, Any]]:
+    """Summiert die Zeilen aller Schulen pro Schlüssel (numerische Spalten)."""
+    merged: Dict[tuple, Dict[str, Any]] = {}
+    for rows in per_school.values():
+        for row in rows:
+            key = tuple(row[c] for c in key_columns)
+            target = merged.setdefault(key, {c: row[c] for c in key_columns})
+            for column, value in row.items():
+                if column in key_columns:
+                    continue
+                if isinstance(value, (int, float)):
+                    target[column] = target.get(column, 0) + value
+                else:
+                    target.setdefault(column, value)
+    return [merged[key] for key in sorted(merged, key=lambda k: tuple(str(v) for v in k))]
+
+
+# Kennzahl -> (Datenbank, SQL, Schlüsselspalten)
+SCHOOL_AGGREGATES = {
+    "schueler": ("gamification", '''
+        SELECT COUNT(*) AS schueler, COALESCE(SUM(xp_total), 0) AS xp
+        FROM users
+    ''', ()),
+    "aktivitaet_pro_tag": ("gamification", '''
+        SELECT activity_date AS tag, SUM(anzahl) AS aktivitaeten, SUM(xp) AS xp
+        FROM (
+            SELECT activity_date, COUNT(*) AS anzahl, COALESCE(SUM(xp_earned), 0) AS xp
+            FROM activity_log GROUP BY activity_date
+            UNION ALL
+            SELECT activity_date, SUM(activity_count), SUM(xp_earned)
+            FROM activity_daily GROUP BY activity_date
+        )
+        GROUP BY activity_date
+    ''', ("tag",)),
+    "bandura_quellen": ("gamification", '''
+        SELECT source_type AS quelle, SUM(anzahl) AS eintraege
+        FROM (
+            SELECT source_type, COUNT(*) AS anzahl FROM bandura_entries GROUP BY source_type
+            UNION ALL
+            SELECT source_type, SUM(entry_count) FROM bandura_daily GROUP BY source_type
+        )
+        GROUP BY source_type
+    ''', ("quelle",)),
+    "screenings": ("coaching", '''
+        SELECT COUNT(DISTINCT student_id) AS schueler, COUNT(*) AS screenings
+        FROM assessments
+    ''', ()),
+}
+
+
+def aggregate_across_schools(name: str, schools: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Berechnet eine Kennzahl aus SCHOOL_AGGREGATES über alle Schulen.
+
+    Returns:
+        {"per_school": {...}, "total": [...], "errors": {...}}
+    """
+    kind, sql, key_columns = SCHOOL_AGGREGATES[name]
+    per_school, errors = fan_out(sql, kind=kind, schools=schools)
+    return {
+        "per_school": per_school,
+        "total": merge_rows(per_school, key_columns),
+        "errors": errors,
+    }
+
+
+def render_school_admin_panel() -> None:
+    """Schulübergreifende Kennzahlen (nur mit PULSE_SCHOOL_ADMIN=1)."""
+    import streamlit as st
+
+    if not is_school_admin_enabled():
+        st.info(f"Die Schul-Auswertung ist deaktiviert. Starte die App mit `{ENV_ADMIN_FLAG}=1`.")
+        return
+
+    schools = list_schools()
+    st.caption(f"Aktive Schule: **{get_current_school()}** · {len(schools)} Shards")
+
+    name = st.selectbox("Kennzahl", list(SCHOOL_AGGREGATES), key="school_admin_aggregate")
+    result = aggregate_across_schools(name, schools)
+
+    st.markdown("**Gesamt**")
+    st.dataframe(result["total"], use_container_width=True, hide_index=True)
+
+    st.markdown("**Pro Schule**")
+    st.dataframe(
+        [{"Schule": school, **row} for school, rows in result["per_school"].items() for row in rows],
+        use_container_width=True, hide_index=True,
+    )
+    for school, error in result["errors"].items():
+        st.warning(f"{school}: {error}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Schul-Shards auflisten und auswerten")
+    parser.add_argument("aggregate", nargs="?", choices=list(SCHOOL_AGGREGATES),
+                        help="Kennzahl über alle Schulen (ohne Angabe: Shards auflisten)")
+    parser.add_argument("--anlegen", metavar="SCHUL_ID", help="Shard einer neuen Schule einrichten")
+    args = parser.parse_args(argv)
+
+    if args.anlegen:
+        print(f"Shard eingerichtet: {provision_school(args.anlegen)}")
+        return 0
+
+    if not args.aggregate:
+        for school in list_schools():
+            sizes = ", ".join(
+                f"{kind}: {path.stat().st_size // 1024} KB" if path.exists() else f"{kind}: -"
+                for kind, path in ((k, get_db_path(k, school)) for k in SHARD_FILES)
+            )
+            print(f"{school:<20} {sizes}")
+        return 0
+
+    result = aggregate_across_schools(args.aggregate)
+    for row in result["total"]:
+        print(row)
+    for school, error in result["errors"].items():
+        print(f"⚠️ {school}: {error}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+"""
+🔎 SQL Tracing
+==============
+
+Query-Instrumentierung für alle SQLite-Zugriffe der App.
+
+Im Tracing-Modus (``PULSE_SQL_TRACE=1``) liefert ``sqlite3.connect`` eine
+``TracingConnection``, deren Cursor pro Statement erfassen:
+- Fingerprint (Literale und IN-Listen durch ``?`` ersetzt)
+- Dauer (execute + fetch, SQLite arbeitet lazy beim Fetchen)
+- Zeilenanzahl (gelesene bzw. geänderte Zeilen)
+
+Die Statistiken werden prozessweit pro Seite aggregiert. Statements über
+``PULSE_SLOW_QUERY_MS`` (Standard 50 ms) landen zusätzlich im Slow-Query-Log
+``data/slow_queries.log``. ``render_sql_admin_panel()`` zeigt die Top-N
+Statements pro Seite an.
+
+Die Seite wird über ``set_current_page`` zugeordnet (ruft ``profile_page``
+aus ``utils/startup_profiler.py`` automatisch auf).
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+ENV_FLAG = "PULSE_SQL_TRACE"
+SLOW_QUERY_MS = float(os.environ.get("PULSE_SLOW_QUERY_MS", "50"))
+SLOW_QUERY_LOG = Path(os.environ.get(
+    "PULSE_SLOW_QUERY_LOG", Path(__file__).parent.parent / "data" / "slow_queries.log"
+))
+
+UNKNOWN_PAGE = "(unbekannt)"
+
+_installed = False
+_original_connect = sqlite3.connect
+_page_local = threading.local()
+_lock = threading.Lock()
+
+# (page, fingerprint) -> Statistik
+_stats: Dict[tuple, Dict[str, Any]] = {}
+
+_slow_logger: Optional[logging.Logger] = None
+
+
+def is_tracing_enabled() -> bool:
+    """Prüft, ob das SQL-Tracing aktiv ist."""
+    return os.environ.get(ENV_FLAG, "").lower() in ("1", "true", "yes")
+
+
+def set_current_page(page_name: str) -> None:
+    """Ordnet alle folgenden Statements dieses Threads einer Seite zu."""
+    _page_local.page = page_name
+
+
+def get_current_page() -> str:
+    return getattr(_page_local, "page", UNKNOWN_PAGE)
+
+
+# ============================================
+# FINGERPRINT
+# ============================================
+
+_RE_STRING = re.compile(r"'(?:[^']|'')*'")
+_RE_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_RE_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_RE_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalisiert ein Statement, sodass gleiche Abfragen mit anderen Werten
+    (z.B. f-String-SQL in ``db_loader``) zusammengefasst werden.
+    """
+    fp = _RE_STRING.sub("?", statement)
+    fp = _RE_NUMBER.sub("?", fp)
+    fp = _RE_IN_LIST.sub("IN (...)", fp)
+    return _RE_WHITESPACE.sub(" ", fp).strip()
+
+
+# ============================================
+# AUFZEICHNUNG
+# ============================================
+
+def _get_slow_logger() -> logging.Logger:
+    global _slow_logger
+    if _slow_logger is None:
+        logger = logging.getLogger("pulse.slow_queries")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        SLOW_QUERY_LOG.parent.mkdir(parents=True, exist_ok=True)
+        handler = logging.FileHandler(SLOW_QUERY_LOG, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        logger.addHandler(handler)
+        _slow_logger = logger
+    return _slow_logger
+
+
+def record_statement(statement: str, duration_ms: float, rows: int) -> None:
+    """Aggregiert ein ausgeführtes Statement und schreibt ggf. ins Slow-Query-Log."""
+    page = get_current_page()
+    fp = fingerprint(statement)
+
+    with _lock:
+        entry = _stats.get((page, fp))
+        if entry is None:
+            entry = _stats[(page, fp)] = {
+                "page": page, "fingerprint": fp, "count": 0,
+                "total_ms": 0.0, "max_ms": 0.0, "rows": 0, "slow": 0,
+            }
+        entry["count"] += 1
+        entry["total_ms"] += duration_ms
+        entry["max_ms"] = max(entry["max_ms"], duration_ms)
+        entry["rows"] += max(rows, 0)
+        if duration_ms >= SLOW_QUERY_MS:
+            entry["slow"] += 1
+
+    if duration_ms >= SLOW_QUERY_MS:
+        statement_short = _RE_WHITESPACE.sub(" ", statement).strip()[:500]
+        _get_slow_logger().info(
+            f"{duration_ms:.1f}ms rows={rows} page={page} | {statement_short}"
+        )
+
+
+def get_top_statements(page: Optional[str] = None, top_n: int = 20,
+                       order_by: str = "total_ms") -> List[Dict[str, Any]]:
+    """
+    Gibt die teuersten Statements zurück.
+
+    Args:
+        page: Nur diese Seite (None = alle Seiten)
+        top_n: Anzahl Einträge
+        order_by: "total_ms", "count", "max_ms" oder "rows"
+    """
+    with _lock:
+        entries = [dict(e) for e in _stats.values() if page is None or e["page"] == page]
+    for entry in entries:
+        entry["avg_ms"] = entry["total_ms"] / entry["count"] if entry["count"] else 0.0
+    return sorted(entries, key=lambda e: e[order_by], reverse=True)[:top_n]
+
+
+def get_traced_pages() -> List[str]:
+    with _lock:
+        return sorted({page for page, _ in _stats})
+
+
+def reset_stats() -> None:
+    with _lock:
+        _stats.clear()
+
+
+# ============================================
+# CONNECTION / CURSOR
+# ============================================
+
+class TracingCursor(sqlite3.Cursor):
+    """
+    Cursor, der Dauer und Zeilen je Statement misst.
+
+    Ein Statement gilt als abgeschlossen, sobald das Ergebnis vollständig
+    gelesen, der Cursor neu verwendet, geschlossen oder freigegeben wird.
+    """
+
+    _pending: Optional[list] = None
+
+    def _finish(self) -> None:
+        pending = self._pending
+        if pending is not None:
+            self._pending = None
+            statement, duration_ms, rows = pending
+            record_statement(statement, duration_ms, rows)
+
+    def _start(self, statement: str, duration_ms: float) -> None:
+        rows = self.rowcount if self.rowcount and self.rowcount > 0 else 0
+        self._pending = [statement, duration_ms, rows]
+        if self.description is None:
+            # Kein Ergebnis (DDL/DML) - sofort abschließen
+            self._finish()
+
+    def _timed_fetch(self, method, *args):
+        start = time.perf_counter()
+        result = method(self, *args)
+        if self._pending is not None:
+            self._pending[1] += (time.perf_counter() - start) * 1000
+        return result
+
+    def execute(self, sql, parameters=()):
+        self._finish()
+        start = time.perf_counter()
+        super().execute(sql, parameters)
+        self._start(sql, (time.perf_counter() - start) * 1000)
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        self._finish()
+        start = time.perf_counter()
+        super().executemany(sql, seq_of_parameters)
+        self._start(sql, (time.perf_counter() - start) * 1000)
+        return self
+
+    def fetchone(self):
+        row = self._timed_fetch(sqlite3.Cursor.fetchone)
+        if self._pending is not None:
+            if row is None:
+                self._finish()
+            else:
+                self._pending[2] += 1
+        return row
+
+    def fetchmany(self, size=None):
+        rows = self._timed_fetch(sqlite3.Cursor.fetchmany, size or self.arraysize)
+        if self._pending is not None:
+            self._pending[2] += len(rows)
+            if not rows:
+                self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = self._timed_fetch(sqlite3.Cursor.fetchall)
+        if self._pending is not None:
+            self._pending[2] += len(rows)
+            self._finish()
+        return rows
+
+    def __next__(self):
+        row = self.fetchone()
+        if row is None:
+            raise StopIteration
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        try:
+            self._finish()
+        except Exception:
+            pass
+
+
+class TracingConnection(sqlite3.Connection):
+    """Connection, deren Cursor (auch für ``conn.execute``) getraced werden."""
+
+    def cursor(self, factory=TracingCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+def connect(*args, **kwargs) -> sqlite3.Connection:
+    """Wie ``sqlite3.connect``, aber mit ``TracingConnection`` als Factory."""
+    kwargs.setdefault("factory", TracingConnection)
+    return _original_connect(*args, **kwargs)
+
+
+def install() -> None:
+    """Ersetzt ``sqlite3.connect`` prozessweit durch die Tracing-Variante."""
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    sqlite3.connect = connect
+
+
+def install_if_enabled() -> None:
+    """Installiert das Tracing nur mit ``PULSE_SQL_TRACE=1``."""
+    if is_tracing_enabled():
+        install()
+
+
+# ============================================
+# ADMIN PANEL
+# ============================================
+
+def render_sql_admin_panel(top_n: int = 20) -> None:
+    """Zeigt die Top-N Statements pro Seite (nur im Tracing-Modus)."""
+    import streamlit as st
+
+    if not is_tracing_enabled():
+        st.info(f"SQL-Tracing ist deaktiviert. Starte die App mit `{ENV_FLAG}=1`.")
+        return
+
+    pages = get_traced_pages()
+    if not pages:
+        st.info("Noch keine Statements aufgezeichnet.")
+        return
+
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        page = st.selectbox("Seite", ["Alle Seiten"] + pages, key="sql_admin_page")
+    with col2:
+        order_labels = {
+            "total_ms": "Gesamtzeit",
+            "count": "Anzahl",
+            "max_ms": "Maximale Dauer",
+            "rows": "Zeilen",
+        }
+        order_by = st.selectbox("Sortierung", list(order_labels), format_func=order_labels.get,
+                                key="sql_admin_order")
+    with col3:
+        if st.button("🗑️ Zurücksetzen", key="sql_admin_reset"):
+            reset_stats()
+            st.rerun()
+
+    entries = get_top_statements(None if page == "Alle Seiten" else page, top_n, order_by)
+    st.dataframe(
+        [
+            {
+                "Seite": e["page"],
+                "Anzahl": e["count"],
+                "Gesamt (ms)": round(e["total_ms"], 1),
+                "Ø (ms)": round(e["avg_ms"], 2),
+                "Max (ms)": round(e["max_ms"], 1),
+                "Zeilen": e["rows"],
+                "Langsam": e["slow"],
+                "Statement": e["fingerprint"],
+            }
+            for e in entries
+        ],
+        use_container_width=True,
+        hide_index=True,
+    )
+    st.caption(f"Slow-Query-Log (≥ {SLOW_QUERY_MS:.0f} ms): `{SLOW_QUERY_LOG}`")
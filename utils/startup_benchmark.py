@@ -0,0 +1,180 @@
+"""
+🏁 Startup Benchmark
+====================
+
+Regressions-Benchmark für Kaltstarts: Jede Seite wird in einem frischen
+Python-Prozess über ``streamlit.testing.v1.AppTest`` einmal ausgeführt, mit
+aktivem Startup-Profiler (siehe ``utils/startup_profiler.py``).
+
+Wie im Browser startet jeder Lauf mit ``Home.py`` als Einstieg und wechselt
+dann auf die Seite (``switch_page``/``page_link`` brauchen den
+Multipage-Kontext). Alle Datenbanken liegen in einem temporären Schul-Shard
+(``PULSE_SHARD_DIR``), der vorab migriert wird - echte ``coaching.db`` und
+``hattie_gamification.db`` werden nicht angefasst.
+
+Überschreitet der Kaltstart einer Seite ihr Budget, endet das Skript mit
+Exit-Code 1 - geeignet für CI.
+
+Verwendung:
+    python -m utils.startup_benchmark
+    python -m utils.startup_benchmark --budget-ms 4000 --page Home.py
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+ROOT_DIR = Path(__file__).parent.parent
+ENTRYPOINT = "Home.py"
+
+# Temporärer Schul-Shard für alle Läufe
+BENCH_SCHOOL = "startup-benchmark"
+
+PAGES = [
+    "Home.py",
+    "pages/1_📚_Ressourcen.py",
+    "pages/2_🎓_Elternakademie.py",
+    "pages/3_🔍_Screening_Diagnostik.py",
+    "pages/4_📊_Auswertung.py",
+    "pages/5_📖_PISA_Forschungsgrundlage.py",
+]
+
+# Budget für den Kaltstart (Prozessstart bis Ende des ersten Laufs) in ms
+DEFAULT_BUDGET_MS = 6000
+PAGE_BUDGETS_MS = {
+    "Home.py": 4000,
+}
+
+RUN_TIMEOUT_S = 120
+
+# Läuft im Kindprozess: Hooks vor allen Imports der Seite installieren
+_RUNNER = """
+import sys
+sys.path.insert(0, {root!r})
+from utils.startup_profiler import install
+install()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({entrypoint!r}, default_timeout={timeout})
+if {page!r} != {entry_name!r}:
+    at.switch_page({page!r})
+at.run()
+# Seiten, die per st.stop() vor finish_page() enden, trotzdem berichten
+from utils.startup_profiler import finish_page
+finish_page()
+if at.exception:
+    print(at.exception[0].message, file=sys.stderr)
+    sys.exit(2)
+"""
+
+
+def _prepare_shard(shard_root: Path) -> None:
+    """Legt den Benchmark-Shard an und migriert ihn (nicht Teil der Messung)."""
+    from utils import coaching_db, migrations, shards
+
+    shard_dir = shard_root / BENCH_SCHOOL
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    migrations.ensure_schema(shard_dir / shards.SHARD_FILES["gamification"])
+    coaching_db.init_database(shard_dir / shards.SHARD_FILES["coaching"])
+
+
+def run_page(page: str, report_dir: Path, shard_root: Path) -> Dict[str, Any]:
+    """
+    Führt eine Seite kalt in einem eigenen Prozess aus (auf dem Benchmark-Shard).
+
+    Returns:
+        Dict mit wall_ms, returncode, stderr und dem Profiler-Report (falls vorhanden)
+    """
+    env = {
+        **os.environ,
+        "PULSE_PROFILE": "1",
+        "PULSE_PROFILE_DIR": str(report_dir),
+        "PULSE_SHARD_DIR": str(shard_root),
+        "PULSE_SCHOOL": BENCH_SCHOOL,
+        "PULSE_SCHOOLS": BENCH_SCHOOL,
+    }
+    code = _RUNNER.format(root=str(ROOT_DIR), entrypoint=str(ROOT_DIR / ENTRYPOINT),
+                          entry_name=ENTRYPOINT, page=page, timeout=RUN_TIMEOUT_S)
+
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True, timeout=RUN_TIMEOUT_S + 30
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    report = None
+    reports = sorted(report_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+    if reports:
+        with open(reports[-1], encoding="utf-8") as f:
+            report = json.load(f)
+        for path in reports:
+            path.unlink()
+
+    return {
+        "page": page,
+        "wall_ms": round(wall_ms, 1),
+        "returncode": proc.returncode,
+        "stderr": proc.stderr.strip()[-2000:],
+        "report": report,
+    }
+
+
+def run_benchmark(pages: List[str], budget_ms: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Führt alle Seiten aus und vergleicht sie mit ihrem Budget."""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp, \
+            tempfile.TemporaryDirectory(prefix="pulse_startup_") as shard_root:
+        _prepare_shard(Path(shard_root))
+        for page in pages:
+            result = run_page(page, Path(tmp), Path(shard_root))
+            result["budget_ms"] = budget_ms or PAGE_BUDGETS_MS.get(page, DEFAULT_BUDGET_MS)
+            result["ok"] = result["returncode"] == 0 and result["wall_ms"] <= result["budget_ms"]
+            results.append(result)
+    return results
+
+
+def print_results(results: List[Dict[str, Any]]) -> None:
+    """Gibt eine kompakte Tabelle plus die teuersten Imports je Seite aus."""
+    for result in results:
+        status = "✅" if result["ok"] else "❌"
+        print(f"{status} {result['page']}: {result['wall_ms']:.0f} ms (Budget {result['budget_ms']:.0f} ms)")
+
+        report = result["report"]
+        if report:
+            print(f"     Imports: {report['modules_imported']} Module, {report['import_ms']:.0f} ms | "
+                  f"SQL: {report['sql_count']} Statements | cache_data: {len(report['cache_data'])} Funktionen")
+            for entry in report["imports"][:5]:
+                print(f"       {entry['self_ms']:8.1f} ms  {entry['module']}")
+        if result["returncode"] != 0:
+            print(f"     Fehler (Exit {result['returncode']}): {result['stderr']}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Kaltstart-Benchmark aller Seiten")
+    parser.add_argument("--page", action="append", help="Nur diese Seite(n) messen")
+    parser.add_argument("--budget-ms", type=float, help="Einheitliches Budget für alle Seiten")
+    parser.add_argument("--json", type=Path, help="Ergebnisse zusätzlich als JSON speichern")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.page or PAGES, args.budget_ms)
+    print_results(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    return 0 if all(r["ok"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
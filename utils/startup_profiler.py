@@ -0,0 +1,314 @@
+"""
+⏱️ Startup Profiler
+===================
+
+Instrumentierungs-Modus für Kaltstarts und Reruns der Seiten.
+
+Erfasst pro Seitenlauf:
+- Import-Zeit pro Modul (kumuliert und "self", wie ``python -X importtime``)
+- Laufzeit jeder ``st.cache_data``-Funktion inkl. Hit/Miss
+- Anzahl und Dauer der SQL-Statements
+
+und schreibt einen JSON-Report pro Seite nach ``data/profiling/``.
+
+Aktivierung über die Umgebungsvariable ``PULSE_PROFILE=1``. Ohne die Variable
+ist ``profile_page`` ein No-Op.
+
+Die Hooks werden bereits in ``utils/__init__.py`` installiert, damit auch die
+Paket-Imports (Gamification, Widgets) mitgemessen werden. In den Seiten:
+    from utils.startup_profiler import profile_page, finish_page
+    profile_page("Home")
+    ...
+    finish_page()
+
+Imports, die vor dem ersten ``profile_page`` liefen, werden dem ersten
+Seitenlauf des Prozesses (dem Kaltstart) zugerechnet.
+
+Seiten, die vorzeitig per ``st.stop()`` enden, erreichen ``finish_page()``
+nicht - ihr Report wird beim nächsten ``profile_page``-Aufruf geschrieben.
+"""
+
+import functools
+import importlib.abc
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .sql_tracing import set_current_page
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+ENV_FLAG = "PULSE_PROFILE"
+REPORT_DIR = Path(os.environ.get("PULSE_PROFILE_DIR", Path(__file__).parent.parent / "data" / "profiling"))
+
+# Nur die teuersten Einträge landen im Report
+TOP_N_IMPORTS = 40
+TOP_N_STATEMENTS = 25
+
+_installed = False
+_installed_at: Optional[float] = None
+_lock = threading.Lock()
+_current_run: Optional[Dict[str, Any]] = None
+
+# Import-Zeiten werden prozessweit gesammelt (ein Modul wird nur einmal importiert)
+_import_times: Dict[str, Dict[str, float]] = {}
+_import_stack: List[List[float]] = []
+_reported_imports: set = set()
+
+
+def is_profiling_enabled() -> bool:
+    """Prüft, ob der Profiling-Modus aktiv ist."""
+    return os.environ.get(ENV_FLAG, "").lower() in ("1", "true", "yes")
+
+
+# ============================================
+# IMPORT-ZEITEN
+# ============================================
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wickelt einen Loader ein und misst ``exec_module``."""
+
+    def __init__(self, loader):
+        self._loader = loader
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        _import_stack.append([0.0])
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            children = _import_stack.pop()[0]
+            if _import_stack:
+                _import_stack[-1][0] += elapsed
+            _import_times[module.__name__] = {
+                "cumulative_ms": round(elapsed, 2),
+                "self_ms": round(elapsed - children, 2),
+            }
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _TimedFinder(importlib.abc.MetaPathFinder):
+    """Meta-Path-Finder, der die Loader aller anderen Finder instrumentiert."""
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader)
+                return spec
+        return None
+
+
+# ============================================
+# ST.CACHE_DATA
+# ============================================
+
+def _record_cache_call(name: str, duration_ms: float, miss: bool) -> None:
+    run = _current_run
+    if run is None:
+        return
+    with _lock:
+        entry = run["cache"].setdefault(name, {"hits": 0, "misses": 0, "total_ms": 0.0, "miss_ms": 0.0})
+        entry["total_ms"] += duration_ms
+        if miss:
+            entry["misses"] += 1
+            entry["miss_ms"] += duration_ms
+        else:
+            entry["hits"] += 1
+
+
+class _ProfiledCacheData:
+    """
+    Ersatz für ``st.cache_data``, der jeden Aufruf misst.
+
+    Ein Miss wird daran erkannt, dass der Funktionskörper tatsächlich lief.
+    Alle anderen Attribute (``clear`` usw.) werden an das Original delegiert.
+    """
+
+    def __init__(self, original):
+        self._original = original
+
+    def __call__(self, func: Optional[Callable] = None, **kwargs):
+        if func is None:
+            return lambda f: self._wrap(f, **kwargs)
+        return self._wrap(func, **kwargs)
+
+    def _wrap(self, func: Callable, **kwargs):
+        name = f"{func.__module__}.{func.__qualname__}"
+        state = threading.local()
+
+        @functools.wraps(func)
+        def body(*args, **kw):
+            state.miss = True
+            return func(*args, **kw)
+
+        cached = self._original(body, **kwargs) if kwargs else self._original(body)
+
+        @functools.wraps(func)
+        def timed(*args, **kw):
+            state.miss = False
+            start = time.perf_counter()
+            try:
+                return cached(*args, **kw)
+            finally:
+                _record_cache_call(name, (time.perf_counter() - start) * 1000, state.miss)
+
+        timed.clear = getattr(cached, "clear", lambda: None)
+        return timed
+
+    def __getattr__(self, name):
+        return getattr(self._original, name)
+
+
+# ============================================
+# SQL
+# ============================================
+
+def _record_statement(statement: str) -> None:
+    run = _current_run
+    if run is None:
+        return
+    key = " ".join(statement.split())[:200]
+    with _lock:
+        run["sql_count"] += 1
+        run["sql"][key] = run["sql"].get(key, 0) + 1
+
+
+def _install_sql_hook() -> None:
+    """Hängt an jede neue sqlite3-Verbindung einen Trace-Callback."""
+    original_connect = sqlite3.connect
+
+    @functools.wraps(original_connect)
+    def connect(*args, **kwargs):
+        conn = original_connect(*args, **kwargs)
+        conn.set_trace_callback(_record_statement)
+        return conn
+
+    sqlite3.connect = connect
+
+
+# ============================================
+# ÖFFENTLICHE API
+# ============================================
+
+def install() -> None:
+    """Installiert Import-, Cache- und SQL-Hooks (einmal pro Prozess)."""
+    global _installed, _installed_at
+    if _installed:
+        return
+    _installed = True
+    _installed_at = time.perf_counter()
+
+    sys.meta_path.insert(0, _TimedFinder())
+    _install_sql_hook()
+
+    import streamlit as st
+    if not isinstance(st.cache_data, _ProfiledCacheData):
+        st.cache_data = _ProfiledCacheData(st.cache_data)
+
+
+def install_if_enabled() -> None:
+    """Installiert die Hooks nur im Profiling-Modus."""
+    if is_profiling_enabled():
+        install()
+
+
+def profile_page(page_name: str) -> None:
+    """
+    Startet die Messung für einen Seitenlauf.
+
+    Muss vor den utils-Imports der Seite aufgerufen werden, damit die
+    Import-Zeiten beim Kaltstart erfasst werden.
+    """
+    global _current_run
+    set_current_page(page_name)
+    if not is_profiling_enabled():
+        return
+
+    install()
+    if _current_run is not None:
+        finish_page()
+
+    cold_start = not _reported_imports
+    _current_run = {
+        "page": page_name,
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "cold_start": cold_start,
+        "start": _installed_at if cold_start else time.perf_counter(),
+        "cache": {},
+        "sql": {},
+        "sql_count": 0,
+    }
+
+
+def finish_page() -> Optional[Path]:
+    """
+    Beendet die Messung und schreibt den Report.
+
+    Returns:
+        Pfad zum Report oder None (Profiling aus / kein laufender Lauf)
+    """
+    global _current_run
+    run = _current_run
+    if run is None:
+        return None
+    _current_run = None
+
+    total_ms = (time.perf_counter() - run["start"]) * 1000
+    new_imports = {
+        name: times for name, times in _import_times.items()
+        if name not in _reported_imports
+    }
+    _reported_imports.update(new_imports)
+    top_imports = sorted(new_imports.items(), key=lambda kv: kv[1]["self_ms"], reverse=True)
+    top_sql = sorted(run["sql"].items(), key=lambda kv: kv[1], reverse=True)
+
+    report = {
+        "page": run["page"],
+        "started_at": run["started_at"],
+        "cold_start": run["cold_start"],
+        "total_ms": round(total_ms, 2),
+        "import_ms": round(sum(t["self_ms"] for t in new_imports.values()), 2),
+        "modules_imported": len(new_imports),
+        "imports": [{"module": name, **times} for name, times in top_imports[:TOP_N_IMPORTS]],
+        "cache_data": {
+            name: {**entry, "total_ms": round(entry["total_ms"], 2), "miss_ms": round(entry["miss_ms"], 2)}
+            for name, entry in sorted(run["cache"].items(), key=lambda kv: kv[1]["total_ms"], reverse=True)
+        },
+        "sql_count": run["sql_count"],
+        "sql": [{"statement": stmt, "count": count} for stmt, count in top_sql[:TOP_N_STATEMENTS]],
+    }
+
+    REPORT_DIR.mkdir(parents=True, exist_ok=True)
+    safe_name = "".join(ch if ch.isalnum() else "_" for ch in run["page"])
+    path = REPORT_DIR / f"{safe_name}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def load_report(page_name: str) -> Optional[Dict[str, Any]]:
+    """Lädt den letzten Report einer Seite."""
+    safe_name = "".join(ch if ch.isalnum() else "_" for ch in page_name)
+    path = REPORT_DIR / f"{safe_name}.json"
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,180 @@
+"""
+🗃️ Storage-Backends
+===================
+
+Austauschbare Persistenz für alle DB-Schichten (Users, Challenges, Badges,
+Aktivität, Motivation, Bandura, Lernstrategien, Coaching).
+
+Backend-Wahl über Umgebungsvariablen:
+    PULSE_STORAGE=sqlite        (Standard) bisherige SQLite-Dateien/Shards
+    PULSE_STORAGE=postgres      PostgreSQL, DSN aus PULSE_DATABASE_URL
+
+Die öffentlichen Funktionen der DB-Schichten (``get_or_create_user``,
+``create_bandura_entry``, ``save_assessment`` ...) bleiben die API für die
+Seiten. Sie sind mit ``@routed("<repository>.<methode>")`` markiert:
+- SQLite aktiv: direkter Aufruf der Funktion, kein Overhead außer einer
+  Attributabfrage
+- anderes Backend: Aufruf der Repository-Methode (siehe ``base.py``);
+  ein übergebenes ``conn`` wird ignoriert
+- Preview-User (``preview_``) bleiben immer in ihrer In-Memory-SQLite-DB
+  (``utils/preview_store.py``)
+
+Konformität beider Backends: ``python -m utils.storage.conformance``.
+"""
+
+import functools
+import inspect
+import os
+import threading
+from typing import Any, Callable, Optional
+
+from ..preview_store import is_preview_user
+from .base import (
+    ActivityRepository,
+    BadgeRepository,
+    BanduraRepository,
+    ChallengeRepository,
+    CoachingRepository,
+    LearnstratRepository,
+    MotivationRepository,
+    Storage,
+    UserRepository,
+)
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+ENV_BACKEND = "PULSE_STORAGE"
+ENV_DATABASE_URL = "PULSE_DATABASE_URL"
+
+BACKENDS = ("sqlite", "postgres")
+_ALIASES = {"postgresql": "postgres", "pg": "postgres", "sqlite3": "sqlite"}
+
+_storage: Optional[Storage] = None
+_lock = threading.Lock()
+
+
+def get_backend_name() -> str:
+    """
+    Konfiguriertes Backend (``PULSE_STORAGE``).
+
+    Raises:
+        ValueError: Bei unbekanntem Backend
+    """
+    name = os.environ.get(ENV_BACKEND, "").strip().lower() or "sqlite"
+    name = _ALIASES.get(name, name)
+    if name not in BACKENDS:
+        raise ValueError(f"Unbekanntes Storage-Backend: {name!r} (erlaubt: {', '.join(BACKENDS)})")
+    return name
+
+
+def create_storage(backend: Optional[str] = None, dsn: Optional[str] = None, **options: Any) -> Storage:
+    """
+    Erzeugt ein neues Storage-Objekt (ohne es global zu aktivieren).
+
+    Args:
+        backend: "sqlite" oder "postgres" (Standard: ``PULSE_STORAGE``)
+        dsn: PostgreSQL-DSN (Standard: ``PULSE_DATABASE_URL``)
+        **options: Backend-spezifisch, z.B. ``min_connections`` für Postgres
+    """
+    backend = _ALIASES.get(backend, backend) if backend else get_backend_name()
+    if backend == "postgres":
+        from .postgres import PostgresStorage
+        dsn = dsn or os.environ.get(ENV_DATABASE_URL)
+        if not dsn:
+            raise ValueError(f"{ENV_BACKEND}=postgres benötigt {ENV_DATABASE_URL}")
+        return PostgresStorage(dsn, **options)
+    from .sqlite import SQLiteStorage
+    return SQLiteStorage()
+
+
+def get_storage() -> Storage:
+    """Aktives Storage-Objekt (einmal pro Prozess erzeugt)."""
+    global _storage
+    if _storage is None:
+        with _lock:
+            if _storage is None:
+                _storage = create_storage()
+    return _storage
+
+
+def set_storage(storage: Optional[Storage]) -> Optional[Storage]:
+    """
+    Aktiviert ein Storage-Objekt für den Prozess (Tests, Konformitätslauf).
+
+    Returns:
+        Das bisher aktive Storage-Objekt (zum Zurücksetzen)
+    """
+    global _storage
+    with _lock:
+        previous, _storage = _storage, storage
+    return previous
+
+
+# ============================================
+# ROUTING
+# ============================================
+
+def _routing_target() -> Optional[Storage]:
+    """Storage, auf das umgeleitet wird - None für den SQLite-Direktpfad."""
+    storage = _storage
+    if storage is None:
+        if get_backend_name() == "sqlite":
+            return None
+        storage = get_storage()
+    return None if storage.backend == "sqlite" else storage
+
+
+def routed(target: str, *leading: Any) -> Callable:
+    """
+    Leitet eine DB-Funktion auf ``<repository>.<methode>`` des aktiven
+    Backends um (siehe Modul-Docstring).
+
+    Args:
+        target: z.B. "users.get_or_create"
+        *leading: Feste erste Argumente der Methode (z.B. die Challenge-ID
+                  bei gemeinsam genutzten Lernstrategie-Methoden)
+    """
+    repository, method = target.split(".")
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            storage = _routing_target()
+            if storage is None:
+                return func(*args, **kwargs)
+
+            arguments = signature.bind(*args, **kwargs).arguments
+            if is_preview_user(arguments.get("user_id")):
+                return func(*args, **kwargs)
+            arguments.pop("conn", None)
+            return getattr(getattr(storage, repository), method)(*leading, **arguments)
+
+        wrapper.storage_target = target
+        return wrapper
+
+    return decorator
+
+
+__all__ = [
+    "ENV_BACKEND",
+    "ENV_DATABASE_URL",
+    "BACKENDS",
+    "Storage",
+    "UserRepository",
+    "ChallengeRepository",
+    "BadgeRepository",
+    "ActivityRepository",
+    "MotivationRepository",
+    "BanduraRepository",
+    "LearnstratRepository",
+    "CoachingRepository",
+    "get_backend_name",
+    "create_storage",
+    "get_storage",
+    "set_storage",
+    "routed",
+]
@@ -0,0 +1,348 @@
+"""
+🧩 Storage-Schnittstellen
+=========================
+
+Repository-Interfaces für alle persistenten Daten der App. Jede Methode
+entspricht einer bestehenden Funktion der DB-Schichten (gleiche Parameter
+ohne ``conn``, gleiche Rückgabe) - die Funktionen werden über
+``utils.storage.routed`` auf das aktive Backend umgeleitet.
+
+Implementierungen:
+- ``utils/storage/sqlite.py``: bisherige SQLite-Dateien (Standard)
+- ``utils/storage/postgres.py``: PostgreSQL mit Connection-Pool
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# ============================================
+# GAMIFICATION
+# ============================================
+
+class UserRepository(ABC):
+    """``users`` (gamification_db + user_system)."""
+
+    @abstractmethod
+    def get_version(self, user_id: str) -> Optional[int]:
+        """version-Spalte (None = User unbekannt)."""
+
+    @abstractmethod
+    def get_or_create(self, user_id: str, username: str = "Lernender") -> Dict[str, Any]:
+        """Holt oder erstellt einen User."""
+
+    @abstractmethod
+    def update_stats(self, user_id: str, xp_delta: int, streak: int) -> Dict[str, Any]:
+        """Addiert XP, setzt Streak/Level und gibt die neue Zeile zurück."""
+
+    @abstractmethod
+    def get_or_create_by_name(self, display_name: str, age_group: str = None,
+                              avatar_style: str = None) -> Dict[str, Any]:
+        """Login über den Anzeigenamen."""
+
+    @abstractmethod
+    def update_avatar(self, user_id: str, avatar_settings: Dict) -> bool:
+        """Speichert die Avatar-Einstellungen."""
+
+    @abstractmethod
+    def update_age_group(self, user_id: str, age_group: str) -> bool:
+        """Speichert die Altersstufe."""
+
+    @abstractmethod
+    def get_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Vollständige User-Zeile oder None."""
+
+    @abstractmethod
+    def get_all(self) -> List[Dict[str, Any]]:
+        """Alle registrierten User (mit Anzeigenamen), zuletzt eingeloggt zuerst."""
+
+
+class ChallengeRepository(ABC):
+    """Hattie-Challenges (Vorhersage -> Ergebnis)."""
+
+    @abstractmethod
+    def create(self, user_id: str, subject: str, prediction: int, task_description: str = "") -> int:
+        """Legt eine offene Challenge an und gibt ihre ID zurück."""
+
+    @abstractmethod
+    def complete(self, challenge_id: int, actual_result: int, reflection: str = "",
+                 user_id: Optional[str] = None) -> Dict[str, Any]:
+        """Schließt eine Challenge ab (XP, Streak, Activity-Log, User-Stats)."""
+
+    @abstractmethod
+    def get_recent(self, user_id: str, limit: int = 20) -> List[Dict]:
+        """Letzte Challenges, neueste zuerst."""
+
+    @abstractmethod
+    def get_open(self, user_id: str) -> List[Dict]:
+        """Nicht abgeschlossene Challenges."""
+
+    @abstractmethod
+    def get_user_stats(self, user_id: str, user: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """User-Zeile (bzw. ``user``) plus Challenge-Statistiken."""
+
+
+class BadgeRepository(ABC):
+    """Gamification-Badges (``user_badges``)."""
+
+    @abstractmethod
+    def get_user_badges(self, user_id: str) -> List[Dict]:
+        """Verdiente Badges, neueste zuerst."""
+
+    @abstractmethod
+    def award(self, user_id: str, badge_id: str) -> bool:
+        """True, wenn das Badge neu vergeben wurde."""
+
+
+class ActivityRepository(ABC):
+    """Aktivitäts-Heatmaps (Challenges und Motivation)."""
+
+    @abstractmethod
+    def get_challenge_heatmap(self, user_id: str, days: int = 90) -> List[Dict]:
+        """Abgeschlossene Challenges pro Tag."""
+
+    @abstractmethod
+    def log_motivation(self, user_id: str, challenge_id: str, grundbeduerfnis: str, xp_earned: int) -> None:
+        """Eintrag im Motivations-Aktivitätslog."""
+
+    @abstractmethod
+    def get_motivation_heatmap(self, user_id: str, weeks: int = 12) -> List[Dict[str, Any]]:
+        """Motivations-Aktivität pro Tag und Grundbedürfnis (inkl. Tages-Aggregate)."""
+
+    @abstractmethod
+    def get_daily_summary(self, user_id: str, target_date: date = None) -> Dict[str, Any]:
+        """Motivations-Aktivität eines Tages."""
+
+
+# ============================================
+# MOTIVATION, BANDURA, LERNSTRATEGIEN
+# ============================================
+
+class MotivationRepository(ABC):
+    """Motivation-Challenges (SDT): Fortschritt, Skill-Tree, Streaks, Badges, Zertifikate."""
+
+    @abstractmethod
+    def save_challenge_progress(self, user_id: str, challenge_id: str, age_group: str,
+                                grundbeduerfnis: str, phase: str = "intro", user_input: str = None,
+                                reflection: str = None, rating: int = None, xp_earned: int = 0,
+                                completed: bool = False) -> int:
+        """Speichert oder aktualisiert den Challenge-Fortschritt."""
+
+    @abstractmethod
+    def get_challenge_progress(self, user_id: str, challenge_id: str, age_group: str) -> Optional[Dict[str, Any]]:
+        """Aktueller Fortschritt einer Challenge."""
+
+    @abstractmethod
+    def get_completed_challenges(self, user_id: str, age_group: str = None,
+                                 grundbeduerfnis: str = None) -> List[Dict[str, Any]]:
+        """Abgeschlossene Challenges (optional gefiltert)."""
+
+    @abstractmethod
+    def count_completed_challenges(self, user_id: str, age_group: str = None,
+                                   grundbeduerfnis: str = None) -> int:
+        """Anzahl verschiedener abgeschlossener Challenges."""
+
+    @abstractmethod
+    def get_or_create_sdt_progress(self, user_id: str) -> Dict[str, Any]:
+        """SDT-Level und -XP."""
+
+    @abstractmethod
+    def update_sdt_progress(self, user_id: str, grundbeduerfnis: str, xp_earned: int) -> Dict[str, Any]:
+        """Bucht XP auf ein Grundbedürfnis (mit Level-Up-Info)."""
+
+    @abstractmethod
+    def get_or_create_streak(self, user_id: str) -> Dict[str, Any]:
+        """Streak-Daten."""
+
+    @abstractmethod
+    def update_streak(self, user_id: str) -> Dict[str, Any]:
+        """Streak nach einer Aktivität fortschreiben (mit Freeze)."""
+
+    @abstractmethod
+    def add_streak_freeze(self, user_id: str, count: int = 1) -> int:
+        """Neue Anzahl verfügbarer Freezes."""
+
+    @abstractmethod
+    def award_badge(self, user_id: str, badge_id: str) -> bool:
+        """True, wenn das Badge neu vergeben wurde."""
+
+    @abstractmethod
+    def get_user_badges(self, user_id: str) -> List[Dict[str, Any]]:
+        """Motivations-Badges, älteste zuerst."""
+
+    @abstractmethod
+    def has_badge(self, user_id: str, badge_id: str) -> bool:
+        """Prüft ein einzelnes Badge."""
+
+    @abstractmethod
+    def issue_certificate(self, user_id: str, certificate_type: str, age_group: str,
+                          challenges_completed: List[str], total_xp: int) -> int:
+        """Stellt ein Zertifikat aus und gibt seine ID zurück."""
+
+    @abstractmethod
+    def get_user_certificates(self, user_id: str) -> List[Dict[str, Any]]:
+        """Zertifikate, neueste zuerst."""
+
+    @abstractmethod
+    def load_snapshot(self, user_id: str):
+        """``MotivationSnapshot`` mit allen Daten eines Reruns."""
+
+    @abstractmethod
+    def reset_user_data(self, user_id: str) -> None:
+        """Löscht alle Motivations-Daten eines Users."""
+
+
+class BanduraRepository(ABC):
+    """Bandura-Tagebuch (vier Quellen der Selbstwirksamkeit)."""
+
+    @abstractmethod
+    def create_entry(self, user_id: str, source_type: str, description: str) -> Dict[str, Any]:
+        """Neuer Eintrag inkl. XP, Tagesbonus, Streak und User-Level."""
+
+    @abstractmethod
+    def get_stats(self, user_id: str) -> Dict[str, Any]:
+        """Einträge pro Quelle, Tage mit allen vier Quellen, Streaks."""
+
+    @abstractmethod
+    def get_entries(self, user_id: str, limit: int = 10) -> List[Dict]:
+        """Letzte Einträge."""
+
+    @abstractmethod
+    def get_entries_by_source(self, user_id: str) -> Dict[str, List[Dict]]:
+        """Alle Einträge gruppiert nach Quelle."""
+
+
+class LearnstratRepository(ABC):
+    """Lernstrategie-Challenges (Powertechniken, Transfer, Birkenbihl)."""
+
+    @abstractmethod
+    def save_technique_progress(self, user_id: str, technique_id: str, rating: int, xp: int) -> None:
+        """Powertechniken: Technik abgeschlossen."""
+
+    @abstractmethod
+    def get_progress(self, user_id: str, challenge_id: str = "powertechniken") -> List[Dict]:
+        """Abgeschlossene Techniken/Phasen (technique_id, rating, xp_earned, completed_at)."""
+
+    @abstractmethod
+    def save_phase_progress(self, challenge_id: str, user_id: str, phase_id: str,
+                            xp: int, response: str = "") -> None:
+        """Transfer/Birkenbihl: Phase abgeschlossen."""
+
+    @abstractmethod
+    def get_phase_progress(self, challenge_id: str, user_id: str) -> List[Dict]:
+        """Abgeschlossene Phasen (phase_id, xp_earned, response, completed_at)."""
+
+    @abstractmethod
+    def save_top3(self, user_id: str, top3: List[str]) -> None:
+        """Top-3-Lerntechniken."""
+
+    @abstractmethod
+    def get_top3(self, user_id: str) -> Optional[List[str]]:
+        """Top-3-Lerntechniken oder None."""
+
+
+# ============================================
+# COACHING
+# ============================================
+
+class CoachingRepository(ABC):
+    """Schüler, Assessments, Förderpläne und Fortschritts-Logs (``coaching.db``)."""
+
+    @abstractmethod
+    def create_student(self, student_code: str, class_name: str = None, notes: str = None) -> Optional[int]:
+        """Neuer Schüler (None bei Fehler, z.B. doppelter Code)."""
+
+    @abstractmethod
+    def get_student(self, student_id: int) -> Optional[Dict]:
+        """Schüler-Dict oder None."""
+
+    @abstractmethod
+    def get_all_students(self, active_only: bool = True):
+        """Alle Schüler als DataFrame."""
+
+    @abstractmethod
+    def search_students(self, term: str = "", class_name: Optional[str] = None,
+                        limit: int = 20, active_only: bool = True) -> List[Dict[str, Any]]:
+        """Fehlertolerante Suche, beste Treffer zuerst (mit "score")."""
+
+    @abstractmethod
+    def get_classes(self, active_only: bool = True) -> List[str]:
+        """Alle Klassen."""
+
+    @abstractmethod
+    def save_assessment(self, student_id: int, results_dict: Dict, notes: str = None) -> Optional[int]:
+        """Speichert ein Screening (komprimiert, mit Score-Header)."""
+
+    @abstractmethod
+    def save_draft_responses(self, drafts: Dict[int, Dict[str, Any]]) -> int:
+        """Upsert der Entwurfs-Antworten mehrerer Schüler in einer Transaktion."""
+
+    @abstractmethod
+    def get_draft(self, student_id: int) -> Optional[Dict]:
+        """Laufendes Screening (responses, context, updated_at) oder None."""
+
+    @abstractmethod
+    def discard_draft(self, student_id: int) -> int:
+        """Löscht den Entwurf eines Schülers."""
+
+    @abstractmethod
+    def promote_draft(self, student_id: int, results_dict: Dict, notes: str = None) -> Optional[int]:
+        """Speichert das Assessment und löscht den Entwurf in einer Transaktion."""
+
+    @abstractmethod
+    def get_latest_assessment(self, student_id: int, include_results: bool = True) -> Optional[Dict]:
+        """Neuestes Assessment."""
+
+    @abstractmethod
+    def get_all_assessments(self, student_id: int, include_results: bool = False,
+                            limit: Optional[int] = None) -> List[Dict]:
+        """Assessments, neueste zuerst."""
+
+    @abstractmethod
+    def get_assessment_results(self, assessment_id: int) -> Optional[Dict]:
+        """Vollständige Ergebnisse eines Assessments."""
+
+    @abstractmethod
+    def get_student_summary(self, student_id: int) -> Dict:
+        """Dashboard-Kennzahlen eines Schülers."""
+
+    @abstractmethod
+    def save_development_plan(self, student_id: int, assessment_id: int,
+                              interventions: Dict, goals: str = None) -> Optional[int]:
+        """Neuer Förderplan."""
+
+    @abstractmethod
+    def log_progress(self, student_id: int, plan_id: int, activity_type: str,
+                     content: str, outcome: str = None) -> Optional[int]:
+        """Neuer Fortschritts-Eintrag."""
+
+    @abstractmethod
+    def get_timeline_page(self, student_id: int, after: Optional[str] = None,
+                          limit: int = 20) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Eine Seite der Coaching-Timeline (Keyset-Cursor)."""
+
+
+# ============================================
+# CONTAINER
+# ============================================
+
+@dataclass
+class Storage:
+    """Alle Repositories eines Backends."""
+    backend: str
+    users: UserRepository
+    challenges: ChallengeRepository
+    badges: BadgeRepository
+    activity: ActivityRepository
+    motivation: MotivationRepository
+    bandura: BanduraRepository
+    learnstrat: LearnstratRepository
+    coaching: CoachingRepository
+
+    def migrate(self) -> None:
+        """Schema des Backends anlegen/aktualisieren (Standard: nichts zu tun)."""
+
+    def close(self) -> None:
+        """Verbindungen freigeben (Standard: nichts zu tun)."""
@@ -0,0 +1,359 @@
+"""
+🔁 Storage-Konformität
+======================
+
+Spielt dasselbe Szenario (Users, Challenges, Badges, Aktivität, Motivation,
+Bandura, Lernstrategien, Coaching) gegen das SQLite- und das
+PostgreSQL-Backend und vergleicht die Ergebnisse Schritt für Schritt.
+IDs und Zeitstempel werden vor dem Vergleich entfernt.
+
+- SQLite läuft in einem temporären Shard (``PULSE_SHARD_DIR``), die
+  Standard-Datenbanken bleiben unberührt.
+- Postgres läuft in einem temporären Schema, das danach gelöscht wird.
+  Ohne DSN startet ``pg_bootstrap.temporary_cluster()`` einen
+  Wegwerf-Cluster per ``initdb``/``pg_ctl`` - beide Backends laufen so
+  ohne weitere Einrichtung.
+
+Zusätzlich wird geprüft, dass jedes ``@routed``-Ziel als Repository-Methode
+existiert.
+
+Verwendung:
+    python -m utils.storage.conformance
+    python -m utils.storage.conformance --postgres postgresql://user@host/db
+    PULSE_DATABASE_URL=... python -m utils.storage.conformance
+"""
+
+import argparse
+import dataclasses
+import inspect
+import json
+import math
+import os
+import sys
+import tempfile
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .. import shards
+from . import ENV_DATABASE_URL, Storage, create_storage
+from .pg_bootstrap import PostgresBootstrapError, temporary_cluster
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+# Backend-abhängige Werte (IDs, Zeitstempel, Cursor)
+VOLATILE_KEYS = {
+    "id", "entry_id", "student_id", "assessment_id", "plan_id", "request_id",
+    "created_at", "created_date", "updated_at", "earned_at", "completed_at", "issued_at",
+    "last_login", "assessment_date", "log_date", "time", "data_version",
+    "first_assessment", "last_assessment", "last_progress_log",
+}
+
+ROUTED_MODULES = [
+    "utils.gamification_db",
+    "utils.user_system",
+    "utils.bandura_sources_widget",
+    "utils.motivation_challenges.motivation_db",
+    "utils.learnstrat_challenges.powertechniken_widget",
+    "utils.learnstrat_challenges.transfer_widget",
+    "utils.learnstrat_challenges.birkenbihl_widget",
+    "utils.coaching_db",
+    "utils.student_search",
+    "utils.coaching_timeline",
+]
+
+USER = "conformance_user"
+
+
+# ============================================
+# SZENARIO
+# ============================================
+
+def run_scenario(storage: Storage) -> List[Tuple[str, Any]]:
+    """Führt alle Schritte aus und liefert [(Schritt, Ergebnis)]."""
+    steps: List[Tuple[str, Any]] = []
+
+    def step(name: str, func: Callable[[], Any]) -> Any:
+        try:
+            result = func()
+        except Exception as e:
+            result = f"{type(e).__name__}: {e}"
+        steps.append((name, result))
+        return result
+
+    users, challenges, badges = storage.users, storage.challenges, storage.badges
+    activity, motivation, bandura = storage.activity, storage.motivation, storage.bandura
+    learnstrat, coaching = storage.learnstrat, storage.coaching
+
+    # Users
+    step("users.get_or_create", lambda: users.get_or_create(USER))
+    step("users.update_stats", lambda: users.update_stats(USER, 30, 2))
+    step("users.get_version", lambda: users.get_version(USER))
+    named = step("users.get_or_create_by_name", lambda: users.get_or_create_by_name("Konform Kind", "unterstufe"))
+    step("users.get_or_create_by_name (vorhanden)", lambda: users.get_or_create_by_name(" Konform Kind ", "mittelstufe"))
+    named_id = named["user_id"] if isinstance(named, dict) else USER
+    step("users.update_avatar", lambda: users.update_avatar(named_id, {"style": "adventurer", "seed": "x"}))
+    step("users.update_age_group", lambda: users.update_age_group(named_id, "oberstufe"))
+    step("users.get_by_id", lambda: users.get_by_id(named_id))
+    step("users.get_all", lambda: users.get_all())
+
+    # Challenges
+    first = step("challenges.create", lambda: challenges.create(USER, "Mathe", 3, "Bruchrechnung"))
+    step("challenges.complete", lambda: challenges.complete(first, 4, "besser als gedacht"))
+    step("challenges.complete (doppelt)", lambda: challenges.complete(first, 4))
+    note = step("challenges.create (Note)", lambda: challenges.create(USER, "Deutsch", 2, "[note] Diktat"))
+    step("challenges.complete (Note)", lambda: challenges.complete(note, 3))
+    step("challenges.create (offen)", lambda: challenges.create(USER, "Bio", 5))
+    step("challenges.get_recent", lambda: challenges.get_recent(USER))
+    step("challenges.get_open", lambda: challenges.get_open(USER))
+    step("challenges.get_user_stats", lambda: challenges.get_user_stats(USER))
+    step("activity.get_challenge_heatmap", lambda: activity.get_challenge_heatmap(USER))
+
+    # Badges
+    step("badges.award", lambda: badges.award(USER, "first_challenge"))
+    step("badges.award (doppelt)", lambda: badges.award(USER, "first_challenge"))
+    step("badges.get_user_badges", lambda: badges.get_user_badges(USER))
+
+    # Motivation
+    step("motivation.save_challenge_progress", lambda: bool(motivation.save_challenge_progress(
+        USER, "m_auto_1", "unterstufe", "autonomie", phase="task", user_input="Plan")))
+    step("motivation.save_challenge_progress (fertig)", lambda: bool(motivation.save_challenge_progress(
+        USER, "m_auto_1", "unterstufe", "autonomie", phase="done", reflection="gut",
+        rating=4, xp_earned=120, completed=True)))
+    step("motivation.get_challenge_progress",
+         lambda: motivation.get_challenge_progress(USER, "m_auto_1", "unterstufe"))
+    step("motivation.get_completed_challenges", lambda: motivation.get_completed_challenges(USER))
+    step("motivation.count_completed_challenges",
+         lambda: motivation.count_completed_challenges(USER, age_group="unterstufe"))
+    step("motivation.get_or_create_sdt_progress", lambda: motivation.get_or_create_sdt_progress(USER))
+    step("motivation.update_sdt_progress", lambda: motivation.update_sdt_progress(USER, "autonomie", 120))
+    step("motivation.update_sdt_progress (2)", lambda: motivation.update_sdt_progress(USER, "kompetenz", 40))
+    step("motivation.get_or_create_streak", lambda: motivation.get_or_create_streak(USER))
+    step("motivation.update_streak", lambda: motivation.update_streak(USER))
+    step("motivation.update_streak (gleicher Tag)", lambda: motivation.update_streak(USER))
+    step("motivation.add_streak_freeze", lambda: motivation.add_streak_freeze(USER, 2))
+    step("motivation.award_badge", lambda: motivation.award_badge(USER, "autonomie_starter"))
+    step("motivation.award_badge (doppelt)", lambda: motivation.award_badge(USER, "autonomie_starter"))
+    step("motivation.has_badge", lambda: motivation.has_badge(USER, "autonomie_starter"))
+    step("motivation.get_user_badges", lambda: motivation.get_user_badges(USER))
+    step("motivation.issue_certificate", lambda: bool(motivation.issue_certificate(
+        USER, "unterstufe_complete", "unterstufe", ["m_auto_1"], 120)))
+    step("motivation.get_user_certificates", lambda: motivation.get_user_certificates(USER))
+    step("activity.log_motivation", lambda: activity.log_motivation(USER, "m_auto_1", "autonomie", 120))
+    step("activity.get_motivation_heatmap", lambda: activity.get_motivation_heatmap(USER))
+    step("activity.get_daily_summary", lambda: activity.get_daily_summary(USER))
+    step("motivation.load_snapshot", lambda: dataclasses.asdict(motivation.load_snapshot(USER)))
+    step("motivation.reset_user_data", lambda: motivation.reset_user_data(USER))
+    step("motivation.load_snapshot (leer)", lambda: dataclasses.asdict(motivation.load_snapshot(USER)))
+
+    # Bandura
+    for source in ("mastery", "vicarious", "persuasion", "physiological"):
+        step(f"bandura.create_entry ({source})", lambda source=source: bandura.create_entry(
+            USER, source, f"Heute habe ich etwas zu {source} erlebt und aufgeschrieben."))
+    step("bandura.create_entry (5.)", lambda: bandura.create_entry(USER, "mastery", "kurz"))
+    step("bandura.get_stats", lambda: bandura.get_stats(USER))
+    step("bandura.get_entries", lambda: bandura.get_entries(USER, limit=3))
+    step("bandura.get_entries_by_source", lambda: bandura.get_entries_by_source(USER))
+
+    # Lernstrategien
+    step("learnstrat.save_technique_progress", lambda: learnstrat.save_technique_progress(USER, "pomodoro", 3, 10))
+    step("learnstrat.save_technique_progress (update)",
+         lambda: learnstrat.save_technique_progress(USER, "pomodoro", 5, 15))
+    step("learnstrat.get_progress", lambda: learnstrat.get_progress(USER))
+    step("learnstrat.save_phase_progress", lambda: learnstrat.save_phase_progress("transfer", USER, "phase_1", 20, "Antwort"))
+    step("learnstrat.get_phase_progress", lambda: learnstrat.get_phase_progress("transfer", USER))
+    step("learnstrat.get_phase_progress (leer)", lambda: learnstrat.get_phase_progress("birkenbihl", USER))
+    step("learnstrat.save_top3", lambda: learnstrat.save_top3(USER, ["pomodoro", "feynman"]))
+    step("learnstrat.save_top3 (update)", lambda: learnstrat.save_top3(USER, ["feynman", "loci", "pomodoro"]))
+    step("learnstrat.get_top3", lambda: learnstrat.get_top3(USER))
+
+    # Coaching
+    student = step("coaching.create_student", lambda: coaching.create_student("Max_M", "7a", "neu"))
+    step("coaching.create_student (2)", lambda: bool(coaching.create_student("Mia_K", "7a")))
+    step("coaching.create_student (3)", lambda: bool(coaching.create_student("Tom_B", "8b")))
+    step("coaching.create_student (doppelt)", lambda: coaching.create_student("Max_M", "7a"))
+    step("coaching.get_student", lambda: coaching.get_student(student))
+    step("coaching.get_all_students", lambda: coaching.get_all_students().to_dict("records"))
+    step("coaching.get_classes", lambda: coaching.get_classes())
+    for term in ("", "ma", "7a", "_k", "Mxa_M"):
+        step(f"coaching.search_students ({term!r})", lambda term=term: coaching.search_students(term))
+    step("coaching.search_students (Klasse 8b)", lambda: coaching.search_students("", class_name="8b"))
+
+    results = {
+        "scales": {"MATHEFF": {"score": 2.75, "interpretation": "mittel"}},
+        "item_responses": {"ST290Q01": 3, "ST290Q02": 2},
+    }
+    assessment = step("coaching.save_assessment", lambda: coaching.save_assessment(student, results, "Erstgespräch"))
+    step("coaching.get_latest_assessment", lambda: coaching.get_latest_assessment(student))
+    step("coaching.get_all_assessments", lambda: coaching.get_all_assessments(student))
+    step("coaching.get_assessment_results", lambda: coaching.get_assessment_results(assessment))
+
+    # Entwürfe laufender Screenings (Autosave)
+    step("coaching.get_draft (leer)", lambda: coaching.get_draft(student))
+    step("coaching.save_draft_responses", lambda: coaching.save_draft_responses({
+        student: {"@context": {"screening_level": 1, "scales": ["MATHEFF"]}, "ST290Q01": "3", "ST290Q02": 2},
+    }))
+    step("coaching.save_draft_responses (update)", lambda: coaching.save_draft_responses({student: {"ST290Q02": 4}}))
+    step("coaching.get_draft", lambda: coaching.get_draft(student))
+    step("coaching.promote_draft", lambda: bool(coaching.promote_draft(student, results, "Autosave")))
+    step("coaching.get_draft (nach promote_draft)", lambda: coaching.get_draft(student))
+    step("coaching.save_draft_responses (neu)", lambda: coaching.save_draft_responses({student: {"ST290Q01": "1"}}))
+    step("coaching.discard_draft", lambda: coaching.discard_draft(student))
+    step("coaching.get_draft (verworfen)", lambda: coaching.get_draft(student))
+    plan = step("coaching.save_development_plan", lambda: coaching.save_development_plan(
+        student, assessment, {"MATHEFF": ["Lernplan"]}, "Selbstwirksamkeit stärken"))
+    for i in range(3):
+        step(f"coaching.log_progress ({i})", lambda i=i: bool(coaching.log_progress(
+            student, plan, "gespraech", f"Termin {i}", "positiv")))
+    step("coaching.get_student_summary", lambda: coaching.get_student_summary(student))
+
+    cursors: List[Optional[str]] = []
+
+    def timeline(after: Optional[str] = None) -> Tuple[List[Dict[str, Any]], bool]:
+        entries, cursor = coaching.get_timeline_page(student, after=after, limit=3)
+        cursors.append(cursor)
+        return entries, cursor is not None
+
+    step("coaching.get_timeline_page", timeline)
+    if cursors and cursors[-1]:
+        step("coaching.get_timeline_page (2)", lambda: timeline(cursors[-1]))
+
+    return steps
+
+
+# ============================================
+# VERGLEICH
+# ============================================
+
+def normalize(value: Any) -> Any:
+    """Entfernt backend-abhängige Werte (IDs, Zeitstempel) für den Vergleich."""
+    if isinstance(value, dict):
+        return {k: normalize(v) for k, v in value.items() if k not in VOLATILE_KEYS}
+    if isinstance(value, (list, tuple)):
+        items = [normalize(v) for v in value]
+        if items and all(isinstance(v, str) for v in items):
+            return sorted(items)
+        return items
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, float) and math.isnan(value):  # pandas: fehlender Wert
+        return None
+    if isinstance(value, (bool, int, float)):  # SQLite liefert Flags als 0/1
+        return round(float(value), 6)
+    if hasattr(value, "item"):
+        return normalize(value.item())
+    return str(value)
+
+
+def compare(left: List[Tuple[str, Any]], right: List[Tuple[str, Any]]) -> List[Dict[str, Any]]:
+    """Schrittweiser Vergleich zweier Szenario-Läufe."""
+    report = []
+    for (name, a), (_, b) in zip(left, right):
+        a, b = normalize(a), normalize(b)
+        report.append({"step": name, "ok": a == b, "sqlite": a, "postgres": b})
+    if len(left) != len(right):
+        report.append({"step": "Anzahl Schritte", "ok": False, "sqlite": len(left), "postgres": len(right)})
+    return report
+
+
+def check_routing() -> List[str]:
+    """Alle ``@routed``-Ziele, die es im Storage-Interface nicht gibt."""
+    import importlib
+
+    from . import base
+
+    repositories = {f.name: f.type for f in dataclasses.fields(base.Storage) if f.name != "backend"}
+    repository_types = {name: getattr(base, annotation) if isinstance(annotation, str) else annotation
+                        for name, annotation in repositories.items()}
+
+    missing = []
+    for module_name in ROUTED_MODULES:
+        module = importlib.import_module(module_name)
+        for name, func in inspect.getmembers(module, inspect.isfunction):
+            target = getattr(func, "storage_target", None)
+            if target is None:
+                continue
+            repository, method = target.split(".")
+            if repository not in repository_types or not hasattr(repository_types[repository], method):
+                missing.append(f"{module_name}.{name} -> {target}")
+    return missing
+
+
+# ============================================
+# BACKENDS
+# ============================================
+
+def run_sqlite() -> List[Tuple[str, Any]]:
+    """Szenario in einem temporären SQLite-Shard."""
+    with tempfile.TemporaryDirectory(prefix="pulse_conformance_") as shard_dir:
+        previous = os.environ.get("PULSE_SHARD_DIR")
+        os.environ["PULSE_SHARD_DIR"] = shard_dir
+        try:
+            school = f"conformance-{uuid.uuid4().hex[:8]}"
+            shards.provision_school(school)
+            with shards.use_school(school):
+                storage = create_storage("sqlite")
+                storage.migrate()
+                return run_scenario(storage)
+        finally:
+            if previous is None:
+                os.environ.pop("PULSE_SHARD_DIR", None)
+            else:
+                os.environ["PULSE_SHARD_DIR"] = previous
+
+
+def run_postgres(dsn: str) -> List[Tuple[str, Any]]:
+    """Szenario in einem temporären Postgres-Schema (wird danach gelöscht)."""
+    schema = f"pulse_conformance_{uuid.uuid4().hex[:8]}"
+    storage = create_storage("postgres", dsn, schema=schema)
+    try:
+        with shards.use_school(shards.DEFAULT_SCHOOL):
+            storage.migrate()
+            return run_scenario(storage)
+    finally:
+        storage.pool.drop_schema(schema)
+        storage.close()
+
+
+def print_report(report: List[Dict[str, Any]], missing_targets: List[str]) -> None:
+    for entry in report:
+        print(f"{'✓' if entry['ok'] else '✗'} {entry['step']}")
+        if not entry["ok"]:
+            print(f"    sqlite:   {json.dumps(entry['sqlite'], ensure_ascii=False, default=str)}")
+            print(f"    postgres: {json.dumps(entry['postgres'], ensure_ascii=False, default=str)}")
+    for target in missing_targets:
+        print(f"✗ Routing-Ziel fehlt: {target}")
+    identical = sum(entry["ok"] for entry in report)
+    print(f"\n{identical}/{len(report)} Schritte identisch, {len(missing_targets)} fehlende Routing-Ziele")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Konformität SQLite <-> PostgreSQL")
+    parser.add_argument("--postgres", default=os.environ.get(ENV_DATABASE_URL),
+                        help=f"PostgreSQL-DSN (Standard: {ENV_DATABASE_URL}, "
+                             f"sonst temporärer Cluster per initdb)")
+    args = parser.parse_args(argv)
+
+    if args.postgres:
+        return run_comparison(args.postgres)
+    try:
+        with temporary_cluster() as dsn:
+            print("Kein PostgreSQL-DSN - temporären Cluster gestartet", file=sys.stderr)
+            return run_comparison(dsn)
+    except PostgresBootstrapError as e:
+        print(f"Kein PostgreSQL-DSN ({ENV_DATABASE_URL}) und kein temporärer Cluster: {e}",
+              file=sys.stderr)
+        return 2
+
+
+def run_comparison(dsn: str) -> int:
+    """Vergleicht beide Backends und gibt den Exit-Code zurück."""
+    missing_targets = check_routing()
+    report = compare(run_sqlite(), run_postgres(dsn))
+    print_report(report, missing_targets)
+    return 0 if all(entry["ok"] for entry in report) and not missing_targets else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+🐘 Temporärer PostgreSQL-Cluster
+================================
+
+Startet einen Wegwerf-Cluster per ``initdb``/``pg_ctl`` - für
+``python -m utils.storage.conformance`` ohne ``PULSE_DATABASE_URL``.
+Datenverzeichnis und Unix-Socket liegen in einem temporären Verzeichnis,
+der Server lauscht nur auf dem Socket (kein TCP-Port, keine Konflikte mit
+einer laufenden Instanz) und wird danach gestoppt und gelöscht.
+
+Gesucht werden die Programme in:
+1. ``PULSE_PG_BIN`` (Verzeichnis mit ``initdb`` und ``pg_ctl``)
+2. ``PATH``
+3. ``pg_config --bindir``
+4. ``/usr/lib/postgresql/<version>/bin`` (Debian/Ubuntu, neueste Version)
+
+``initdb`` startet nicht als root - dann als normaler Benutzer ausführen
+oder einen DSN übergeben.
+
+Verwendung:
+    with temporary_cluster() as dsn:
+        storage = create_storage("postgres", dsn)
+"""
+
+import glob
+import os
+import shutil
+import subprocess
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+ENV_PG_BIN = "PULSE_PG_BIN"
+START_TIMEOUT = 30
+
+# Nur Unix-Socket: die Portnummer benennt lediglich die Socket-Datei
+SOCKET_PORT = 5432
+
+
+class PostgresBootstrapError(RuntimeError):
+    """Der temporäre Cluster konnte nicht gestartet werden."""
+
+
+# ============================================
+# PROGRAMME FINDEN
+# ============================================
+
+def _version_key(bin_dir: str) -> Tuple[int, ...]:
+    """``/usr/lib/postgresql/16/bin`` -> (16,)"""
+    version = Path(bin_dir).parent.name
+    return tuple(int(part) for part in version.split(".") if part.isdigit())
+
+
+def _candidate_dirs() -> List[Path]:
+    dirs = []
+    if os.environ.get(ENV_PG_BIN):
+        dirs.append(Path(os.environ[ENV_PG_BIN]))
+    dirs.extend(Path(p) for p in os.environ.get("PATH", "").split(os.pathsep) if p)
+
+    pg_config = shutil.which("pg_config")
+    if pg_config:
+        try:
+            bindir = subprocess.run([pg_config, "--bindir"], capture_output=True,
+                                    text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            bindir = ""
+        if bindir:
+            dirs.append(Path(bindir))
+
+    dirs.extend(Path(p) for p in sorted(glob.glob("/usr/lib/postgresql/*/bin"),
+                                        key=_version_key, reverse=True))
+    return dirs
+
+
+def find_pg_binary(name: str) -> Optional[str]:
+    """Pfad zu einem PostgreSQL-Programm (oder None)."""
+    for directory in _candidate_dirs():
+        candidate = directory / name
+        if candidate.is_file() and os.access(candidate, os.X_OK):
+            return str(candidate)
+    return None
+
+
+# ============================================
+# CLUSTER
+# ============================================
+
+def _run(command: List[str]) -> None:
+    try:
+        subprocess.run(command, capture_output=True, text=True, check=True)
+    except subprocess.CalledProcessError as e:
+        output = (e.stderr or e.stdout or "").strip().splitlines()[-5:]
+        raise PostgresBootstrapError(f"{Path(command[0]).name} fehlgeschlagen: {' '.join(output)}") from e
+
+
+@contextmanager
+def temporary_cluster() -> Iterator[str]:
+    """
+    Startet einen temporären Cluster und liefert seinen DSN.
+
+    Raises:
+        PostgresBootstrapError: Als root, ohne ``initdb``/``pg_ctl`` oder
+            wenn der Server nicht startet
+    """
+    if hasattr(os, "geteuid") and os.geteuid() == 0:
+        raise PostgresBootstrapError("initdb läuft nicht als root - DSN übergeben "
+                                     "oder als normaler Benutzer starten")
+    initdb, pg_ctl = find_pg_binary("initdb"), find_pg_binary("pg_ctl")
+    if not initdb or not pg_ctl:
+        raise PostgresBootstrapError(f"initdb/pg_ctl nicht gefunden - PostgreSQL installieren "
+                                     f"oder {ENV_PG_BIN} setzen")
+
+    with tempfile.TemporaryDirectory(prefix="pulse_pg_") as tmp:
+        data_dir = os.path.join(tmp, "data")
+        _run([initdb, "-D", data_dir, "-U", "postgres", "-A", "trust", "-E", "UTF8", "-N"])
+        _run([pg_ctl, "-D", data_dir, "-l", os.path.join(tmp, "server.log"),
+              "-o", f"-c listen_addresses='' -k {tmp} -p {SOCKET_PORT} -c fsync=off",
+              "-w", "-t", str(START_TIMEOUT), "start"])
+        try:
+            yield f"host={tmp} port={SOCKET_PORT} user=postgres dbname=postgres"
+        finally:
+            subprocess.run([pg_ctl, "-D", data_dir, "-m", "fast", "-w", "stop"],
+                           capture_output=True)
@@ -0,0 +1,1736 @@
+"""
+🐘 PostgreSQL-Backend
+=====================
+
+Alle Repositories auf einer PostgreSQL-Datenbank (``PULSE_STORAGE=postgres``,
+DSN in ``PULSE_DATABASE_URL``).
+
+Verbindungen:
+- ``ThreadedConnectionPool`` (``PULSE_PG_POOL_MIN``/``PULSE_PG_POOL_MAX``).
+  Ist der Pool ausgeschöpft, wartet ein Aufruf bis zu ``POOL_TIMEOUT``
+  Sekunden auf eine freie Verbindung statt sofort zu scheitern.
+- Jede Repository-Methode ist genau eine Transaktion. Lese-Ändere-Schreib-
+  Abläufe (XP, Streaks, SDT-Level) sperren ihre Zeile mit ``FOR UPDATE`` -
+  parallele Worker zählen damit nichts doppelt.
+
+Mandanten: Jede Schule (``utils/shards.py``) bekommt ein eigenes Schema
+(Standard-Schule: ``public`` bzw. das ``schema``-Argument von
+``PostgresStorage``, sonst ``school_<id>``). Das Schema wird beim ersten
+Zugriff pro Prozess angelegt/migriert (``SCHEMA_MIGRATIONS``).
+
+Datumswerte kommen wie bei SQLite als ISO-Strings zurück, damit die
+Spielregeln (``next_streak``, ``advance_streak`` ...) für beide Backends
+identisch sind.
+
+Nicht portiert (bleiben SQLite-Werkzeuge): Retention/Rollups
+(``utils/maintenance.py``), Export, ``fan_out`` über Shards.
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import psycopg2
+    import psycopg2.extensions
+    import psycopg2.extras
+    import psycopg2.pool
+    from psycopg2 import sql as pgsql
+    HAS_PSYCOPG2 = True
+except ImportError:
+    HAS_PSYCOPG2 = False
+
+from .. import bandura_sources_widget as bandura_db
+from .. import coaching_db, coaching_timeline, gamification_db, shards, student_search, user_system
+from ..assessment_codec import decode_results, encode_results
+from ..motivation_challenges import motivation_db
+from .base import (
+    ActivityRepository,
+    BadgeRepository,
+    BanduraRepository,
+    ChallengeRepository,
+    CoachingRepository,
+    LearnstratRepository,
+    MotivationRepository,
+    Storage,
+    UserRepository,
+)
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+ENV_POOL_MIN = "PULSE_PG_POOL_MIN"
+ENV_POOL_MAX = "PULSE_PG_POOL_MAX"
+
+DEFAULT_POOL_MIN = 1
+DEFAULT_POOL_MAX = 10
+POOL_TIMEOUT = 30.0
+DEFAULT_SCHEMA = "public"
+SCHOOL_SCHEMA_PREFIX = "school_"
+
+# DATE, TIMESTAMP, TIMESTAMPTZ
+ISO_TEXT_OIDS = (1082, 1114, 1184)
+
+SDT_NEEDS = ("autonomie", "kompetenz", "verbundenheit")
+
+# SQLite-CURRENT_TIMESTAMP-Äquivalent (UTC, Sekunden)
+NOW_UTC = "(now() AT TIME ZONE 'utc')::timestamp(0)"
+
+
+# ============================================
+# SCHEMA
+# ============================================
+
+# (version, beschreibung, statements) - Spalten wie utils/migrations.py bzw.
+# coaching_db.py; Datumsspalten als DATE/TIMESTAMP, Flags als BOOLEAN
+SCHEMA_MIGRATIONS: List[Tuple[int, str, List[str]]] = [
+    (1, "Gamification, Bandura, Motivation, Lernstrategien", [
+        f"""
+        CREATE TABLE IF NOT EXISTS users (
+            user_id TEXT PRIMARY KEY,
+            username TEXT DEFAULT 'Lernender',
+            created_at TIMESTAMP DEFAULT {NOW_UTC},
+            xp_total INTEGER DEFAULT 0,
+            level INTEGER DEFAULT 1,
+            current_streak INTEGER DEFAULT 0,
+            longest_streak INTEGER DEFAULT 0,
+            last_activity_date DATE,
+            settings TEXT DEFAULT '{{}}',
+            display_name TEXT,
+            last_login TIMESTAMP,
+            age_group TEXT DEFAULT 'unterstufe',
+            avatar_settings TEXT DEFAULT '{{}}',
+            version INTEGER DEFAULT 0
+        )
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS challenges (
+            id SERIAL PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT {NOW_UTC},
+            challenge_date DATE NOT NULL,
+            subject TEXT NOT NULL,
+            task_description TEXT,
+            prediction INTEGER NOT NULL,
+            actual_result INTEGER,
+            outcome TEXT,
+            xp_earned INTEGER DEFAULT 0,
+            reflection TEXT,
+            completed BOOLEAN DEFAULT FALSE
+        )
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS user_badges (
+            user_id TEXT NOT NULL,
+            badge_id TEXT NOT NULL,
+            earned_at TIMESTAMP DEFAULT {NOW_UTC},
+            PRIMARY KEY (user_id, badge_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS activity_log (
+            id SERIAL PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            activity_date DATE NOT NULL,
+            activity_type TEXT NOT NULL,
+            xp_earned INTEGER DEFAULT 0,
+            details TEXT
+        )
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS bandura_entries (
+            id SERIAL PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT {NOW_UTC},
+            entry_date DATE NOT NULL,
+            source_type TEXT NOT NULL,
+            description TEXT NOT NULL,
+            xp_earned INTEGER DEFAULT 0
+        )
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS motivation_challenges (
+            id SERIAL PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            challenge_id TEXT NOT NULL,
+            age_group TEXT NOT NULL,
+            grundbeduerfnis TEXT NOT NULL,
+            phase TEXT DEFAULT 'intro',
+            user_input TEXT,
+            reflection TEXT,
+            rating INTEGER,
+            xp_earned INTEGER DEFAULT 0,
+            completed BOOLEAN DEFAULT FALSE,
+            completed_at TIMESTAMP,
+            created_at TIMESTAMP DEFAULT {NOW_UTC}
+        )
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS motivation_sdt_progress (
+            id SERIAL PRIMARY KEY,
+            user_id TEXT NOT NULL UNIQUE,
+            autonomie_level INTEGER DEFAULT 0,
+            autonomie_xp INTEGER DEFAULT 0,
+            kompetenz_level INTEGER DEFAULT 0,
+            kompetenz_xp INTEGER DEFAULT 0,
+            verbundenheit_level INTEGER DEFAULT 0,
+            verbundenheit_xp INTEGER DEFAULT 0,
+            total_challenges INTEGER DEFAULT 0,
+            total_xp INTEGER DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT {NOW_UTC}
+        )
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS motivation_streaks (
+            id SERIAL PRIMARY KEY,
+            user_id TEXT NOT NULL UNIQUE,
+            current_streak INTEGER DEFAULT 0,
+            longest_streak INTEGER DEFAULT 0,
+            last_activity_date DATE,
+            freeze_available INTEGER DEFAULT 1,
+            freeze_used_date DATE,
+            updated_at TIMESTAMP DEFAULT {NOW_UTC}
+        )
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS motivation_activity_log (
+            id SERIAL PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            activity_date DATE NOT NULL,
+            challenge_id TEXT NOT NULL,
+            grundbeduerfnis TEXT NOT NULL,
+            xp_earned INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT {NOW_UTC}
+        )
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS motivation_badges (
+            id SERIAL PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            badge_id TEXT NOT NULL,
+            earned_at TIMESTAMP DEFAULT {NOW_UTC},
+            UNIQUE (user_id, badge_id)
+        )
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS motivation_certificates (
+            id SERIAL PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            certificate_type TEXT NOT NULL,
+            age_group TEXT NOT NULL,
+            challenges_completed TEXT,
+            total_xp INTEGER DEFAULT 0,
+            issued_at TIMESTAMP DEFAULT {NOW_UTC}
+        )
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS user_learning_preferences (
+            id SERIAL PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            technique_1 TEXT,
+            technique_2 TEXT,
+            technique_3 TEXT,
+            created_at TIMESTAMP DEFAULT {NOW_UTC},
+            updated_at TIMESTAMP DEFAULT {NOW_UTC}
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS learnstrat_progress (
+            id SERIAL PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            challenge_id TEXT NOT NULL,
+            technique_id TEXT,
+            completed BOOLEAN DEFAULT FALSE,
+            rating INTEGER,
+            reflection TEXT,
+            xp_earned INTEGER DEFAULT 0,
+            completed_at TIMESTAMP
+        )
+        """,
+        # Tages-Aggregate: gleiche Abfragen wie unter SQLite (dort von der Retention befüllt)
+        """
+        CREATE TABLE IF NOT EXISTS motivation_activity_daily (
+            user_id TEXT NOT NULL,
+            activity_date DATE NOT NULL,
+            grundbeduerfnis TEXT NOT NULL,
+            activity_count INTEGER NOT NULL DEFAULT 0,
+            xp_earned INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, activity_date, grundbeduerfnis)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS bandura_daily (
+            user_id TEXT NOT NULL,
+            entry_date DATE NOT NULL,
+            source_type TEXT NOT NULL,
+            entry_count INTEGER NOT NULL DEFAULT 0,
+            xp_earned INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, entry_date, source_type)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_challenges_user_created ON challenges(user_id, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_challenges_user_date ON challenges(user_id, challenge_date)",
+        "CREATE INDEX IF NOT EXISTS idx_activity_user_date ON activity_log(user_id, activity_date)",
+        "CREATE INDEX IF NOT EXISTS idx_bandura_user_date ON bandura_entries(user_id, entry_date)",
+        "CREATE INDEX IF NOT EXISTS idx_mot_challenges_user ON motivation_challenges(user_id, challenge_id, age_group)",
+        "CREATE INDEX IF NOT EXISTS idx_mot_activity_user_date ON motivation_activity_log(user_id, activity_date)",
+        "CREATE INDEX IF NOT EXISTS idx_learnstrat_user ON learnstrat_progress(user_id, challenge_id)",
+        "CREATE INDEX IF NOT EXISTS idx_learning_prefs_user ON user_learning_preferences(user_id)",
+    ]),
+    (2, "Coaching: Schüler, Assessments, Förderpläne, Logs", [
+        f"""
+        CREATE TABLE IF NOT EXISTS students (
+            id SERIAL PRIMARY KEY,
+            student_code TEXT UNIQUE NOT NULL,
+            class TEXT,
+            school_year TEXT,
+            created_date TIMESTAMP DEFAULT {NOW_UTC},
+            notes TEXT,
+            is_active INTEGER DEFAULT 1
+        )
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS assessments (
+            id SERIAL PRIMARY KEY,
+            student_id INTEGER NOT NULL REFERENCES students(id) ON DELETE CASCADE,
+            request_id INTEGER,
+            assessment_date TIMESTAMP DEFAULT {NOW_UTC},
+            results BYTEA NOT NULL,
+            quadrant TEXT,
+            risk_level TEXT,
+            performance_estimate REAL,
+            notes TEXT,
+            summary TEXT,
+            item_count INTEGER
+        )
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS development_plans (
+            id SERIAL PRIMARY KEY,
+            student_id INTEGER NOT NULL REFERENCES students(id) ON DELETE CASCADE,
+            assessment_id INTEGER NOT NULL REFERENCES assessments(id) ON DELETE CASCADE,
+            created_date TIMESTAMP DEFAULT {NOW_UTC},
+            interventions TEXT NOT NULL,
+            goals TEXT,
+            status TEXT DEFAULT 'active',
+            start_date DATE,
+            target_end_date DATE,
+            actual_end_date DATE,
+            notes TEXT
+        )
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS progress_logs (
+            id SERIAL PRIMARY KEY,
+            student_id INTEGER NOT NULL REFERENCES students(id) ON DELETE CASCADE,
+            plan_id INTEGER REFERENCES development_plans(id) ON DELETE SET NULL,
+            log_date TIMESTAMP DEFAULT {NOW_UTC},
+            activity_type TEXT NOT NULL,
+            content TEXT NOT NULL,
+            outcome TEXT,
+            reflection TEXT,
+            created_by TEXT
+        )
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS assessment_requests (
+            id SERIAL PRIMARY KEY,
+            student_id INTEGER NOT NULL REFERENCES students(id) ON DELETE CASCADE,
+            created_date TIMESTAMP DEFAULT {NOW_UTC},
+            selected_scales TEXT NOT NULL,
+            assessment_type TEXT,
+            survey_url TEXT,
+            status TEXT DEFAULT 'pending',
+            completed_date TIMESTAMP
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_assessments_student_date ON assessments(student_id, assessment_date, id)",
+        "CREATE INDEX IF NOT EXISTS idx_plans_student_date ON development_plans(student_id, created_date, id)",
+        "CREATE INDEX IF NOT EXISTS idx_plans_student_status ON development_plans(student_id, status)",
+        "CREATE INDEX IF NOT EXISTS idx_logs_student_date ON progress_logs(student_id, log_date, id)",
+        "CREATE INDEX IF NOT EXISTS idx_requests_student_status ON assessment_requests(student_id, status)",
+        "CREATE INDEX IF NOT EXISTS idx_students_active_code ON students(is_active, lower(student_code) text_pattern_ops)",
+        "CREATE INDEX IF NOT EXISTS idx_students_active_class ON students(is_active, class)",
+    ]),
+    (3, "Coaching: Entwürfe laufender Screenings", [
+        """
+        CREATE TABLE IF NOT EXISTS assessment_drafts (
+            student_id INTEGER NOT NULL REFERENCES students(id) ON DELETE CASCADE,
+            variable_name TEXT NOT NULL,
+            value TEXT NOT NULL,
+            updated_at TIMESTAMP NOT NULL,
+            PRIMARY KEY (student_id, variable_name)
+        )
+        """,
+    ]),
+]
+
+# Optional: Trigramm-Index für die fehlertolerante Schülersuche (pg_trgm)
+TRIGRAM_STATEMENTS = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm SCHEMA public",
+    "CREATE INDEX IF NOT EXISTS idx_students_code_trgm ON students USING gin (lower(student_code) gin_trgm_ops)",
+]
+
+
+def schema_for_school(school_id: str, base_schema: str = DEFAULT_SCHEMA) -> str:
+    """Schema einer Schule (Standard-Schule: ``base_schema``)."""
+    if school_id == shards.DEFAULT_SCHOOL:
+        return base_schema
+    return f"{SCHOOL_SCHEMA_PREFIX}{school_id}"
+
+
+# ============================================
+# CONNECTION-POOL
+# ============================================
+
+if HAS_PSYCOPG2:
+    class PulseConnection(psycopg2.extensions.connection):
+        """Verbindung mit UTF-8, Datum als ISO-Text und gemerktem ``search_path``."""
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.search_path: Optional[str] = None
+            self.set_client_encoding("UTF8")
+            psycopg2.extensions.register_type(
+                psycopg2.extensions.new_type(ISO_TEXT_OIDS, "PULSE_ISO_TEXT", lambda value, cur: value),
+                self,
+            )
+
+
+class ConnectionPool:
+    """
+    ``ThreadedConnectionPool`` mit Warte-Semaphore, Schema-Auswahl pro
+    Schule und einmaliger Migration pro Schema.
+    """
+
+    def __init__(self, dsn: str, min_connections: int, max_connections: int,
+                 base_schema: str = DEFAULT_SCHEMA, timeout: float = POOL_TIMEOUT):
+        self.base_schema = base_schema
+        self.timeout = timeout
+        self._pool = psycopg2.pool.ThreadedConnectionPool(min_connections, max_connections, dsn,
+                                                          connection_factory=PulseConnection)
+        # psycopg2 schließt zurückgegebene Verbindungen oberhalb von minconn -
+        # offene Verbindungen bis max_connections behalten statt neu aufzubauen
+        self._pool.minconn = max_connections
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._migrated: Set[str] = set()
+        self._migrate_lock = threading.Lock()
+        self.has_trigram: Dict[str, bool] = {}
+
+    def current_schema(self) -> str:
+        return schema_for_school(shards.get_current_school(), self.base_schema)
+
+    @contextmanager
+    def _connection(self) -> Iterator[Any]:
+        if not self._slots.acquire(timeout=self.timeout):
+            raise psycopg2.pool.PoolError(f"Keine freie Datenbankverbindung nach {self.timeout} s")
+        conn = None
+        try:
+            conn = self._pool.getconn()
+            yield conn
+        finally:
+            if conn is not None:
+                broken = conn.closed or conn.get_transaction_status() == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN
+                self._pool.putconn(conn, close=bool(broken))
+            self._slots.release()
+
+    @contextmanager
+    def cursor(self, schema: Optional[str] = None) -> Iterator[Any]:
+        """
+        Cursor in einer Transaktion auf dem Schema der aktiven Schule.
+        Commit beim Verlassen, Rollback bei Exceptions.
+        """
+        schema = schema or self.current_schema()
+        if schema not in self._migrated:
+            self.migrate(schema)
+
+        with self._connection() as conn:
+            try:
+                if conn.search_path != schema:
+                    with conn.cursor() as cur:
+                        cur.execute(pgsql.SQL("SET search_path TO {}, public").format(pgsql.Identifier(schema)))
+                    conn.commit()
+                    conn.search_path = schema
+                with conn.cursor() as cur:
+                    yield cur
+                conn.commit()
+            except Exception:
+                if not conn.closed:
+                    conn.rollback()
+                raise
+
+    def migrate(self, schema: Optional[str] = None) -> List[int]:
+        """
+        Legt das Schema an und wendet ausstehende ``SCHEMA_MIGRATIONS`` an.
+        Mehrere Prozesse serialisieren sich über ein Advisory-Lock.
+
+        Returns:
+            Liste der angewendeten Versionsnummern
+        """
+        schema = schema or self.current_schema()
+        applied = []
+        with self._migrate_lock, self._connection() as conn:
+            if schema in self._migrated:
+                return applied
+            try:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (f"pulse_migrate:{schema}",))
+                    cur.execute(pgsql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(pgsql.Identifier(schema)))
+                    cur.execute(pgsql.SQL("SET LOCAL search_path TO {}, public").format(pgsql.Identifier(schema)))
+                    cur.execute("""
+                        CREATE TABLE IF NOT EXISTS schema_migrations (
+                            version INTEGER PRIMARY KEY,
+                            description TEXT,
+                            applied_at TIMESTAMP DEFAULT now()
+                        )
+                    """)
+                    cur.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")
+                    current = cur.fetchone()[0]
+                    for version, description, statements in SCHEMA_MIGRATIONS:
+                        if version <= current:
+                            continue
+                        for statement in statements:
+                            cur.execute(statement)
+                        cur.execute("INSERT INTO schema_migrations (version, description) VALUES (%s, %s)",
+                                    (version, description))
+                        applied.append(version)
+
+                    # Trigramm-Suche nur, wenn pg_trgm verfügbar ist (Rechte, Build)
+                    cur.execute("SAVEPOINT trigram")
+                    try:
+                        for statement in TRIGRAM_STATEMENTS:
+                            cur.execute(statement)
+                        cur.execute("RELEASE SAVEPOINT trigram")
+                        has_trigram = True
+                    except psycopg2.Error:
+                        cur.execute("ROLLBACK TO SAVEPOINT trigram")
+                        has_trigram = False
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        self.has_trigram[schema] = has_trigram
+        self._migrated.add(schema)
+        return applied
+
+    def drop_schema(self, schema: str) -> None:
+        """Löscht ein Schema samt Inhalt (Konformitätslauf, Tests)."""
+        with self._connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(pgsql.SQL("DROP SCHEMA IF EXISTS {} CASCADE").format(pgsql.Identifier(schema)))
+            conn.commit()
+        self._migrated.discard(schema)
+
+    def close(self) -> None:
+        self._pool.closeall()
+
+
+def _rows(cur) -> List[Dict[str, Any]]:
+    columns = [col.name for col in cur.description]
+    return [dict(zip(columns, row)) for row in cur.fetchall()]
+
+
+def _row(cur) -> Optional[Dict[str, Any]]:
+    row = cur.fetchone()
+    return dict(zip([col.name for col in cur.description], row)) if row else None
+
+
+def _today() -> str:
+    return datetime.now().date().isoformat()
+
+
+class _PostgresRepository:
+    def __init__(self, pool: ConnectionPool):
+        self.pool = pool
+
+
+# ============================================
+# GAMIFICATION
+# ============================================
+
+def _get_or_create_user(cur, user_id: str, username: str = "Lernender") -> Dict[str, Any]:
+    cur.execute("SELECT * FROM users WHERE user_id = %s", (user_id,))
+    user = _row(cur)
+    if user is None:
+        cur.execute("""
+            INSERT INTO users (user_id, username, xp_total, level, current_streak, longest_streak)
+            VALUES (%s, %s, 0, 1, 0, 0)
+            ON CONFLICT (user_id) DO NOTHING
+        """, (user_id, username))
+        cur.execute("SELECT * FROM users WHERE user_id = %s", (user_id,))
+        user = _row(cur)
+    return user
+
+
+def _update_user_stats(cur, user_id: str, xp_delta: int, streak: int) -> Dict[str, Any]:
+    cur.execute("SELECT xp_total, longest_streak FROM users WHERE user_id = %s FOR UPDATE", (user_id,))
+    xp_total, longest_streak = cur.fetchone()
+
+    new_xp = (xp_total or 0) + xp_delta
+    cur.execute("""
+        UPDATE users
+        SET xp_total = %s, level = %s, current_streak = %s, longest_streak = %s, last_activity_date = %s,
+            version = COALESCE(version, 0) + 1
+        WHERE user_id = %s
+        RETURNING *
+    """, (new_xp, gamification_db.calculate_level(new_xp), streak, max(longest_streak or 0, streak),
+          _today(), user_id))
+    return _row(cur)
+
+
+class PostgresUserRepository(_PostgresRepository, UserRepository):
+
+    def get_version(self, user_id: str) -> Optional[int]:
+        with self.pool.cursor() as cur:
+            cur.execute("SELECT version FROM users WHERE user_id = %s", (user_id,))
+            row = cur.fetchone()
+        return (row[0] or 0) if row else None
+
+    def get_or_create(self, user_id: str, username: str = "Lernender") -> Dict[str, Any]:
+        with self.pool.cursor() as cur:
+            return _get_or_create_user(cur, user_id, username)
+
+    def update_stats(self, user_id: str, xp_delta: int, streak: int) -> Dict[str, Any]:
+        with self.pool.cursor() as cur:
+            user = _update_user_stats(cur, user_id, xp_delta, streak)
+        gamification_db.mark_user_written(user_id)
+        return user
+
+    def get_or_create_by_name(self, display_name: str, age_group: str = None,
+                              avatar_style: str = None) -> Dict[str, Any]:
+        clean_name = display_name.strip().lower()
+        user_id = user_system.user_id_for_name(display_name)
+        now = datetime.now().isoformat()
+
+        with self.pool.cursor() as cur:
+            cur.execute("SELECT 1 FROM users WHERE user_id = %s", (user_id,))
+            exists = cur.fetchone() is not None
+            if not exists:
+                age = age_group or "unterstufe"
+                cur.execute("""
+                    INSERT INTO users (user_id, username, display_name, created_at, last_login,
+                                       xp_total, level, age_group, avatar_settings)
+                    VALUES (%s, %s, %s, %s, %s, 0, 1, %s, %s)
+                    ON CONFLICT (user_id) DO NOTHING
+                """, (user_id, clean_name, display_name.strip(), now, now, age,
+                      user_system.default_avatar_settings(age, avatar_style)))
+            else:
+                cur.execute("""
+                    UPDATE users SET last_login = %s, display_name = %s, age_group = COALESCE(%s, age_group),
+                                     version = COALESCE(version, 0) + 1
+                    WHERE user_id = %s
+                """, (now, display_name.strip(), age_group, user_id))
+            cur.execute("SELECT * FROM users WHERE user_id = %s", (user_id,))
+            user = _row(cur)
+
+        if exists:
+            gamification_db.mark_user_written(user_id)
+        return user
+
+    def _update_user(self, user_id: str, column: str, value: Any, label: str) -> bool:
+        try:
+            with self.pool.cursor() as cur:
+                cur.execute(pgsql.SQL("UPDATE users SET {} = %s, version = COALESCE(version, 0) + 1 "
+                                      "WHERE user_id = %s").format(pgsql.Identifier(column)), (value, user_id))
+        except psycopg2.Error as e:
+            print(f"Error updating {label}: {e}")
+            return False
+        gamification_db.mark_user_written(user_id)
+        return True
+
+    def update_avatar(self, user_id: str, avatar_settings: Dict) -> bool:
+        return self._update_user(user_id, "avatar_settings", json.dumps(avatar_settings), "avatar")
+
+    def update_age_group(self, user_id: str, age_group: str) -> bool:
+        return self._update_user(user_id, "age_group", age_group, "age group")
+
+    def get_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
+        with self.pool.cursor() as cur:
+            cur.execute("SELECT * FROM users WHERE user_id = %s", (user_id,))
+            return _row(cur)
+
+    def get_all(self) -> List[Dict[str, Any]]:
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                SELECT user_id, display_name, xp_total, level, last_login
+                FROM users
+                WHERE display_name IS NOT NULL
+                ORDER BY last_login DESC NULLS LAST
+            """)
+            return _rows(cur)
+
+
+class PostgresChallengeRepository(_PostgresRepository, ChallengeRepository):
+
+    def create(self, user_id: str, subject: str, prediction: int, task_description: str = "") -> int:
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                INSERT INTO challenges (user_id, challenge_date, subject, task_description, prediction, completed)
+                VALUES (%s, %s, %s, %s, %s, FALSE)
+                RETURNING id
+            """, (user_id, _today(), subject, task_description, prediction))
+            return cur.fetchone()[0]
+
+    def complete(self, challenge_id: int, actual_result: int, reflection: str = "",
+                 user_id: Optional[str] = None) -> Dict[str, Any]:
+        with self.pool.cursor() as cur:
+            cur.execute("SELECT * FROM challenges WHERE id = %s FOR UPDATE", (challenge_id,))
+            challenge = _row(cur)
+            if not challenge:
+                return {"error": "Challenge nicht gefunden"}
+            if challenge['completed']:
+                return {"error": "Challenge bereits abgeschlossen"}
+
+            user_id = challenge['user_id']
+            prediction = challenge['prediction']
+            is_note_type = (challenge['task_description'] or '').startswith("[note]")
+            outcome, base_xp = gamification_db.challenge_outcome(prediction, actual_result, is_note_type)
+
+            cur.execute("SELECT current_streak, last_activity_date FROM users WHERE user_id = %s FOR UPDATE",
+                        (user_id,))
+            user_data = cur.fetchone()
+            new_streak = gamification_db.next_streak(*user_data, datetime.now().date()) if user_data else 1
+            xp_earned = gamification_db.apply_streak_bonus(base_xp, new_streak)
+
+            cur.execute("""
+                UPDATE challenges
+                SET actual_result = %s, outcome = %s, xp_earned = %s, reflection = %s, completed = TRUE
+                WHERE id = %s
+            """, (actual_result, outcome, xp_earned, reflection, challenge_id))
+            cur.execute("""
+                INSERT INTO activity_log (user_id, activity_date, activity_type, xp_earned, details)
+                VALUES (%s, %s, 'challenge_completed', %s, %s)
+            """, (user_id, _today(), xp_earned, json.dumps({
+                "subject": challenge['subject'],
+                "outcome": outcome,
+                "prediction": prediction,
+                "actual": actual_result
+            })))
+            user = _update_user_stats(cur, user_id, xp_earned, new_streak)
+
+        gamification_db.mark_user_written(user_id)
+        old_level = gamification_db.calculate_level(user['xp_total'] - xp_earned)
+        return {
+            "challenge_id": challenge_id,
+            "outcome": outcome,
+            "prediction": prediction,
+            "actual_result": actual_result,
+            "xp_earned": xp_earned,
+            "streak": new_streak,
+            "total_xp": user['xp_total'],
+            "level": user['level'],
+            "level_up": user['level'] > old_level,
+            "streak_bonus": new_streak >= 3
+        }
+
+    def get_recent(self, user_id: str, limit: int = 20) -> List[Dict]:
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                SELECT * FROM challenges WHERE user_id = %s
+                ORDER BY created_at DESC, id DESC LIMIT %s
+            """, (user_id, limit))
+            return _rows(cur)
+
+    def get_open(self, user_id: str) -> List[Dict]:
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                SELECT * FROM challenges WHERE user_id = %s AND completed = FALSE
+                ORDER BY created_at DESC, id DESC
+            """, (user_id,))
+            return _rows(cur)
+
+    def get_user_stats(self, user_id: str, user: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        with self.pool.cursor() as cur:
+            stats = dict(user) if user is not None else _get_or_create_user(cur, user_id)
+
+            cur.execute("""
+                SELECT COUNT(*) FILTER (WHERE completed),
+                       COUNT(*) FILTER (WHERE outcome = 'exceeded'),
+                       COUNT(*) FILTER (WHERE outcome = 'exact'),
+                       COUNT(*) FILTER (WHERE outcome = 'below'),
+                       COUNT(DISTINCT subject),
+                       COALESCE(SUM(xp_earned), 0)
+                FROM challenges WHERE user_id = %s
+            """, (user_id,))
+            (stats["total_challenges"], stats["times_exceeded"], stats["exact_predictions"],
+             stats["times_below"], stats["unique_subjects"], stats["total_xp_from_challenges"]) = cur.fetchone()
+
+            cur.execute("""
+                SELECT subject, COUNT(*) AS count,
+                       SUM(CASE WHEN outcome = 'exceeded' THEN 1 ELSE 0 END) AS exceeded,
+                       SUM(CASE WHEN outcome = 'exact' THEN 1 ELSE 0 END) AS exact
+                FROM challenges
+                WHERE user_id = %s AND completed = TRUE
+                GROUP BY subject
+                ORDER BY subject
+            """, (user_id,))
+            stats["subjects_breakdown"] = _rows(cur)
+
+        if stats["total_challenges"] > 0:
+            success = stats["times_exceeded"] + stats["exact_predictions"]
+            stats["success_rate"] = round((success / stats["total_challenges"]) * 100, 1)
+        else:
+            stats["success_rate"] = 0
+        return stats
+
+
+class PostgresBadgeRepository(_PostgresRepository, BadgeRepository):
+
+    def get_user_badges(self, user_id: str) -> List[Dict]:
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                SELECT badge_id, earned_at FROM user_badges
+                WHERE user_id = %s ORDER BY earned_at DESC
+            """, (user_id,))
+            return _rows(cur)
+
+    def award(self, user_id: str, badge_id: str) -> bool:
+        try:
+            with self.pool.cursor() as cur:
+                cur.execute("""
+                    INSERT INTO user_badges (user_id, badge_id) VALUES (%s, %s)
+                    ON CONFLICT DO NOTHING
+                """, (user_id, badge_id))
+                return cur.rowcount > 0
+        except psycopg2.Error:
+            return False
+
+
+class PostgresActivityRepository(_PostgresRepository, ActivityRepository):
+
+    def get_challenge_heatmap(self, user_id: str, days: int = 90) -> List[Dict]:
+        start_date = (datetime.now().date() - timedelta(days=days)).isoformat()
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                SELECT challenge_date, COUNT(*) AS count, SUM(xp_earned) AS xp
+                FROM challenges
+                WHERE user_id = %s AND challenge_date >= %s AND completed = TRUE
+                GROUP BY challenge_date
+                ORDER BY challenge_date
+            """, (user_id, start_date))
+            return _rows(cur)
+
+    def log_motivation(self, user_id: str, challenge_id: str, grundbeduerfnis: str, xp_earned: int) -> None:
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                INSERT INTO motivation_activity_log
+                (user_id, activity_date, challenge_id, grundbeduerfnis, xp_earned)
+                VALUES (%s, %s, %s, %s, %s)
+            """, (user_id, date.today().isoformat(), challenge_id, grundbeduerfnis, xp_earned))
+        motivation_db._touch_user(user_id)
+
+    def get_motivation_heatmap(self, user_id: str, weeks: int = 12) -> List[Dict[str, Any]]:
+        start_date = (date.today() - timedelta(weeks=weeks * 7)).isoformat()
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                SELECT activity_date, grundbeduerfnis, SUM(count)::bigint, SUM(xp)::bigint
+                FROM (
+                    SELECT activity_date, grundbeduerfnis, COUNT(*) AS count, SUM(xp_earned) AS xp
+                    FROM motivation_activity_log
+                    WHERE user_id = %s AND activity_date >= %s
+                    GROUP BY activity_date, grundbeduerfnis
+                    UNION ALL
+                    SELECT activity_date, grundbeduerfnis, activity_count, xp_earned
+                    FROM motivation_activity_daily
+                    WHERE user_id = %s AND activity_date >= %s
+                ) AS days
+                GROUP BY activity_date, grundbeduerfnis
+                ORDER BY activity_date, grundbeduerfnis
+            """, (user_id, start_date) * 2)
+            return [{"date": row[0], "grundbeduerfnis": row[1], "count": row[2], "xp": row[3]}
+                    for row in cur.fetchall()]
+
+    def get_daily_summary(self, user_id: str, target_date: date = None) -> Dict[str, Any]:
+        target_date = target_date or date.today()
+        with self.pool.cursor() as cur:
+            cur.execute(_DAILY_SUMMARY_SQL, (user_id, target_date.isoformat()))
+            return motivation_db._build_daily_summary(cur.fetchall(), target_date)
+
+
+_DAILY_SUMMARY_SQL = """
+    SELECT grundbeduerfnis, COUNT(*) AS count, SUM(xp_earned) AS xp
+    FROM motivation_activity_log
+    WHERE user_id = %s AND activity_date = %s
+    GROUP BY grundbeduerfnis
+"""
+
+
+# ============================================
+# MOTIVATION
+# ============================================
+
+_SDT_COLUMNS = ("autonomie_level", "autonomie_xp", "kompetenz_level", "kompetenz_xp",
+                "verbundenheit_level", "verbundenheit_xp", "total_challenges", "total_xp")
+_STREAK_COLUMNS = ("current_streak", "longest_streak", "last_activity_date",
+                   "freeze_available", "freeze_used_date")
+
+
+def _completed_filter(user_id: str, age_group: Optional[str], grundbeduerfnis: Optional[str]) -> Tuple[str, List[Any]]:
+    where, params = "user_id = %s AND completed", [user_id]
+    if age_group:
+        where += " AND age_group = %s"
+        params.append(age_group)
+    if grundbeduerfnis:
+        where += " AND grundbeduerfnis = %s"
+        params.append(grundbeduerfnis)
+    return where, params
+
+
+class PostgresMotivationRepository(_PostgresRepository, MotivationRepository):
+
+    def save_challenge_progress(self, user_id: str, challenge_id: str, age_group: str,
+                                grundbeduerfnis: str, phase: str = "intro", user_input: str = None,
+                                reflection: str = None, rating: int = None, xp_earned: int = 0,
+                                completed: bool = False) -> int:
+        completed_at = datetime.now().isoformat() if completed else None
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                SELECT id FROM motivation_challenges
+                WHERE user_id = %s AND challenge_id = %s AND age_group = %s
+                ORDER BY created_at DESC, id DESC LIMIT 1
+            """, (user_id, challenge_id, age_group))
+            existing = cur.fetchone()
+
+            if existing and not completed:
+                cur.execute("""
+                    UPDATE motivation_challenges
+                    SET phase = %s, user_input = %s, reflection = %s, rating = %s,
+                        xp_earned = %s, completed = %s, completed_at = %s
+                    WHERE id = %s
+                """, (phase, user_input, reflection, rating, xp_earned, bool(completed), completed_at, existing[0]))
+                entry_id = existing[0]
+            else:
+                cur.execute("""
+                    INSERT INTO motivation_challenges
+                    (user_id, challenge_id, age_group, grundbeduerfnis, phase,
+                     user_input, reflection, rating, xp_earned, completed, completed_at)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    RETURNING id
+                """, (user_id, challenge_id, age_group, grundbeduerfnis, phase,
+                      user_input, reflection, rating, xp_earned, bool(completed), completed_at))
+                entry_id = cur.fetchone()[0]
+        motivation_db._touch_user(user_id)
+        return entry_id
+
+    def get_challenge_progress(self, user_id: str, challenge_id: str, age_group: str) -> Optional[Dict[str, Any]]:
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                SELECT id, phase, user_input, reflection, rating, xp_earned, completed, completed_at
+                FROM motivation_challenges
+                WHERE user_id = %s AND challenge_id = %s AND age_group = %s
+                ORDER BY created_at DESC, id DESC LIMIT 1
+            """, (user_id, challenge_id, age_group))
+            progress = _row(cur)
+        if progress:
+            progress["completed"] = bool(progress["completed"])
+        return progress
+
+    def get_completed_challenges(self, user_id: str, age_group: str = None,
+                                 grundbeduerfnis: str = None) -> List[Dict[str, Any]]:
+        where, params = _completed_filter(user_id, age_group, grundbeduerfnis)
+        with self.pool.cursor() as cur:
+            cur.execute(f"""
+                SELECT DISTINCT challenge_id, age_group, grundbeduerfnis,
+                       xp_earned, completed_at, rating
+                FROM motivation_challenges
+                WHERE {where}
+                ORDER BY completed_at DESC
+            """, params)
+            return [motivation_db._completed_from_row(row) for row in cur.fetchall()]
+
+    def count_completed_challenges(self, user_id: str, age_group: str = None,
+                                   grundbeduerfnis: str = None) -> int:
+        where, params = _completed_filter(user_id, age_group, grundbeduerfnis)
+        with self.pool.cursor() as cur:
+            cur.execute(f"SELECT COUNT(DISTINCT challenge_id) FROM motivation_challenges WHERE {where}", params)
+            return cur.fetchone()[0]
+
+    def _ensure_row(self, cur, table: str, user_id: str) -> None:
+        cur.execute(pgsql.SQL("INSERT INTO {} (user_id) VALUES (%s) ON CONFLICT (user_id) DO NOTHING")
+                    .format(pgsql.Identifier(table)), (user_id,))
+
+    def _select_locked(self, cur, table: str, columns: Tuple[str, ...], user_id: str) -> Dict[str, Any]:
+        self._ensure_row(cur, table, user_id)
+        cur.execute(pgsql.SQL("SELECT {} FROM {} WHERE user_id = %s FOR UPDATE").format(
+            pgsql.SQL(", ").join(map(pgsql.Identifier, columns)), pgsql.Identifier(table)), (user_id,))
+        return dict(zip(columns, cur.fetchone()))
+
+    def get_or_create_sdt_progress(self, user_id: str) -> Dict[str, Any]:
+        with self.pool.cursor() as cur:
+            cur.execute(f"SELECT {', '.join(_SDT_COLUMNS)} FROM motivation_sdt_progress WHERE user_id = %s",
+                        (user_id,))
+            row = cur.fetchone()
+            if row:
+                return dict(zip(_SDT_COLUMNS, row))
+            self._ensure_row(cur, "motivation_sdt_progress", user_id)
+        return dict.fromkeys(_SDT_COLUMNS, 0)
+
+    def update_sdt_progress(self, user_id: str, grundbeduerfnis: str, xp_earned: int) -> Dict[str, Any]:
+        if grundbeduerfnis not in SDT_NEEDS:
+            raise ValueError(f"Unbekanntes Grundbedürfnis: {grundbeduerfnis!r}")
+        xp_col, level_col = f"{grundbeduerfnis}_xp", f"{grundbeduerfnis}_level"
+
+        with self.pool.cursor() as cur:
+            progress = self._select_locked(cur, "motivation_sdt_progress", _SDT_COLUMNS, user_id)
+            old_xp, old_level = progress[xp_col], progress[level_col]
+            new_xp = old_xp + xp_earned
+            new_level = motivation_db.sdt_level(new_xp)
+            cur.execute(f"""
+                UPDATE motivation_sdt_progress
+                SET {xp_col} = %s, {level_col} = %s,
+                    total_xp = total_xp + %s,
+                    total_challenges = total_challenges + 1,
+                    updated_at = %s
+                WHERE user_id = %s
+            """, (new_xp, new_level, xp_earned, datetime.now().isoformat(), user_id))
+        motivation_db._touch_user(user_id)
+
+        return {
+            "grundbeduerfnis": grundbeduerfnis,
+            "old_level": old_level,
+            "new_level": new_level,
+            "old_xp": old_xp,
+            "new_xp": new_xp,
+            "xp_earned": xp_earned,
+            "level_up": new_level > old_level,
+            "next_level_xp": motivation_db.SDT_LEVEL_THRESHOLDS[new_level + 1] if new_level < 5 else None
+        }
+
+    def get_or_create_streak(self, user_id: str) -> Dict[str, Any]:
+        with self.pool.cursor() as cur:
+            cur.execute(f"SELECT {', '.join(_STREAK_COLUMNS)} FROM motivation_streaks WHERE user_id = %s",
+                        (user_id,))
+            row = cur.fetchone()
+            if row:
+                return dict(zip(_STREAK_COLUMNS, row))
+            self._ensure_row(cur, "motivation_streaks", user_id)
+        return {"current_streak": 0, "longest_streak": 0, "last_activity_date": None,
+                "freeze_available": 1, "freeze_used_date": None}
+
+    def update_streak(self, user_id: str) -> Dict[str, Any]:
+        today = date.today()
+        with self.pool.cursor() as cur:
+            streak_data = self._select_locked(cur, "motivation_streaks", _STREAK_COLUMNS, user_id)
+            result, changed = motivation_db.advance_streak(streak_data, today)
+            if changed:
+                cur.execute("""
+                    UPDATE motivation_streaks
+                    SET current_streak = %s, longest_streak = %s, last_activity_date = %s,
+                        freeze_available = %s, updated_at = %s
+                    WHERE user_id = %s
+                """, (result["current_streak"], result["longest_streak"], today.isoformat(),
+                      result["freeze_available"], datetime.now().isoformat(), user_id))
+        if changed:
+            motivation_db._touch_user(user_id)
+        return result
+
+    def add_streak_freeze(self, user_id: str, count: int = 1) -> int:
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                UPDATE motivation_streaks SET freeze_available = freeze_available + %s
+                WHERE user_id = %s
+                RETURNING freeze_available
+            """, (count, user_id))
+            freeze_available = cur.fetchone()[0]
+        motivation_db._touch_user(user_id)
+        return freeze_available
+
+    def award_badge(self, user_id: str, badge_id: str) -> bool:
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                INSERT INTO motivation_badges (user_id, badge_id) VALUES (%s, %s)
+                ON CONFLICT (user_id, badge_id) DO NOTHING
+            """, (user_id, badge_id))
+            awarded = cur.rowcount > 0
+        if awarded:
+            motivation_db._touch_user(user_id)
+        return awarded
+
+    def get_user_badges(self, user_id: str) -> List[Dict[str, Any]]:
+        with self.pool.cursor() as cur:
+            cur.execute(_MOTIVATION_BADGES_SQL, (user_id,))
+            return [{"badge_id": row[0], "earned_at": row[1]} for row in cur.fetchall()]
+
+    def has_badge(self, user_id: str, badge_id: str) -> bool:
+        with self.pool.cursor() as cur:
+            cur.execute("SELECT 1 FROM motivation_badges WHERE user_id = %s AND badge_id = %s",
+                        (user_id, badge_id))
+            return cur.fetchone() is not None
+
+    def issue_certificate(self, user_id: str, certificate_type: str, age_group: str,
+                          challenges_completed: List[str], total_xp: int) -> int:
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                INSERT INTO motivation_certificates
+                (user_id, certificate_type, age_group, challenges_completed, total_xp)
+                VALUES (%s, %s, %s, %s, %s)
+                RETURNING id
+            """, (user_id, certificate_type, age_group, json.dumps(challenges_completed), total_xp))
+            certificate_id = cur.fetchone()[0]
+        motivation_db._touch_user(user_id)
+        return certificate_id
+
+    def get_user_certificates(self, user_id: str) -> List[Dict[str, Any]]:
+        with self.pool.cursor() as cur:
+            cur.execute(_CERTIFICATES_SQL, (user_id,))
+            return [motivation_db._certificate_from_row(row) for row in cur.fetchall()]
+
+    def load_snapshot(self, user_id: str):
+        version = motivation_db.get_data_version(user_id)
+        today = date.today()
+
+        with self.pool.cursor() as cur:
+            cur.execute(f"""
+                SELECT {', '.join('s.' + c for c in _SDT_COLUMNS)},
+                       {', '.join('k.' + c for c in _STREAK_COLUMNS)},
+                       s.user_id IS NOT NULL, k.user_id IS NOT NULL
+                FROM (SELECT %s::text AS user_id) u
+                LEFT JOIN motivation_sdt_progress s ON s.user_id = u.user_id
+                LEFT JOIN motivation_streaks k ON k.user_id = u.user_id
+            """, (user_id,))
+            row = cur.fetchone()
+            has_sdt, has_streak = row[13], row[14]
+
+            cur.execute(_MOTIVATION_BADGES_SQL, (user_id,))
+            badges = [{"badge_id": r[0], "earned_at": r[1]} for r in cur.fetchall()]
+
+            cur.execute(_CERTIFICATES_SQL, (user_id,))
+            certificates = [motivation_db._certificate_from_row(r) for r in cur.fetchall()]
+
+            cur.execute(_DAILY_SUMMARY_SQL, (user_id, today.isoformat()))
+            today_activity = motivation_db._build_daily_summary(cur.fetchall(), today)
+
+            cur.execute("""
+                SELECT DISTINCT challenge_id, age_group, grundbeduerfnis,
+                       xp_earned, completed_at, rating
+                FROM motivation_challenges
+                WHERE user_id = %s AND completed
+                ORDER BY completed_at DESC
+            """, (user_id,))
+            completed = [motivation_db._completed_from_row(r) for r in cur.fetchall()]
+
+            if not has_sdt:
+                self._ensure_row(cur, "motivation_sdt_progress", user_id)
+            if not has_streak:
+                self._ensure_row(cur, "motivation_streaks", user_id)
+
+        progress = {column: row[i] or 0 for i, column in enumerate(_SDT_COLUMNS)}
+        streak = {
+            "current_streak": row[8] or 0,
+            "longest_streak": row[9] or 0,
+            "last_activity_date": row[10],
+            "freeze_available": row[11] if has_streak else 1,
+            "freeze_used_date": row[12],
+        }
+        return motivation_db.MotivationSnapshot(
+            user_id=user_id,
+            data_version=version,
+            loaded_for=today.isoformat(),
+            sdt_progress=motivation_db._build_sdt_summary(progress),
+            streak=streak,
+            badges=badges,
+            certificates=certificates,
+            today=today_activity,
+            completed=completed,
+        )
+
+    def reset_user_data(self, user_id: str) -> None:
+        with self.pool.cursor() as cur:
+            for table in ("motivation_challenges", "motivation_sdt_progress", "motivation_streaks",
+                          "motivation_activity_log", "motivation_activity_daily",
+                          "motivation_badges", "motivation_certificates"):
+                cur.execute(f"DELETE FROM {table} WHERE user_id = %s", (user_id,))
+        motivation_db._touch_user(user_id)
+
+
+_MOTIVATION_BADGES_SQL = """
+    SELECT badge_id, earned_at FROM motivation_badges
+    WHERE user_id = %s ORDER BY earned_at, id
+"""
+
+_CERTIFICATES_SQL = """
+    SELECT id, certificate_type, age_group, challenges_completed, total_xp, issued_at
+    FROM motivation_certificates
+    WHERE user_id = %s ORDER BY issued_at DESC, id DESC
+"""
+
+
+# ============================================
+# BANDURA
+# ============================================
+
+# Wie BANDURA_DAYS_SQL (Rohdaten + Tages-Aggregate). Parameter: (user_id, user_id)
+_BANDURA_DAYS_SQL = """
+    SELECT entry_date, source_type, COUNT(*) AS entry_count
+    FROM bandura_entries WHERE user_id = %s
+    GROUP BY entry_date, source_type
+    UNION ALL
+    SELECT entry_date, source_type, entry_count
+    FROM bandura_daily WHERE user_id = %s
+"""
+
+
+def _bandura_dates(cur, user_id: str, descending: bool) -> List[str]:
+    cur.execute(f"""
+        SELECT DISTINCT entry_date FROM ({_BANDURA_DAYS_SQL}) AS days
+        ORDER BY entry_date {'DESC' if descending else 'ASC'}
+    """, (user_id, user_id))
+    return [row[0] for row in cur.fetchall()]
+
+
+class PostgresBanduraRepository(_PostgresRepository, BanduraRepository):
+
+    def create_entry(self, user_id: str, source_type: str, description: str) -> Dict[str, Any]:
+        today = _today()
+        base_xp = bandura_db.entry_xp(source_type, description)
+
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                INSERT INTO bandura_entries (user_id, entry_date, source_type, description, xp_earned)
+                VALUES (%s, %s, %s, %s, %s)
+                RETURNING id
+            """, (user_id, today, source_type, description, base_xp))
+            entry_id = cur.fetchone()[0]
+
+            # Den User sperren: parallele Einträge vergeben den Tagesbonus nur einmal
+            cur.execute("SELECT xp_total, level FROM users WHERE user_id = %s FOR UPDATE", (user_id,))
+            user_row = cur.fetchone()
+
+            cur.execute("""
+                SELECT DISTINCT source_type FROM bandura_entries
+                WHERE user_id = %s AND entry_date = %s
+            """, (user_id, today))
+            sources_today = [row[0] for row in cur.fetchall()]
+
+            all_four_bonus = 0
+            if len(sources_today) == 4:
+                cur.execute("""
+                    SELECT COUNT(*) FROM activity_log
+                    WHERE user_id = %s AND activity_date = %s AND activity_type = 'bandura_all_four'
+                """, (user_id, today))
+                if cur.fetchone()[0] == 0:
+                    all_four_bonus = bandura_db.XP_CONFIG["all_four_today"]
+                    cur.execute("""
+                        INSERT INTO activity_log (user_id, activity_date, activity_type, xp_earned, details)
+                        VALUES (%s, %s, 'bandura_all_four', %s, %s)
+                    """, (user_id, today, all_four_bonus, json.dumps({"sources": sources_today})))
+
+            total_xp = base_xp + all_four_bonus
+            cur.execute("""
+                INSERT INTO activity_log (user_id, activity_date, activity_type, xp_earned, details)
+                VALUES (%s, %s, %s, %s, %s)
+            """, (user_id, today, f'bandura_{source_type}', base_xp, json.dumps({
+                "description": description[:100],
+                "source": source_type
+            })))
+
+            streak = bandura_db.current_day_streak(_bandura_dates(cur, user_id, descending=True))
+
+            if user_row:
+                new_xp = (user_row[0] or 0) + total_xp
+                new_level = bandura_db.calculate_level(new_xp)
+                level_up = new_level > (user_row[1] or 1)
+                cur.execute("""
+                    UPDATE users SET xp_total = %s, level = %s, last_activity_date = %s,
+                                     version = COALESCE(version, 0) + 1
+                    WHERE user_id = %s
+                """, (new_xp, new_level, today, user_id))
+            else:
+                new_xp, new_level, level_up = total_xp, 1, False
+
+        if user_row:
+            gamification_db.mark_user_written(user_id)
+
+        return {
+            "entry_id": entry_id,
+            "source_type": source_type,
+            "xp_earned": base_xp,
+            "all_four_bonus": all_four_bonus,
+            "total_xp": total_xp,
+            "sources_today": sources_today,
+            "streak": streak,
+            "level": new_level,
+            "level_up": level_up,
+            "total_user_xp": new_xp
+        }
+
+    def get_stats(self, user_id: str) -> Dict[str, Any]:
+        stats = {}
+        with self.pool.cursor() as cur:
+            cur.execute(f"""
+                SELECT source_type, SUM(entry_count)::bigint FROM ({_BANDURA_DAYS_SQL}) AS days
+                GROUP BY source_type
+            """, (user_id, user_id))
+            per_source = dict(cur.fetchall())
+            for source in bandura_db.BANDURA_SOURCES.keys():
+                stats[f"bandura_{source}"] = per_source.get(source, 0)
+            stats["bandura_total"] = sum(per_source.values())
+
+            cur.execute(f"""
+                SELECT COUNT(*) FROM (
+                    SELECT entry_date FROM ({_BANDURA_DAYS_SQL}) AS days
+                    GROUP BY entry_date
+                    HAVING COUNT(DISTINCT source_type) = 4
+                ) AS complete_days
+            """, (user_id, user_id))
+            stats["bandura_all_four_days"] = cur.fetchone()[0]
+
+            cur.execute("""
+                SELECT source_type FROM bandura_entries
+                WHERE user_id = %s AND entry_date = %s
+            """, (user_id, _today()))
+            stats["sources_today"] = [row[0] for row in cur.fetchall()]
+
+            dates = _bandura_dates(cur, user_id, descending=False)
+
+        stats["bandura_streak"] = bandura_db.current_day_streak(dates[::-1])
+        stats["bandura_longest_streak"] = max(bandura_db.longest_day_streak(dates), stats["bandura_streak"])
+        return stats
+
+    def get_entries(self, user_id: str, limit: int = 10) -> List[Dict]:
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                SELECT * FROM bandura_entries WHERE user_id = %s
+                ORDER BY created_at DESC, id DESC LIMIT %s
+            """, (user_id, limit))
+            return _rows(cur)
+
+    def get_entries_by_source(self, user_id: str) -> Dict[str, List[Dict]]:
+        result = {source: [] for source in bandura_db.BANDURA_SOURCES.keys()}
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                SELECT * FROM bandura_entries WHERE user_id = %s
+                ORDER BY entry_date DESC, id DESC
+            """, (user_id,))
+            for entry in _rows(cur):
+                source = entry.get("source_type", "mastery")
+                if source in result:
+                    result[source].append(entry)
+        return result
+
+
+# ============================================
+# LERNSTRATEGIEN
+# ============================================
+
+class PostgresLearnstratRepository(_PostgresRepository, LearnstratRepository):
+
+    def _save(self, user_id: str, challenge_id: str, technique_id: str, xp: int,
+              rating: Optional[int] = None, reflection: Optional[str] = None) -> None:
+        now = datetime.now().isoformat()
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                SELECT id FROM learnstrat_progress
+                WHERE user_id = %s AND challenge_id = %s AND technique_id = %s
+                FOR UPDATE
+            """, (user_id, challenge_id, technique_id))
+            existing = cur.fetchone()
+            if existing:
+                # Powertechniken speichern das Rating, Transfer/Birkenbihl die Antwort
+                column = "rating" if reflection is None else "reflection"
+                cur.execute(f"""
+                    UPDATE learnstrat_progress
+                    SET {column} = %s, xp_earned = %s, completed = TRUE, completed_at = %s
+                    WHERE id = %s
+                """, (rating if reflection is None else reflection, xp, now, existing[0]))
+            else:
+                cur.execute("""
+                    INSERT INTO learnstrat_progress
+                    (user_id, challenge_id, technique_id, rating, reflection, xp_earned, completed, completed_at)
+                    VALUES (%s, %s, %s, %s, %s, %s, TRUE, %s)
+                """, (user_id, challenge_id, technique_id, rating, reflection, xp, now))
+
+    def save_technique_progress(self, user_id: str, technique_id: str, rating: int, xp: int) -> None:
+        self._save(user_id, "powertechniken", technique_id, xp, rating=rating)
+
+    def get_progress(self, user_id: str, challenge_id: str = "powertechniken") -> List[Dict]:
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                SELECT technique_id, rating, xp_earned, completed_at
+                FROM learnstrat_progress
+                WHERE user_id = %s AND challenge_id = %s AND completed
+                ORDER BY completed_at, id
+            """, (user_id, challenge_id))
+            return _rows(cur)
+
+    def save_phase_progress(self, challenge_id: str, user_id: str, phase_id: str,
+                            xp: int, response: str = "") -> None:
+        self._save(user_id, challenge_id, phase_id, xp, reflection=response or "")
+
+    def get_phase_progress(self, challenge_id: str, user_id: str) -> List[Dict]:
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                SELECT technique_id AS phase_id, xp_earned, reflection AS response, completed_at
+                FROM learnstrat_progress
+                WHERE user_id = %s AND challenge_id = %s AND completed
+                ORDER BY completed_at, id
+            """, (user_id, challenge_id))
+            return _rows(cur)
+
+    def save_top3(self, user_id: str, top3: List[str]) -> None:
+        techniques = (list(top3) + [None, None, None])[:3]
+        with self.pool.cursor() as cur:
+            cur.execute("SELECT id FROM user_learning_preferences WHERE user_id = %s FOR UPDATE", (user_id,))
+            existing = cur.fetchone()
+            if existing:
+                cur.execute("""
+                    UPDATE user_learning_preferences
+                    SET technique_1 = %s, technique_2 = %s, technique_3 = %s, updated_at = %s
+                    WHERE id = %s
+                """, (*techniques, datetime.now().isoformat(), existing[0]))
+            else:
+                cur.execute("""
+                    INSERT INTO user_learning_preferences (user_id, technique_1, technique_2, technique_3)
+                    VALUES (%s, %s, %s, %s)
+                """, (user_id, *techniques))
+
+    def get_top3(self, user_id: str) -> Optional[List[str]]:
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                SELECT technique_1, technique_2, technique_3
+                FROM user_learning_preferences WHERE user_id = %s
+                ORDER BY id LIMIT 1
+            """, (user_id,))
+            row = cur.fetchone()
+        return [t for t in row if t] if row else None
+
+
+# ============================================
+# COACHING
+# ============================================
+
+_STUDENT_SELECT = f"SELECT {', '.join('s.' + c for c in student_search.STUDENT_COLUMNS)} FROM students s"
+_ASSESSMENT_SELECT = f"SELECT {', '.join(coaching_db.ASSESSMENT_COLUMNS)}"
+
+
+def _assessment(row: tuple, include_results: bool) -> Dict:
+    if include_results:
+        row = row[:-1] + (bytes(row[-1]),)
+    return coaching_db._assessment_from_row(row, include_results)
+
+
+class PostgresCoachingRepository(_PostgresRepository, CoachingRepository):
+
+    def _insert(self, sql: str, params: tuple, label: str) -> Optional[int]:
+        """INSERT ... RETURNING id; Fehler werden wie bisher geloggt (None)."""
+        try:
+            with self.pool.cursor() as cur:
+                cur.execute(sql, params)
+                return cur.fetchone()[0]
+        except psycopg2.Error as e:
+            print(f"Error {label}: {e}")
+            return None
+
+    def create_student(self, student_code: str, class_name: str = None, notes: str = None) -> Optional[int]:
+        return self._insert("""
+            INSERT INTO students (student_code, class, notes) VALUES (%s, %s, %s) RETURNING id
+        """, (student_code, class_name, notes), "creating student")
+
+    def get_student(self, student_id: int) -> Optional[Dict]:
+        with self.pool.cursor() as cur:
+            cur.execute(f"{_STUDENT_SELECT} WHERE s.id = %s", (student_id,))
+            row = cur.fetchone()
+        return dict(zip(student_search.STUDENT_COLUMNS, row)) if row else None
+
+    def get_all_students(self, active_only: bool = True):
+        import pandas as pd
+
+        with self.pool.cursor() as cur:
+            cur.execute(f"{_STUDENT_SELECT}{' WHERE s.is_active = 1' if active_only else ''} ORDER BY s.student_code")
+            rows = cur.fetchall()
+        return pd.DataFrame(rows, columns=student_search.STUDENT_COLUMNS)
+
+    def search_students(self, term: str = "", class_name: Optional[str] = None,
+                        limit: int = student_search.SEARCH_LIMIT, active_only: bool = True) -> List[Dict[str, Any]]:
+        term = (term or "").strip()
+        filters, filter_params = [], []
+        if active_only:
+            filters.append("s.is_active = 1")
+        if class_name:
+            filters.append("s.class = %s")
+            filter_params.append(class_name)
+
+        def where(*conditions: str) -> str:
+            clauses = list(conditions) + filters
+            return f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self.pool.cursor() as cur:
+            if not term:
+                cur.execute(f"{_STUDENT_SELECT}{where()} ORDER BY s.id DESC LIMIT %s", filter_params + [limit])
+                return [dict(zip(student_search.STUDENT_COLUMNS, row), score=1.0) for row in cur.fetchall()]
+
+            lowered = term.lower()
+            escaped = lowered.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            candidate_limit = limit * student_search.CANDIDATE_FACTOR
+            candidates: Dict[int, tuple] = {}
+
+            def collect(sql: str, params: List[Any]) -> None:
+                cur.execute(sql, params + [candidate_limit])
+                for row in cur.fetchall():
+                    candidates.setdefault(row[0], row)
+
+            # Präfix auf dem Code (Index auf is_active, lower(student_code))
+            collect(f"{_STUDENT_SELECT}{where('lower(s.student_code) LIKE %s')} "
+                    f"ORDER BY lower(s.student_code) LIMIT %s", [escaped + "%"] + filter_params)
+
+            # Klasse exakt
+            collect(f"{_STUDENT_SELECT}{where('s.class IN (%s, %s, %s)')} LIMIT %s",
+                    [term, lowered, term.upper()] + filter_params)
+
+            # Teilstring / Tippfehler (Trigramm-Ähnlichkeit, falls pg_trgm verfügbar)
+            if len(term) >= 3:
+                pattern = f"%{escaped}%"
+                if self.pool.has_trigram.get(self.pool.current_schema()):
+                    collect(f"{_STUDENT_SELECT}"
+                            f"{where('(lower(s.student_code) LIKE %s OR lower(s.class) LIKE %s OR lower(s.student_code) %% %s)')} "
+                            f"ORDER BY similarity(lower(s.student_code), %s) DESC LIMIT %s",
+                            [pattern, pattern, lowered] + filter_params + [lowered])
+                else:
+                    collect(f"{_STUDENT_SELECT}{where('(lower(s.student_code) LIKE %s OR lower(s.class) LIKE %s)')} "
+                            f"LIMIT %s", [pattern, pattern] + filter_params)
+
+        ranked = []
+        for row in candidates.values():
+            student = dict(zip(student_search.STUDENT_COLUMNS, row))
+            student["score"] = student_search.score_match(term, student["student_code"], student["class"])
+            if student["score"] >= student_search.MIN_FUZZY_SCORE:
+                ranked.append(student)
+        ranked.sort(key=lambda s: (-s["score"], s["student_code"]))
+        return ranked[:limit]
+
+    def get_classes(self, active_only: bool = True) -> List[str]:
+        with self.pool.cursor() as cur:
+            cur.execute(f"""
+                SELECT DISTINCT class FROM students
+                WHERE class IS NOT NULL{' AND is_active = 1' if active_only else ''}
+                ORDER BY class
+            """)
+            return [row[0] for row in cur.fetchall() if row[0]]
+
+    def save_assessment(self, student_id: int, results_dict: Dict, notes: str = None) -> Optional[int]:
+        results_blob, summary = encode_results(results_dict)
+        return self._insert("""
+            INSERT INTO assessments
+            (student_id, assessment_date, results, risk_level, notes, summary, item_count)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            RETURNING id
+        """, (student_id, coaching_db._now(), psycopg2.Binary(results_blob), "mittel", notes, summary,
+              len(results_dict.get('item_responses', {}))), "saving assessment")
+
+    def save_draft_responses(self, drafts: Dict[int, Dict[str, Any]]) -> int:
+        now = coaching_db._now()
+        rows = [
+            (student_id, variable_name, json.dumps(value), now)
+            for student_id, responses in drafts.items()
+            for variable_name, value in responses.items()
+        ]
+        if not rows:
+            return 0
+        with self.pool.cursor() as cur:
+            psycopg2.extras.execute_values(cur, """
+                INSERT INTO assessment_drafts (student_id, variable_name, value, updated_at) VALUES %s
+                ON CONFLICT (student_id, variable_name)
+                DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+            """, rows)
+        return len(rows)
+
+    def get_draft(self, student_id: int) -> Optional[Dict]:
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                SELECT variable_name, value, updated_at FROM assessment_drafts WHERE student_id = %s
+            """, (student_id,))
+            rows = cur.fetchall()
+        return coaching_db._draft_from_rows(rows)
+
+    def discard_draft(self, student_id: int) -> int:
+        with self.pool.cursor() as cur:
+            cur.execute("DELETE FROM assessment_drafts WHERE student_id = %s", (student_id,))
+            return cur.rowcount
+
+    def promote_draft(self, student_id: int, results_dict: Dict, notes: str = None) -> Optional[int]:
+        results_blob, summary = encode_results(results_dict)
+        try:
+            with self.pool.cursor() as cur:
+                cur.execute("""
+                    INSERT INTO assessments
+                    (student_id, assessment_date, results, risk_level, notes, summary, item_count)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    RETURNING id
+                """, (student_id, coaching_db._now(), psycopg2.Binary(results_blob), "mittel", notes, summary,
+                      len(results_dict.get('item_responses', {}))))
+                assessment_id = cur.fetchone()[0]
+                cur.execute("DELETE FROM assessment_drafts WHERE student_id = %s", (student_id,))
+            return assessment_id
+        except psycopg2.Error as e:
+            print(f"Error saving assessment: {e}")
+            return None
+
+    def _select_assessments(self, include_results: bool) -> str:
+        return _ASSESSMENT_SELECT + (", results" if include_results else "") + " FROM assessments"
+
+    def get_latest_assessment(self, student_id: int, include_results: bool = True) -> Optional[Dict]:
+        with self.pool.cursor() as cur:
+            cur.execute(f"""
+                {self._select_assessments(include_results)}
+                WHERE student_id = %s
+                ORDER BY assessment_date DESC, id DESC
+                LIMIT 1
+            """, (student_id,))
+            row = cur.fetchone()
+        return _assessment(row, include_results) if row else None
+
+    def get_all_assessments(self, student_id: int, include_results: bool = False,
+                            limit: Optional[int] = None) -> List[Dict]:
+        with self.pool.cursor() as cur:
+            cur.execute(f"""
+                {self._select_assessments(include_results)}
+                WHERE student_id = %s
+                ORDER BY assessment_date DESC, id DESC
+                LIMIT %s
+            """, (student_id, limit))
+            rows = cur.fetchall()
+        return [_assessment(row, include_results) for row in rows]
+
+    def get_assessment_results(self, assessment_id: int) -> Optional[Dict]:
+        with self.pool.cursor() as cur:
+            cur.execute("SELECT results FROM assessments WHERE id = %s", (assessment_id,))
+            row = cur.fetchone()
+        return decode_results(bytes(row[0])) if row else None
+
+    def get_student_summary(self, student_id: int) -> Dict:
+        with self.pool.cursor() as cur:
+            cur.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM assessments WHERE student_id = %(sid)s),
+                    (SELECT MIN(assessment_date) FROM assessments WHERE student_id = %(sid)s),
+                    (SELECT MAX(assessment_date) FROM assessments WHERE student_id = %(sid)s),
+                    (SELECT summary FROM assessments WHERE student_id = %(sid)s
+                     ORDER BY assessment_date DESC, id DESC LIMIT 1),
+                    (SELECT COUNT(*) FROM development_plans WHERE student_id = %(sid)s AND status = 'active'),
+                    (SELECT COUNT(*) FROM development_plans WHERE student_id = %(sid)s),
+                    (SELECT COUNT(*) FROM progress_logs WHERE student_id = %(sid)s),
+                    (SELECT MAX(log_date) FROM progress_logs WHERE student_id = %(sid)s),
+                    (SELECT COUNT(*) FROM assessment_requests WHERE student_id = %(sid)s AND status = 'pending')
+            """, {'sid': student_id})
+            row = cur.fetchone()
+
+        return {
+            'total_assessments': row[0],
+            'first_assessment': row[1],
+            'last_assessment': row[2],
+            'latest_scores': coaching_db.decode_summary(row[3]).get('scales', {}) if row[3] else {},
+            'active_plans': row[4],
+            'total_plans': row[5],
+            'progress_logs': row[6],
+            'last_progress_log': row[7],
+            'pending_requests': row[8]
+        }
+
+    def save_development_plan(self, student_id: int, assessment_id: int,
+                              interventions: Dict, goals: str = None) -> Optional[int]:
+        return self._insert("""
+            INSERT INTO development_plans
+            (student_id, assessment_id, created_date, interventions, goals, status)
+            VALUES (%s, %s, %s, %s, %s, 'active')
+            RETURNING id
+        """, (student_id, assessment_id, coaching_db._now(), json.dumps(interventions), goals),
+            "saving development plan")
+
+    def log_progress(self, student_id: int, plan_id: int, activity_type: str,
+                     content: str, outcome: str = None) -> Optional[int]:
+        return self._insert("""
+            INSERT INTO progress_logs
+            (student_id, plan_id, log_date, activity_type, content, outcome)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            RETURNING id
+        """, (student_id, plan_id, coaching_db._now(), activity_type, content, outcome), "logging progress")
+
+    def get_timeline_page(self, student_id: int, after: Optional[str] = None,
+                          limit: int = coaching_timeline.PAGE_SIZE) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        position = coaching_timeline.decode_cursor(after) if after else None
+
+        parts, params = [], []
+        for kind, (rank, table, date_col, title, status, payload) in coaching_timeline.TIMELINE_SOURCES.items():
+            where, source_params = ["student_id = %s"], [student_id]
+            if position is not None:
+                event_time, cursor_rank, cursor_id = position
+                if rank < cursor_rank:
+                    where.append(f"{date_col} <= %s")
+                    source_params.append(event_time)
+                elif rank > cursor_rank:
+                    where.append(f"{date_col} < %s")
+                    source_params.append(event_time)
+                else:
+                    where.append(f"({date_col}, id) < (%s, %s)")
+                    source_params.extend([event_time, cursor_id])
+            parts.append(f"""
+                (SELECT '{kind}'::text AS kind, {rank} AS rank, id, {date_col} AS event_time,
+                        {title}::text AS title, {status}::text AS status, {payload}::text AS payload
+                 FROM {table}
+                 WHERE {' AND '.join(where)}
+                 ORDER BY {date_col} DESC, id DESC
+                 LIMIT %s)
+            """)
+            params.extend(source_params + [limit + 1])
+
+        with self.pool.cursor() as cur:
+            cur.execute(f"""
+                {" UNION ALL ".join(parts)}
+                ORDER BY event_time DESC, rank DESC, id DESC
+                LIMIT %s
+            """, params + [limit + 1])
+            rows = cur.fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = coaching_timeline.encode_cursor(rows[-1][3], rows[-1][1], rows[-1][2]) if has_more else None
+        return [coaching_timeline._entry_from_row(row) for row in rows], next_cursor
+
+
+# ============================================
+# STORAGE
+# ============================================
+
+class PostgresStorage(Storage):
+    """
+    PostgreSQL-Backend.
+
+    Args:
+        dsn: libpq-DSN oder URL (``postgresql://user@host/db``)
+        min_connections, max_connections: Pool-Größe (Standard aus
+            ``PULSE_PG_POOL_MIN``/``PULSE_PG_POOL_MAX``)
+        schema: Schema der Standard-Schule
+    """
+
+    def __init__(self, dsn: str, min_connections: Optional[int] = None,
+                 max_connections: Optional[int] = None, schema: str = DEFAULT_SCHEMA):
+        if not HAS_PSYCOPG2:
+            raise ImportError("PULSE_STORAGE=postgres benötigt psycopg2 (pip install psycopg2-binary)")
+
+        self.pool = ConnectionPool(
+            dsn,
+            min_connections or int(os.environ.get(ENV_POOL_MIN, DEFAULT_POOL_MIN)),
+            max_connections or int(os.environ.get(ENV_POOL_MAX, DEFAULT_POOL_MAX)),
+            base_schema=schema,
+        )
+        super().__init__(
+            backend="postgres",
+            users=PostgresUserRepository(self.pool),
+            challenges=PostgresChallengeRepository(self.pool),
+            badges=PostgresBadgeRepository(self.pool),
+            activity=PostgresActivityRepository(self.pool),
+            motivation=PostgresMotivationRepository(self.pool),
+            bandura=PostgresBanduraRepository(self.pool),
+            learnstrat=PostgresLearnstratRepository(self.pool),
+            coaching=PostgresCoachingRepository(self.pool),
+        )
+
+    def migrate(self) -> None:
+        self.pool.migrate()
+
+    def close(self) -> None:
+        self.pool.close()
@@ -0,0 +1,310 @@
+"""
+🗃️ SQLite-Backend
+=================
+
+Die bisherigen DB-Schichten als Repositories: Jede Methode ruft die
+ursprüngliche Funktion (ohne ``@routed``-Umleitung) auf. Pfade, Shards,
+Preview-Datenbanken und Migrationen bleiben damit genau wie bisher.
+
+Für Funktionen mit ``conn``-Parameter (Motivation, Lernstrategien) öffnet
+das Repository selbst eine Verbindung zur Gamification-DB des Users.
+"""
+
+from contextlib import closing
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .. import bandura_sources_widget as bandura_db
+from .. import coaching_db, coaching_timeline, gamification_db, student_search, user_system
+from ..learnstrat_challenges import birkenbihl_widget, powertechniken_widget, transfer_widget
+from ..migrations import ensure_connection_schema
+from ..motivation_challenges import motivation_db
+from ..preview_store import connect_db
+from .base import (
+    ActivityRepository,
+    BadgeRepository,
+    BanduraRepository,
+    ChallengeRepository,
+    CoachingRepository,
+    LearnstratRepository,
+    MotivationRepository,
+    Storage,
+    UserRepository,
+)
+
+
+def _direct(func: Callable) -> Callable:
+    """Ursprüngliche Funktion hinter ``@routed``."""
+    return getattr(func, "__wrapped__", func)
+
+
+def _with_conn(func: Callable, user_id: str, *args, **kwargs):
+    """Ruft eine ``conn``-basierte Funktion mit eigener Verbindung auf."""
+    with closing(connect_db(gamification_db.get_db_path(), user_id)) as conn:
+        ensure_connection_schema(conn)
+        return _direct(func)(conn, user_id, *args, **kwargs)
+
+
+# ============================================
+# GAMIFICATION
+# ============================================
+
+class SQLiteUserRepository(UserRepository):
+
+    def get_version(self, user_id: str) -> Optional[int]:
+        return _direct(gamification_db.get_user_version)(user_id)
+
+    def get_or_create(self, user_id: str, username: str = "Lernender") -> Dict[str, Any]:
+        return _direct(gamification_db.get_or_create_user)(user_id, username)
+
+    def update_stats(self, user_id: str, xp_delta: int, streak: int) -> Dict[str, Any]:
+        return _direct(gamification_db.update_user_stats)(user_id, xp_delta, streak)
+
+    def get_or_create_by_name(self, display_name: str, age_group: str = None,
+                              avatar_style: str = None) -> Dict[str, Any]:
+        return _direct(user_system.get_or_create_user_by_name)(display_name, age_group, avatar_style)
+
+    def update_avatar(self, user_id: str, avatar_settings: Dict) -> bool:
+        return _direct(user_system.update_user_avatar)(user_id, avatar_settings)
+
+    def update_age_group(self, user_id: str, age_group: str) -> bool:
+        return _direct(user_system.update_user_age_group)(user_id, age_group)
+
+    def get_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
+        return _direct(user_system.get_user_by_id)(user_id)
+
+    def get_all(self) -> List[Dict[str, Any]]:
+        return _direct(user_system.get_all_users)()
+
+
+class SQLiteChallengeRepository(ChallengeRepository):
+
+    def create(self, user_id: str, subject: str, prediction: int, task_description: str = "") -> int:
+        return _direct(gamification_db.create_challenge)(user_id, subject, prediction, task_description)
+
+    def complete(self, challenge_id: int, actual_result: int, reflection: str = "",
+                 user_id: Optional[str] = None) -> Dict[str, Any]:
+        return _direct(gamification_db.complete_challenge)(challenge_id, actual_result, reflection, user_id)
+
+    def get_recent(self, user_id: str, limit: int = 20) -> List[Dict]:
+        return _direct(gamification_db.get_user_challenges)(user_id, limit)
+
+    def get_open(self, user_id: str) -> List[Dict]:
+        return _direct(gamification_db.get_open_challenges)(user_id)
+
+    def get_user_stats(self, user_id: str, user: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return _direct(gamification_db.get_user_stats)(user_id, user)
+
+
+class SQLiteBadgeRepository(BadgeRepository):
+
+    def get_user_badges(self, user_id: str) -> List[Dict]:
+        return _direct(gamification_db.get_user_badges)(user_id)
+
+    def award(self, user_id: str, badge_id: str) -> bool:
+        return _direct(gamification_db.award_badge)(user_id, badge_id)
+
+
+class SQLiteActivityRepository(ActivityRepository):
+
+    def get_challenge_heatmap(self, user_id: str, days: int = 90) -> List[Dict]:
+        return _direct(gamification_db.get_activity_heatmap)(user_id, days)
+
+    def log_motivation(self, user_id: str, challenge_id: str, grundbeduerfnis: str, xp_earned: int) -> None:
+        return _with_conn(motivation_db.log_activity, user_id, challenge_id, grundbeduerfnis, xp_earned)
+
+    def get_motivation_heatmap(self, user_id: str, weeks: int = 12) -> List[Dict[str, Any]]:
+        return _with_conn(motivation_db.get_activity_heatmap_data, user_id, weeks)
+
+    def get_daily_summary(self, user_id: str, target_date: date = None) -> Dict[str, Any]:
+        return _with_conn(motivation_db.get_daily_activity_summary, user_id, target_date)
+
+
+# ============================================
+# MOTIVATION, BANDURA, LERNSTRATEGIEN
+# ============================================
+
+class SQLiteMotivationRepository(MotivationRepository):
+
+    def save_challenge_progress(self, user_id: str, challenge_id: str, age_group: str,
+                                grundbeduerfnis: str, phase: str = "intro", user_input: str = None,
+                                reflection: str = None, rating: int = None, xp_earned: int = 0,
+                                completed: bool = False) -> int:
+        return _with_conn(motivation_db.save_challenge_progress, user_id, challenge_id, age_group,
+                          grundbeduerfnis, phase, user_input, reflection, rating, xp_earned, completed)
+
+    def get_challenge_progress(self, user_id: str, challenge_id: str, age_group: str) -> Optional[Dict[str, Any]]:
+        return _with_conn(motivation_db.get_challenge_progress, user_id, challenge_id, age_group)
+
+    def get_completed_challenges(self, user_id: str, age_group: str = None,
+                                 grundbeduerfnis: str = None) -> List[Dict[str, Any]]:
+        return _with_conn(motivation_db.get_completed_challenges, user_id, age_group, grundbeduerfnis)
+
+    def count_completed_challenges(self, user_id: str, age_group: str = None,
+                                   grundbeduerfnis: str = None) -> int:
+        return _with_conn(motivation_db.count_completed_challenges, user_id, age_group, grundbeduerfnis)
+
+    def get_or_create_sdt_progress(self, user_id: str) -> Dict[str, Any]:
+        return _with_conn(motivation_db.get_or_create_sdt_progress, user_id)
+
+    def update_sdt_progress(self, user_id: str, grundbeduerfnis: str, xp_earned: int) -> Dict[str, Any]:
+        return _with_conn(motivation_db.update_sdt_progress, user_id, grundbeduerfnis, xp_earned)
+
+    def get_or_create_streak(self, user_id: str) -> Dict[str, Any]:
+        return _with_conn(motivation_db.get_or_create_streak, user_id)
+
+    def update_streak(self, user_id: str) -> Dict[str, Any]:
+        return _with_conn(motivation_db.update_streak, user_id)
+
+    def add_streak_freeze(self, user_id: str, count: int = 1) -> int:
+        return _with_conn(motivation_db.add_streak_freeze, user_id, count)
+
+    def award_badge(self, user_id: str, badge_id: str) -> bool:
+        return _with_conn(motivation_db.award_badge, user_id, badge_id)
+
+    def get_user_badges(self, user_id: str) -> List[Dict[str, Any]]:
+        return _with_conn(motivation_db.get_user_badges, user_id)
+
+    def has_badge(self, user_id: str, badge_id: str) -> bool:
+        return _with_conn(motivation_db.has_badge, user_id, badge_id)
+
+    def issue_certificate(self, user_id: str, certificate_type: str, age_group: str,
+                          challenges_completed: List[str], total_xp: int) -> int:
+        return _with_conn(motivation_db.issue_certificate, user_id, certificate_type, age_group,
+                          challenges_completed, total_xp)
+
+    def get_user_certificates(self, user_id: str) -> List[Dict[str, Any]]:
+        return _with_conn(motivation_db.get_user_certificates, user_id)
+
+    def load_snapshot(self, user_id: str):
+        return _with_conn(motivation_db.load_motivation_snapshot, user_id)
+
+    def reset_user_data(self, user_id: str) -> None:
+        return _with_conn(motivation_db.reset_user_motivation_data, user_id)
+
+
+class SQLiteBanduraRepository(BanduraRepository):
+
+    def create_entry(self, user_id: str, source_type: str, description: str) -> Dict[str, Any]:
+        return _direct(bandura_db.create_bandura_entry)(user_id, source_type, description)
+
+    def get_stats(self, user_id: str) -> Dict[str, Any]:
+        return _direct(bandura_db.get_bandura_stats)(user_id)
+
+    def get_entries(self, user_id: str, limit: int = 10) -> List[Dict]:
+        return _direct(bandura_db.get_bandura_entries)(user_id, limit)
+
+    def get_entries_by_source(self, user_id: str) -> Dict[str, List[Dict]]:
+        return _direct(bandura_db.get_all_entries_by_source)(user_id)
+
+
+class SQLiteLearnstratRepository(LearnstratRepository):
+
+    PHASE_FUNCTIONS = {
+        "transfer": (transfer_widget.save_transfer_progress, transfer_widget.get_transfer_progress),
+        "birkenbihl": (birkenbihl_widget.save_birkenbihl_progress, birkenbihl_widget.get_birkenbihl_progress),
+    }
+
+    def save_technique_progress(self, user_id: str, technique_id: str, rating: int, xp: int) -> None:
+        return _with_conn(powertechniken_widget.save_technique_progress, user_id, technique_id, rating, xp)
+
+    def get_progress(self, user_id: str, challenge_id: str = "powertechniken") -> List[Dict]:
+        return _with_conn(powertechniken_widget.get_user_learnstrat_progress, user_id, challenge_id)
+
+    def save_phase_progress(self, challenge_id: str, user_id: str, phase_id: str,
+                            xp: int, response: str = "") -> None:
+        save, _ = self.PHASE_FUNCTIONS[challenge_id]
+        return _with_conn(save, user_id, phase_id, xp, response)
+
+    def get_phase_progress(self, challenge_id: str, user_id: str) -> List[Dict]:
+        _, load = self.PHASE_FUNCTIONS[challenge_id]
+        return _with_conn(load, user_id)
+
+    def save_top3(self, user_id: str, top3: List[str]) -> None:
+        return _with_conn(powertechniken_widget.save_top3_preferences, user_id, top3)
+
+    def get_top3(self, user_id: str) -> Optional[List[str]]:
+        return _with_conn(powertechniken_widget.get_user_top3, user_id)
+
+
+# ============================================
+# COACHING
+# ============================================
+
+class SQLiteCoachingRepository(CoachingRepository):
+
+    def create_student(self, student_code: str, class_name: str = None, notes: str = None) -> Optional[int]:
+        return _direct(coaching_db.create_student)(student_code, class_name, notes)
+
+    def get_student(self, student_id: int) -> Optional[Dict]:
+        return _direct(coaching_db.get_student_by_id)(student_id)
+
+    def get_all_students(self, active_only: bool = True):
+        return _direct(coaching_db.get_all_students)(active_only)
+
+    def search_students(self, term: str = "", class_name: Optional[str] = None,
+                        limit: int = student_search.SEARCH_LIMIT, active_only: bool = True) -> List[Dict[str, Any]]:
+        return _direct(student_search.search_students_ranked)(term, class_name, limit, active_only)
+
+    def get_classes(self, active_only: bool = True) -> List[str]:
+        return _direct(student_search.get_classes)(active_only)
+
+    def save_assessment(self, student_id: int, results_dict: Dict, notes: str = None) -> Optional[int]:
+        return _direct(coaching_db.save_assessment)(student_id, results_dict, notes)
+
+    def save_draft_responses(self, drafts: Dict[int, Dict[str, Any]]) -> int:
+        return _direct(coaching_db.save_draft_responses)(drafts)
+
+    def get_draft(self, student_id: int) -> Optional[Dict]:
+        return _direct(coaching_db.get_draft)(student_id)
+
+    def discard_draft(self, student_id: int) -> int:
+        return _direct(coaching_db.discard_draft)(student_id)
+
+    def promote_draft(self, student_id: int, results_dict: Dict, notes: str = None) -> Optional[int]:
+        return _direct(coaching_db.promote_draft)(student_id, results_dict, notes)
+
+    def get_latest_assessment(self, student_id: int, include_results: bool = True) -> Optional[Dict]:
+        return _direct(coaching_db.get_latest_assessment)(student_id, include_results)
+
+    def get_all_assessments(self, student_id: int, include_results: bool = False,
+                            limit: Optional[int] = None) -> List[Dict]:
+        return _direct(coaching_db.get_all_assessments)(student_id, include_results, limit)
+
+    def get_assessment_results(self, assessment_id: int) -> Optional[Dict]:
+        return _direct(coaching_db.get_assessment_results)(assessment_id)
+
+    def get_student_summary(self, student_id: int) -> Dict:
+        return _direct(coaching_db.get_student_summary)(student_id)
+
+    def save_development_plan(self, student_id: int, assessment_id: int,
+                              interventions: Dict, goals: str = None) -> Optional[int]:
+        return _direct(coaching_db.save_development_plan)(student_id, assessment_id, interventions, goals)
+
+    def log_progress(self, student_id: int, plan_id: int, activity_type: str,
+                     content: str, outcome: str = None) -> Optional[int]:
+        return _direct(coaching_db.log_progress)(student_id, plan_id, activity_type, content, outcome)
+
+    def get_timeline_page(self, student_id: int, after: Optional[str] = None,
+                          limit: int = coaching_timeline.PAGE_SIZE) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        return _direct(coaching_timeline.get_timeline_page)(student_id, after, limit)
+
+
+class SQLiteStorage(Storage):
+    """Bisherige SQLite-Dateien (pro Schule, siehe utils/shards.py)."""
+
+    def __init__(self):
+        super().__init__(
+            backend="sqlite",
+            users=SQLiteUserRepository(),
+            challenges=SQLiteChallengeRepository(),
+            badges=SQLiteBadgeRepository(),
+            activity=SQLiteActivityRepository(),
+            motivation=SQLiteMotivationRepository(),
+            bandura=SQLiteBanduraRepository(),
+            learnstrat=SQLiteLearnstratRepository(),
+            coaching=SQLiteCoachingRepository(),
+        )
+
+    def migrate(self) -> None:
+        gamification_db.init_database()
@@ -0,0 +1,168 @@
+"""
+🔎 Schüler-Suche
+================
+
+Indizierte, fehlertolerante Suche über ``students`` in ``coaching.db`` für
+die Schüler-Auswahl (Screening, Elternakademie).
+
+Kandidaten kommen ausschließlich aus Indizes (Migration 3 in
+``coaching_db.py``):
+- Präfix auf dem Code über ``idx_students_active_code``
+- exakte Klasse über ``idx_students_active_class``
+- ab 3 Zeichen: FTS5-Tabelle ``students_fts`` mit Trigramm-Tokenizer.
+  Die Trigramme des Suchbegriffs werden ODER-verknüpft, damit auch
+  Tippfehler ("Mxa_M") Treffer liefern; bm25 sortiert vor.
+
+Die Kandidaten werden anschließend in Python nach Ähnlichkeit bewertet
+(exakt > Präfix > Teilstring > Trigramm-Überlappung) und die besten
+``limit`` zurückgegeben. Ohne FTS5 (SQLite < 3.34) fällt die
+Teilstring-Suche auf ein begrenztes ``LIKE`` zurück.
+"""
+
+import sqlite3
+from typing import Any, Dict, List, Optional, Set
+
+from utils.coaching_db import get_db_connection
+from utils.storage import routed
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+SEARCH_LIMIT = 20
+CANDIDATE_FACTOR = 5
+MIN_FUZZY_SCORE = 0.3
+
+STUDENT_COLUMNS = ["id", "student_code", "class", "school_year", "created_date", "notes", "is_active"]
+_SELECT = f"SELECT {', '.join('s.' + c for c in STUDENT_COLUMNS)} FROM students s"
+
+
+def _trigrams(text: str) -> Set[str]:
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _fts_query(term: str) -> str:
+    """ODER-Verknüpfung der Trigramme als FTS5-Phrasen."""
+    return " OR ".join('"' + t.replace('"', '""') + '"' for t in sorted(_trigrams(term)))
+
+
+def score_match(term: str, student_code: str, class_name: Optional[str]) -> float:
+    """Ähnlichkeit zwischen Suchbegriff und Schüler (0..1)."""
+    term = term.lower()
+    code = (student_code or "").lower()
+    klass = (class_name or "").lower()
+
+    if code == term:
+        return 1.0
+    if code.startswith(term):
+        return 0.9 + 0.05 * len(term) / len(code)
+    if klass == term:
+        return 0.85
+    if term in code:
+        return 0.7 + 0.1 * len(term) / len(code)
+    if term in klass:
+        return 0.6
+
+    wanted = _trigrams(term)
+    if not wanted:
+        return 0.0
+    overlap = max(len(wanted & _trigrams(code)), len(wanted & _trigrams(klass)))
+    return 0.6 * overlap / len(wanted)
+
+
+def _has_fts(conn: sqlite3.Connection) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'students_fts'"
+    ).fetchone() is not None
+
+
+# ============================================
+# SUCHE
+# ============================================
+
+@routed("coaching.search_students")
+def search_students_ranked(term: str = "", class_name: Optional[str] = None,
+                           limit: int = SEARCH_LIMIT, active_only: bool = True) -> List[Dict[str, Any]]:
+    """
+    Sucht Schüler nach Code oder Klasse (fehlertolerant, sortiert nach Treffergüte).
+
+    Args:
+        term: Suchbegriff (leer = zuletzt angelegte Schüler)
+        class_name: Nur diese Klasse
+        limit: Maximale Anzahl Treffer (Top-K)
+        active_only: Nur aktive Schüler
+
+    Returns:
+        Liste von Schüler-Dicts (STUDENT_COLUMNS + "score")
+    """
+    term = (term or "").strip()
+    filters, filter_params = [], []
+    if active_only:
+        filters.append("s.is_active = 1")
+    if class_name:
+        filters.append("s.class = ?")
+        filter_params.append(class_name)
+
+    def where(*conditions: str) -> str:
+        clauses = list(conditions) + filters
+        return f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    conn = get_db_connection()
+    try:
+        if not term:
+            rows = conn.execute(
+                f"{_SELECT}{where()} ORDER BY s.id DESC LIMIT ?", filter_params + [limit]
+            ).fetchall()
+            return [dict(zip(STUDENT_COLUMNS, row), score=1.0) for row in rows]
+
+        lowered = term.lower()
+        candidate_limit = limit * CANDIDATE_FACTOR
+        candidates: Dict[int, tuple] = {}
+
+        def collect(sql: str, params: List[Any]) -> None:
+            for row in conn.execute(sql, params + [candidate_limit]):
+                candidates.setdefault(row[0], row)
+
+        # Präfix auf dem Code (Index auf is_active, lower(student_code))
+        collect(f"{_SELECT}{where('lower(s.student_code) >= ?', 'lower(s.student_code) < ?')} "
+                f"ORDER BY lower(s.student_code) LIMIT ?",
+                [lowered, lowered + "\U0010ffff"] + filter_params)
+
+        # Klasse exakt ("7a" findet die ganze Klasse)
+        collect(f"{_SELECT}{where('s.class IN (?, ?, ?)')} LIMIT ?",
+                [term, lowered, term.upper()] + filter_params)
+
+        # Teilstring / Tippfehler
+        if len(term) >= 3:
+            if _has_fts(conn):
+                collect(f"{_SELECT} JOIN students_fts f ON f.rowid = s.id"
+                        f"{where('students_fts MATCH ?')} ORDER BY bm25(students_fts) LIMIT ?",
+                        [_fts_query(term)] + filter_params)
+            else:
+                pattern = f"%{term}%"
+                collect(f"{_SELECT}{where('(s.student_code LIKE ? OR s.class LIKE ?)')} LIMIT ?",
+                        [pattern, pattern] + filter_params)
+    finally:
+        conn.close()
+
+    ranked = []
+    for row in candidates.values():
+        student = dict(zip(STUDENT_COLUMNS, row))
+        student["score"] = score_match(term, student["student_code"], student["class"])
+        if student["score"] >= MIN_FUZZY_SCORE:
+            ranked.append(student)
+    ranked.sort(key=lambda s: (-s["score"], s["student_code"]))
+    return ranked[:limit]
+
+
+@routed("coaching.get_classes")
+def get_classes(active_only: bool = True) -> List[str]:
+    """Alle Klassen (für den Klassenfilter)."""
+    conn = get_db_connection()
+    try:
+        where = "WHERE is_active = 1 AND class IS NOT NULL" if active_only else "WHERE class IS NOT NULL"
+        rows = conn.execute(f"SELECT DISTINCT class FROM students {where} ORDER BY class").fetchall()
+    finally:
+        conn.close()
+    return [row[0] for row in rows if row[0]]
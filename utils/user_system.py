@@ -18,12 +18,28 @@ Verwendung:
 
 import streamlit as st
 import sqlite3
+import time
 from datetime import datetime
-from typing import Dict, Optional, Any, List
+from typing import Callable, Dict, Optional, Any, List
 from pathlib import Path
 import hashlib
 import json
 
+from utils.gamification_db import (
+    get_or_create_user,
+    get_user_version,
+    get_local_user_writes,
+    mark_user_written,
+)
+from utils import shards
+from utils.migrations import ensure_schema
+from utils.storage import routed
+from utils.preview_store import (
+    connect_db,
+    new_preview_user_id,
+    discard_preview_db,
+)
+
 # ============================================
 # AVATAR KONFIGURATION (DiceBear)
 # ============================================
@@ -112,57 +128,23 @@ def get_unlocked_options(user: Dict, category: str) -> List[str]:
 # ============================================
 
 def get_db_path() -> Path:
-    """Gibt den Pfad zur SQLite-Datenbank zurück."""
-    if Path("/tmp").exists() and Path("/tmp").is_dir():
-        db_dir = Path("/tmp")
-    else:
-        db_dir = Path(__file__).parent.parent / "data"
-        db_dir.mkdir(exist_ok=True)
-    return db_dir / "hattie_gamification.db"
+    """Gibt den Pfad zur SQLite-Datenbank der aktiven Schule zurück (siehe utils/shards.py)."""
+    return shards.get_db_path("gamification")
 
 def init_user_tables():
-    """Initialisiert die Benutzer-Tabellen."""
-    conn = sqlite3.connect(get_db_path())
-    c = conn.cursor()
-
-    # Erweiterte Users-Tabelle (falls noch nicht vorhanden, erweitern)
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            user_id TEXT PRIMARY KEY,
-            username TEXT DEFAULT 'Lernender',
-            display_name TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            last_login TIMESTAMP,
-            xp_total INTEGER DEFAULT 0,
-            level INTEGER DEFAULT 1,
-            current_streak INTEGER DEFAULT 0,
-            longest_streak INTEGER DEFAULT 0,
-            last_activity_date DATE,
-            settings TEXT DEFAULT '{}',
-            age_group TEXT DEFAULT 'unterstufe',
-            avatar_settings TEXT DEFAULT '{}'
-        )
-    ''')
+    """Stellt sicher, dass die Benutzer-Tabellen migriert sind (siehe utils/migrations.py)."""
+    ensure_schema(get_db_path())
 
-    # Prüfe ob Spalten existieren, wenn nicht hinzufügen
-    c.execute("PRAGMA table_info(users)")
-    columns = [col[1] for col in c.fetchall()]
+def user_id_for_name(display_name: str) -> str:
+    """Stabile user_id aus dem Anzeigenamen (lowercase, ohne Leerzeichen am Rand)."""
+    return hashlib.md5(display_name.strip().lower().encode()).hexdigest()[:16]
 
-    if 'display_name' not in columns:
-        c.execute('ALTER TABLE users ADD COLUMN display_name TEXT')
-
-    if 'last_login' not in columns:
-        c.execute('ALTER TABLE users ADD COLUMN last_login TIMESTAMP')
-
-    if 'age_group' not in columns:
-        c.execute("ALTER TABLE users ADD COLUMN age_group TEXT DEFAULT 'unterstufe'")
-
-    if 'avatar_settings' not in columns:
-        c.execute("ALTER TABLE users ADD COLUMN avatar_settings TEXT DEFAULT '{}'")
-
-    conn.commit()
-    conn.close()
+def default_avatar_settings(age_group: str, avatar_style: str = None) -> str:
+    """Avatar-Einstellungen (JSON) für neue User - Stil nach Altersstufe."""
+    style = avatar_style or AVATAR_STYLES_BY_AGE.get(age_group, {}).get('styles', ['adventurer'])[0]
+    return json.dumps({"style": style, "background": "b6e3f4"})
 
+@routed("users.get_or_create_by_name")
 def get_or_create_user_by_name(display_name: str, age_group: str = None, avatar_style: str = None) -> Dict[str, Any]:
     """Holt oder erstellt einen User basierend auf dem Display-Namen."""
     init_user_tables()
@@ -172,7 +154,7 @@ def get_or_create_user_by_name(display_name: str, age_group: str = None, avatar_
 
     # Generiere user_id aus dem Namen (lowercase, keine Sonderzeichen)
     clean_name = display_name.strip().lower()
-    user_id = hashlib.md5(clean_name.encode()).hexdigest()[:16]
+    user_id = user_id_for_name(display_name)
 
     # Prüfe ob User existiert
     c.execute("SELECT * FROM users WHERE user_id = ?", (user_id,))
@@ -185,12 +167,7 @@ def get_or_create_user_by_name(display_name: str, age_group: str = None, avatar_
         age = age_group or "unterstufe"
 
         # Default Avatar-Style basierend auf Altersstufe
-        if avatar_style:
-            style = avatar_style
-        else:
-            style = AVATAR_STYLES_BY_AGE.get(age, {}).get('styles', ['adventurer'])[0]
-
-        avatar_settings = json.dumps({"style": style, "background": "b6e3f4"})
+        avatar_settings = default_avatar_settings(age, avatar_style)
 
         c.execute('''
             INSERT INTO users (user_id, username, display_name, created_at, last_login,
@@ -203,12 +180,15 @@ def get_or_create_user_by_name(display_name: str, age_group: str = None, avatar_
     else:
         # Update last_login (und ggf. age_group wenn angegeben)
         if age_group:
-            c.execute("UPDATE users SET last_login = ?, display_name = ?, age_group = ? WHERE user_id = ?",
+            c.execute("UPDATE users SET last_login = ?, display_name = ?, age_group = ?, "
+                      "version = COALESCE(version, 0) + 1 WHERE user_id = ?",
                       (now, display_name.strip(), age_group, user_id))
         else:
-            c.execute("UPDATE users SET last_login = ?, display_name = ? WHERE user_id = ?",
+            c.execute("UPDATE users SET last_login = ?, display_name = ?, "
+                      "version = COALESCE(version, 0) + 1 WHERE user_id = ?",
                       (now, display_name.strip(), user_id))
         conn.commit()
+        mark_user_written(user_id)
         c.execute("SELECT * FROM users WHERE user_id = ?", (user_id,))
         user = c.fetchone()
 
@@ -216,15 +196,17 @@ def get_or_create_user_by_name(display_name: str, age_group: str = None, avatar_
     conn.close()
     return result
 
+@routed("users.update_avatar")
 def update_user_avatar(user_id: str, avatar_settings: Dict) -> bool:
     """Aktualisiert die Avatar-Einstellungen eines Users."""
-    conn = sqlite3.connect(get_db_path())
+    conn = connect_db(get_db_path(), user_id)
     c = conn.cursor()
 
     try:
-        c.execute("UPDATE users SET avatar_settings = ? WHERE user_id = ?",
+        c.execute("UPDATE users SET avatar_settings = ?, version = COALESCE(version, 0) + 1 WHERE user_id = ?",
                   (json.dumps(avatar_settings), user_id))
         conn.commit()
+        mark_user_written(user_id)
         success = True
     except Exception as e:
         print(f"Error updating avatar: {e}")
@@ -233,15 +215,17 @@ def update_user_avatar(user_id: str, avatar_settings: Dict) -> bool:
     conn.close()
     return success
 
+@routed("users.update_age_group")
 def update_user_age_group(user_id: str, age_group: str) -> bool:
     """Aktualisiert die Altersstufe eines Users."""
-    conn = sqlite3.connect(get_db_path())
+    conn = connect_db(get_db_path(), user_id)
     c = conn.cursor()
 
     try:
-        c.execute("UPDATE users SET age_group = ? WHERE user_id = ?",
+        c.execute("UPDATE users SET age_group = ?, version = COALESCE(version, 0) + 1 WHERE user_id = ?",
                   (age_group, user_id))
         conn.commit()
+        mark_user_written(user_id)
         success = True
     except Exception as e:
         print(f"Error updating age group: {e}")
@@ -250,9 +234,10 @@ def update_user_age_group(user_id: str, age_group: str) -> bool:
     conn.close()
     return success
 
+@routed("users.get_by_id")
 def get_user_by_id(user_id: str) -> Optional[Dict[str, Any]]:
     """Holt einen User anhand der ID."""
-    conn = sqlite3.connect(get_db_path())
+    conn = connect_db(get_db_path(), user_id)
     conn.row_factory = sqlite3.Row
     c = conn.cursor()
 
@@ -262,6 +247,7 @@ def get_user_by_id(user_id: str) -> Optional[Dict[str, Any]]:
     conn.close()
     return dict(user) if user else None
 
+@routed("users.get_all")
 def get_all_users() -> list:
     """Holt alle registrierten Benutzer."""
     init_user_tables()
@@ -289,10 +275,10 @@ def is_logged_in() -> bool:
     return "current_user_id" in st.session_state and st.session_state.current_user_id is not None
 
 def get_current_user() -> Optional[Dict[str, Any]]:
-    """Gibt den aktuell eingeloggten Benutzer zurück."""
+    """Gibt den aktuell eingeloggten Benutzer zurück (aus dem Session-Snapshot)."""
     if not is_logged_in():
         return None
-    return get_user_by_id(st.session_state.current_user_id)
+    return _get_user_snapshot(st.session_state.current_user_id, get_user_by_id)
 
 def get_current_user_id() -> Optional[str]:
     """Gibt die ID des aktuell eingeloggten Benutzers zurück."""
@@ -303,6 +289,7 @@ def get_current_user_id() -> Optional[str]:
 def login_user(display_name: str, age_group: str = None, avatar_style: str = None) -> Dict[str, Any]:
     """Loggt einen Benutzer ein (erstellt ihn falls nötig)."""
     user = get_or_create_user_by_name(display_name, age_group, avatar_style)
+    store_user_snapshot(user)
     st.session_state.current_user_id = user['user_id']
     st.session_state.current_user_name = user['display_name']
     st.session_state.current_user_age_group = user.get('age_group', 'unterstufe')
@@ -311,11 +298,69 @@ def login_user(display_name: str, age_group: str = None, avatar_style: str = Non
 def logout_user():
     """Loggt den aktuellen Benutzer aus."""
     keys_to_delete = ["current_user_id", "current_user_name", "current_user_age_group",
-                      "registration_step", "registration_name", "registration_age"]
+                      "registration_step", "registration_name", "registration_age",
+                      USER_SNAPSHOT_KEY]
     for key in keys_to_delete:
         if key in st.session_state:
             del st.session_state[key]
 
+# ============================================
+# USER-SNAPSHOT (Session-Cache)
+# ============================================
+# Statt bei jedem Rerun die komplette users-Zeile zu lesen, hält jede Session
+# einen Snapshot samt version. Innerhalb der TTL (und ohne lokale
+# Schreibzugriffe) wird er ungeprüft genutzt, danach genügt ein
+# SELECT version per Primärschlüssel.
+
+USER_SNAPSHOT_KEY = "user_snapshot"
+USER_SNAPSHOT_TTL = 30  # Sekunden ohne Versions-Check
+
+def store_user_snapshot(user: Dict[str, Any], local_writes: Optional[int] = None):
+    """Legt den Snapshot eines Users im Session State ab."""
+    user_id = user['user_id']
+    st.session_state[USER_SNAPSHOT_KEY] = {
+        "user_id": user_id,
+        "user": dict(user),
+        "version": user.get('version') or 0,
+        "local_writes": get_local_user_writes(user_id) if local_writes is None else local_writes,
+        "checked_at": time.monotonic(),
+    }
+
+def invalidate_user_snapshot():
+    """Verwirft den Snapshot (nächster Zugriff liest neu)."""
+    st.session_state.pop(USER_SNAPSHOT_KEY, None)
+
+def _get_user_snapshot(user_id: str, loader: Callable[[str], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+    """
+    Gibt den User aus dem Snapshot zurück oder lädt ihn über ``loader`` neu.
+
+    Args:
+        user_id: ID des Users
+        loader: Funktion zum Laden der vollständigen Zeile (z.B. get_user_by_id)
+    """
+    snapshot = st.session_state.get(USER_SNAPSHOT_KEY)
+    now = time.monotonic()
+    local_writes = get_local_user_writes(user_id)
+
+    if snapshot and snapshot["user_id"] == user_id:
+        if snapshot["local_writes"] == local_writes and now - snapshot["checked_at"] < USER_SNAPSHOT_TTL:
+            return dict(snapshot["user"])
+        if get_user_version(user_id) == snapshot["version"]:
+            snapshot["checked_at"] = now
+            snapshot["local_writes"] = local_writes
+            return dict(snapshot["user"])
+
+    user = loader(user_id)
+    if user is None:
+        invalidate_user_snapshot()
+        return None
+    store_user_snapshot(user, local_writes)
+    return dict(user)
+
+def get_cached_user(user_id: str) -> Dict[str, Any]:
+    """Wie ``get_or_create_user``, aber über den Session-Snapshot."""
+    return _get_user_snapshot(user_id, get_or_create_user)
+
 # ============================================
 # UI COMPONENTS
 # ============================================
@@ -561,58 +606,58 @@ def is_preview_mode() -> bool:
 
 
 def start_preview_mode(age_group: str = "unterstufe"):
-    """Startet den Preview-Modus mit einem temporären User."""
-    # Nutze die existierende Funktion um den Preview-User zu erstellen/aktualisieren
-    user = get_or_create_user_by_name(PREVIEW_USER_NAME, age_group=age_group)
+    """
+    Startet den Preview-Modus mit einem temporären User.
 
-    # Altersstufe aktualisieren falls nötig
-    if user.get("age_group") != age_group:
-        update_user_age_group(user["user_id"], age_group)
+    Der User und alle seine Daten liegen in einer eigenen In-Memory-Datenbank
+    (siehe utils/preview_store.py) - die Produktions-DB bleibt unberührt.
+    """
+    user_id = new_preview_user_id()
+
+    conn = connect_db(get_db_path(), user_id)
+    conn.execute(
+        "INSERT INTO users (user_id, username, display_name, age_group, last_login) VALUES (?, ?, ?, ?, ?)",
+        (user_id, PREVIEW_USER_NAME, PREVIEW_USER_NAME, age_group, datetime.now().isoformat())
+    )
+    conn.commit()
+    conn.close()
 
     # Session State setzen
     st.session_state.preview_mode = True
-    st.session_state.current_user_id = user["user_id"]
+    st.session_state.current_user_id = user_id
     st.session_state.current_user_name = PREVIEW_USER_NAME
     st.session_state.current_user_age_group = age_group
+    invalidate_user_snapshot()
 
 
 def end_preview_mode():
-    """Beendet den Preview-Modus."""
+    """Beendet den Preview-Modus und verwirft alle Preview-Daten."""
+    user_id = st.session_state.get("current_user_id")
+    if user_id and is_preview_mode():
+        discard_preview_db(user_id)
+
     st.session_state.preview_mode = False
     st.session_state.current_user_id = None
     st.session_state.current_user_name = None
     st.session_state.current_user_age_group = None
+    invalidate_user_snapshot()
 
 
 def reset_preview_data():
-    """Setzt alle Preview-User Daten zurück."""
-    user_id = st.session_state.get("current_user_id")
-    if not user_id:
-        return
-
-    conn = sqlite3.connect(get_db_path())
-    c = conn.cursor()
-
-    # User-Daten zurücksetzen (nur Spalten die existieren)
-    try:
-        c.execute("UPDATE users SET xp_total = 0, current_streak = 0, longest_streak = 0 WHERE user_id = ?", (user_id,))
-    except sqlite3.OperationalError:
-        pass  # Spalten existieren möglicherweise nicht
-
-    # Challenges löschen
-    try:
-        c.execute("DELETE FROM challenges WHERE user_id = ?", (user_id,))
-    except sqlite3.OperationalError:
-        pass
+    """
+    Setzt alle Preview-User Daten zurück.
 
-    # Badges löschen
-    try:
-        c.execute("DELETE FROM user_badges WHERE user_id = ?", (user_id,))
-    except sqlite3.OperationalError:
-        pass
+    Die In-Memory-Datenbank wird verworfen und ein frischer Preview-User
+    angelegt. Die neue User-ID entwertet nebenbei alle Session-Snapshots.
+    """
+    if not is_preview_mode():
+        return
 
-    conn.commit()
-    conn.close()
+    age_group = st.session_state.get("current_user_age_group") or "unterstufe"
+    user_id = st.session_state.get("current_user_id")
+    if user_id:
+        discard_preview_db(user_id)
+    start_preview_mode(age_group)
 
 
 def change_preview_age_group(age_group: str):
@@ -0,0 +1,202 @@
+"""
+🎯 WLE-Scoring
+==============
+
+Weighted Likelihood Estimates (Warm, 1989) für die Fragebogen-Antworten -
+dieselbe Schätzung, mit der PISA die Skalenindizes (MATHEFF, ANXMAT, ...)
+berichtet. Anders als der 1-4-Mittelwert aus ``calculate_scale_score``
+liegen die Werte damit direkt auf der PISA-Metrik.
+
+Modell und Item-Parameter kommen aus ``utils/irt_model.py`` (GPCM, aus
+``student_data`` kalibriert; das Partial-Credit-Modell ist der Spezialfall
+a = 1).
+
+Schätzung:
+- ``wle_matrix`` löst die WLE-Gleichung per Newton-Raphson für eine ganze
+  Klasse auf einmal: Antwortmatrix (Schüler × Items), fehlende Antworten
+  = -1. Alle Schritte sind NumPy-Operationen über (N, I, K).
+- Für vollständige Antwortmuster hängt der WLE nur von der gewichteten
+  Summe Σ a·k ab. ``wle_lookup`` tabelliert diese Statistik einmal pro Bank
+  auf dem Theta-Gitter; vollständige Zeilen werden per Interpolation
+  geschätzt und nur noch mit einem Newton-Schritt nachpoliert.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from utils.irt_model import ItemBank, load_item_banks
+
+# ============================================
+# KONFIGURATION
+# ============================================
+
+NEWTON_ITERATIONS = 30
+TOLERANCE = 1e-6
+MAX_STEP = 1.0
+THETA_BOUNDS = (-6.0, 6.0)
+DECIMALS = 4
+
+
+# ============================================
+# MOMENTE
+# ============================================
+
+def _moments(bank: ItemBank, theta: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Kumulanten der Kategorie pro (Schüler, Item) am jeweiligen Theta.
+
+    Returns:
+        (E[k], Var[k], 3. und 4. Kumulante) - je Form (N, I)
+    """
+    a = bank.discrimination[None, :, None]
+    z = np.zeros((theta.size, len(bank), bank.steps.shape[1] + 1))
+    z[:, :, 1:] = np.cumsum(a * (theta[:, None, None] - bank.steps[None, :, :]), axis=2)
+    z -= z.max(axis=2, keepdims=True)
+    p = np.exp(z)
+    p /= p.sum(axis=2, keepdims=True)
+
+    k = np.arange(z.shape[2])[None, None, :]
+    mean = (p * k).sum(axis=2)
+    centered = k - mean[:, :, None]
+    var = (p * centered ** 2).sum(axis=2)
+    third = (p * centered ** 3).sum(axis=2)
+    fourth = (p * centered ** 4).sum(axis=2) - 3 * var ** 2
+    return mean, var, third, fourth
+
+
+def _wle_terms(bank: ItemBank, theta: np.ndarray, categories: np.ndarray):
+    """WLE-Gleichung f(θ), Ableitung f'(θ) und Testinformation I(θ) pro Schüler."""
+    valid = categories >= 0
+    a = bank.discrimination[None, :]
+    mean, var, third, fourth = (np.where(valid, m, 0.0) for m in _moments(bank, theta))
+
+    score = (a * (np.where(valid, categories, 0) - mean)).sum(axis=1)
+    info = (a ** 2 * var).sum(axis=1)
+    j = (a ** 3 * third).sum(axis=1)             # dI/dθ
+    dj = (a ** 4 * fourth).sum(axis=1)
+
+    f = score + j / (2 * info)
+    df = -info + (dj * info - j ** 2) / (2 * info ** 2)
+    return f, df, info
+
+
+def _newton(bank: ItemBank, theta: np.ndarray, categories: np.ndarray,
+            iterations: int = NEWTON_ITERATIONS) -> Tuple[np.ndarray, np.ndarray]:
+    active = np.ones(theta.size, dtype=bool)
+    for _ in range(iterations):
+        f, df, _ = _wle_terms(bank, theta[active], categories[active])
+        step = np.clip(-f / np.where(df < 0, df, -1e-6), -MAX_STEP, MAX_STEP)
+        theta[active] = np.clip(theta[active] + step, *THETA_BOUNDS)
+        still = np.abs(step) > TOLERANCE
+        active[np.flatnonzero(active)[~still]] = False
+        if not active.any():
+            break
+    _, _, info = _wle_terms(bank, theta, categories)
+    return theta, 1 / np.sqrt(info)
+
+
+# ============================================
+# LOOKUP FÜR VOLLSTÄNDIGE MUSTER
+# ============================================
+
+@lru_cache(maxsize=64)
+def _lookup(bank: ItemBank) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    (gewichtete Summe Σ a·k, WLE) auf dem Theta-Gitter für vollständige Muster.
+
+    Die WLE-Gleichung lautet dort Σ a·k = Σ a·E[k|θ] - J(θ)/(2 I(θ)); die
+    rechte Seite wird einmal tabelliert. None, falls sie nicht streng monoton
+    ist (dann Newton ab 0).
+    """
+    grid = bank.grid.astype(float)
+    mean, var, third, _ = _moments(bank, grid)
+    a = bank.discrimination[None, :]
+    statistic = (a * mean).sum(axis=1) - (a ** 3 * third).sum(axis=1) / (2 * (a ** 2 * var).sum(axis=1))
+    if not np.all(np.diff(statistic) > 0):
+        return None
+    return statistic, grid
+
+
+def wle_lookup(bank: ItemBank, categories: np.ndarray) -> np.ndarray:
+    """Startwerte per Tabelle für vollständige Zeilen, sonst 0."""
+    theta = np.zeros(categories.shape[0])
+    table = _lookup(bank)
+    complete = (categories >= 0).all(axis=1)
+    if table is not None and complete.any():
+        statistic = (bank.discrimination[None, :] * categories[complete]).sum(axis=1)
+        theta[complete] = np.interp(statistic, *table)
+    return theta
+
+
+# ============================================
+# SCHÄTZUNG
+# ============================================
+
+def wle_matrix(bank: ItemBank, categories: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    WLE und Standardfehler für eine Antwortmatrix.
+
+    Args:
+        bank: Item-Bank der Skala
+        categories: (N, I) Kategorie-Indizes in Bank-Reihenfolge, -1 = fehlt
+
+    Returns:
+        (WLE, SE) - je Form (N,), NaN für Zeilen ohne gültige Antwort
+    """
+    categories = np.asarray(categories, dtype=int)
+    theta = np.full(categories.shape[0], np.nan)
+    se = np.full(categories.shape[0], np.nan)
+    answered = (categories >= 0).any(axis=1)
+    if answered.any():
+        rows = categories[answered]
+        theta[answered], se[answered] = _newton(bank, wle_lookup(bank, rows), rows)
+    return theta, se
+
+
+def response_matrix(bank: ItemBank, responses: Iterable[Dict[str, Any]]) -> np.ndarray:
+    """Antwort-Dicts (Roh-Codes) -> Kategorie-Matrix für ``wle_matrix``."""
+    def category(answers: Dict[str, Any], variable: str) -> int:
+        k = bank.category(variable, answers[variable]) if variable in answers else None
+        return -1 if k is None else k
+
+    return np.array([
+        [category(answers, variable) for variable in bank.items]
+        for answers in responses
+    ], dtype=int).reshape(-1, len(bank))
+
+
+def score_class(responses: List[Dict[str, Any]],
+                scales: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    WLE aller kalibrierten Skalen für viele Schüler.
+
+    Args:
+        responses: Ein Antwort-Dict pro Schüler (z.B. ``item_responses``)
+        scales: Nur diese Skalen (Standard: alle kalibrierten)
+
+    Returns:
+        {Skala: {"wle": (N,), "se": (N,)}} - NaN, wo ein Schüler keine Items der Skala hat
+    """
+    banks = load_item_banks()
+    selected = banks if scales is None else {s: banks[s] for s in scales if s in banks}
+    scores = {}
+    for scale, bank in selected.items():
+        wle, se = wle_matrix(bank, response_matrix(bank, responses))
+        scores[scale] = {"wle": wle, "se": se}
+    return scores
+
+
+def score_responses(responses: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """
+    WLE pro Skala für ein einzelnes Screening.
+
+    Returns:
+        {Skala: {"wle": ..., "se": ...}} nur für beantwortete, kalibrierte Skalen
+    """
+    return {
+        scale: {"wle": round(float(values["wle"][0]), DECIMALS), "se": round(float(values["se"][0]), DECIMALS)}
+        for scale, values in score_class([responses]).items()
+        if not np.isnan(values["wle"][0])
+    }